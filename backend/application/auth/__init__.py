@@ -1,5 +1,15 @@
 """Authentication application services."""
 
+from application.auth.password_workers import (
+    LoginThrottle,
+    LoginThrottledError,
+    PasswordWorkerPool,
+    PasswordWorkersBusyError,
+)
+from application.auth.session_cache import (
+    SESSION_REVOKED_TOPIC_PREFIX,
+    SessionResolutionCache,
+)
 from application.auth.session_service import (
     AuthError,
     AuthSessionService,
@@ -11,5 +21,11 @@ __all__ = [
     "AuthError",
     "AuthSessionService",
     "InvalidCredentialsError",
+    "LoginThrottle",
+    "LoginThrottledError",
+    "PasswordWorkerPool",
+    "PasswordWorkersBusyError",
+    "SESSION_REVOKED_TOPIC_PREFIX",
     "SessionNotFoundError",
+    "SessionResolutionCache",
 ]
@@ -0,0 +1,185 @@
+"""Bounded off-loop password hashing and per-email login throttling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import math
+import os
+from threading import Lock
+from time import monotonic
+from typing import TypeVar
+
+from application.auth.passwords import hash_password, verify_password
+
+_T = TypeVar("_T")
+
+DEFAULT_PASSWORD_WORKERS = 2
+DEFAULT_PASSWORD_MAX_PENDING = 32
+DEFAULT_LOGIN_ATTEMPTS_PER_WINDOW = 10
+DEFAULT_LOGIN_WINDOW_SECONDS = 60.0
+_MAX_TRACKED_EMAILS = 10_000
+
+
+class PasswordWorkersBusyError(RuntimeError):
+    """Raised when the password worker queue is full."""
+
+    def __init__(self, retry_after_seconds: int = 1) -> None:
+        super().__init__("password workers are busy")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class PasswordWorkerPool:
+    """Run PBKDF2 work on a small dedicated thread pool.
+
+    `hashlib.pbkdf2_hmac` releases the GIL, so hashing on these threads keeps
+    the event loop responsive. Work beyond `max_pending` queued or running
+    calls is rejected up front instead of piling up behind a login burst.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_PASSWORD_WORKERS,
+        max_pending: int = DEFAULT_PASSWORD_MAX_PENDING,
+    ) -> None:
+        self.max_workers = max(int(max_workers), 1)
+        self.max_pending = max(int(max_pending), self.max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._lock = Lock()
+
+    @classmethod
+    def from_env(cls) -> "PasswordWorkerPool":
+        return cls(
+            max_workers=_env_int("AUTH_PASSWORD_WORKERS", DEFAULT_PASSWORD_WORKERS),
+            max_pending=_env_int(
+                "AUTH_PASSWORD_MAX_PENDING",
+                DEFAULT_PASSWORD_MAX_PENDING,
+            ),
+        )
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    async def hash_password(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        return await self.run(verify_password, password, password_hash)
+
+    async def run(self, function: Callable[..., _T], *args: object) -> _T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordWorkersBusyError()
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                function,
+                *args,
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoginThrottledError(RuntimeError):
+    """Raised when one email exceeded its login attempt budget."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__("too many login attempts")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class LoginThrottle:
+    """Sliding-window login attempt budget per normalized email.
+
+    Every attempt counts until a successful login clears the email, so a
+    burst of guesses against one account cannot occupy the password workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_LOGIN_ATTEMPTS_PER_WINDOW,
+        window_seconds: float = DEFAULT_LOGIN_WINDOW_SECONDS,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_attempts = max(int(max_attempts), 1)
+        self.window_seconds = float(window_seconds)
+        self._clock = clock
+        self._attempts: OrderedDict[str, deque[float]] = OrderedDict()
+        self._lock = Lock()
+
+    @classmethod
+    def from_env(cls) -> "LoginThrottle":
+        return cls(
+            max_attempts=_env_int(
+                "AUTH_LOGIN_ATTEMPTS_PER_WINDOW",
+                DEFAULT_LOGIN_ATTEMPTS_PER_WINDOW,
+            ),
+            window_seconds=_env_int(
+                "AUTH_LOGIN_WINDOW_SECONDS",
+                int(DEFAULT_LOGIN_WINDOW_SECONDS),
+            ),
+        )
+
+    def acquire(self, email: str) -> None:
+        """Record one attempt or raise `LoginThrottledError`."""
+
+        key = email.strip().lower()
+        now = self._clock()
+        with self._lock:
+            attempts = self._attempts.get(key)
+            if attempts is None:
+                attempts = deque()
+                self._attempts[key] = attempts
+                while len(self._attempts) > _MAX_TRACKED_EMAILS:
+                    self._attempts.popitem(last=False)
+            else:
+                self._attempts.move_to_end(key)
+            while attempts and attempts[0] <= now - self.window_seconds:
+                attempts.popleft()
+            if len(attempts) >= self.max_attempts:
+                retry_after = attempts[0] + self.window_seconds - now
+                raise LoginThrottledError(max(1, math.ceil(retry_after)))
+            attempts.append(now)
+
+    def reset(self, email: str) -> None:
+        with self._lock:
+            self._attempts.pop(email.strip().lower(), None)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+__all__ = [
+    "LoginThrottle",
+    "LoginThrottledError",
+    "PasswordWorkerPool",
+    "PasswordWorkersBusyError",
+]
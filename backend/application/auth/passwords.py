@@ -10,18 +10,18 @@ _ITERATIONS = 600_000
 _SALT_BYTES = 16
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, *, iterations: int = _ITERATIONS) -> str:
     salt = os.urandom(_SALT_BYTES)
     digest = hashlib.pbkdf2_hmac(
         "sha256",
         password.encode("utf-8"),
         salt,
-        _ITERATIONS,
+        iterations,
     )
     return ":".join(
         (
             _ALGORITHM,
-            str(_ITERATIONS),
+            str(iterations),
             base64.b64encode(salt).decode("ascii"),
             base64.b64encode(digest).decode("ascii"),
         )
@@ -48,4 +48,12 @@ def verify_password(password: str, password_hash: str) -> bool:
     return hmac.compare_digest(actual, expected)
 
 
-__all__ = ["hash_password", "verify_password"]
+def password_needs_rehash(password_hash: str) -> bool:
+    """Return whether a stored hash uses an outdated algorithm or work factor."""
+
+    algorithm, _, remainder = password_hash.partition(":")
+    iterations_text = remainder.partition(":")[0]
+    return algorithm != _ALGORITHM or iterations_text != str(_ITERATIONS)
+
+
+__all__ = ["hash_password", "password_needs_rehash", "verify_password"]
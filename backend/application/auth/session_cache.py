@@ -0,0 +1,148 @@
+"""Process-local cache of resolved browser sessions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+import os
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+DEFAULT_SESSION_CACHE_TTL_SECONDS = 30.0
+DEFAULT_SESSION_CACHE_MAX_ENTRIES = 10_000
+SESSION_REVOKED_TOPIC_PREFIX = "auth-session-revoked:"
+
+
+def session_revoked_topic(token_hash: str) -> str:
+    return f"{SESSION_REVOKED_TOPIC_PREFIX}{token_hash}"
+
+
+class SessionResolutionCache:
+    """LRU of resolved users keyed by session token hash.
+
+    An entry lives for at most `ttl_seconds` and never past the session's
+    own `expires_at`. Logout evicts the entry at once in this process; other
+    processes drop it when the revocation topic reaches `invalidate_topic`,
+    or after the TTL when no cross-process channel is configured.
+
+    A miss reads the database outside the lock, so a logout can land between
+    that read and the `put`. Callers take `generation()` before the read and
+    pass it to `put`, which then skips the write if the token was
+    invalidated in between.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_SESSION_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_SESSION_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+        self.max_entries = max(int(max_entries), 1)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = Lock()
+        self._generation = 0
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        # Generation of the newest invalidation dropped from `_invalidated`.
+        self._forgotten_generation = 0
+
+    @classmethod
+    def from_env(cls) -> "SessionResolutionCache":
+        return cls(
+            ttl_seconds=_env_float(
+                "AUTH_SESSION_CACHE_TTL_SECONDS",
+                DEFAULT_SESSION_CACHE_TTL_SECONDS,
+            ),
+            max_entries=int(
+                _env_float(
+                    "AUTH_SESSION_CACHE_MAX_ENTRIES",
+                    DEFAULT_SESSION_CACHE_MAX_ENTRIES,
+                )
+            ),
+        )
+
+    def get(self, token_hash: str) -> dict[str, Any] | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            deadline, user = entry
+            if deadline <= now:
+                del self._entries[token_hash]
+                return None
+            self._entries.move_to_end(token_hash)
+            return dict(user)
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(
+        self,
+        token_hash: str,
+        user: Mapping[str, Any],
+        *,
+        expires_at: datetime,
+        generation: int | None = None,
+    ) -> None:
+        remaining_s = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        lifetime_s = min(self.ttl_seconds, remaining_s)
+        if lifetime_s <= 0:
+            return
+        with self._lock:
+            if generation is not None and (
+                self._invalidated.get(token_hash, 0) > generation
+                or self._forgotten_generation > generation
+            ):
+                return
+            self._entries[token_hash] = (self._clock() + lifetime_s, dict(user))
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token_hash: str) -> None:
+        with self._lock:
+            self._entries.pop(token_hash, None)
+            self._generation += 1
+            self._invalidated[token_hash] = self._generation
+            self._invalidated.move_to_end(token_hash)
+            while len(self._invalidated) > self.max_entries:
+                _, forgotten = self._invalidated.popitem(last=False)
+                self._forgotten_generation = forgotten
+
+    def invalidate_topic(self, topic: str) -> None:
+        if topic.startswith(SESSION_REVOKED_TOPIC_PREFIX):
+            self.invalidate(topic[len(SESSION_REVOKED_TOPIC_PREFIX) :])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidated.clear()
+            self._forgotten_generation = self._generation
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+__all__ = [
+    "SESSION_REVOKED_TOPIC_PREFIX",
+    "SessionResolutionCache",
+    "session_revoked_topic",
+]
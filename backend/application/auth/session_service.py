@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
 import secrets
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
-from typing import Any, Mapping
+from typing import Any, Mapping, Protocol
 from uuid import uuid4
 
-from application.auth.passwords import hash_password, verify_password
+from application.auth.password_workers import LoginThrottle, PasswordWorkerPool
+from application.auth.passwords import (
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+from application.auth.session_cache import (
+    SessionResolutionCache,
+    session_revoked_topic,
+)
 from infra.persistence.postgres.auth_repository import PostgresAuthRepository
 
+logger = logging.getLogger(__name__)
+
 SESSION_COOKIE_NAME = "lens_session"
 DEFAULT_SESSION_TTL_HOURS = 24
 
@@ -26,6 +39,10 @@ class SessionNotFoundError(AuthError):
     """Raised when a browser session is missing or no longer valid."""
 
 
+class _TopicPublisher(Protocol):
+    def publish(self, topic: str) -> None: ...
+
+
 class AuthSessionService:
     """Owns private-beta password auth and server-side sessions."""
 
@@ -34,9 +51,17 @@ class AuthSessionService:
         repository: PostgresAuthRepository,
         *,
         session_ttl_hours: int = DEFAULT_SESSION_TTL_HOURS,
+        password_workers: PasswordWorkerPool | None = None,
+        login_throttle: LoginThrottle | None = None,
+        session_cache: SessionResolutionCache | None = None,
+        session_events: _TopicPublisher | None = None,
     ) -> None:
         self.repository = repository
         self.session_ttl = timedelta(hours=session_ttl_hours)
+        self.password_workers = password_workers or PasswordWorkerPool.from_env()
+        self.login_throttle = login_throttle or LoginThrottle.from_env()
+        self.session_cache = session_cache or SessionResolutionCache.from_env()
+        self.session_events = session_events
 
     def ensure_bootstrap_user(self) -> dict[str, Any] | None:
         email = _clean_text(os.getenv("BOOTSTRAP_ADMIN_EMAIL"))
@@ -74,9 +99,61 @@ class AuthSessionService:
         return _public_user(user)
 
     def login(self, *, email: str, password: str) -> dict[str, Any]:
-        user = self.repository.read_user_by_email(_required_text(email, "email"))
+        normalized_email = _required_text(email, "email")
+        self.login_throttle.acquire(normalized_email)
+        user = self.repository.read_user_by_email(normalized_email)
         if not user or not verify_password(password, str(user["password_hash"])):
             raise InvalidCredentialsError("invalid email or password")
+        if password_needs_rehash(str(user["password_hash"])):
+            self._store_rehashed_password(user, hash_password(password))
+        return self._open_session(normalized_email, user)
+
+    async def login_async(self, *, email: str, password: str) -> dict[str, Any]:
+        """Log in without running PBKDF2 or database calls on the event loop.
+
+        Raises `LoginThrottledError` or `PasswordWorkersBusyError` before any
+        hashing when the email or the worker queue is over budget.
+        """
+
+        normalized_email = _required_text(email, "email")
+        self.login_throttle.acquire(normalized_email)
+        user = await asyncio.to_thread(
+            self.repository.read_user_by_email,
+            normalized_email,
+        )
+        if not user or not await self.password_workers.verify_password(
+            password,
+            str(user["password_hash"]),
+        ):
+            raise InvalidCredentialsError("invalid email or password")
+        if password_needs_rehash(str(user["password_hash"])):
+            password_hash = await self.password_workers.hash_password(password)
+            await asyncio.to_thread(self._store_rehashed_password, user, password_hash)
+        return await asyncio.to_thread(self._open_session, normalized_email, user)
+
+    def _store_rehashed_password(
+        self,
+        user: Mapping[str, Any],
+        password_hash: str,
+    ) -> None:
+        try:
+            self.repository.update_user_password_hash(
+                str(user["user_id"]),
+                password_hash,
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Password rehash failed user_id=%s",
+                user["user_id"],
+                exc_info=True,
+            )
+
+    def _open_session(
+        self,
+        normalized_email: str,
+        user: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        self.login_throttle.reset(normalized_email)
         now = datetime.now(timezone.utc)
         bearer_token = secrets.token_urlsafe(32)
         session = {
@@ -97,25 +174,48 @@ class AuthSessionService:
     def logout(self, session_id: str | None) -> None:
         if not session_id:
             return
-        self.repository.revoke_session_by_token_hash(
-            _session_token_hash(session_id),
-            _now_iso(),
-        )
+        token_hash = _session_token_hash(session_id)
+        self.repository.revoke_session_by_token_hash(token_hash, _now_iso())
+        self.session_cache.invalidate(token_hash)
+        if self.session_events is not None:
+            self.session_events.publish(session_revoked_topic(token_hash))
 
     def resolve_session(self, session_id: str | None) -> dict[str, Any]:
         if not session_id:
             raise SessionNotFoundError("authentication required")
-        session = self.repository.read_session_by_token_hash(
-            _session_token_hash(session_id)
-        )
-        if not session or session.get("revoked_at"):
+        token_hash = _session_token_hash(session_id)
+        cached = self.session_cache.get(token_hash)
+        if cached is not None:
+            return cached
+        return self._resolve_uncached(token_hash)
+
+    async def resolve_session_async(self, session_id: str | None) -> dict[str, Any]:
+        """Resolve from the cache on the loop; read misses on a worker thread."""
+
+        if not session_id:
             raise SessionNotFoundError("authentication required")
-        if _parse_iso(str(session["expires_at"])) <= datetime.now(timezone.utc):
+        token_hash = _session_token_hash(session_id)
+        cached = self.session_cache.get(token_hash)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self._resolve_uncached, token_hash)
+
+    def _resolve_uncached(self, token_hash: str) -> dict[str, Any]:
+        generation = self.session_cache.generation()
+        session = self.repository.read_session_user_by_token_hash(token_hash)
+        if not session or session.get("revoked_at"):
             raise SessionNotFoundError("authentication required")
-        user = self.repository.read_user(str(session["user_id"]))
-        if not user:
+        expires_at = _parse_iso(str(session["expires_at"]))
+        if expires_at <= datetime.now(timezone.utc):
             raise SessionNotFoundError("authentication required")
-        return _public_user(user)
+        user = _public_user(session["user"])
+        self.session_cache.put(
+            token_hash,
+            user,
+            expires_at=expires_at,
+            generation=generation,
+        )
+        return user
 
 
 def _public_user(payload: Mapping[str, Any]) -> dict[str, Any]:
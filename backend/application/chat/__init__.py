@@ -1,6 +1,8 @@
 from application.chat.agent_runner import (
     AgentRunResult,
     AgentRunStatus,
+    ChatTurnEvent,
+    ChatTurnEventType,
     ResearchAgentRunner,
 )
 from application.chat.authorization import AuthorizationDecision, evaluate_authorization
@@ -12,7 +14,12 @@ from application.chat.capabilities import (
     ToolSpec,
 )
 from application.chat.context_builder import ChatContextBuilder
-from application.chat.model import ChatModel, ModelToolCall, ModelTurn
+from application.chat.model import (
+    ChatModel,
+    ModelToolCall,
+    ModelTurn,
+    StreamingChatModel,
+)
 from application.chat.session_service import (
     ChatSessionNotFoundError,
     ChatSessionService,
@@ -30,9 +37,12 @@ __all__ = [
     "ChatModel",
     "ChatSessionNotFoundError",
     "ChatSessionService",
+    "ChatTurnEvent",
+    "ChatTurnEventType",
     "ModelToolCall",
     "ModelTurn",
     "ResearchAgentRunner",
+    "StreamingChatModel",
     "ToolSpec",
     "evaluate_authorization",
 ]
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import StrEnum
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 from uuid import uuid4
 
 from pydantic import ValidationError
@@ -18,7 +18,7 @@ from application.chat.capabilities import (
     CapabilityRegistry,
 )
 from application.chat.context_builder import ChatContextBuilder
-from application.chat.model import ChatModel
+from application.chat.model import ChatModel, StreamingChatModel
 from domain.chat import (
     ChatMessage,
     ChatToolCall,
@@ -57,6 +57,29 @@ class AgentRunStatus(StrEnum):
     FAILED = "failed"
 
 
+class ChatTurnEventType(StrEnum):
+    MESSAGE = "message"
+    TEXT_DELTA = "text_delta"
+    TOOL_CALL = "tool_call"
+    TOOL_RESULT = "tool_result"
+
+
+@dataclass(frozen=True)
+class ChatTurnEvent:
+    """One observable step of a running turn.
+
+    Message, tool call, and tool result events are published only after the
+    checkpoint that made them durable; text deltas are provisional answer text
+    that the following message event replaces.
+    """
+
+    type: ChatTurnEventType
+    data: ChatMessage | ChatToolCall | ChatToolResult | Mapping[str, Any]
+
+
+ChatTurnEventSink = Callable[[ChatTurnEvent], None]
+
+
 @dataclass(frozen=True)
 class AgentRunResult:
     status: AgentRunStatus
@@ -90,7 +113,9 @@ class ResearchAgentRunner:
         previous_messages: tuple[ChatMessage, ...],
         user_message: str,
         checkpoint: _TrajectoryCheckpoint | None = None,
+        on_event: ChatTurnEventSink | None = None,
     ) -> AgentRunResult:
+        checkpoint = _with_events(checkpoint, on_event, previous_messages)
         messages = [
             *previous_messages,
             ChatMessage.user(
@@ -109,6 +134,7 @@ class ResearchAgentRunner:
             calls,
             results,
             checkpoint=checkpoint,
+            on_event=on_event,
         )
 
     def resume_approved_call(
@@ -118,8 +144,10 @@ class ResearchAgentRunner:
         previous_messages: tuple[ChatMessage, ...],
         approved_call: ChatToolCall,
         checkpoint: _TrajectoryCheckpoint | None = None,
+        on_event: ChatTurnEventSink | None = None,
     ) -> AgentRunResult:
         self._validate_approved_call(context, approved_call)
+        checkpoint = _with_events(checkpoint, on_event, previous_messages)
         messages = list(previous_messages)
         calls = [approved_call]
         results: list[ChatToolResult] = []
@@ -150,6 +178,7 @@ class ResearchAgentRunner:
             calls,
             results,
             checkpoint=checkpoint,
+            on_event=on_event,
         )
 
     def _continue(
@@ -160,13 +189,11 @@ class ResearchAgentRunner:
         results: list[ChatToolResult],
         *,
         checkpoint: _TrajectoryCheckpoint | None,
+        on_event: ChatTurnEventSink | None = None,
     ) -> AgentRunResult:
         for _ in range(self.max_model_steps):
             try:
-                turn = self.model.respond(
-                    messages=self.context_builder.for_model(tuple(messages)),
-                    tool_specs=self.capabilities.specs,
-                )
+                turn = self._respond(messages, on_event)
             except Exception as exc:  # noqa: BLE001
                 logger.warning(
                     "Research Agent model call failed exception_type=%s",
@@ -245,6 +272,25 @@ class ResearchAgentRunner:
             "agent_step_limit_reached",
         )
 
+    def _respond(
+        self,
+        messages: list[ChatMessage],
+        on_event: ChatTurnEventSink | None,
+    ) -> Any:
+        model_messages = self.context_builder.for_model(tuple(messages))
+        if on_event is None or not isinstance(self.model, StreamingChatModel):
+            return self.model.respond(
+                messages=model_messages,
+                tool_specs=self.capabilities.specs,
+            )
+        return self.model.respond_streaming(
+            messages=model_messages,
+            tool_specs=self.capabilities.specs,
+            on_text_delta=lambda delta: on_event(
+                ChatTurnEvent(ChatTurnEventType.TEXT_DELTA, {"delta": delta})
+            ),
+        )
+
     def _requested_call(
         self,
         context: AgentContext,
@@ -396,8 +442,65 @@ class ResearchAgentRunner:
         return f"msg_{uuid4().hex[:16]}"
 
 
+class _EventingCheckpoint:
+    """Persist through the wrapped checkpoint, then publish what changed."""
+
+    def __init__(
+        self,
+        checkpoint: _TrajectoryCheckpoint | None,
+        on_event: ChatTurnEventSink,
+        *,
+        message_count: int,
+    ) -> None:
+        self.checkpoint = checkpoint
+        self.on_event = on_event
+        self.message_count = message_count
+        self.result_count = 0
+        self.call_statuses: dict[str, str] = {}
+
+    def __call__(
+        self,
+        messages: tuple[ChatMessage, ...],
+        tool_calls: tuple[ChatToolCall, ...],
+        tool_results: tuple[ChatToolResult, ...],
+    ) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint(messages, tool_calls, tool_results)
+        # The runner only appends messages and results and only replaces the
+        # state of calls it already holds, so counts and statuses are enough
+        # to find what this checkpoint added.
+        for call in tool_calls:
+            status = str(call.status)
+            if self.call_statuses.get(call.tool_call_id) != status:
+                self.call_statuses[call.tool_call_id] = status
+                self.on_event(ChatTurnEvent(ChatTurnEventType.TOOL_CALL, call))
+        for result in tool_results[self.result_count :]:
+            self.on_event(ChatTurnEvent(ChatTurnEventType.TOOL_RESULT, result))
+        self.result_count = len(tool_results)
+        for message in messages[self.message_count :]:
+            self.on_event(ChatTurnEvent(ChatTurnEventType.MESSAGE, message))
+        self.message_count = len(messages)
+
+
+def _with_events(
+    checkpoint: _TrajectoryCheckpoint | None,
+    on_event: ChatTurnEventSink | None,
+    previous_messages: tuple[ChatMessage, ...],
+) -> _TrajectoryCheckpoint | None:
+    if on_event is None:
+        return checkpoint
+    return _EventingCheckpoint(
+        checkpoint,
+        on_event,
+        message_count=len(previous_messages),
+    )
+
+
 __all__ = [
     "AgentRunResult",
     "AgentRunStatus",
+    "ChatTurnEvent",
+    "ChatTurnEventSink",
+    "ChatTurnEventType",
     "ResearchAgentRunner",
 ]
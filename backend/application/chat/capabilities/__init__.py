@@ -22,6 +22,10 @@ from application.chat.capabilities.published_findings import (
     QueryPublishedFindingsCapability,
 )
 from application.chat.capabilities.registry import CapabilityRegistry
+from application.chat.capabilities.source_text_search import (
+    SearchSourceTextArguments,
+    SearchSourceTextCapability,
+)
 
 __all__ = [
     "AgentContext",
@@ -37,5 +41,7 @@ __all__ = [
     "ProposeObjectiveDraftsCapability",
     "QueryPublishedFindingsArguments",
     "QueryPublishedFindingsCapability",
+    "SearchSourceTextArguments",
+    "SearchSourceTextCapability",
     "ToolSpec",
 ]
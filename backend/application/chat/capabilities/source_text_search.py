@@ -0,0 +1,110 @@
+"""Bounded lexical search over the collection's active Source text."""
+
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from application.chat.capabilities.contracts import (
+    CapabilityExecutionContext,
+    ToolSpec,
+)
+from domain.chat import ChatResourceRef, ChatToolResult, ToolRisk
+
+
+DocumentId = Annotated[str, Field(min_length=1, max_length=160)]
+
+
+class SearchSourceTextArguments(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    query: str = Field(min_length=1, max_length=500)
+    document_ids: list[DocumentId] = Field(default_factory=list, max_length=20)
+    limit: int = Field(default=8, ge=1, le=20)
+
+    @field_validator("query")
+    @classmethod
+    def _non_blank_query(cls, value: str) -> str:
+        query = " ".join(value.split())
+        if not query:
+            raise ValueError("query must not be blank")
+        return query
+
+
+class SearchSourceTextCapability:
+    spec = ToolSpec(
+        name="search_source_text",
+        description=(
+            "Find source paragraphs in the current literature collection that match "
+            "keywords such as materials, process variables, properties, or test "
+            "conditions. Results are ranked passages with page locations, not "
+            "verified Findings or Evidence."
+        ),
+        risk=ToolRisk.READ,
+        input_model=SearchSourceTextArguments,
+    )
+
+    def __init__(self, *, collection_service: Any, lexical_search_service: Any) -> None:
+        self.collection_service = collection_service
+        self.lexical_search_service = lexical_search_service
+
+    def execute(
+        self,
+        context: CapabilityExecutionContext,
+        arguments: SearchSourceTextArguments,
+    ) -> ChatToolResult:
+        self.collection_service.get_collection_for_user(
+            context.collection_id,
+            context.user_id,
+        )
+        index = self.lexical_search_service.read_index(context.collection_id)
+        if index is None:
+            return ChatToolResult(
+                tool_call_id=context.tool_call_id,
+                status="succeeded",
+                data={"query": arguments.query, "match_count": 0, "matches": []},
+                warnings=("The collection has no built Source text to search yet.",),
+            )
+        hits = index.search(
+            arguments.query,
+            k=arguments.limit,
+            document_ids=arguments.document_ids or None,
+            kinds=("block",),
+        )
+        matches = [
+            {
+                "document_id": hit.document_id,
+                "block_id": hit.entry_id,
+                "page": hit.page,
+                "score": hit.score,
+                "excerpt": hit.preview,
+            }
+            for hit in hits
+        ]
+        document_ids = list(dict.fromkeys(hit.document_id for hit in hits))
+        return ChatToolResult(
+            tool_call_id=context.tool_call_id,
+            status="succeeded",
+            data={
+                "query": arguments.query,
+                "match_count": len(matches),
+                "matches": matches,
+            },
+            resource_refs=tuple(
+                ChatResourceRef(
+                    resource_type="document",
+                    resource_id=document_id,
+                    href=f"/collections/{context.collection_id}/documents/{document_id}",
+                )
+                for document_id in document_ids
+            ),
+            warnings=(
+                ()
+                if matches
+                else ("No Source passage matched the query terms.",)
+            ),
+        )
+
+
+__all__ = ["SearchSourceTextArguments", "SearchSourceTextCapability"]
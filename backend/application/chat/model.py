@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Protocol
+from typing import Any, Callable, Mapping, Protocol, runtime_checkable
 
 from application.chat.capabilities.contracts import ToolSpec
 from domain.chat import ChatMessage
@@ -128,10 +128,31 @@ class ChatModel(Protocol):
     ) -> ModelTurn: ...
 
 
+@runtime_checkable
+class StreamingChatModel(Protocol):
+    """A chat model that can also report answer text while it is generated."""
+
+    def respond(
+        self,
+        *,
+        messages: tuple[ChatMessage, ...],
+        tool_specs: tuple[ToolSpec, ...],
+    ) -> ModelTurn: ...
+
+    def respond_streaming(
+        self,
+        *,
+        messages: tuple[ChatMessage, ...],
+        tool_specs: tuple[ToolSpec, ...],
+        on_text_delta: Callable[[str], None],
+    ) -> ModelTurn: ...
+
+
 __all__ = [
     "ChatModel",
     "ModelToolCall",
     "ModelTurn",
     "RESEARCH_AGENT_PROMPT_VERSION",
     "RESEARCH_AGENT_SYSTEM_PROMPT",
+    "StreamingChatModel",
 ]
@@ -7,7 +7,11 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from application.chat.agent_runner import AgentRunResult, ResearchAgentRunner
+from application.chat.agent_runner import (
+    AgentRunResult,
+    ChatTurnEventSink,
+    ResearchAgentRunner,
+)
 from application.chat.capabilities import AgentContext
 from domain.chat import (
     ChatMessage,
@@ -86,13 +90,7 @@ class ChatSessionService:
         user_id: str,
     ) -> ChatToolCall | None:
         messages = self.list_messages_for_user(session_id, user_id)
-        for message in reversed(messages):
-            if message.tool_call_id is None:
-                continue
-            call = self.repository.read_tool_call(message.tool_call_id)
-            if call is not None and call.status is ToolCallStatus.APPROVAL_REQUIRED:
-                return call
-        return None
+        return self._pending_approval(messages)
 
     def post_message_for_user(
         self,
@@ -100,10 +98,11 @@ class ChatSessionService:
         user_id: str,
         *,
         message: str,
+        on_event: ChatTurnEventSink | None = None,
     ) -> dict[str, Any]:
         session = self.get_session_for_user(session_id, user_id)
-        previous_messages = self.repository.read_messages(session_id)
-        pending = self.get_pending_approval_for_user(session_id, user_id)
+        previous_messages = self._recent_messages(session_id)
+        pending = self._pending_approval(previous_messages)
         if pending is not None:
             raise ChatApprovalPendingError(pending.tool_call_id)
         result = self.runner.run_turn(
@@ -111,6 +110,7 @@ class ChatSessionService:
             previous_messages=previous_messages,
             user_message=message,
             checkpoint=self._trajectory_checkpoint(session),
+            on_event=on_event,
         )
         return self._turn_record(result, previous_count=len(previous_messages))
 
@@ -140,7 +140,7 @@ class ChatSessionService:
             decision=decision,
             decided_at=_now_iso(),
         )
-        previous_messages = self.repository.read_messages(session_id)
+        previous_messages = self._recent_messages(session_id)
         if decided.status is ToolCallStatus.REJECTED:
             result = ChatToolResult(
                 tool_call_id=decided.tool_call_id,
@@ -182,6 +182,29 @@ class ChatSessionService:
             previous_count=len(previous_messages),
         )
 
+    def _recent_messages(self, session_id: str) -> tuple[ChatMessage, ...]:
+        # The runner only shows the model what its context builder selects, and
+        # trajectory checkpoints anchor on the last stored message, so a tail
+        # covering the builder's bounds is enough to continue a session.
+        context_builder = self.runner.context_builder
+        return self.repository.read_recent_messages(
+            session_id,
+            limit=context_builder.max_messages,
+            max_chars=context_builder.max_chars,
+        )
+
+    def _pending_approval(
+        self,
+        messages: tuple[ChatMessage, ...],
+    ) -> ChatToolCall | None:
+        for message in reversed(messages):
+            if message.tool_call_id is None:
+                continue
+            call = self.repository.read_tool_call(message.tool_call_id)
+            if call is not None and call.status is ToolCallStatus.APPROVAL_REQUIRED:
+                return call
+        return None
+
     def _trajectory_checkpoint(
         self,
         session: ChatSession,
@@ -6,7 +6,7 @@ import os
 from time import perf_counter
 from typing import Any
 
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
 from pydantic import ValidationError
 
 from application.core.document_profiles.prompts import (
@@ -21,6 +21,7 @@ from application.core.structured_extraction.json_support import (
     trace_json,
     trace_text,
 )
+from infra.llm.transport import build_default_llm_client
 from infra.llm.usage import record_llm_completion, record_llm_prompt_version
 
 logger = logging.getLogger(__name__)
@@ -62,9 +63,10 @@ class DocumentProfileExtractor:
             os.getenv("LLM_REASONING_EFFORT", "").strip() or None
         )
         self.last_trace: dict[str, Any] | None = None
-        self.client = client or OpenAI(
-            api_key=(api_key or os.getenv("LLM_API_KEY", "").strip() or "not-needed"),
-            base_url=(base_url or os.getenv("LLM_BASE_URL", "").strip() or None),
+        self.client = client or build_default_llm_client(
+            api_key=api_key,
+            base_url=base_url,
+            task_type="document_profile",
         )
 
     def extract_document_profile(
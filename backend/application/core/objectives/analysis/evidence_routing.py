@@ -19,6 +19,7 @@ from domain.core import (
     normalize_objective_terms,
 )
 from domain.source import SourceDocumentTree
+from infra.source.retrieval import LexicalIndex
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ _ROUTE_PROMPT_TEXT_CHARS = 320
 _ROUTE_PROMPT_HEADER_LIMIT = 8
 _ROUTE_CANDIDATE_LIMIT = 40
 _ROUTE_TEXT_CANDIDATE_LIMIT = 8
+_ROUTE_LEXICAL_CANDIDATE_LIMIT = 32
 _ROUTE_TEXT_HINT_LIMIT = 3
 _ROUTE_TREE_TEXT_SECTION_LIMIT = 3
 _OBJECTIVE_STATE_TEXT_CHARS = 220
@@ -51,7 +53,7 @@ _OBJECTIVE_ROUTE_ROLES = {
 }
 _NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
 _ROUTE_MAX_COMPLETION_TOKENS = 512
-_ROUTE_PROMPT_VERSION = "objective_evidence_route.v1"
+OBJECTIVE_EVIDENCE_ROUTE_PROMPT_VERSION = "objective_evidence_route.v1"
 _ROUTE_SYSTEM_PROMPT = """
 You are routing source units for one research objective in an evidence-backed literature comparison backend.
 
@@ -172,7 +174,7 @@ class ObjectiveEvidenceRouter:
             max_completion_tokens=_ROUTE_MAX_COMPLETION_TOKENS,
             force_json_text=True,
             task_type="objective_evidence_route",
-            prompt_version=_ROUTE_PROMPT_VERSION,
+            prompt_version=OBJECTIVE_EVIDENCE_ROUTE_PROMPT_VERSION,
         )
         if not isinstance(response, StructuredEvidenceSelections):
             raise TypeError("unexpected objective evidence route response type")
@@ -312,6 +314,7 @@ def route_sources(
     tables_by_document_id: dict[str, list[Any]],
     document_trees_by_document_id: dict[str, SourceDocumentTree],
     progress_callback: ProgressCallback | None = None,
+    lexical_index: LexicalIndex | None = None,
 ) -> tuple[EvidenceCandidate, ...]:
     objective_by_id = {objective.objective_id: objective for objective in objectives}
     all_tables = tuple(
@@ -397,6 +400,7 @@ def route_sources(
             blocks=blocks_by_document_id.get(frame.document_id, []),
             tables=tables_by_document_id.get(frame.document_id, []),
             document_tree=document_trees_by_document_id.get(frame.document_id),
+            lexical_index=lexical_index,
         )
         if not source_candidates:
             logger.info(
@@ -1126,6 +1130,7 @@ def _build_route_source_candidates(
     blocks: list[Any],
     tables: list[Any],
     document_tree: SourceDocumentTree | None = None,
+    lexical_index: LexicalIndex | None = None,
 ) -> list[dict[str, Any]]:
     candidates_by_key: dict[tuple[str, str], dict[str, Any]] = {}
     table_by_id = {
@@ -1153,12 +1158,18 @@ def _build_route_source_candidates(
             candidate,
             document_tree=document_tree,
         )
+    lexical_block_ids = _lexical_route_block_ids(
+        frame=frame,
+        objective_context=objective_context,
+        lexical_index=lexical_index,
+    )
     if document_tree is not None:
         text_candidates = _build_tree_route_text_candidates(
             frame=frame,
             objective_context=objective_context,
             blocks=blocks,
             document_tree=document_tree,
+            lexical_block_ids=lexical_block_ids,
         )
     else:
         text_candidate_limit = max(
@@ -1170,6 +1181,7 @@ def _build_route_source_candidates(
             objective_context=objective_context,
             blocks=blocks,
             limit=text_candidate_limit,
+            lexical_block_ids=lexical_block_ids,
         )
     for candidate in text_candidates:
         source_ref = str(candidate.get("source_ref") or "")
@@ -1409,12 +1421,47 @@ def _empty_objective_document_state() -> dict[str, Any]:
     }
 
 
+def _lexical_route_block_ids(
+    *,
+    frame: PaperAnalysisFrame,
+    objective_context: ResearchObjective,
+    lexical_index: LexicalIndex | None,
+) -> frozenset[str] | None:
+    """Return the document blocks that lexically match the Objective scope.
+
+    ``None`` means no narrowing: there is no index, the frame already selected
+    its text sources, or nothing matched and keyword scoring must decide alone.
+    """
+    if lexical_index is None or frame.relevant_text_source_refs:
+        return None
+    query = " ".join(
+        str(term or "")
+        for term in (
+            *objective_context.material_scope,
+            *objective_context.variables,
+            *objective_context.outcomes,
+            *frame.material_match,
+            *frame.changed_variables,
+            *frame.measured_property_scope,
+            *frame.test_environment_scope,
+        )
+    )
+    hits = lexical_index.search(
+        query,
+        k=_ROUTE_LEXICAL_CANDIDATE_LIMIT,
+        document_ids=(frame.document_id,),
+        kinds=("block",),
+    )
+    return frozenset(hit.entry_id for hit in hits) or None
+
+
 def _build_ranked_route_text_candidates(
     *,
     frame: PaperAnalysisFrame,
     objective_context: ResearchObjective,
     blocks: list[Any],
     limit: int,
+    lexical_block_ids: frozenset[str] | None = None,
 ) -> list[dict[str, Any]]:
     if limit <= 0:
         return []
@@ -1437,6 +1484,8 @@ def _build_ranked_route_text_candidates(
             continue
         if selected_source_refs and block_id not in selected_source_refs:
             continue
+        if lexical_block_ids is not None and block_id not in lexical_block_ids:
+            continue
         score = _route_text_candidate_score(
             frame=frame,
             objective_context=objective_context,
@@ -1475,6 +1524,7 @@ def _build_tree_route_text_candidates(
     objective_context: ResearchObjective,
     blocks: list[Any],
     document_tree: SourceDocumentTree,
+    lexical_block_ids: frozenset[str] | None = None,
 ) -> list[dict[str, Any]]:
     block_by_id = {
         str(getattr(block, "block_id", "") or ""): block
@@ -1502,6 +1552,8 @@ def _build_tree_route_text_candidates(
             text = str(getattr(node, "text", "") or "").strip()
         if not source_ref or not text or not any(char.isalpha() for char in text):
             continue
+        if lexical_block_ids is not None and source_ref not in lexical_block_ids:
+            continue
         section_label = _tree_section_label_for_route_node(
             document_tree=document_tree,
             node=node,
@@ -371,7 +371,7 @@ class PaperFrameSourceDisposition:
 
 @dataclass(frozen=True)
 class PaperAnalysisFrame:
-    """Transient paper traversal state; never persisted or exposed by the API."""
+    """Transient paper traversal state; cached only as scratch, never exposed."""
 
     objective_id: str
     document_id: str
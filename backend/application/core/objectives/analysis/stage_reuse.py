@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import fields, is_dataclass
+from hashlib import sha256
+from typing import Any, Callable, Mapping
+
+from application.core.objectives.analysis.evidence_routing import (
+    OBJECTIVE_EVIDENCE_ROUTE_PROMPT_VERSION,
+    EvidenceCandidate,
+    ObjectiveEvidenceRouter,
+    route_sources,
+)
+from application.core.objectives.analysis.source_extraction import (
+    OBJECTIVE_EVIDENCE_EXTRACTION_PROMPT_VERSION,
+    ExtractedEvidenceDraft,
+    ObjectiveSourceExtractor,
+    extract_and_validate_source_facts,
+)
+from application.core.objectives.analysis.source_screening import (
+    OBJECTIVE_PAPER_FRAME_PROMPT_VERSION,
+    ObjectiveSourceScreener,
+    PaperAnalysisFrame,
+    screen_sources,
+)
+from application.core.paper_facts.extraction import PaperFactsExtractor
+from application.core.paper_facts.prompts import (
+    PAPER_FACT_TABLE_MATRIX_REPAIR_PROMPT_VERSION,
+)
+from domain.core import PaperSkim, ResearchObjective
+from domain.ports import ObjectiveStageCache
+from domain.source import SourceDocumentTree
+from infra.source.retrieval import LEXICAL_INDEX_FORMAT, LexicalIndex
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+PAPER_FRAME_STAGE = "paper_frame"
+EVIDENCE_ROUTE_STAGE = "evidence_route"
+SOURCE_EXTRACTION_STAGE = "source_extraction"
+
+_OBJECTIVE_DEFINITION_FIELDS = (
+    "collection_id",
+    "objective_id",
+    "question",
+    "material_scope",
+    "variables",
+    "outcomes",
+    "mechanisms",
+    "constraints",
+    "requested_comparator",
+    "seed_document_ids",
+    "excluded_document_ids",
+)
+
+_UnitKey = tuple[str, str]
+
+
+def run_source_stages_with_reuse(
+    *,
+    collection_id: str,
+    stage_cache: ObjectiveStageCache,
+    source_screener: ObjectiveSourceScreener,
+    evidence_router: ObjectiveEvidenceRouter,
+    source_extractor: ObjectiveSourceExtractor,
+    paper_facts_extractor: PaperFactsExtractor | None,
+    objectives: tuple[ResearchObjective, ...],
+    paper_skims: tuple[PaperSkim, ...],
+    documents: tuple[Any, ...],
+    profiles_by_document_id: dict[str, Any],
+    blocks_by_document_id: dict[str, list[Any]],
+    tables_by_document_id: dict[str, list[Any]],
+    table_cells_by_document_id: dict[str, list[Any]],
+    document_trees_by_document_id: dict[str, SourceDocumentTree],
+    progress_callback: ProgressCallback | None = None,
+    lexical_index: LexicalIndex | None = None,
+) -> tuple[
+    tuple[PaperAnalysisFrame, ...],
+    tuple[EvidenceCandidate, ...],
+    tuple[ExtractedEvidenceDraft, ...],
+]:
+    """Run screening, routing, and extraction, reusing unchanged document work.
+
+    Every (objective, document) unit is keyed per stage by the document input
+    fingerprint, the objective definition fingerprint, the stage prompt
+    version, the configured model, and the upstream stage output. Only units
+    whose key misses the cache are sent through the stage; results are spliced
+    back in objective and document order. Units that hit a model fallback or
+    failure are not cached.
+    """
+
+    skim_by_document_id = {
+        skim.document_id: skim for skim in paper_skims if skim.document_id
+    }
+    document_fingerprints = {
+        document.document_id: document_input_fingerprint(
+            document=document,
+            profile=profiles_by_document_id.get(document.document_id),
+            paper_skim=skim_by_document_id.get(document.document_id),
+            document_tree=document_trees_by_document_id.get(document.document_id),
+        )
+        for document in documents
+    }
+    objective_fingerprints = {
+        objective.objective_id: objective_definition_fingerprint(objective)
+        for objective in objectives
+    }
+    screening_model = model_fingerprint(
+        getattr(source_screener, "response_client", source_screener)
+    )
+    routing_model = model_fingerprint(
+        getattr(evidence_router, "response_client", evidence_router)
+    )
+    extraction_model = model_fingerprint(
+        getattr(source_extractor, "response_client", source_extractor),
+        paper_facts_extractor,
+    )
+    units = tuple(
+        (objective.objective_id, document_id)
+        for objective in objectives
+        for document_id in document_fingerprints
+    )
+
+    frame_keys = {
+        unit: stage_key(
+            PAPER_FRAME_STAGE,
+            OBJECTIVE_PAPER_FRAME_PROMPT_VERSION,
+            screening_model,
+            objective_fingerprints[unit[0]],
+            document_fingerprints[unit[1]],
+        )
+        for unit in units
+    }
+    frames_by_unit = _read_cached_units(
+        stage_cache,
+        collection_id=collection_id,
+        stage=PAPER_FRAME_STAGE,
+        keys=frame_keys,
+        decode=PaperAnalysisFrame.from_mapping,
+    )
+    stale_frame_units = tuple(unit for unit in units if unit not in frames_by_unit)
+    for objective in objectives:
+        stale_document_ids = {
+            document_id
+            for objective_id, document_id in stale_frame_units
+            if objective_id == objective.objective_id
+        }
+        if not stale_document_ids:
+            continue
+        screened = _group_by_unit(
+            screen_sources(
+                collection_id=collection_id,
+                source_screener=source_screener,
+                objectives=(objective,),
+                paper_skims=paper_skims,
+                documents=tuple(
+                    document
+                    for document in documents
+                    if document.document_id in stale_document_ids
+                ),
+                profiles_by_document_id=profiles_by_document_id,
+                blocks_by_document_id=blocks_by_document_id,
+                tables_by_document_id=tables_by_document_id,
+                document_trees_by_document_id=document_trees_by_document_id,
+                progress_callback=progress_callback,
+            )
+        )
+        for document_id in stale_document_ids:
+            unit = (objective.objective_id, document_id)
+            frames_by_unit[unit] = screened.get(unit, ())
+            if not any(
+                disposition.disposition.startswith("fallback_")
+                for frame in frames_by_unit[unit]
+                for disposition in frame.source_dispositions
+            ):
+                _write_unit(
+                    stage_cache,
+                    collection_id=collection_id,
+                    stage=PAPER_FRAME_STAGE,
+                    key=frame_keys[unit],
+                    values=frames_by_unit[unit],
+                )
+    _log_stage_reuse(
+        collection_id,
+        stage=PAPER_FRAME_STAGE,
+        unit_count=len(units),
+        recomputed_count=len(stale_frame_units),
+    )
+
+    route_keys = {
+        unit: stage_key(
+            EVIDENCE_ROUTE_STAGE,
+            OBJECTIVE_EVIDENCE_ROUTE_PROMPT_VERSION,
+            routing_model,
+            frame_keys[unit],
+            [frame.to_record() for frame in frames_by_unit[unit]],
+            *((LEXICAL_INDEX_FORMAT,) if lexical_index is not None else ()),
+        )
+        for unit in units
+    }
+    routes_by_unit = _read_cached_units(
+        stage_cache,
+        collection_id=collection_id,
+        stage=EVIDENCE_ROUTE_STAGE,
+        keys=route_keys,
+        decode=EvidenceCandidate.from_mapping,
+    )
+    stale_route_units = tuple(unit for unit in units if unit not in routes_by_unit)
+    if stale_route_units:
+        failure_recorder = _RouteFailureRecorder(evidence_router)
+        routed = _group_by_unit(
+            route_sources(
+                collection_id=collection_id,
+                evidence_router=failure_recorder,
+                objectives=objectives,
+                objective_paper_frames=tuple(
+                    frame
+                    for unit in stale_route_units
+                    for frame in frames_by_unit[unit]
+                ),
+                blocks_by_document_id=blocks_by_document_id,
+                tables_by_document_id=tables_by_document_id,
+                document_trees_by_document_id=document_trees_by_document_id,
+                progress_callback=progress_callback,
+                lexical_index=lexical_index,
+            )
+        )
+        for unit in stale_route_units:
+            routes_by_unit[unit] = routed.get(unit, ())
+            if unit not in failure_recorder.failed_units:
+                _write_unit(
+                    stage_cache,
+                    collection_id=collection_id,
+                    stage=EVIDENCE_ROUTE_STAGE,
+                    key=route_keys[unit],
+                    values=routes_by_unit[unit],
+                )
+    _log_stage_reuse(
+        collection_id,
+        stage=EVIDENCE_ROUTE_STAGE,
+        unit_count=len(units),
+        recomputed_count=len(stale_route_units),
+    )
+
+    extraction_keys = {
+        unit: stage_key(
+            SOURCE_EXTRACTION_STAGE,
+            OBJECTIVE_EVIDENCE_EXTRACTION_PROMPT_VERSION,
+            PAPER_FACT_TABLE_MATRIX_REPAIR_PROMPT_VERSION,
+            extraction_model,
+            route_keys[unit],
+            [route.to_record() for route in routes_by_unit[unit]],
+        )
+        for unit in units
+    }
+    facts_by_unit = _read_cached_units(
+        stage_cache,
+        collection_id=collection_id,
+        stage=SOURCE_EXTRACTION_STAGE,
+        keys=extraction_keys,
+        decode=ExtractedEvidenceDraft.from_mapping,
+    )
+    stale_extraction_units = tuple(
+        unit for unit in units if unit not in facts_by_unit
+    )
+    if stale_extraction_units:
+        extracted = _group_by_unit(
+            extract_and_validate_source_facts(
+                collection_id=collection_id,
+                source_extractor=source_extractor,
+                paper_facts_extractor=paper_facts_extractor,
+                objectives=objectives,
+                objective_paper_frames=tuple(
+                    frame
+                    for unit in stale_extraction_units
+                    for frame in frames_by_unit[unit]
+                ),
+                objective_evidence_routes=tuple(
+                    route
+                    for unit in stale_extraction_units
+                    for route in routes_by_unit[unit]
+                ),
+                blocks_by_document_id=blocks_by_document_id,
+                tables_by_document_id=tables_by_document_id,
+                document_trees_by_document_id=document_trees_by_document_id,
+                table_cells_by_document_id=table_cells_by_document_id,
+                progress_callback=progress_callback,
+            )
+        )
+        for unit in stale_extraction_units:
+            facts_by_unit[unit] = extracted.get(unit, ())
+            if not any(
+                fact.selection_status == "failed" for fact in facts_by_unit[unit]
+            ):
+                _write_unit(
+                    stage_cache,
+                    collection_id=collection_id,
+                    stage=SOURCE_EXTRACTION_STAGE,
+                    key=extraction_keys[unit],
+                    values=facts_by_unit[unit],
+                )
+    _log_stage_reuse(
+        collection_id,
+        stage=SOURCE_EXTRACTION_STAGE,
+        unit_count=len(units),
+        recomputed_count=len(stale_extraction_units),
+    )
+
+    return (
+        tuple(frame for unit in units for frame in frames_by_unit[unit]),
+        tuple(route for unit in units for route in routes_by_unit[unit]),
+        tuple(fact for unit in units for fact in facts_by_unit[unit]),
+    )
+
+
+def document_input_fingerprint(
+    *,
+    document: Any,
+    profile: Any,
+    paper_skim: PaperSkim | None,
+    document_tree: SourceDocumentTree | None,
+) -> str:
+    """Return a digest of every per-document input read by the Source stages."""
+
+    return _digest(
+        {
+            "document": _fingerprint_value(document),
+            "profile": _fingerprint_value(profile),
+            "paper_skim": _fingerprint_value(paper_skim),
+            "document_tree": (
+                document_tree.to_record() if document_tree is not None else None
+            ),
+        }
+    )
+
+
+def objective_definition_fingerprint(objective: ResearchObjective) -> str:
+    """Return a digest of the Objective fields that shape analysis prompts."""
+
+    return _digest(
+        {
+            name: _fingerprint_value(getattr(objective, name))
+            for name in _OBJECTIVE_DEFINITION_FIELDS
+        }
+    )
+
+
+def model_fingerprint(*clients: Any) -> str:
+    """Return a digest of the model settings the stage clients call with."""
+
+    return _digest(
+        [
+            {
+                "model": getattr(client, "model", None),
+                "base_url": getattr(
+                    getattr(client, "client", None), "base_url", None
+                ),
+                "extraction_mode": getattr(client, "extraction_mode", None),
+                "enable_thinking": getattr(client, "enable_thinking", None),
+                "reasoning_effort": getattr(client, "reasoning_effort", None),
+            }
+            for client in clients
+            if client is not None
+        ]
+    )
+
+
+def stage_key(stage: str, *parts: Any) -> str:
+    return _digest([stage, *parts])
+
+
+class _RouteFailureRecorder:
+    """Route-model proxy that remembers which units fell back deterministically."""
+
+    def __init__(self, evidence_router: ObjectiveEvidenceRouter) -> None:
+        self._evidence_router = evidence_router
+        self.failed_units: set[_UnitKey] = set()
+
+    def route_source(self, payload: Mapping[str, Any]) -> Any:
+        try:
+            return self._evidence_router.route_source(payload)
+        except Exception:
+            paper_frame = payload.get("paper_frame") or {}
+            self.failed_units.add(
+                (
+                    str(paper_frame.get("objective_id") or ""),
+                    str(paper_frame.get("document_id") or ""),
+                )
+            )
+            raise
+
+
+def _read_cached_units(
+    stage_cache: ObjectiveStageCache,
+    *,
+    collection_id: str,
+    stage: str,
+    keys: Mapping[_UnitKey, str],
+    decode: Callable[[Mapping[str, Any]], Any],
+) -> dict[_UnitKey, tuple[Any, ...]]:
+    cached: dict[_UnitKey, tuple[Any, ...]] = {}
+    for unit, key in keys.items():
+        records = stage_cache.read_stage(collection_id, stage, key)
+        if records is not None:
+            cached[unit] = tuple(decode(record) for record in records)
+    return cached
+
+
+def _write_unit(
+    stage_cache: ObjectiveStageCache,
+    *,
+    collection_id: str,
+    stage: str,
+    key: str,
+    values: tuple[Any, ...],
+) -> None:
+    try:
+        stage_cache.write_stage(
+            collection_id,
+            stage,
+            key,
+            tuple(value.to_record() for value in values),
+        )
+    except (OSError, TypeError, ValueError):
+        logger.warning(
+            "Research objective stage cache write failed "
+            "collection_id=%s stage=%s key=%s",
+            collection_id,
+            stage,
+            key,
+            exc_info=True,
+        )
+
+
+def _group_by_unit(values: tuple[Any, ...]) -> dict[_UnitKey, tuple[Any, ...]]:
+    grouped: dict[_UnitKey, list[Any]] = {}
+    for value in values:
+        grouped.setdefault((value.objective_id, value.document_id), []).append(value)
+    return {unit: tuple(items) for unit, items in grouped.items()}
+
+
+def _log_stage_reuse(
+    collection_id: str,
+    *,
+    stage: str,
+    unit_count: int,
+    recomputed_count: int,
+) -> None:
+    logger.info(
+        "Research objective stage reuse collection_id=%s stage=%s "
+        "unit_count=%s reused_units=%s recomputed_units=%s",
+        collection_id,
+        stage,
+        unit_count,
+        unit_count - recomputed_count,
+        recomputed_count,
+    )
+
+
+def _digest(value: Any) -> str:
+    return sha256(
+        json.dumps(
+            value,
+            ensure_ascii=True,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _fingerprint_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _fingerprint_value(getattr(value, field.name))
+            for field in fields(value)
+        }
+    if isinstance(value, Mapping):
+        return {str(key): _fingerprint_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_fingerprint_value(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True, default=str))
+        return items
+    return str(value)
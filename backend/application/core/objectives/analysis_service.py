@@ -13,8 +13,10 @@ from application.core.objectives.research_objective_service import (
     ResearchObjectiveService,
 )
 from domain.core import ObjectiveAnalysis, ResearchObjective
-from domain.ports import ObjectiveRepository
+from domain.ports import ObjectiveRepository, ProgressNotifier
 from infra.llm.usage import capture_llm_usage
+from infra.notifications.progress import objective_analysis_progress_topic
+from infra.tracing.spans import capture_spans, export_chrome_trace, span
 
 
 logger = logging.getLogger(__name__)
@@ -30,9 +32,11 @@ class ObjectiveAnalysisService:
         *,
         objective_repository: ObjectiveRepository,
         research_objective_service: ResearchObjectiveService,
+        progress_notifier: ProgressNotifier | None = None,
     ) -> None:
         self.objective_repository = objective_repository
         self.research_objective_service = research_objective_service
+        self.progress_notifier = progress_notifier
 
     def confirm_objective(self, collection_id: str, objective_id: str) -> dict[str, Any]:
         objective = self.objective_repository.confirm_objective(
@@ -48,6 +52,7 @@ class ObjectiveAnalysisService:
             model_name=None,
             prompt_versions={},
         )
+        self._notify(collection_id, objective_id)
         return self._result(collection_id, objective, analysis=analysis)
 
     def fail_analysis_dispatch(
@@ -67,6 +72,7 @@ class ObjectiveAnalysisService:
             ),
             expected_status="queued",
         )
+        self._notify(collection_id, objective_id)
         return self._result(collection_id, objective, analysis=analysis)
 
     def get_analysis_state(
@@ -272,28 +278,37 @@ class ObjectiveAnalysisService:
             )
             if claimed is None:
                 return self._result(collection_id, objective)
+            self._notify(collection_id, objective_id)
             usage_started_at = perf_counter()
             with (
                 capture_llm_usage() as usage,
                 capture_analysis_diagnostics() as diagnostics,
+                capture_spans() as spans,
             ):
                 try:
-                    artifacts = (
-                        self.research_objective_service.generate_objective_analysis_artifacts(
-                            collection_id,
-                            claimed,
-                            progress_callback=self._build_progress_callback(claimed),
+                    with span("objective_analysis"):
+                        artifacts = (
+                            self.research_objective_service.generate_objective_analysis_artifacts(
+                                collection_id,
+                                claimed,
+                                progress_callback=self._build_progress_callback(claimed),
+                            )
                         )
-                    )
-                    self._validate_artifacts(artifacts)
+                        self._validate_artifacts(artifacts)
                 finally:
+                    export_chrome_trace(
+                        spans,
+                        f"analysis-{collection_id}-{objective_id}-v{analysis_version}",
+                    )
                     claimed = self.objective_repository.update_analysis_execution_stats(
                         collection_id,
                         objective_id,
                         analysis_version,
-                        stats=usage.execution_stats(
-                            duration_ms=round(
-                                (perf_counter() - usage_started_at) * 1000
+                        stats=spans.execution_stats(
+                            usage.execution_stats(
+                                duration_ms=round(
+                                    (perf_counter() - usage_started_at) * 1000
+                                )
                             )
                         ),
                         model_name=usage.model_name,
@@ -308,6 +323,7 @@ class ObjectiveAnalysisService:
                 evidence_records=artifacts.evidence_records,
                 findings=artifacts.findings,
             )
+            self._notify(collection_id, objective_id)
             return self._result(collection_id, objective, analysis=completed)
         except Exception as exc:  # noqa: BLE001
             logger.exception(
@@ -329,6 +345,7 @@ class ObjectiveAnalysisService:
                     error_code=self._error_code(exc),
                     error_message=str(exc) or exc.__class__.__name__,
                 )
+                self._notify(collection_id, objective_id)
             objective = self._require_objective(collection_id, objective_id)
             return self._result(collection_id, objective, analysis=current)
 
@@ -461,9 +478,16 @@ class ObjectiveAnalysisService:
                     str(progress.get("message")) if progress.get("message") else None
                 ),
             )
+            self._notify(analysis.collection_id, analysis.objective_id)
 
         return update
 
+    def _notify(self, collection_id: str, objective_id: str) -> None:
+        if self.progress_notifier is not None:
+            self.progress_notifier.publish(
+                objective_analysis_progress_topic(collection_id, objective_id)
+            )
+
     @staticmethod
     def _safe_int(value: Any) -> int | None:
         try:
@@ -10,8 +10,7 @@ from contextvars import ContextVar
 from time import perf_counter
 from typing import Any
 
-import tiktoken
-from openai import LengthFinishReasonError, OpenAI
+from openai import LengthFinishReasonError
 from pydantic import BaseModel, ValidationError
 
 from application.core.structured_extraction.json_support import (
@@ -21,12 +20,21 @@ from application.core.structured_extraction.json_support import (
     trace_json,
     trace_text,
 )
-from infra.llm.usage import record_llm_completion, record_llm_prompt_version
+from infra.llm.tokenizer import count_text_tokens, encoding_for_model
+from infra.llm.transport import build_default_llm_client
+from infra.llm.usage import (
+    llm_task_type,
+    record_llm_completion,
+    record_llm_prompt_version,
+)
 
 logger = logging.getLogger(__name__)
 
 _EXTRACTION_MODE_JSON_TEXT = "json_text"
 _EXTRACTION_MODE_PROVIDER_PARSE = "provider_parse"
+_PROVIDER_PARSE_TO_JSON_TEXT = (
+    f"{_EXTRACTION_MODE_PROVIDER_PARSE}->{_EXTRACTION_MODE_JSON_TEXT}"
+)
 _DEFAULT_EXTRACTION_MODE = _EXTRACTION_MODE_PROVIDER_PARSE
 _TRACE_TEXT_LIMIT = 8000
 _SUPPORTED_EXTRACTION_MODES = {
@@ -68,9 +76,9 @@ class StructuredResponseClient:
             "structured_response_last_trace",
             default=None,
         )
-        self.client = client or OpenAI(
-            api_key=(api_key or os.getenv("LLM_API_KEY", "").strip() or "not-needed"),
-            base_url=(base_url or os.getenv("LLM_BASE_URL", "").strip() or None),
+        self.client = client or build_default_llm_client(
+            api_key=api_key,
+            base_url=base_url,
         )
 
     def estimate_prompt_tokens(
@@ -88,16 +96,13 @@ class StructuredResponseClient:
             response_model=response_model,
             include_schema=True,
         )
-        try:
-            encoding = tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = encoding_for_model(self.model)
         serialized_messages = json.dumps(
             messages,
             ensure_ascii=False,
             separators=(",", ":"),
         )
-        return len(encoding.encode(serialized_messages))
+        return count_text_tokens(serialized_messages, encoding=encoding)
 
     def complete(
         self,
@@ -127,120 +132,118 @@ class StructuredResponseClient:
         self._last_trace.set(None)
         started_at = perf_counter()
         trace_extraction_mode = self.extraction_mode
-        try:
-            use_provider_parse = (
-                self.extraction_mode == _EXTRACTION_MODE_PROVIDER_PARSE
-                and not force_json_text
-            )
-            if use_provider_parse:
-                try:
-                    parsed, raw_content = self._parse_provider_structured_response(
-                        messages=messages,
-                        response_model=response_model,
-                        max_completion_tokens=max_completion_tokens,
-                    )
-                    if parsed_validator is not None:
-                        validated = parsed_validator(parsed)
-                        if validated is not None:
-                            parsed = validated
-                except LengthFinishReasonError as exc:
-                    if fail_on_output_saturation:
-                        raise StructuredOutputSaturatedError(
-                            "PaperSkim provider output reached the completion-token "
-                            "limit"
-                        ) from exc
-                    logger.warning(
-                        "Objective provider output reached the completion-token limit; "
-                        "retrying with json_text model=%s response_model=%s",
-                        self.model,
-                        response_model.__name__,
-                    )
-                    messages = self._build_messages(
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
-                        response_model=response_model,
-                        include_schema=True,
-                    )
+        with llm_task_type(task_type):
+            try:
+                use_provider_parse = (
+                    self.extraction_mode == _EXTRACTION_MODE_PROVIDER_PARSE
+                    and not force_json_text
+                )
+                if use_provider_parse:
+                    try:
+                        parsed, raw_content = self._parse_provider_structured_response(
+                            messages=messages,
+                            response_model=response_model,
+                            max_completion_tokens=max_completion_tokens,
+                        )
+                        if parsed_validator is not None:
+                            validated = parsed_validator(parsed)
+                            if validated is not None:
+                                parsed = validated
+                    except LengthFinishReasonError as exc:
+                        if fail_on_output_saturation:
+                            raise StructuredOutputSaturatedError(
+                                "PaperSkim provider output reached the "
+                                "completion-token limit"
+                            ) from exc
+                        logger.warning(
+                            "Objective provider output reached the completion-token "
+                            "limit; retrying with json_text model=%s "
+                            "response_model=%s",
+                            self.model,
+                            response_model.__name__,
+                        )
+                        messages = self._build_messages(
+                            system_prompt=system_prompt,
+                            user_prompt=user_prompt,
+                            response_model=response_model,
+                            include_schema=True,
+                        )
+                        parsed, raw_content = parse_json_text(
+                            messages=messages,
+                            response_model=response_model,
+                            max_completion_tokens=max_completion_tokens,
+                        )
+                        trace_extraction_mode = _PROVIDER_PARSE_TO_JSON_TEXT
+                    except Exception as exc:
+                        if validation_error_observer is not None:
+                            validation_error_observer(exc)
+                        logger.warning(
+                            "Objective provider parse failed; retrying with json_text "
+                            "model=%s response_model=%s",
+                            self.model,
+                            response_model.__name__,
+                            exc_info=True,
+                        )
+                        messages = self._build_messages(
+                            system_prompt=system_prompt,
+                            user_prompt=user_prompt,
+                            response_model=response_model,
+                            include_schema=True,
+                        )
+                        messages.append(
+                            {
+                                "role": "user",
+                                "content": (
+                                    "The provider-parsed output failed validation. "
+                                    "Correct this validation error and return only the "
+                                    f"schema-valid JSON object: {str(exc)[:1000]}"
+                                ),
+                            }
+                        )
+                        parsed, raw_content = parse_json_text(
+                            messages=messages,
+                            response_model=response_model,
+                            max_completion_tokens=max_completion_tokens,
+                        )
+                        trace_extraction_mode = _PROVIDER_PARSE_TO_JSON_TEXT
+                else:
+                    if self.extraction_mode == _EXTRACTION_MODE_PROVIDER_PARSE:
+                        if include_schema_for_forced_json:
+                            messages = self._build_messages(
+                                system_prompt=system_prompt,
+                                user_prompt=user_prompt,
+                                response_model=response_model,
+                                include_schema=True,
+                            )
+                        trace_extraction_mode = _EXTRACTION_MODE_JSON_TEXT
                     parsed, raw_content = parse_json_text(
                         messages=messages,
                         response_model=response_model,
                         max_completion_tokens=max_completion_tokens,
                     )
-                    trace_extraction_mode = (
-                        f"{_EXTRACTION_MODE_PROVIDER_PARSE}->{_EXTRACTION_MODE_JSON_TEXT}"
-                    )
-                except Exception as exc:
-                    if validation_error_observer is not None:
-                        validation_error_observer(exc)
-                    logger.warning(
-                        "Objective provider parse failed; retrying with json_text "
-                        "model=%s response_model=%s",
-                        self.model,
-                        response_model.__name__,
-                        exc_info=True,
-                    )
-                    messages = self._build_messages(
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
+            except Exception:
+                elapsed_s = perf_counter() - started_at
+                self._last_trace.set(
+                    self._build_trace(
+                        task_type=task_type,
+                        prompt_version=prompt_version,
                         response_model=response_model,
-                        include_schema=True,
-                    )
-                    messages.append(
-                        {
-                            "role": "user",
-                            "content": (
-                                "The provider-parsed output failed validation. "
-                                "Correct this validation error and return only the "
-                                f"schema-valid JSON object: {str(exc)[:1000]}"
-                            ),
-                        }
-                    )
-                    parsed, raw_content = parse_json_text(
                         messages=messages,
-                        response_model=response_model,
-                        max_completion_tokens=max_completion_tokens,
+                        extraction_mode=trace_extraction_mode,
+                        trace_status="failed",
+                        elapsed_s=elapsed_s,
+                        error="structured extraction failed",
                     )
-                    trace_extraction_mode = (
-                        f"{_EXTRACTION_MODE_PROVIDER_PARSE}->{_EXTRACTION_MODE_JSON_TEXT}"
-                    )
-            else:
-                if self.extraction_mode == _EXTRACTION_MODE_PROVIDER_PARSE:
-                    if include_schema_for_forced_json:
-                        messages = self._build_messages(
-                            system_prompt=system_prompt,
-                            user_prompt=user_prompt,
-                            response_model=response_model,
-                            include_schema=True,
-                        )
-                    trace_extraction_mode = _EXTRACTION_MODE_JSON_TEXT
-                parsed, raw_content = parse_json_text(
-                    messages=messages,
-                    response_model=response_model,
-                    max_completion_tokens=max_completion_tokens,
                 )
-        except Exception:
-            elapsed_s = perf_counter() - started_at
-            self._last_trace.set(
-                self._build_trace(
-                    task_type=task_type,
-                    prompt_version=prompt_version,
-                    response_model=response_model,
-                    messages=messages,
-                    extraction_mode=trace_extraction_mode,
-                    trace_status="failed",
-                    elapsed_s=elapsed_s,
-                    error="structured extraction failed",
+                logger.exception(
+                    "Objective extraction failed mode=%s model=%s "
+                    "response_model=%s elapsed_s=%.3f validated=false",
+                    self.extraction_mode,
+                    self.model,
+                    response_model.__name__,
+                    elapsed_s,
                 )
-            )
-            logger.exception(
-                "Objective extraction failed mode=%s model=%s "
-                "response_model=%s elapsed_s=%.3f validated=false",
-                self.extraction_mode,
-                self.model,
-                response_model.__name__,
-                elapsed_s,
-            )
-            raise
+                raise
         elapsed_s = perf_counter() - started_at
         self._last_trace.set(
             self._build_trace(
@@ -431,8 +431,16 @@ class ObjectiveCandidateService:
         left: Iterable[str],
         right: Iterable[str],
     ) -> _Compatibility:
-        left_keys = cls._known_material_keys(left)
-        right_keys = cls._known_material_keys(right)
+        return cls._material_key_compatibility(
+            cls._known_material_keys(left),
+            cls._known_material_keys(right),
+        )
+
+    @staticmethod
+    def _material_key_compatibility(
+        left_keys: frozenset[str],
+        right_keys: frozenset[str],
+    ) -> _Compatibility:
         if not left_keys and not right_keys:
             return _Compatibility.COMPATIBLE
         if not left_keys or not right_keys:
@@ -1057,10 +1065,24 @@ class ObjectiveCandidateService:
         )
         for axis_type, values in axis_candidates.items():
             candidates = [
-                (left, right)
-                for left, right in combinations(values, 2)
-                if cls._axis_pair_might_be_equivalent(axis_type, left, right)
-                or cls._axis_relation_key(axis_type, left, right)
+                (values[left_position], values[right_position])
+                for left_position, right_position in sorted(
+                    cls._indexed_axis_candidate_positions(
+                        axis_type,
+                        values,
+                        supported_cross_paper_pairs=supported_cross_paper_pairs,
+                    )
+                )
+                if cls._axis_pair_might_be_equivalent(
+                    axis_type,
+                    values[left_position],
+                    values[right_position],
+                )
+                or cls._axis_relation_key(
+                    axis_type,
+                    values[left_position],
+                    values[right_position],
+                )
                 in supported_cross_paper_pairs
             ]
             candidates.sort(
@@ -1079,6 +1101,61 @@ class ObjectiveCandidateService:
                 pairs[pair_id] = (axis_type, left, right)
         return pairs
 
+    @classmethod
+    def _indexed_axis_candidate_positions(
+        cls,
+        axis_type: str,
+        values: list[str],
+        *,
+        supported_cross_paper_pairs: frozenset[AxisPair],
+    ) -> set[tuple[int, int]]:
+        """Return every value-position pair that may need pair classification.
+
+        Blocking keys cover each branch of `_axis_pair_might_be_equivalent` and
+        the supported cross-paper pairs, so callers verify only these pairs
+        instead of every combination of collection axis values.
+        """
+
+        positions_by_block: dict[str, list[int]] = {}
+        positions_by_record_key: dict[str, list[int]] = {}
+        for position, value in enumerate(values):
+            positions_by_record_key.setdefault(
+                cls._axis_record_key(value), []
+            ).append(position)
+            block_keys = {
+                f"identity:{identity}"
+                for identity in (cls._axis_identity(value),)
+                if identity
+            }
+            if property_label := property_matching.normalize_property_label(value):
+                block_keys.add(f"property:{property_label}")
+            if axis_type == "material":
+                block_keys.update(
+                    f"grade:{grade}" for grade in cls._material_grade_keys(value)
+                )
+            for block_key in block_keys:
+                positions_by_block.setdefault(block_key, []).append(position)
+
+        candidate_positions: set[tuple[int, int]] = {
+            (left_position, right_position)
+            for block_positions in positions_by_block.values()
+            for left_position, right_position in combinations(block_positions, 2)
+        }
+        if axis_type != "material":
+            candidate_positions.update(
+                property_matching.axis_alias_candidate_pairs(values)
+            )
+        for supported_axis_type, left_key, right_key in supported_cross_paper_pairs:
+            if supported_axis_type != axis_type:
+                continue
+            candidate_positions.update(
+                (min(left_position, right_position), max(left_position, right_position))
+                for left_position in positions_by_record_key.get(left_key, ())
+                for right_position in positions_by_record_key.get(right_key, ())
+                if left_position != right_position
+            )
+        return candidate_positions
+
     @classmethod
     def _variable_axis_observations(
         cls,
@@ -1170,16 +1247,27 @@ class ObjectiveCandidateService:
     ) -> frozenset[AxisPair]:
         indexed_occurrences: dict[
             tuple[str, str],
-            dict[str, list[tuple[str, PaperStudy, str]]],
+            dict[str, dict[tuple[str, frozenset[str]], tuple[int, str]]],
         ] = {}
         indexed_outcomes: dict[
             tuple[str, str],
-            dict[str, list[tuple[str, PaperStudy, str]]],
+            dict[str, dict[tuple[str, frozenset[str]], tuple[int, str]]],
         ] = {}
-        for document_id, study, relationship in relationship_inventory.values():
+        material_keys_by_scope: dict[tuple[str, ...], frozenset[str]] = {}
+        for occurrence_position, (document_id, study, relationship) in enumerate(
+            relationship_inventory.values()
+        ):
             outcome_key = cls._axis_identity(relationship.outcome)
             if not outcome_key:
                 continue
+            material_keys = material_keys_by_scope.get(study.material_scope)
+            if material_keys is None:
+                material_keys = cls._known_material_keys(study.material_scope)
+                material_keys_by_scope[study.material_scope] = material_keys
+            # Occurrences with the same document and material keys are
+            # interchangeable for compatibility, so each bucket keeps only the
+            # first occurrence of every such class.
+            occurrence_class = (document_id, material_keys)
             for factor in relationship.varied_factors:
                 factor_key = cls._axis_record_key(factor)
                 if not factor_key:
@@ -1187,58 +1275,79 @@ class ObjectiveCandidateService:
                 for topic_hint in cls._variable_topic_hints(factor):
                     indexed_occurrences.setdefault(
                         (outcome_key, topic_hint), {}
-                    ).setdefault(factor_key, []).append(
-                        (document_id, study, factor)
+                    ).setdefault(factor_key, {}).setdefault(
+                        occurrence_class,
+                        (occurrence_position, factor),
                     )
                 for outcome_hint in cls._outcome_identity_hints(
                     relationship.outcome
                 ):
                     indexed_outcomes.setdefault(
                         (cls._axis_identity(factor), outcome_hint), {}
-                    ).setdefault(outcome_key, []).append(
-                        (document_id, study, relationship.outcome)
+                    ).setdefault(outcome_key, {}).setdefault(
+                        occurrence_class,
+                        (occurrence_position, relationship.outcome),
                     )
 
+        compatibility_cache: dict[tuple[frozenset[str], frozenset[str]], bool] = {}
+
+        def first_compatible_pair(
+            left_occurrences: Mapping[tuple[str, frozenset[str]], tuple[int, str]],
+            right_occurrences: Mapping[tuple[str, frozenset[str]], tuple[int, str]],
+        ) -> tuple[str, str] | None:
+            for (left_document_id, left_material_keys), (
+                _left_position,
+                left_value,
+            ) in left_occurrences.items():
+                right_candidates = []
+                for (right_document_id, right_material_keys), (
+                    right_position,
+                    right_value,
+                ) in right_occurrences.items():
+                    if left_document_id == right_document_id:
+                        continue
+                    cache_key = (left_material_keys, right_material_keys)
+                    compatible = compatibility_cache.get(cache_key)
+                    if compatible is None:
+                        compatible = (
+                            cls._material_key_compatibility(
+                                left_material_keys,
+                                right_material_keys,
+                            )
+                            is not _Compatibility.INCOMPATIBLE
+                        )
+                        compatibility_cache[cache_key] = compatible
+                    if compatible:
+                        right_candidates.append((right_position, right_value))
+                if right_candidates:
+                    return left_value, min(right_candidates)[1]
+            return None
+
         supported: set[AxisPair] = set()
         for occurrences_by_factor in indexed_occurrences.values():
-            for left_records, right_records in combinations(
-                occurrences_by_factor.values(), 2
-            ):
-                compatible_pair = next(
-                    (
-                        (left_factor, right_factor)
-                        for left_document_id, left_study, left_factor in left_records
-                        for right_document_id, right_study, right_factor in right_records
-                        if left_document_id != right_document_id
-                        and cls._context_collection_compatibility(
-                            left_study.material_scope,
-                            right_study.material_scope,
-                        )
-                        is not _Compatibility.INCOMPATIBLE
-                    ),
-                    None,
+            for (left_key, left_occurrences), (
+                right_key,
+                right_occurrences,
+            ) in combinations(occurrences_by_factor.items(), 2):
+                if cls._axis_relation_key("variable", left_key, right_key) in (
+                    supported
+                ):
+                    continue
+                compatible_pair = first_compatible_pair(
+                    left_occurrences,
+                    right_occurrences,
                 )
                 if compatible_pair is not None:
                     supported.add(
                         cls._axis_relation_key("variable", *compatible_pair)
                     )
         for occurrences_by_outcome in indexed_outcomes.values():
-            for left_records, right_records in combinations(
+            for left_occurrences, right_occurrences in combinations(
                 occurrences_by_outcome.values(), 2
             ):
-                compatible_pair = next(
-                    (
-                        (left_outcome, right_outcome)
-                        for left_document_id, left_study, left_outcome in left_records
-                        for right_document_id, right_study, right_outcome in right_records
-                        if left_document_id != right_document_id
-                        and cls._context_collection_compatibility(
-                            left_study.material_scope,
-                            right_study.material_scope,
-                        )
-                        is not _Compatibility.INCOMPATIBLE
-                    ),
-                    None,
+                compatible_pair = first_compatible_pair(
+                    left_occurrences,
+                    right_occurrences,
                 )
                 if compatible_pair is not None:
                     supported.add(
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
 from typing import Any
 
 from domain.core import ResearchObjective
 
 
+# Axis labels repeat across every relationship in a collection; normalization is
+# pure, so discovery memoizes it instead of re-running the regexes per pair.
+_AXIS_TEXT_CACHE_SIZE = 16384
+
 # Materials-science outcome hints used to match broad Objectives to measurements.
 _BROAD_OUTCOME_EXPANSIONS = {
     "densification": ("relative density",),
@@ -284,6 +289,11 @@ _CHARACTERIZATION_METHOD_PROPERTIES = frozenset(
 
 
 def normalize_property_label(value: Any) -> str | None:
+    return _normalize_property_label_text(str(value or "").strip())
+
+
+@lru_cache(maxsize=_AXIS_TEXT_CACHE_SIZE)
+def _normalize_property_label_text(value: str) -> str | None:
     text = _label_without_unit_suffix(value)
     text = text.replace("_", " ").replace("-", " ").strip()
     normalized = " ".join(text.split()).casefold()
@@ -463,6 +473,11 @@ def axis_key_set(*values: Any) -> set[str]:
 
 
 def axis_key(value: Any) -> str:
+    return _axis_key_text(str(value or "").strip())
+
+
+@lru_cache(maxsize=_AXIS_TEXT_CACHE_SIZE)
+def _axis_key_text(value: str) -> str:
     text = _label_without_unit_suffix(value).casefold()
     if text.endswith(")") and "(" in text:
         base, _, suffix = text.rpartition("(")
@@ -503,6 +518,106 @@ def axis_alias_matches_canonical(alias: str, canonical: str) -> bool:
     )
 
 
+def axis_alias_candidate_pairs(values: Sequence[str]) -> set[tuple[int, int]]:
+    """Return ordered index pairs that may match as aliases in either direction.
+
+    The result is a superset of the pairs accepted by
+    `axis_alias_matches_canonical`, found through token, acronym, and
+    close-token indexes instead of comparing every label with every other label.
+    """
+
+    keys = [axis_key(value) for value in values]
+    token_sets = [axis_tokens(key) for key in keys]
+    positions_by_key: dict[str, list[int]] = {}
+    positions_by_token: dict[str, list[int]] = {}
+    positions_by_short_key: dict[str, list[int]] = {}
+    for position, (key, tokens) in enumerate(zip(keys, token_sets)):
+        if not key:
+            continue
+        positions_by_key.setdefault(key, []).append(position)
+        for token in tokens:
+            positions_by_token.setdefault(token, []).append(position)
+        if key.isalpha() and 2 <= len(key) <= 8:
+            positions_by_short_key.setdefault(key, []).append(position)
+    close_tokens = _CloseAxisTokenIndex(positions_by_token)
+
+    pairs: set[tuple[int, int]] = set()
+
+    def add(position: int, others: Iterable[int]) -> None:
+        pairs.update(
+            (min(position, other), max(position, other))
+            for other in others
+            if other != position
+        )
+
+    for position, (key, tokens) in enumerate(zip(keys, token_sets)):
+        if not key:
+            continue
+        add(position, positions_by_key[key])
+        acronym = "".join(token[0] for token in key.split() if token)
+        add(position, positions_by_short_key.get(acronym, ()))
+        if not tokens:
+            continue
+        # Any ceil(|tokens| / 4) + 1 tokens must include one shared token when
+        # the overlap reaches 75% of the larger token set.
+        ordered_tokens = sorted(
+            tokens,
+            key=lambda token: (len(positions_by_token[token]), token),
+        )
+        prefix_length = len(tokens) - (3 * len(tokens) + 3) // 4 + 1
+        for token in ordered_tokens[:prefix_length]:
+            add(position, positions_by_token[token])
+        # Equal-length token sets where every token is close must pair the
+        # rarest token with some close token of the other label.
+        add(
+            position,
+            (
+                other
+                for close_token in close_tokens.close_to(ordered_tokens[0])
+                for other in positions_by_token[close_token]
+                if len(token_sets[other]) == len(tokens)
+            ),
+        )
+    return pairs
+
+
+class _CloseAxisTokenIndex:
+    """Lazily resolve close axis tokens within one bounded token vocabulary."""
+
+    def __init__(self, vocabulary: Iterable[str]) -> None:
+        self._tokens_by_length: dict[int, list[str]] = {}
+        self._density_tokens: list[str] = []
+        for token in vocabulary:
+            self._tokens_by_length.setdefault(len(token), []).append(token)
+            if token.startswith("dens"):
+                self._density_tokens.append(token)
+        self._close: dict[str, frozenset[str]] = {}
+
+    def close_to(self, token: str) -> frozenset[str]:
+        cached = self._close.get(token)
+        if cached is not None:
+            return cached
+        close = {token}
+        if token.startswith("dens"):
+            close.update(self._density_tokens)
+        if len(token) >= 6:
+            matcher = SequenceMatcher(b=token)
+            for length in range(max(6, len(token) - 2), len(token) + 3):
+                for candidate in self._tokens_by_length.get(length, ()):
+                    if candidate in close:
+                        continue
+                    matcher.set_seq1(candidate)
+                    if matcher.real_quick_ratio() < 0.88 or matcher.quick_ratio() < 0.88:
+                        continue
+                    if _axis_token_is_close(candidate, token) or _axis_token_is_close(
+                        token, candidate
+                    ):
+                        close.add(candidate)
+        result = frozenset(close)
+        self._close[token] = result
+        return result
+
+
 def axis_values_match(left: str, right: str) -> bool:
     if axis_alias_matches_canonical(left, right):
         return True
@@ -668,13 +783,18 @@ def axis_label_is_mentioned(text: str, axis: str) -> bool:
 
 
 def axis_tokens(value: str) -> set[str]:
-    return {
-        _normalize_axis_token(token)
+    return set(_axis_token_set(value))
+
+
+@lru_cache(maxsize=_AXIS_TEXT_CACHE_SIZE)
+def _axis_token_set(value: str) -> frozenset[str]:
+    return frozenset(
+        normalized
         for token in (
             value.replace("_", " ").replace("-", " ").replace("/", " ").split()
         )
-        if _normalize_axis_token(token)
-    }
+        if (normalized := _normalize_axis_token(token))
+    )
 
 
 def _contextual_property_variant_match(
@@ -770,6 +890,7 @@ def _label_without_unit_suffix(value: Any) -> str:
     return re.sub(r"\s*(?:\[[^\]]*\]|\([^)]*\))\s*$", "", text).strip()
 
 
+@lru_cache(maxsize=_AXIS_TEXT_CACHE_SIZE * 4)
 def _axis_token_is_close(left: str, right: str) -> bool:
     if left == right:
         return True
@@ -792,6 +913,7 @@ def _is_acronym_match(left: str, right: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=_AXIS_TEXT_CACHE_SIZE)
 def _normalize_axis_token(token: str) -> str:
     normalized = "".join(char for char in token.casefold() if char.isalnum())
     if len(normalized) > 5 and normalized.endswith("ing"):
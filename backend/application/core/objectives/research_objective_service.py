@@ -30,6 +30,9 @@ from application.core.objectives.analysis.source_screening import (
     ObjectiveSourceScreener,
     screen_sources,
 )
+from application.core.objectives.analysis.stage_reuse import (
+    run_source_stages_with_reuse,
+)
 from application.core.objectives.discovery.axis_equivalence import (
     ResearchAxisEquivalenceClassifier,
 )
@@ -50,6 +53,7 @@ from application.core.objectives.paper_skim_service import PaperSkimService
 from application.core.paper_facts.extraction import PaperFactsExtractor
 from application.source.artifact_input_service import load_document_tree
 from application.source.collection_service import CollectionService
+from application.source.lexical_search_service import SourceLexicalSearchService
 from domain.core import (
     Finding,
     ObjectiveAnalysis,
@@ -63,10 +67,13 @@ from domain.core import (
 )
 from domain.ports import (
     ObjectiveRepository,
+    ObjectiveStageCache,
     PaperFactRepository,
     SourceArtifactRepository,
 )
 from domain.source import SourceDocument
+from infra.source.retrieval import LexicalIndex
+from infra.tracing.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +127,8 @@ class ResearchObjectiveService:
         paper_study_window_extractor: PaperStudyWindowExtractor | None = None,
         paper_signal_reconciler: PaperSignalReconciler | None = None,
         paper_facts_extractor: PaperFactsExtractor | None = None,
+        objective_stage_cache: ObjectiveStageCache | None = None,
+        lexical_search_service: SourceLexicalSearchService | None = None,
     ) -> None:
         self.collection_service = collection_service
         self._response_client = response_client
@@ -130,6 +139,8 @@ class ResearchObjectiveService:
         self._paper_study_window_extractor = paper_study_window_extractor
         self._paper_signal_reconciler = paper_signal_reconciler
         self._paper_facts_extractor = paper_facts_extractor
+        self.objective_stage_cache = objective_stage_cache
+        self.lexical_search_service = lexical_search_service
         self.paper_fact_repository = paper_fact_repository
         self.objective_repository = objective_repository
         self.source_artifact_repository = source_artifact_repository
@@ -346,10 +357,11 @@ class ResearchObjectiveService:
             raise ResearchObjectiveNotFoundError(collection_id, analysis.objective_id)
         if active_objective.active_analysis_version != analysis.analysis_version:
             raise ValueError("analysis is not the active objective version")
-        objective_inputs = self._build_objective_analysis_inputs(
-            collection_id,
-            build_id=analysis.source_build_id,
-        )
+        with span("load_inputs"):
+            objective_inputs = self._build_objective_analysis_inputs(
+                collection_id,
+                build_id=analysis.source_build_id,
+            )
         source_objective = (
             active_objective
             if active_objective.origin == "chat_assisted"
@@ -381,74 +393,107 @@ class ResearchObjectiveService:
         if self._objective_source_extractor is None:
             self._objective_source_extractor = ObjectiveSourceExtractor(response_client)
 
-        screened_sources = screen_sources(
-            collection_id=collection_id,
-            source_screener=self._objective_source_screener,
-            objectives=(objective,),
-            paper_skims=objective_inputs["paper_skims"],
-            documents=objective_inputs["documents"],
-            profiles_by_document_id=objective_inputs["profiles_by_document_id"],
-            blocks_by_document_id=objective_inputs["blocks_by_document_id"],
-            tables_by_document_id=objective_inputs["tables_by_document_id"],
-            document_trees_by_document_id=objective_inputs[
-                "document_trees_by_document_id"
-            ],
-            progress_callback=progress_callback,
-        )
-        source_inspection_routes = route_sources(
-            collection_id=collection_id,
-            evidence_router=self._objective_evidence_router,
-            objectives=(objective,),
-            objective_paper_frames=screened_sources,
-            blocks_by_document_id=objective_inputs["blocks_by_document_id"],
-            tables_by_document_id=objective_inputs["tables_by_document_id"],
-            document_trees_by_document_id=objective_inputs[
-                "document_trees_by_document_id"
-            ],
-            progress_callback=progress_callback,
-        )
-        validated_source_facts = extract_and_validate_source_facts(
-            collection_id=collection_id,
-            source_extractor=self._objective_source_extractor,
-            paper_facts_extractor=self._paper_facts_extractor,
-            objectives=(objective,),
-            objective_paper_frames=screened_sources,
-            objective_evidence_routes=source_inspection_routes,
-            blocks_by_document_id=objective_inputs["blocks_by_document_id"],
-            tables_by_document_id=objective_inputs["tables_by_document_id"],
-            document_trees_by_document_id=objective_inputs[
-                "document_trees_by_document_id"
-            ],
-            table_cells_by_document_id=objective_inputs[
-                "table_cells_by_document_id"
-            ],
-            progress_callback=progress_callback,
-        )
-        paper_evidence_drafts = reconstruct_paper_experiments(
-            collection_id=collection_id,
-            source_facts=validated_source_facts,
-            paper_skims=objective_inputs["paper_skims"],
-            objectives=(objective,),
-        )
-        evidence_records, contributions = materialize_evidence(
-            collection_id=collection_id,
-            analysis=analysis,
-            objective=objective,
-            drafts=paper_evidence_drafts,
-            paper_skims=objective_inputs["paper_skims"],
-            frames=screened_sources,
-            routes=source_inspection_routes,
-            blocks_by_document_id=objective_inputs["blocks_by_document_id"],
-            tables_by_document_id=objective_inputs["tables_by_document_id"],
-            figures_by_document_id=objective_inputs["figures_by_document_id"],
-        )
-        findings = self.finding_synthesis_service.synthesize(
-            collection_id=collection_id,
-            objective=objective,
-            analysis=analysis,
-            contributions=contributions,
-            evidence_records=evidence_records,
-        )
+        with span("source_stages"):
+            if self.objective_stage_cache is not None:
+                (
+                    screened_sources,
+                    source_inspection_routes,
+                    validated_source_facts,
+                ) = run_source_stages_with_reuse(
+                    collection_id=collection_id,
+                    stage_cache=self.objective_stage_cache,
+                    source_screener=self._objective_source_screener,
+                    evidence_router=self._objective_evidence_router,
+                    source_extractor=self._objective_source_extractor,
+                    paper_facts_extractor=self._paper_facts_extractor,
+                    objectives=(objective,),
+                    paper_skims=objective_inputs["paper_skims"],
+                    documents=objective_inputs["documents"],
+                    profiles_by_document_id=objective_inputs["profiles_by_document_id"],
+                    blocks_by_document_id=objective_inputs["blocks_by_document_id"],
+                    tables_by_document_id=objective_inputs["tables_by_document_id"],
+                    table_cells_by_document_id=objective_inputs[
+                        "table_cells_by_document_id"
+                    ],
+                    document_trees_by_document_id=objective_inputs[
+                        "document_trees_by_document_id"
+                    ],
+                    progress_callback=progress_callback,
+                    lexical_index=objective_inputs["lexical_index"],
+                )
+            else:
+                screened_sources = screen_sources(
+                    collection_id=collection_id,
+                    source_screener=self._objective_source_screener,
+                    objectives=(objective,),
+                    paper_skims=objective_inputs["paper_skims"],
+                    documents=objective_inputs["documents"],
+                    profiles_by_document_id=objective_inputs["profiles_by_document_id"],
+                    blocks_by_document_id=objective_inputs["blocks_by_document_id"],
+                    tables_by_document_id=objective_inputs["tables_by_document_id"],
+                    document_trees_by_document_id=objective_inputs[
+                        "document_trees_by_document_id"
+                    ],
+                    progress_callback=progress_callback,
+                )
+                source_inspection_routes = route_sources(
+                    collection_id=collection_id,
+                    evidence_router=self._objective_evidence_router,
+                    objectives=(objective,),
+                    objective_paper_frames=screened_sources,
+                    blocks_by_document_id=objective_inputs["blocks_by_document_id"],
+                    tables_by_document_id=objective_inputs["tables_by_document_id"],
+                    document_trees_by_document_id=objective_inputs[
+                        "document_trees_by_document_id"
+                    ],
+                    progress_callback=progress_callback,
+                    lexical_index=objective_inputs["lexical_index"],
+                )
+                validated_source_facts = extract_and_validate_source_facts(
+                    collection_id=collection_id,
+                    source_extractor=self._objective_source_extractor,
+                    paper_facts_extractor=self._paper_facts_extractor,
+                    objectives=(objective,),
+                    objective_paper_frames=screened_sources,
+                    objective_evidence_routes=source_inspection_routes,
+                    blocks_by_document_id=objective_inputs["blocks_by_document_id"],
+                    tables_by_document_id=objective_inputs["tables_by_document_id"],
+                    document_trees_by_document_id=objective_inputs[
+                        "document_trees_by_document_id"
+                    ],
+                    table_cells_by_document_id=objective_inputs[
+                        "table_cells_by_document_id"
+                    ],
+                    progress_callback=progress_callback,
+                )
+        with span("reconstruct_experiments"):
+            paper_evidence_drafts = reconstruct_paper_experiments(
+                collection_id=collection_id,
+                source_facts=validated_source_facts,
+                paper_skims=objective_inputs["paper_skims"],
+                objectives=(objective,),
+            )
+        with span("materialize_evidence"):
+            evidence_records, contributions = materialize_evidence(
+                collection_id=collection_id,
+                analysis=analysis,
+                objective=objective,
+                drafts=paper_evidence_drafts,
+                paper_skims=objective_inputs["paper_skims"],
+                frames=screened_sources,
+                routes=source_inspection_routes,
+                blocks_by_document_id=objective_inputs["blocks_by_document_id"],
+                tables_by_document_id=objective_inputs["tables_by_document_id"],
+                figures_by_document_id=objective_inputs["figures_by_document_id"],
+            )
+        with span("synthesize_findings"):
+            findings = self.finding_synthesis_service.synthesize(
+                collection_id=collection_id,
+                objective=objective,
+                analysis=analysis,
+                contributions=contributions,
+                evidence_records=evidence_records,
+            )
         return ObjectiveAnalysisArtifacts(
             contributions=contributions,
             evidence_records=evidence_records,
@@ -469,6 +514,11 @@ class ResearchObjectiveService:
         if facts.research_objectives_ready and facts.paper_skims:
             return {
                 **source_inputs,
+                "lexical_index": self._load_lexical_index(
+                    collection_id,
+                    build_id=build_id,
+                    documents=source_inputs["documents"],
+                ),
                 "paper_skims": facts.paper_skims,
                 "research_objectives": facts.research_objectives,
             }
@@ -526,6 +576,30 @@ class ResearchObjectiveService:
             "response_client": self._get_response_client(),
         }
 
+    def _load_lexical_index(
+        self,
+        collection_id: str,
+        *,
+        build_id: str,
+        documents: tuple[SourceDocument, ...],
+    ) -> LexicalIndex | None:
+        if self.lexical_search_service is None:
+            return None
+        try:
+            return self.lexical_search_service.read_index(
+                collection_id,
+                build_id,
+                documents=documents,
+            )
+        except (OSError, ValueError):
+            logger.warning(
+                "Source lexical index unavailable; routing without lexical narrowing collection_id=%s build_id=%s",
+                collection_id,
+                build_id,
+                exc_info=True,
+            )
+            return None
+
     def _get_response_client(self) -> StructuredResponseClient:
         if self._response_client is None:
             self._response_client = build_default_structured_response_client()
@@ -6,9 +6,7 @@ import os
 from time import perf_counter
 from typing import Any, TypeVar
 
-from openai import OpenAI
 from pydantic import BaseModel, ValidationError
-import tiktoken
 
 from application.core.paper_facts.prompts import (
     PAPER_FACT_TABLE_BATCH_PROMPT_VERSION,
@@ -30,7 +28,14 @@ from application.core.structured_extraction.json_support import (
     trace_json,
     trace_text,
 )
-from infra.llm.usage import record_llm_completion, record_llm_prompt_version
+from infra.llm.tokenizer import count_text_tokens, encoding_for_model
+from infra.llm.transport import build_default_llm_client
+from infra.llm.usage import (
+    llm_task_type,
+    record_llm_completion,
+    record_llm_prompt_version,
+)
+from infra.tracing.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -70,16 +75,17 @@ class PaperFactsExtractor:
             os.getenv("LLM_REASONING_EFFORT", "").strip() or None
         )
         self.last_trace: dict[str, Any] | None = None
-        self.client = client or OpenAI(
-            api_key=(api_key or os.getenv("LLM_API_KEY", "").strip() or "not-needed"),
-            base_url=(base_url or os.getenv("LLM_BASE_URL", "").strip() or None),
+        self.client = client or build_default_llm_client(
+            api_key=api_key,
+            base_url=base_url,
         )
 
     def extract_text_window_mentions(
         self,
         payload: dict[str, Any],
     ) -> StructuredTextWindowMentions:
-        system_prompt, user_prompt = build_text_window_extraction_prompt(payload)
+        with span("build_prompt"):
+            system_prompt, user_prompt = build_text_window_extraction_prompt(payload)
         return self._extract(
             task_type="paper_fact_text_window",
             prompt_version=PAPER_FACT_TEXT_WINDOW_PROMPT_VERSION,
@@ -92,7 +98,8 @@ class PaperFactsExtractor:
         self,
         payload: dict[str, Any],
     ) -> StructuredTableBatchMentions:
-        system_prompt, user_prompt = build_table_batch_mentions_prompt(payload)
+        with span("build_prompt"):
+            system_prompt, user_prompt = build_table_batch_mentions_prompt(payload)
         return self._extract(
             task_type="paper_fact_table_batch",
             prompt_version=PAPER_FACT_TABLE_BATCH_PROMPT_VERSION,
@@ -131,14 +138,10 @@ class PaperFactsExtractor:
             StructuredTableMatrixRepair,
             include_schema=True,
         )
-        try:
-            encoding = tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        return len(
-            encoding.encode(
-                json.dumps(messages, ensure_ascii=False, separators=(",", ":"))
-            )
+        encoding = encoding_for_model(self.model)
+        return count_text_tokens(
+            json.dumps(messages, ensure_ascii=False, separators=(",", ":")),
+            encoding=encoding,
         )
 
     def _extract(
@@ -161,59 +164,60 @@ class PaperFactsExtractor:
         self.last_trace = None
         started_at = perf_counter()
         trace_mode = self.extraction_mode
-        try:
-            if self.extraction_mode == _PROVIDER_PARSE:
-                try:
-                    parsed, raw_content = self._request_provider_parsed(
-                        messages,
-                        response_model,
-                        max_completion_tokens=provider_max_completion_tokens,
-                    )
-                except Exception:
-                    logger.warning(
-                        "Paper-fact provider parse failed; retrying with json_text "
-                        "model=%s response_model=%s",
-                        self.model,
-                        response_model.__name__,
-                        exc_info=True,
-                    )
-                    messages = self._build_messages(
-                        system_prompt,
-                        user_prompt,
-                        response_model,
-                        include_schema=True,
-                    )
+        with llm_task_type(task_type):
+            try:
+                if self.extraction_mode == _PROVIDER_PARSE:
+                    try:
+                        parsed, raw_content = self._request_provider_parsed(
+                            messages,
+                            response_model,
+                            max_completion_tokens=provider_max_completion_tokens,
+                        )
+                    except Exception:
+                        logger.warning(
+                            "Paper-fact provider parse failed; retrying with json_text "
+                            "model=%s response_model=%s",
+                            self.model,
+                            response_model.__name__,
+                            exc_info=True,
+                        )
+                        messages = self._build_messages(
+                            system_prompt,
+                            user_prompt,
+                            response_model,
+                            include_schema=True,
+                        )
+                        parsed, raw_content = self._request_json_text(
+                            messages,
+                            response_model,
+                        )
+                        trace_mode = f"{_PROVIDER_PARSE}->{_JSON_TEXT}"
+                else:
                     parsed, raw_content = self._request_json_text(
                         messages,
                         response_model,
                     )
-                    trace_mode = f"{_PROVIDER_PARSE}->{_JSON_TEXT}"
-            else:
-                parsed, raw_content = self._request_json_text(
-                    messages,
-                    response_model,
+            except Exception:
+                elapsed_s = perf_counter() - started_at
+                self.last_trace = self._build_trace(
+                    response_model=response_model,
+                    task_type=task_type,
+                    prompt_version=prompt_version,
+                    messages=messages,
+                    extraction_mode=trace_mode,
+                    trace_status="failed",
+                    elapsed_s=elapsed_s,
+                    error="structured extraction failed",
                 )
-        except Exception:
-            elapsed_s = perf_counter() - started_at
-            self.last_trace = self._build_trace(
-                response_model=response_model,
-                task_type=task_type,
-                prompt_version=prompt_version,
-                messages=messages,
-                extraction_mode=trace_mode,
-                trace_status="failed",
-                elapsed_s=elapsed_s,
-                error="structured extraction failed",
-            )
-            logger.exception(
-                "Paper-fact extraction failed mode=%s model=%s "
-                "response_model=%s elapsed_s=%.3f validated=false",
-                self.extraction_mode,
-                self.model,
-                response_model.__name__,
-                elapsed_s,
-            )
-            raise
+                logger.exception(
+                    "Paper-fact extraction failed mode=%s model=%s "
+                    "response_model=%s elapsed_s=%.3f validated=false",
+                    self.extraction_mode,
+                    self.model,
+                    response_model.__name__,
+                    elapsed_s,
+                )
+                raise
         elapsed_s = perf_counter() - started_at
         self.last_trace = self._build_trace(
             response_model=response_model,
@@ -281,25 +285,26 @@ class PaperFactsExtractor:
                     raise RuntimeError(
                         "structured extraction returned empty response content"
                     )
-                payload = load_json_payload(extract_json_object(raw_content))
-                try:
-                    return response_model.model_validate(payload), raw_content
-                except ValidationError:
-                    if isinstance(payload, dict):
-                        extra_keys = set(payload) - set(response_model.model_fields)
-                        if extra_keys - {"confidence"}:
-                            raise
-                        filtered_payload = {
-                            key: value
-                            for key, value in payload.items()
-                            if key in response_model.model_fields
-                        }
-                        if filtered_payload != payload:
-                            return (
-                                response_model.model_validate(filtered_payload),
-                                raw_content,
-                            )
-                    raise
+                with span("validate"):
+                    payload = load_json_payload(extract_json_object(raw_content))
+                    try:
+                        return response_model.model_validate(payload), raw_content
+                    except ValidationError:
+                        if isinstance(payload, dict):
+                            extra_keys = set(payload) - set(response_model.model_fields)
+                            if extra_keys - {"confidence"}:
+                                raise
+                            filtered_payload = {
+                                key: value
+                                for key, value in payload.items()
+                                if key in response_model.model_fields
+                            }
+                            if filtered_payload != payload:
+                                return (
+                                    response_model.model_validate(filtered_payload),
+                                    raw_content,
+                                )
+                        raise
             except (
                 RuntimeError,
                 ValueError,
@@ -72,6 +72,7 @@ from domain.shared.enums import (
     TRACEABILITY_STATUS_PARTIAL,
 )
 from domain.shared.record_normalization import normalize_record_value
+from infra.tracing.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -567,88 +568,90 @@ class PaperFactsService:
         build_id: str,
     ) -> dict[str, tuple[dict[str, Any], ...]]:
         self.collection_service.get_collection(collection_id)
-        try:
-            profiles = self.document_profile_service.read_document_profiles(
-                collection_id,
-                build_id=build_id,
-            )
-        except DocumentProfilesNotReadyError as exc:
-            raise PaperFactsNotReadyError(collection_id) from exc
+        with span("load_inputs"):
+            try:
+                profiles = self.document_profile_service.read_document_profiles(
+                    collection_id,
+                    build_id=build_id,
+                )
+            except DocumentProfilesNotReadyError as exc:
+                raise PaperFactsNotReadyError(collection_id) from exc
 
-        try:
-            documents, text_units = load_collection_inputs(
-                collection_id,
-                self.source_artifact_repository,
-                build_id=build_id,
-            )
-            blocks = load_blocks_artifact(
-                collection_id,
-                self.source_artifact_repository,
-                build_id=build_id,
-            )
-            tables = load_tables_artifact(
-                collection_id,
-                self.source_artifact_repository,
-                build_id=build_id,
-            )
-            table_rows = load_table_rows_artifact(
-                collection_id,
-                self.source_artifact_repository,
-                build_id=build_id,
-            )
-            table_cells = load_table_cells_artifact(
-                collection_id,
-                self.source_artifact_repository,
-                build_id=build_id,
-            )
-        except FileNotFoundError as exc:
-            raise PaperFactsNotReadyError(collection_id) from exc
-
-        document_records = build_document_records(documents, text_units)
-        all_text_windows_by_doc = self._build_text_windows_by_document(blocks)
-        tables_by_doc = self._group_tables_by_document(tables)
-        table_rows_by_doc = self._group_table_rows_by_document(table_rows)
-        table_cells_by_doc = self._group_table_cells_by_document(table_cells)
-        profile_by_doc = {
-            profile.document_id: profile.to_record()
-            for profile in profiles
-        }
-        total_documents = len(document_records)
-        total_extraction_units = 0
-        selected_text_windows_by_doc: dict[str, list[dict[str, Any]]] = {}
-        selected_table_rows_by_doc: dict[str, list[dict[str, Any]]] = {}
-        selected_table_row_batches_by_doc: dict[str, list[list[dict[str, Any]]]] = {}
-        for candidate_row in document_records:
-            candidate_document_id = str(candidate_row.get("paper_id") or "")
-            candidate_profile = profile_by_doc.get(candidate_document_id)
-            if not candidate_profile:
-                continue
-            candidate_text_windows = all_text_windows_by_doc.get(candidate_document_id, [])
-            candidate_table_rows = table_rows_by_doc.get(candidate_document_id, [])
-            grouped_row_cells = self._group_table_cells_by_row(
-                table_cells_by_doc.get(candidate_document_id, [])
-            )
-            selected_text_windows = self._select_text_windows_for_extraction(
-                text_windows=candidate_text_windows,
-                profile=candidate_profile,
-                has_table_rows=bool(candidate_table_rows),
-            )
-            if str(candidate_profile.get("doc_type") or "") == DOC_TYPE_REVIEW:
-                selected_table_rows: list[dict[str, Any]] = []
-            else:
-                selected_table_rows = self._select_table_rows_for_extraction(
-                    table_rows=candidate_table_rows,
-                    grouped_row_cells=grouped_row_cells,
+            try:
+                documents, text_units = load_collection_inputs(
+                    collection_id,
+                    self.source_artifact_repository,
+                    build_id=build_id,
                 )
-            selected_table_row_batches = self._batch_table_rows_for_extraction(
-                selected_table_rows
-            )
-            selected_text_windows_by_doc[candidate_document_id] = selected_text_windows
-            selected_table_rows_by_doc[candidate_document_id] = selected_table_rows
-            selected_table_row_batches_by_doc[candidate_document_id] = (
-                selected_table_row_batches
-            )
-            total_extraction_units += len(selected_text_windows) + len(selected_table_row_batches)
+                blocks = load_blocks_artifact(
+                    collection_id,
+                    self.source_artifact_repository,
+                    build_id=build_id,
+                )
+                tables = load_tables_artifact(
+                    collection_id,
+                    self.source_artifact_repository,
+                    build_id=build_id,
+                )
+                table_rows = load_table_rows_artifact(
+                    collection_id,
+                    self.source_artifact_repository,
+                    build_id=build_id,
+                )
+                table_cells = load_table_cells_artifact(
+                    collection_id,
+                    self.source_artifact_repository,
+                    build_id=build_id,
+                )
+            except FileNotFoundError as exc:
+                raise PaperFactsNotReadyError(collection_id) from exc
+
+        with span("select_units"):
+            document_records = build_document_records(documents, text_units)
+            all_text_windows_by_doc = self._build_text_windows_by_document(blocks)
+            tables_by_doc = self._group_tables_by_document(tables)
+            table_rows_by_doc = self._group_table_rows_by_document(table_rows)
+            table_cells_by_doc = self._group_table_cells_by_document(table_cells)
+            profile_by_doc = {
+                profile.document_id: profile.to_record()
+                for profile in profiles
+            }
+            total_documents = len(document_records)
+            total_extraction_units = 0
+            selected_text_windows_by_doc: dict[str, list[dict[str, Any]]] = {}
+            selected_table_rows_by_doc: dict[str, list[dict[str, Any]]] = {}
+            selected_table_row_batches_by_doc: dict[str, list[list[dict[str, Any]]]] = {}
+            for candidate_row in document_records:
+                candidate_document_id = str(candidate_row.get("paper_id") or "")
+                candidate_profile = profile_by_doc.get(candidate_document_id)
+                if not candidate_profile:
+                    continue
+                candidate_text_windows = all_text_windows_by_doc.get(candidate_document_id, [])
+                candidate_table_rows = table_rows_by_doc.get(candidate_document_id, [])
+                grouped_row_cells = self._group_table_cells_by_row(
+                    table_cells_by_doc.get(candidate_document_id, [])
+                )
+                selected_text_windows = self._select_text_windows_for_extraction(
+                    text_windows=candidate_text_windows,
+                    profile=candidate_profile,
+                    has_table_rows=bool(candidate_table_rows),
+                )
+                if str(candidate_profile.get("doc_type") or "") == DOC_TYPE_REVIEW:
+                    selected_table_rows: list[dict[str, Any]] = []
+                else:
+                    selected_table_rows = self._select_table_rows_for_extraction(
+                        table_rows=candidate_table_rows,
+                        grouped_row_cells=grouped_row_cells,
+                    )
+                selected_table_row_batches = self._batch_table_rows_for_extraction(
+                    selected_table_rows
+                )
+                selected_text_windows_by_doc[candidate_document_id] = selected_text_windows
+                selected_table_rows_by_doc[candidate_document_id] = selected_table_rows
+                selected_table_row_batches_by_doc[candidate_document_id] = (
+                    selected_table_row_batches
+                )
+                total_extraction_units += len(selected_text_windows) + len(selected_table_row_batches)
         completed_extraction_units = 0
         logger.info(
             "Paper facts extraction started collection_id=%s document_count=%s block_count=%s table_count=%s table_row_count=%s table_cell_count=%s total_extraction_units=%s",
@@ -728,18 +731,19 @@ class PaperFactsService:
             doc_condition_start = len(test_condition_rows)
             doc_baseline_start = len(baseline_rows)
             doc_measurement_start = len(measurement_rows)
-            text_window_jobs = [
-                {
-                    "text_window": text_window,
-                    "payload": self._build_text_window_extraction_payload(
-                        title=title,
-                        source_filename=source_filename,
-                        profile=profile,
-                        text_window=text_window,
-                    ),
-                }
-                for text_window in doc_text_windows
-            ]
+            with span("build_payloads"):
+                text_window_jobs = [
+                    {
+                        "text_window": text_window,
+                        "payload": self._build_text_window_extraction_payload(
+                            title=title,
+                            source_filename=source_filename,
+                            profile=profile,
+                            text_window=text_window,
+                        ),
+                    }
+                    for text_window in doc_text_windows
+                ]
             for text_window_position, job in enumerate(text_window_jobs, start=1):
                 text_window = job["text_window"]
                 window_id = self._normalize_scalar_text(text_window.get("window_id")) or ""
@@ -796,21 +800,22 @@ class PaperFactsService:
                 )
                 text_window_elapsed_s = result["elapsed_s"]
                 text_window_elapsed_ms = round(text_window_elapsed_s * 1000)
-                self._materialize_bundle(
-                    bundle=bundle,
-                    collection_id=collection_id,
-                    document_id=document_id,
-                    text_window=text_window,
-                    table_id=None,
-                    row_index=None,
-                    evidence_anchor_rows=evidence_anchor_rows,
-                    method_fact_rows=method_fact_rows,
-                    sample_variant_rows=sample_variant_rows,
-                    test_condition_rows=test_condition_rows,
-                    baseline_rows=baseline_rows,
-                    measurement_rows=measurement_rows,
-                    document_state=document_state,
-                )
+                with span("materialize"):
+                    self._materialize_bundle(
+                        bundle=bundle,
+                        collection_id=collection_id,
+                        document_id=document_id,
+                        text_window=text_window,
+                        table_id=None,
+                        row_index=None,
+                        evidence_anchor_rows=evidence_anchor_rows,
+                        method_fact_rows=method_fact_rows,
+                        sample_variant_rows=sample_variant_rows,
+                        test_condition_rows=test_condition_rows,
+                        baseline_rows=baseline_rows,
+                        measurement_rows=measurement_rows,
+                        document_state=document_state,
+                    )
                 completed_extraction_units += 1
                 document_completed_units += 1
                 logger.info(
@@ -837,37 +842,38 @@ class PaperFactsService:
                     max(document_total_units - document_completed_units, 0),
                 )
 
-            table_batch_jobs = []
-            for batch_rows in doc_table_row_batches:
-                if not batch_rows:
-                    continue
-                first_row = batch_rows[0]
-                table_id = str(first_row.get("table_id") or "")
-                table_context = doc_tables_by_id.get(table_id)
-                row_cells_by_index = {
-                    self._safe_int(row.get("row_index")): grouped_row_cells.get(
-                        (table_id, self._safe_int(row.get("row_index"))),
-                        [],
-                    )
-                    for row in batch_rows
-                }
-                table_batch_jobs.append(
-                    {
-                        "rows": batch_rows,
-                        "row_cells_by_index": row_cells_by_index,
-                        "table_id": table_id,
-                        "table_context": table_context,
-                        "payload": self._build_table_batch_extraction_payload(
-                            title=title,
-                            source_filename=source_filename,
-                            profile=profile,
-                            table_context=table_context,
-                            table_rows=batch_rows,
-                            row_cells_by_index=row_cells_by_index,
-                            text_windows=all_doc_text_windows,
-                        ),
+            with span("build_payloads"):
+                table_batch_jobs = []
+                for batch_rows in doc_table_row_batches:
+                    if not batch_rows:
+                        continue
+                    first_row = batch_rows[0]
+                    table_id = str(first_row.get("table_id") or "")
+                    table_context = doc_tables_by_id.get(table_id)
+                    row_cells_by_index = {
+                        self._safe_int(row.get("row_index")): grouped_row_cells.get(
+                            (table_id, self._safe_int(row.get("row_index"))),
+                            [],
+                        )
+                        for row in batch_rows
                     }
-                )
+                    table_batch_jobs.append(
+                        {
+                            "rows": batch_rows,
+                            "row_cells_by_index": row_cells_by_index,
+                            "table_id": table_id,
+                            "table_context": table_context,
+                            "payload": self._build_table_batch_extraction_payload(
+                                title=title,
+                                source_filename=source_filename,
+                                profile=profile,
+                                table_context=table_context,
+                                table_rows=batch_rows,
+                                row_cells_by_index=row_cells_by_index,
+                                text_windows=all_doc_text_windows,
+                            ),
+                        }
+                    )
             for table_batch_position, job in enumerate(table_batch_jobs, start=1):
                 rows = job["rows"]
                 table_id = job["table_id"]
@@ -956,21 +962,22 @@ class PaperFactsService:
                         row_cells=row_cells,
                         table_context=job["table_context"],
                     )
-                    self._materialize_bundle(
-                        bundle=bundle,
-                        collection_id=collection_id,
-                        document_id=document_id,
-                        text_window=None,
-                        table_id=table_id,
-                        row_index=row_index,
-                        evidence_anchor_rows=evidence_anchor_rows,
-                        method_fact_rows=method_fact_rows,
-                        sample_variant_rows=sample_variant_rows,
-                        test_condition_rows=test_condition_rows,
-                        baseline_rows=baseline_rows,
-                        measurement_rows=measurement_rows,
-                        document_state=document_state,
-                    )
+                    with span("materialize"):
+                        self._materialize_bundle(
+                            bundle=bundle,
+                            collection_id=collection_id,
+                            document_id=document_id,
+                            text_window=None,
+                            table_id=table_id,
+                            row_index=row_index,
+                            evidence_anchor_rows=evidence_anchor_rows,
+                            method_fact_rows=method_fact_rows,
+                            sample_variant_rows=sample_variant_rows,
+                            test_condition_rows=test_condition_rows,
+                            baseline_rows=baseline_rows,
+                            measurement_rows=measurement_rows,
+                            document_state=document_state,
+                        )
                     batch_method_count += len(bundle.method_facts)
                     batch_variant_count += len(bundle.sample_variants)
                     batch_condition_count += len(bundle.test_conditions)
@@ -1035,95 +1042,97 @@ class PaperFactsService:
                 max(total_extraction_units - completed_extraction_units, 0),
             )
 
-        evidence_anchors = self._normalize_evidence_anchor_records(
-            evidence_anchor_rows,
-        )
-        method_facts = self._normalize_method_fact_records(
-            method_fact_rows,
-            collection_id,
-        )
-        sample_variants = self._normalize_sample_variant_records(
-            sample_variant_rows,
-            collection_id,
-        )
-        sample_variants, removed_variant_ids = self._filter_generic_text_sample_variants(
-            sample_variants
-        )
-        test_conditions = self._normalize_test_condition_records(
-            test_condition_rows,
-            collection_id,
-        )
-        test_conditions = self._filter_superseded_local_test_conditions(
-            test_conditions
-        )
-        baseline_references = self._normalize_baseline_reference_records(
-            baseline_rows,
-            collection_id,
-        )
-        measurement_results = self._normalize_measurement_result_records(
-            measurement_rows,
-            collection_id,
-        )
-        measurement_results = self._clear_removed_variant_ids_from_measurements(
-            measurement_results,
-            removed_variant_ids,
-        )
-        measurement_results = self._attach_document_test_condition_ids_to_measurements(
-            measurement_results=measurement_results,
-            test_conditions=test_conditions,
-        )
-        if method_facts and not measurement_results:
-            logger.warning(
-                "Paper facts extraction produced zero measurement_results collection_id=%s method_fact_count=%s raw_measurement_count=%s",
+        with span("normalize"):
+            evidence_anchors = self._normalize_evidence_anchor_records(
+                evidence_anchor_rows,
+            )
+            method_facts = self._normalize_method_fact_records(
+                method_fact_rows,
+                collection_id,
+            )
+            sample_variants = self._normalize_sample_variant_records(
+                sample_variant_rows,
+                collection_id,
+            )
+            sample_variants, removed_variant_ids = self._filter_generic_text_sample_variants(
+                sample_variants
+            )
+            test_conditions = self._normalize_test_condition_records(
+                test_condition_rows,
+                collection_id,
+            )
+            test_conditions = self._filter_superseded_local_test_conditions(
+                test_conditions
+            )
+            baseline_references = self._normalize_baseline_reference_records(
+                baseline_rows,
+                collection_id,
+            )
+            measurement_results = self._normalize_measurement_result_records(
+                measurement_rows,
                 collection_id,
-                len(method_facts),
-                len(measurement_rows),
             )
+            measurement_results = self._clear_removed_variant_ids_from_measurements(
+                measurement_results,
+                removed_variant_ids,
+            )
+            measurement_results = self._attach_document_test_condition_ids_to_measurements(
+                measurement_results=measurement_results,
+                test_conditions=test_conditions,
+            )
+            if method_facts and not measurement_results:
+                logger.warning(
+                    "Paper facts extraction produced zero measurement_results collection_id=%s method_fact_count=%s raw_measurement_count=%s",
+                    collection_id,
+                    len(method_facts),
+                    len(measurement_rows),
+                )
 
-        characterization = self._build_characterization_observations(
-            collection_id=collection_id,
-            method_facts=method_facts,
-            evidence_anchors=evidence_anchors,
-            text_windows_by_doc=all_text_windows_by_doc,
-            sample_variants=sample_variants,
-            measurement_results=measurement_results,
-        )
-        characterization = self._attach_variant_ids_to_characterization(
-            characterization,
-            sample_variants,
-        )
-        structure_features = self._build_structure_features(characterization)
-        sample_variants = self._attach_structure_feature_ids_to_variants(
-            sample_variants,
-            structure_features,
-        )
-        baseline_references = self._attach_variant_ids_to_baseline_references(
-            baseline_references,
-            sample_variants,
-        )
-        measurement_results = self._attach_context_to_measurement_results(
-            measurement_results=measurement_results,
-            characterization=characterization,
-            structure_features=structure_features,
-        )
-        measurement_results = self._deduplicate_measurement_result_records(
-            measurement_results
-        )
-        self.paper_fact_repository.replace_paper_facts(
-            collection_id,
-            build_id,
-            self._build_paper_fact_set(
-                document_profiles=profiles,
-                evidence_anchors=evidence_anchors,
+            characterization = self._build_characterization_observations(
+                collection_id=collection_id,
                 method_facts=method_facts,
+                evidence_anchors=evidence_anchors,
+                text_windows_by_doc=all_text_windows_by_doc,
                 sample_variants=sample_variants,
-                test_conditions=test_conditions,
-                baseline_references=baseline_references,
+                measurement_results=measurement_results,
+            )
+            characterization = self._attach_variant_ids_to_characterization(
+                characterization,
+                sample_variants,
+            )
+            structure_features = self._build_structure_features(characterization)
+            sample_variants = self._attach_structure_feature_ids_to_variants(
+                sample_variants,
+                structure_features,
+            )
+            baseline_references = self._attach_variant_ids_to_baseline_references(
+                baseline_references,
+                sample_variants,
+            )
+            measurement_results = self._attach_context_to_measurement_results(
                 measurement_results=measurement_results,
                 characterization=characterization,
                 structure_features=structure_features,
-            ),
-        )
+            )
+            measurement_results = self._deduplicate_measurement_result_records(
+                measurement_results
+            )
+        with span("persist"):
+            self.paper_fact_repository.replace_paper_facts(
+                collection_id,
+                build_id,
+                self._build_paper_fact_set(
+                    document_profiles=profiles,
+                    evidence_anchors=evidence_anchors,
+                    method_facts=method_facts,
+                    sample_variants=sample_variants,
+                    test_conditions=test_conditions,
+                    baseline_references=baseline_references,
+                    measurement_results=measurement_results,
+                    characterization=characterization,
+                    structure_features=structure_features,
+                ),
+            )
         logger.info(
             "Paper facts extraction finished collection_id=%s evidence_anchors=%s method_facts=%s sample_variants=%s test_conditions=%s baselines=%s measurement_results=%s characterization_observations=%s structure_features=%s",
             collection_id,
@@ -4314,23 +4323,26 @@ class PaperFactsService:
     ) -> list[dict[str, Any]]:
         if not jobs:
             return []
-        if len(jobs) == 1:
-            return [self._execute_extraction_job(extractor=extractor, job=jobs[0], kind=kind)]
-
-        with ThreadPoolExecutor(
-            max_workers=min(max_extraction_concurrency, len(jobs)),
-        ) as executor:
-            futures = [
-                executor.submit(
-                    copy_context().run,
-                    self._execute_extraction_job,
-                    extractor=extractor,
-                    job=job,
-                    kind=kind,
-                )
-                for job in jobs
-            ]
-            return [future.result() for future in futures]
+        with span(f"extract_{kind}", job_count=len(jobs)):
+            if len(jobs) == 1:
+                return [
+                    self._execute_extraction_job(extractor=extractor, job=jobs[0], kind=kind)
+                ]
+
+            with ThreadPoolExecutor(
+                max_workers=min(max_extraction_concurrency, len(jobs)),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        copy_context().run,
+                        self._execute_extraction_job,
+                        extractor=extractor,
+                        job=job,
+                        kind=kind,
+                    )
+                    for job in jobs
+                ]
+                return [future.result() for future in futures]
 
     def _execute_extraction_job(
         self,
@@ -4341,12 +4353,13 @@ class PaperFactsService:
     ) -> dict[str, Any]:
         started_at = perf_counter()
         try:
-            if kind == "text_window":
-                parsed = extractor.extract_text_window_mentions(job["payload"])
-            elif kind == "table_batch":
-                parsed = extractor.extract_table_batch_mentions(job["payload"])
-            else:
-                raise ValueError(f"unsupported extraction job kind: {kind}")
+            with span("job"):
+                if kind == "text_window":
+                    parsed = extractor.extract_text_window_mentions(job["payload"])
+                elif kind == "table_batch":
+                    parsed = extractor.extract_table_batch_mentions(job["payload"])
+                else:
+                    raise ValueError(f"unsupported extraction job kind: {kind}")
         except Exception as exc:
             return {
                 "parsed": None,
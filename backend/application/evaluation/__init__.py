@@ -7,6 +7,7 @@ from application.evaluation.prediction_snapshot_service import (
 )
 from application.evaluation.finding_feedback_service import (
     FindingFeedbackService,
+    FindingSourceIndex,
 )
 from application.evaluation.finding_review_import_service import (
     FindingReviewImportService,
@@ -17,5 +18,6 @@ __all__ = [
     "EvaluationGoldService",
     "EvaluationPredictionSnapshotService",
     "FindingFeedbackService",
+    "FindingSourceIndex",
     "FindingReviewImportService",
 ]
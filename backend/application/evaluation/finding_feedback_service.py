@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha1, sha256
+from threading import Lock
 from typing import Any, Mapping
 
 from domain.core import Finding, ObjectiveEvidence
@@ -13,8 +16,27 @@ from domain.ports import FindingReviewRepository, ObjectiveRepository
 DATASET_SCHEMA_VERSION = "objective_finding_dataset.v2"
 TRAINING_SCHEMA_VERSION = "objective_finding_training.v2"
 TRAINING_PROMPT_VERSION = "objective_finding_training_prompt.v2"
-_FINDING_PAGE_SIZE = 200
 _EVIDENCE_PAGE_SIZE = 500
+_PUBLISHED_FINGERPRINT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class _PublishedFindingFingerprint:
+    finding_fingerprint: str
+    evidence_fingerprint: str
+    evidence_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class FindingSourceIndex:
+    """Current review-aware fingerprints for one Objective's published Findings.
+
+    `analysis_version` is None when the Objective has no published analysis,
+    in which case every source snapshot checked against it is stale.
+    """
+
+    analysis_version: int | None
+    findings: Mapping[str, Mapping[str, Any]]
 
 
 class FindingFeedbackService:
@@ -28,6 +50,12 @@ class FindingFeedbackService:
     ) -> None:
         self.review_repository = review_repository
         self.objective_repository = objective_repository
+        # Published analysis versions are immutable, so their fingerprints
+        # never need invalidation; only review state is read per check.
+        self._published_fingerprints: OrderedDict[
+            tuple[str, str, int], dict[str, _PublishedFindingFingerprint]
+        ] = OrderedDict()
+        self._published_fingerprints_lock = Lock()
 
     def record_feedback(
         self,
@@ -276,24 +304,138 @@ class FindingFeedbackService:
             "items": dataset["items"],
         }
 
+    def source_snapshot_index(
+        self,
+        *,
+        collection_id: str,
+        objective_id: str,
+    ) -> FindingSourceIndex:
+        """Fingerprint lookup equivalent to the items of `export_dataset`."""
+
+        objective = self.objective_repository.read_objective(
+            collection_id, objective_id
+        )
+        version = objective.published_analysis_version if objective else None
+        if version is None:
+            return FindingSourceIndex(analysis_version=None, findings={})
+        published = self._published_finding_fingerprints(
+            collection_id,
+            objective_id,
+            version,
+        )
+        feedback_by_finding, curations_by_finding = self._review_state(
+            collection_id,
+            objective_id,
+            version,
+        )
+        findings: dict[str, dict[str, Any]] = {}
+        for finding_id, fingerprints in published.items():
+            _label, use_status, current_curation = _dataset_status(
+                tuple(feedback_by_finding.get(finding_id, ())),
+                tuple(curations_by_finding.get(finding_id, ())),
+            )
+            findings[finding_id] = {
+                "finding_id": finding_id,
+                "analysis_version": version,
+                "dataset_use_status": use_status,
+                "finding_fingerprint": (
+                    _fingerprint(
+                        "finding.v2",
+                        current_curation.curated_finding.to_record(),
+                    )
+                    if current_curation is not None
+                    else fingerprints.finding_fingerprint
+                ),
+                "evidence_fingerprint": fingerprints.evidence_fingerprint,
+                "evidence_ids": list(fingerprints.evidence_ids),
+            }
+        return FindingSourceIndex(analysis_version=version, findings=findings)
+
     def source_snapshot_validity(
         self,
         *,
         collection_id: str,
         objective_id: str,
         source_findings: tuple[Mapping[str, Any], ...] | list[Mapping[str, Any]],
+        source_index: FindingSourceIndex | None = None,
     ) -> tuple[str, list[str]]:
-        try:
-            dataset = self.export_dataset(
+        """Compare stored Finding snapshots with the current published state.
+
+        Pass `source_index` to check several snapshots of one Objective
+        against a single lookup.
+        """
+
+        if source_index is None:
+            source_index = self.source_snapshot_index(
                 collection_id=collection_id,
                 objective_id=objective_id,
             )
-        except (FileNotFoundError, ValueError):
-            return "stale", ["source_dataset_unavailable"]
-        items = dataset.get("items") if isinstance(dataset, Mapping) else None
-        if not isinstance(items, list):
+        if source_index.analysis_version is None:
             return "stale", ["source_dataset_unavailable"]
-        return _source_snapshot_validity(source_findings, items)
+        return _source_snapshot_validity(source_findings, source_index.findings)
+
+    def _published_finding_fingerprints(
+        self,
+        collection_id: str,
+        objective_id: str,
+        analysis_version: int,
+    ) -> dict[str, _PublishedFindingFingerprint]:
+        key = (collection_id, objective_id, analysis_version)
+        with self._published_fingerprints_lock:
+            cached = self._published_fingerprints.get(key)
+            if cached is not None:
+                self._published_fingerprints.move_to_end(key)
+                return cached
+        fingerprints = {
+            finding.finding_id: _PublishedFindingFingerprint(
+                finding_fingerprint=_fingerprint("finding.v2", finding.to_record()),
+                evidence_fingerprint=_fingerprint(
+                    "evidence.v2",
+                    [item.to_record() for item in evidence],
+                ),
+                evidence_ids=tuple(item.evidence_id for item in evidence),
+            )
+            for finding, evidence in (
+                self.objective_repository.iter_findings_with_evidence(
+                    collection_id,
+                    objective_id,
+                    analysis_version,
+                )
+            )
+        }
+        with self._published_fingerprints_lock:
+            self._published_fingerprints[key] = fingerprints
+            self._published_fingerprints.move_to_end(key)
+            while (
+                len(self._published_fingerprints) > _PUBLISHED_FINGERPRINT_CACHE_SIZE
+            ):
+                self._published_fingerprints.popitem(last=False)
+        return fingerprints
+
+    def _review_state(
+        self,
+        collection_id: str,
+        objective_id: str,
+        analysis_version: int,
+    ) -> tuple[
+        dict[str, list[FindingFeedback]],
+        dict[str, list[FindingCuration]],
+    ]:
+        feedback_by_finding: dict[str, list[FindingFeedback]] = defaultdict(list)
+        for item in self.review_repository.list_feedback(
+            collection_id,
+            objective_id,
+            analysis_version,
+        ):
+            feedback_by_finding[item.finding_id].append(item)
+        curations_by_finding: dict[str, list[FindingCuration]] = defaultdict(list)
+        for item in self.review_repository.list_curations(
+            collection_id,
+            objective_id,
+            analysis_version,
+        ):
+            curations_by_finding[item.finding_id].append(item)
+        return feedback_by_finding, curations_by_finding
 
     def _dataset_items(
         self,
@@ -308,25 +450,20 @@ class FindingFeedbackService:
             collection_id, objective_id
         )
         assert objective is not None
-        findings = self._all_findings(collection_id, objective_id, analysis_version)
+        feedback_by_finding, curations_by_finding = self._review_state(
+            collection_id,
+            objective_id,
+            analysis_version,
+        )
         result: list[dict[str, Any]] = []
-        for finding in findings:
-            evidence = self._finding_evidence(finding)
-            feedback = self.review_repository.list_feedback(
-                collection_id,
-                objective_id,
-                analysis_version,
-                finding.finding_id,
-            )
-            curations = self.review_repository.list_curations(
-                collection_id,
-                objective_id,
-                analysis_version,
-                finding.finding_id,
-            )
+        for finding, evidence in self.objective_repository.iter_findings_with_evidence(
+            collection_id,
+            objective_id,
+            analysis_version,
+        ):
             sample_label, use_status, current_curation = _dataset_status(
-                feedback,
-                curations,
+                tuple(feedback_by_finding.get(finding.finding_id, ())),
+                tuple(curations_by_finding.get(finding.finding_id, ())),
             )
             if label_status is not None and sample_label != label_status:
                 continue
@@ -395,29 +532,6 @@ class FindingFeedbackService:
             )
         return result
 
-    def _all_findings(
-        self,
-        collection_id: str,
-        objective_id: str,
-        analysis_version: int,
-    ) -> tuple[Finding, ...]:
-        result: list[Finding] = []
-        offset = 0
-        while True:
-            page, total = self.objective_repository.list_findings(
-                collection_id,
-                objective_id,
-                analysis_version,
-                offset=offset,
-                limit=_FINDING_PAGE_SIZE,
-            )
-            result.extend(page)
-            offset += len(page)
-            if offset >= total:
-                return tuple(result)
-            if not page:
-                raise RuntimeError("Finding pagination ended before the reported total")
-
     def _finding_evidence(self, finding: Finding) -> tuple[ObjectiveEvidence, ...]:
         result: list[ObjectiveEvidence] = []
         offset = 0
@@ -488,16 +602,10 @@ def _dataset_status(
 
 def _source_snapshot_validity(
     source_findings: tuple[Mapping[str, Any], ...] | list[Mapping[str, Any]],
-    dataset_items: list[Any],
+    current_by_finding_id: Mapping[str, Mapping[str, Any]],
 ) -> tuple[str, list[str]]:
     if not source_findings:
         return "stale", ["source_finding_snapshot_missing"]
-    current_by_finding_id = {
-        finding_id: item
-        for item in dataset_items
-        if isinstance(item, Mapping)
-        and (finding_id := _text(item.get("finding_id")))
-    }
     reasons: list[str] = []
     for source_finding in source_findings:
         finding_id = _text(source_finding.get("finding_id"))
@@ -520,7 +628,7 @@ def _source_snapshot_validity(
             source_finding.get("evidence_fingerprint")
         ):
             reasons.append("source_evidence_changed")
-        if _dataset_evidence_ids(current) != _strings(
+        if _strings(current.get("evidence_ids")) != _strings(
             source_finding.get("evidence_ids")
         ):
             reasons.append("source_evidence_ids_changed")
@@ -529,14 +637,6 @@ def _source_snapshot_validity(
     return "current", []
 
 
-def _dataset_evidence_ids(item: Mapping[str, Any]) -> tuple[str, ...]:
-    return _strings(
-        evidence.get("evidence_id")
-        for evidence in item.get("evidence", [])
-        if isinstance(evidence, Mapping)
-    )
-
-
 def _strings(values: Any) -> tuple[str, ...]:
     if isinstance(values, (str, bytes)) or values is None:
         values = ()
@@ -637,6 +737,7 @@ def _now_iso() -> str:
 __all__ = [
     "DATASET_SCHEMA_VERSION",
     "FindingFeedbackService",
+    "FindingSourceIndex",
     "TRAINING_PROMPT_VERSION",
     "TRAINING_SCHEMA_VERSION",
 ]
@@ -104,87 +104,58 @@ class EvaluationPredictionSnapshotService:
             if analysis_version is None:
                 continue
             published_analysis_count += 1
-            finding_offset = 0
-            while True:
-                findings, finding_total = self.objective_repository.list_findings(
+            for finding, evidence_records in (
+                self.objective_repository.iter_findings_with_evidence(
                     collection_id,
                     objective.objective_id,
                     analysis_version,
-                    offset=finding_offset,
-                    limit=200,
                 )
-                if not findings:
-                    break
-                for finding in findings:
-                    evidence_records: list[Any] = []
-                    evidence_offset = 0
-                    while True:
-                        evidence_page, evidence_total = (
-                            self.objective_repository.list_evidence(
-                                collection_id,
-                                objective.objective_id,
-                                analysis_version,
-                                finding_id=finding.finding_id,
-                                offset=evidence_offset,
-                                limit=500,
-                            )
+            ):
+                for evidence in evidence_records:
+                    exported_evidence_keys.add(
+                        (
+                            objective.objective_id,
+                            analysis_version,
+                            evidence.evidence_id,
                         )
-                        if not evidence_page:
-                            break
-                        evidence_records.extend(evidence_page)
-                        evidence_offset += len(evidence_page)
-                        if evidence_offset >= evidence_total:
-                            break
-                    for evidence in evidence_records:
-                        exported_evidence_keys.add(
-                            (
-                                objective.objective_id,
-                                analysis_version,
-                                evidence.evidence_id,
-                            )
-                        )
-                    contributing_documents = finding.contributing_document_ids
-                    item_key = (
-                        f"{objective.objective_id}:v{analysis_version}:"
-                        f"{finding.finding_id}"
-                    )
-                    payload = finding.to_record()
-                    payload["evidence"] = [
-                        evidence.to_record() for evidence in evidence_records
-                    ]
-                    source_refs = tuple(
-                        {
-                            "evidence_id": evidence.evidence_id,
-                            "document_id": evidence.document_id,
-                            "source_kind": evidence.source_kind,
-                            "source_ref": evidence.source_ref,
-                            "source_excerpt": evidence.source_excerpt,
-                            "page_numbers": list(evidence.page_numbers),
-                            "related_source_refs": [
-                                dict(locator)
-                                for locator in evidence.related_source_refs
-                            ],
-                        }
-                        for evidence in evidence_records
                     )
-                    items.append(
-                        EvaluationPredictionItem(
-                            item_id=item_key,
-                            document_id=(
-                                contributing_documents[0]
-                                if len(contributing_documents) == 1
-                                else ""
-                            ),
-                            family="objective_findings",
-                            item_key=item_key,
-                            payload=payload,
-                            source_refs=source_refs,
-                            confidence=finding.certainty,
-                        )
+                contributing_documents = finding.contributing_document_ids
+                item_key = (
+                    f"{objective.objective_id}:v{analysis_version}:{finding.finding_id}"
+                )
+                payload = finding.to_record()
+                payload["evidence"] = [
+                    evidence.to_record() for evidence in evidence_records
+                ]
+                source_refs = tuple(
+                    {
+                        "evidence_id": evidence.evidence_id,
+                        "document_id": evidence.document_id,
+                        "source_kind": evidence.source_kind,
+                        "source_ref": evidence.source_ref,
+                        "source_excerpt": evidence.source_excerpt,
+                        "page_numbers": list(evidence.page_numbers),
+                        "related_source_refs": [
+                            dict(locator) for locator in evidence.related_source_refs
+                        ],
+                    }
+                    for evidence in evidence_records
+                )
+                items.append(
+                    EvaluationPredictionItem(
+                        item_id=item_key,
+                        document_id=(
+                            contributing_documents[0]
+                            if len(contributing_documents) == 1
+                            else ""
+                        ),
+                        family="objective_findings",
+                        item_key=item_key,
+                        payload=payload,
+                        source_refs=source_refs,
+                        confidence=finding.certainty,
                     )
-                finding_offset += len(findings)
-                if finding_offset >= finding_total:
-                    break
+                )
         return items, {
             "published_objective_analyses": published_analysis_count,
             "objective_findings": len(items),
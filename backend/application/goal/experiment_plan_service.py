@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from hashlib import sha1
 
-from application.evaluation import FindingFeedbackService
+from application.evaluation import FindingFeedbackService, FindingSourceIndex
 from application.goal.protocol_contract import (
     proposed_design_choices_are_source_independent,
     ved_design_is_scientifically_consistent,
@@ -74,12 +74,21 @@ class ExperimentPlanService:
         objective_id: str,
     ) -> tuple[ExperimentPlanRecord, ...]:
         plans = self.repository.list_plans(collection_id, objective_id)
-        return tuple(
-            self._with_source_validity(plan)
-            if _is_historical_grounded_plan(plan)
-            else plan
-            for plan in plans
-        )
+        source_index: FindingSourceIndex | None = None
+        result: list[ExperimentPlanRecord] = []
+        for plan in plans:
+            if not _is_historical_grounded_plan(plan):
+                result.append(plan)
+                continue
+            # Every plan in the list shares one Objective, so one lookup
+            # serves the whole page.
+            if source_index is None:
+                source_index = self.finding_feedback_service.source_snapshot_index(
+                    collection_id=collection_id,
+                    objective_id=objective_id,
+                )
+            result.append(self._with_source_validity(plan, source_index=source_index))
+        return tuple(result)
 
     def update_plan(
         self,
@@ -114,6 +123,8 @@ class ExperimentPlanService:
     def _with_source_validity(
         self,
         plan: ExperimentPlanRecord,
+        *,
+        source_index: FindingSourceIndex | None = None,
     ) -> ExperimentPlanRecord:
         if not proposed_design_choices_are_source_independent(
             plan.content
@@ -129,6 +140,7 @@ class ExperimentPlanService:
                 collection_id=plan.collection_id,
                 objective_id=plan.objective_id,
                 source_findings=source_findings,
+                source_index=source_index,
             )
         payload = plan.to_record()
         payload["metadata"] = {
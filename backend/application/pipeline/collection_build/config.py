@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import os
 from typing import Any
 
 from infra.source.config.pipeline_mode import IndexingMethod
@@ -13,3 +14,9 @@ class CollectionBuildPipelineConfig:
     mode: IndexingMethod | str
     verbose: bool = False
     source_additional_context: dict[str, Any] | None = None
+    memory_profile: bool = field(
+        default_factory=lambda: os.getenv("SOURCE_PIPELINE_MEMORY_PROFILE", "")
+        .strip()
+        .lower()
+        in {"1", "true", "yes", "on"}
+    )
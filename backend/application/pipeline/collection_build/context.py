@@ -12,6 +12,7 @@ from application.core.objectives.research_objective_service import (
 )
 from application.source.artifact_registry_service import ArtifactRegistryService
 from application.source.collection_service import CollectionService
+from application.source.lexical_search_service import SourceLexicalSearchService
 from application.source.task_service import TaskService
 from domain.ports import SourceArtifactRepository
 from infra.source.runtime.typing.pipeline_run_result import PipelineRunResult
@@ -34,4 +35,5 @@ class CollectionBuildContext:
     research_objective_service: ResearchObjectiveService
     build_source_artifacts: SourceArtifactBuilder
     objective_progress_callback: ObjectiveProgressCallback | None = None
+    lexical_search_service: SourceLexicalSearchService | None = None
     state: dict[str, Any] = field(default_factory=dict)
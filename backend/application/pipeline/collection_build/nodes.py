@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import replace
+import logging
 from typing import Any
 
 from application.pipeline.collection_build.config import CollectionBuildPipelineConfig
 from application.pipeline.collection_build.context import CollectionBuildContext
-from application.source.reference_extraction_service import (
-    SourceReferenceExtractionService,
-)
+from application.source.lexical_search_service import lexical_entries
+from application.source.reference_extraction_service import SourceReferenceCollector
 from domain.core import PaperSourceUnitCoverageStatus
-from infra.source.runtime.artifact_bundle import SourceArtifactBundle
+from domain.source import SourceDocument
+from infra.source.runtime.artifact_bundle import (
+    SourceArtifactBundle,
+    StreamedSourceArtifacts,
+)
+from infra.source.retrieval import LexicalIndexBuilder
+from infra.tracing.spans import span
+
+logger = logging.getLogger(__name__)
 
 
 async def build_source_artifacts(
@@ -21,12 +29,14 @@ async def build_source_artifacts(
         raise RuntimeError("集合内没有可构建文件")
     context.state["file_count"] = len(files)
 
-    outputs = await context.build_source_artifacts(
-        config=config.source,
-        method=config.mode,
-        additional_context=config.source_additional_context,
-        verbose=config.verbose,
-    )
+    with span("source_pipeline"):
+        outputs = await context.build_source_artifacts(
+            config=config.source,
+            method=config.mode,
+            additional_context=config.source_additional_context,
+            verbose=config.verbose,
+            memory_profile=config.memory_profile,
+        )
     errors = [str(err) for output in outputs for err in (output.errors or [])]
     if errors:
         raise RuntimeError("; ".join(errors))
@@ -34,15 +44,97 @@ async def build_source_artifacts(
         (
             output.result
             for output in reversed(outputs)
-            if isinstance(output.result, SourceArtifactBundle)
+            if isinstance(
+                output.result,
+                (SourceArtifactBundle, StreamedSourceArtifacts),
+            )
         ),
         None,
     )
     if bundle is None:
         raise RuntimeError("Source pipeline did not return an artifact bundle")
-    documents = bundle.to_documents()
-    persisted_documents = []
+    collection_id = context.collection_id
+    build_id = context.build_id
+    repository = context.source_artifact_repository
+    # The index is derived data and is rebuilt on first read if missing.
+    index_builder = (
+        LexicalIndexBuilder() if context.lexical_search_service is not None else None
+    )
+    references = SourceReferenceCollector()
     referenced_assets: set[str] = set()
+    counts = {"document_count": 0, "table_count": 0, "figure_count": 0}
+    # One transaction: readers never see a build with part of its documents.
+    with repository.write_collection_documents(collection_id, build_id) as writer:
+        async for documents in bundle.document_batches():
+            with span("figure_assets"):
+                documents = _persist_figure_assets(
+                    context,
+                    bundle,
+                    documents,
+                    referenced_assets,
+                )
+            with span("persist_documents", document_count=len(documents)):
+                writer.append(documents)
+            if index_builder is not None:
+                try:
+                    index_builder.add(lexical_entries(documents))
+                except Exception:
+                    _warn_lexical_index_failed(context)
+                    index_builder = None
+            references.add(documents)
+            counts["document_count"] += len(documents)
+            counts["table_count"] += sum(
+                len(document.tables) for document in documents
+            )
+            counts["figure_count"] += sum(
+                len(document.figures) for document in documents
+            )
+            del documents
+        unreferenced_assets = set(bundle.figure_assets) - referenced_assets
+        if unreferenced_assets:
+            raise RuntimeError(
+                "Source figure assets have no metadata rows: "
+                + ", ".join(sorted(unreferenced_assets))
+            )
+    if index_builder is not None:
+        with span("lexical_index") as current:
+            try:
+                index = context.lexical_search_service.save_index(
+                    collection_id,
+                    build_id,
+                    index_builder.build(),
+                )
+            except Exception:
+                _warn_lexical_index_failed(context)
+            else:
+                current.add("entry_count", index.entry_count)
+    with span("references") as current:
+        reference_set = references.result()
+        repository.replace_collection_references(
+            collection_id,
+            build_id,
+            reference_set,
+        )
+        current.add("reference_entry_count", len(reference_set.entries))
+    return counts
+
+
+def _warn_lexical_index_failed(context: CollectionBuildContext) -> None:
+    logger.warning(
+        "Source lexical index build failed; continuing without it collection_id=%s build_id=%s",
+        context.collection_id,
+        context.build_id,
+        exc_info=True,
+    )
+
+
+def _persist_figure_assets(
+    context: CollectionBuildContext,
+    bundle: SourceArtifactBundle | StreamedSourceArtifacts,
+    documents: tuple[SourceDocument, ...],
+    referenced_assets: set[str],
+) -> tuple[SourceDocument, ...]:
+    persisted_documents = []
     for document in documents:
         figures = []
         for figure in document.figures:
@@ -73,29 +165,7 @@ async def build_source_artifacts(
         persisted_documents.append(
             replace(document, figures=tuple(figures))
         )
-    unreferenced_assets = set(bundle.figure_assets) - referenced_assets
-    if unreferenced_assets:
-        raise RuntimeError(
-            "Source figure assets have no metadata rows: "
-            + ", ".join(sorted(unreferenced_assets))
-        )
-    documents = tuple(persisted_documents)
-    context.source_artifact_repository.replace_collection_documents(
-        context.collection_id,
-        context.build_id,
-        documents,
-    )
-    references = SourceReferenceExtractionService().extract(documents)
-    context.source_artifact_repository.replace_collection_references(
-        context.collection_id,
-        context.build_id,
-        references,
-    )
-    return {
-        "document_count": len(documents),
-        "table_count": sum(len(document.tables) for document in documents),
-        "figure_count": sum(len(document.figures) for document in documents),
-    }
+    return tuple(persisted_documents)
 
 
 def register_artifacts(
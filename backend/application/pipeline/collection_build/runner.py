@@ -23,6 +23,7 @@ from domain.pipeline import (
     PipelineRunStatus,
 )
 from infra.llm.usage import capture_llm_usage
+from infra.tracing.spans import capture_spans, export_chrome_trace, span
 
 logger = logging.getLogger(__name__)
 
@@ -86,18 +87,19 @@ class CollectionBuildPipelineRunner:
 
                 definition = definitions_by_name[node.name]
                 pipeline_run = self._mark_running(context, definition, pipeline_run)
-                with capture_llm_usage() as usage:
+                with capture_llm_usage() as usage, capture_spans() as spans:
                     try:
-                        result = self.node_functions[node.name](context, config)
-                        if inspect.isawaitable(result):
-                            result = await result
+                        with span(node.name):
+                            result = self.node_functions[node.name](context, config)
+                            if inspect.isawaitable(result):
+                                result = await result
                     except Exception as exc:  # noqa: BLE001
                         pipeline_run = self._mark_failed(
                             context,
                             definition,
                             pipeline_run,
                             exc,
-                            stats=usage.execution_stats(),
+                            stats=spans.execution_stats(usage.execution_stats()),
                         )
                         logger.exception(
                             "Collection build pipeline node failed task_id=%s collection_id=%s node=%s",
@@ -111,7 +113,12 @@ class CollectionBuildPipelineRunner:
                             definition,
                             pipeline_run,
                             result,
-                            stats=usage.execution_stats(),
+                            stats=spans.execution_stats(usage.execution_stats()),
+                        )
+                    finally:
+                        export_chrome_trace(
+                            spans,
+                            f"build-{context.task_id}-{node.name}",
                         )
                 progressed = True
 
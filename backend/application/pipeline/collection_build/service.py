@@ -38,6 +38,7 @@ from application.pipeline.collection_build import nodes
 from application.pipeline.collection_build.runner import CollectionBuildPipelineRunner
 from application.source.artifact_registry_service import ArtifactRegistryService
 from application.source.collection_service import CollectionService
+from application.source.lexical_search_service import SourceLexicalSearchService
 from application.source.task_service import TaskService
 from domain.pipeline import PipelineNodeStatus, PipelineRun, PipelineRunStatus
 from domain.ports import SourceArtifactRepository
@@ -75,6 +76,7 @@ class CollectionBuildPipelineService:
         source_artifact_repository: SourceArtifactRepository,
         document_profile_service: DocumentProfileService,
         research_objective_service: ResearchObjectiveService,
+        lexical_search_service: SourceLexicalSearchService | None = None,
     ) -> None:
         self.collection_service = collection_service
         self.task_service = task_service
@@ -82,6 +84,7 @@ class CollectionBuildPipelineService:
         self.source_artifact_repository = source_artifact_repository
         self.document_profile_service = document_profile_service
         self.research_objective_service = research_objective_service
+        self.lexical_search_service = lexical_search_service
 
     def _resolve_build_source_artifacts(self) -> SourceArtifactBuilder:
         global build_source_artifacts
@@ -175,6 +178,7 @@ class CollectionBuildPipelineService:
                     task_id,
                     collection_id,
                 ),
+                lexical_search_service=self.lexical_search_service,
             )
             pipeline_run = PipelineRun.create(
                 pipeline_name="collection_build",
@@ -141,8 +141,9 @@ def _load_source_documents(
     return documents
 
 
-def _records(records: Iterable[Mapping[str, Any]]) -> tuple[SourceRecord, ...]:
-    return tuple(dict(record) for record in records)
+def _records(records: Iterable[SourceRecord]) -> tuple[SourceRecord, ...]:
+    # `to_record()` already returns a fresh dict per item; do not copy twice.
+    return tuple(records)
 
 
 def build_document_records(
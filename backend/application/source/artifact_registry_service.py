@@ -43,34 +43,30 @@ class ArtifactRegistryService:
         build_id: str | None = None,
     ) -> dict:
         base_dir = Path(output_dir).expanduser().resolve()
-        source_documents = (
-            self.source_artifact_repository.read_collection_documents(
+        counts = (
+            self.source_artifact_repository.count_collection_artifacts(
                 collection_id,
                 build_id=build_id,
             )
             if build_id is not None
-            else self.source_artifact_repository.read_collection_documents(
+            else self.source_artifact_repository.count_collection_artifacts(
                 collection_id
             )
         )
-        source_artifacts_generated = bool(source_documents)
+        source_artifacts_generated = counts["documents"] > 0
         payload = ArtifactStatusRecord.build(
             collection_id=collection_id,
             output_path=str(base_dir),
-            documents_generated=bool(source_documents),
-            documents_ready=bool(source_documents),
+            documents_generated=source_artifacts_generated,
+            documents_ready=source_artifacts_generated,
             blocks_generated=source_artifacts_generated,
-            blocks_ready=any(document.blocks for document in source_documents),
+            blocks_ready=counts["blocks"] > 0,
             figures_generated=source_artifacts_generated,
-            figures_ready=any(document.figures for document in source_documents),
+            figures_ready=counts["figures"] > 0,
             table_rows_generated=source_artifacts_generated,
-            table_rows_ready=any(
-                document.table_rows for document in source_documents
-            ),
+            table_rows_ready=counts["table_rows"] > 0,
             table_cells_generated=source_artifacts_generated,
-            table_cells_ready=any(
-                document.table_cells for document in source_documents
-            ),
+            table_cells_ready=counts["table_cells"] > 0,
             updated_at=_now_iso(),
         ).to_record()
         return payload
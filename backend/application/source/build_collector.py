@@ -0,0 +1,129 @@
+"""Background garbage collection of expired collection builds."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import dataclass
+import logging
+from threading import Event, Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from application.source.build_retention_service import BuildRetentionService
+    from domain.ports import JobLock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCHES_PER_PASS = 50
+DEFAULT_IDLE_INTERVAL_S = 300.0
+BUILD_COLLECTOR_LOCK_NAME = "build-garbage-collector"
+
+
+@dataclass(frozen=True)
+class BuildCollectionPass:
+    collected_builds: int = 0
+    deleted_rows: int = 0
+
+    @property
+    def made_progress(self) -> bool:
+        """A pass can finalize builds whose rows were already gone."""
+
+        return bool(self.collected_builds or self.deleted_rows)
+
+
+class BuildGarbageCollector:
+    """Remove builds outside the retention policy a bounded batch at a time.
+
+    Rows are deleted in their own short transactions, so live reads and new
+    builds never wait on a long delete. A build stays listed as expired
+    until its last row is gone, which makes a restart resume on its own.
+    With a `lock`, only the process holding it runs a background pass.
+    """
+
+    def __init__(
+        self,
+        retention_service: BuildRetentionService,
+        *,
+        max_batches_per_pass: int = DEFAULT_MAX_BATCHES_PER_PASS,
+        idle_interval_s: float = DEFAULT_IDLE_INTERVAL_S,
+        lock: JobLock | None = None,
+    ) -> None:
+        self.retention_service = retention_service
+        self.max_batches_per_pass = max(int(max_batches_per_pass), 1)
+        self.idle_interval_s = idle_interval_s
+        self.lock = lock
+        self.collected_builds = 0
+        self.deleted_rows = 0
+        self.freed_bytes = 0
+        self._resume_tables: dict[str, str | None] = {}
+        self._stopped = Event()
+        self._worker: Thread | None = None
+
+    def run_once(self) -> BuildCollectionPass:
+        """Run one pass over every expired build; report what it removed."""
+
+        collected_builds = 0
+        deleted_rows = 0
+        for build in self.retention_service.list_expired_builds():
+            for _batch in range(self.max_batches_per_pass):
+                progress = self.retention_service.purge_batch(
+                    build,
+                    start_table=self._resume_tables.get(build.build_id),
+                )
+                deleted_rows += progress.deleted_rows
+                if progress.done:
+                    self._resume_tables.pop(build.build_id, None)
+                    freed_bytes = self.retention_service.finalize(build)
+                    collected_builds += 1
+                    self.freed_bytes += freed_bytes
+                    logger.info(
+                        "Build collected collection_id=%s build_id=%s "
+                        "build_number=%d freed_bytes=%d",
+                        build.collection_id,
+                        build.build_id,
+                        build.build_number,
+                        freed_bytes,
+                    )
+                    break
+                self._resume_tables[build.build_id] = progress.table
+            if self._stopped.is_set():
+                break
+        self.collected_builds += collected_builds
+        self.deleted_rows += deleted_rows
+        return BuildCollectionPass(
+            collected_builds=collected_builds,
+            deleted_rows=deleted_rows,
+        )
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._stopped.clear()
+        self._worker = Thread(
+            target=self._run_forever,
+            name="build-garbage-collector",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5.0)
+            self._worker = None
+
+    def _run_forever(self) -> None:
+        while not self._stopped.is_set():
+            result = BuildCollectionPass()
+            try:
+                with self.lock.hold() if self.lock else nullcontext(True) as held:
+                    if held:
+                        result = self.run_once()
+            except Exception:  # noqa: BLE001
+                # Expired builds stay listed; the next pass resumes from what is left.
+                logger.warning("Build garbage collection pass failed", exc_info=True)
+            if not result.made_progress:
+                self._stopped.wait(self.idle_interval_s)
+
+
+__all__ = ["BuildCollectionPass", "BuildGarbageCollector"]
@@ -0,0 +1,173 @@
+"""Retention policy for finished collection builds."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import os
+from typing import TYPE_CHECKING, Any
+
+from domain.ports import BuildRepository, SourceLexicalIndexStore
+from domain.source import BuildPurgeProgress, CollectionBuildRecord
+
+if TYPE_CHECKING:
+    from application.source.collection_service import CollectionService
+
+DEFAULT_KEEP_LAST_BUILDS = 3
+DEFAULT_PURGE_BATCH_SIZE = 1000
+DEFAULT_REPORT_LIMIT = 100
+
+
+@dataclass(frozen=True)
+class BuildRetentionPolicy:
+    """How many finished builds each collection keeps.
+
+    Beyond the newest `keep_last` builds, a collection always keeps its active
+    build and every build a published analysis, authored candidate,
+    evaluation snapshot or gold set still depends on.
+    """
+
+    keep_last: int = DEFAULT_KEEP_LAST_BUILDS
+    batch_size: int = DEFAULT_PURGE_BATCH_SIZE
+
+    @classmethod
+    def from_env(cls, *, required: bool = False) -> "BuildRetentionPolicy | None":
+        """Policy from `BUILD_RETENTION_KEEP_LAST`, or None when unset.
+
+        With `required`, an unset variable means the default policy instead.
+        PostgreSQL needs that: every build adds a partition to each
+        partitioned Source table, and only collected builds drop theirs.
+        """
+
+        keep_last = _env_int("BUILD_RETENTION_KEEP_LAST")
+        if keep_last is None and not required:
+            return None
+        return cls(
+            keep_last=max(
+                DEFAULT_KEEP_LAST_BUILDS if keep_last is None else keep_last,
+                0,
+            ),
+            batch_size=max(
+                _env_int("BUILD_RETENTION_BATCH_SIZE") or DEFAULT_PURGE_BATCH_SIZE,
+                1,
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class ExpiredBuildReport:
+    build: CollectionBuildRecord
+    row_counts: dict[str, int] = field(default_factory=dict)
+    artifact_bytes: int = 0
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "collection_id": self.build.collection_id,
+            "build_id": self.build.build_id,
+            "build_number": self.build.build_number,
+            "status": self.build.status,
+            "finished_at": self.build.finished_at,
+            "row_count": sum(self.row_counts.values()),
+            "row_counts": dict(self.row_counts),
+            "artifact_bytes": self.artifact_bytes,
+        }
+
+
+class BuildRetentionService:
+    """Find builds outside the retention policy and remove them in batches."""
+
+    def __init__(
+        self,
+        build_repository: BuildRepository,
+        collection_service: CollectionService,
+        lexical_index_store: SourceLexicalIndexStore,
+        policy: BuildRetentionPolicy | None = None,
+    ) -> None:
+        self.build_repository = build_repository
+        self.collection_service = collection_service
+        self.lexical_index_store = lexical_index_store
+        self.policy = policy or BuildRetentionPolicy()
+
+    def list_expired_builds(
+        self,
+        limit: int = DEFAULT_REPORT_LIMIT,
+    ) -> tuple[CollectionBuildRecord, ...]:
+        return self.build_repository.list_expired_builds(
+            keep_last=self.policy.keep_last,
+            limit=limit,
+        )
+
+    def dry_run(self, limit: int = DEFAULT_REPORT_LIMIT) -> dict[str, Any]:
+        """Report what a collection pass would delete, without deleting it.
+
+        `artifact_bytes` counts every workspace file an expired build owns;
+        content another build shares stays on disk when it is collected.
+        """
+
+        reports = [
+            ExpiredBuildReport(
+                build=build,
+                row_counts=self.build_repository.count_build_rows(build.build_id),
+                artifact_bytes=self._artifact_bytes(build),
+            )
+            for build in self.list_expired_builds(limit)
+        ]
+        return {
+            "keep_last": self.policy.keep_last,
+            "build_count": len(reports),
+            "row_count": sum(sum(report.row_counts.values()) for report in reports),
+            "artifact_bytes": sum(report.artifact_bytes for report in reports),
+            "builds": [report.to_record() for report in reports],
+        }
+
+    def purge_batch(
+        self,
+        build: CollectionBuildRecord,
+        *,
+        start_table: str | None = None,
+    ) -> BuildPurgeProgress:
+        return self.build_repository.purge_build_rows(
+            build.build_id,
+            batch_size=self.policy.batch_size,
+            start_table=start_table,
+        )
+
+    def finalize(self, build: CollectionBuildRecord) -> int:
+        """Drop an emptied build's files and lineage; return bytes freed.
+
+        Files go first so a crash in between leaves the build listed as
+        expired and the next pass repeats the idempotent file removal.
+        """
+
+        freed_bytes = self.collection_service.delete_build_assets(
+            build.collection_id,
+            build.build_id,
+        )
+        freed_bytes += self.lexical_index_store.delete_index(
+            build.collection_id,
+            build.build_id,
+        )
+        self.build_repository.finalize_build_purge(build.build_id)
+        return freed_bytes
+
+    def _artifact_bytes(self, build: CollectionBuildRecord) -> int:
+        return self.collection_service.build_asset_bytes(
+            build.collection_id,
+            build.build_id,
+        ) + self.lexical_index_store.index_size(build.collection_id, build.build_id)
+
+
+def _env_int(name: str) -> int | None:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+__all__ = [
+    "BuildRetentionPolicy",
+    "BuildRetentionService",
+    "ExpiredBuildReport",
+]
@@ -0,0 +1,175 @@
+"""Background purge of tombstoned collections."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+import logging
+from threading import Event, Thread
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from application.source.collection_service import CollectionService
+    from domain.ports import JobLock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+DEFAULT_MAX_BATCHES_PER_PASS = 50
+DEFAULT_IDLE_INTERVAL_S = 5.0
+DEFAULT_OBJECT_SWEEP_INTERVAL_S = 3600.0
+
+
+class CollectionReaper:
+    """Drain tombstoned collections a bounded batch at a time.
+
+    Every batch commits on its own, so the tombstone plus whatever rows
+    remain is the whole resume state: after a restart the next pass simply
+    continues. Each pass spends at most `max_batches_per_pass` batches per
+    collection so one huge collection cannot starve the others. Every
+    `object_sweep_interval_s` the reaper also frees content blobs that no
+    storage key links to any more. With a `lock`, only the process holding
+    it runs a background pass.
+
+    A build still running when its collection is tombstoned would keep
+    writing rows behind the purge. The reaper cancels such builds first and
+    leaves the collection for the next pass, so writes already in flight
+    can finish. A batch that fails anyway, say on a RESTRICT reference to a
+    row written after the purge passed its table, restarts the collection
+    from the first table.
+    """
+
+    def __init__(
+        self,
+        collection_service: CollectionService,
+        *,
+        batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+        max_batches_per_pass: int = DEFAULT_MAX_BATCHES_PER_PASS,
+        idle_interval_s: float = DEFAULT_IDLE_INTERVAL_S,
+        object_sweep_interval_s: float = DEFAULT_OBJECT_SWEEP_INTERVAL_S,
+        lock: JobLock | None = None,
+    ) -> None:
+        self.collection_service = collection_service
+        self.batch_size = max(int(batch_size), 1)
+        self.max_batches_per_pass = max(int(max_batches_per_pass), 1)
+        self.idle_interval_s = idle_interval_s
+        self.object_sweep_interval_s = object_sweep_interval_s
+        self.lock = lock
+        self._last_object_sweep: float | None = None
+        self._resume_tables: dict[str, str | None] = {}
+        self._deleted_rows: dict[str, int] = {}
+        self._stopped = Event()
+        self._worker: Thread | None = None
+
+    def run_once(self) -> int:
+        """Run one pass over every tombstone; return the rows deleted."""
+
+        deleted_rows = 0
+        for collection_id in self.collection_service.list_tombstoned_collections():
+            cancelled = self.collection_service.cancel_collection_builds(collection_id)
+            if cancelled:
+                logger.info(
+                    "Collection purge waiting on cancelled builds "
+                    "collection_id=%s builds=%d",
+                    collection_id,
+                    cancelled,
+                )
+                continue
+            for _batch in range(self.max_batches_per_pass):
+                try:
+                    progress = self.collection_service.purge_collection_batch(
+                        collection_id,
+                        batch_size=self.batch_size,
+                        start_table=self._resume_tables.get(collection_id),
+                    )
+                except Exception:  # noqa: BLE001
+                    self._resume_tables.pop(collection_id, None)
+                    logger.warning(
+                        "Collection purge batch failed collection_id=%s",
+                        collection_id,
+                        exc_info=True,
+                    )
+                    break
+                deleted_rows += progress.deleted_rows
+                total = self._deleted_rows.get(collection_id, 0)
+                total += progress.deleted_rows
+                if progress.done:
+                    self._resume_tables.pop(collection_id, None)
+                    self._deleted_rows.pop(collection_id, None)
+                    logger.info(
+                        "Collection purged collection_id=%s deleted_rows=%d",
+                        collection_id,
+                        total,
+                    )
+                    break
+                self._resume_tables[collection_id] = progress.table
+                self._deleted_rows[collection_id] = total
+            else:
+                logger.info(
+                    "Collection purge progress collection_id=%s table=%s "
+                    "deleted_rows=%d",
+                    collection_id,
+                    self._resume_tables.get(collection_id),
+                    self._deleted_rows.get(collection_id, 0),
+                )
+            if self._stopped.is_set():
+                break
+        return deleted_rows
+
+    def sweep_objects(self) -> int:
+        """Free unreferenced content blobs; return how many were removed."""
+
+        self._last_object_sweep = time.monotonic()
+        removed = self.collection_service.collect_unreferenced_objects()
+        if removed:
+            logger.info("Unreferenced content blobs removed count=%d", removed)
+        return removed
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._stopped.clear()
+        self._worker = Thread(
+            target=self._run_forever,
+            name="collection-reaper",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.idle_interval_s * 2)
+            self._worker = None
+
+    def _run_forever(self) -> None:
+        while not self._stopped.is_set():
+            deleted_rows = 0
+            try:
+                with self.lock.hold() if self.lock else nullcontext(True) as held:
+                    if held:
+                        deleted_rows = self._run_pass()
+            except Exception:  # noqa: BLE001
+                # The tombstone stays; the next pass retries from the rows left.
+                logger.warning("Collection purge pass failed", exc_info=True)
+            if not deleted_rows:
+                self._stopped.wait(self.idle_interval_s)
+
+    def _run_pass(self) -> int:
+        deleted_rows = self.run_once()
+        if self._object_sweep_due():
+            try:
+                self.sweep_objects()
+            except Exception:  # noqa: BLE001
+                logger.warning("Content blob sweep failed", exc_info=True)
+        return deleted_rows
+
+    def _object_sweep_due(self) -> bool:
+        return (
+            self._last_object_sweep is None
+            or time.monotonic() - self._last_object_sweep
+            >= self.object_sweep_interval_s
+        )
+
+
+__all__ = ["CollectionReaper"]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import base64
+import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from hashlib import sha256
 from pathlib import Path, PurePosixPath
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import uuid4
 
 from domain.ports import CollectionPaths, CollectionRepository
@@ -13,10 +15,11 @@ from domain.source import (
     CollectionHandoffRecord,
     CollectionImportDocumentRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
     CollectionRecord,
     empty_import_manifest,
 )
-from domain.source.ports import ObjectStore
+from domain.source.ports import ObjectStore, StagedObject
 from infra.persistence.file import FileCollectionWorkspace
 from infra.persistence.file.object_store import FileObjectStore
 from infra.source.ingestion import (
@@ -24,9 +27,16 @@ from infra.source.ingestion import (
     NormalizedImportDocument,
     SourceAdapter,
     SourceAdapterRequest,
+    StagedUpload,
+    is_archive_upload,
+    is_supported_upload,
+    iter_archive_members,
+    normalize_staged_uploads,
     normalize_upload,
 )
 
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -116,6 +126,72 @@ class CollectionService:
         except ValueError as exc:
             raise OSError("figure object verification failed") from exc
 
+    def build_asset_bytes(self, collection_id: str, build_id: str) -> int:
+        """Bytes held by a build's figure objects, counting shared blobs too."""
+
+        return sum(
+            path.stat().st_size
+            for path in self._build_figure_paths(collection_id, build_id)
+        )
+
+    def delete_build_assets(self, collection_id: str, build_id: str) -> int:
+        """Remove a build's figure objects; return the bytes actually freed.
+
+        Content another key still links to stays on disk and is not counted.
+        """
+
+        freed_bytes = 0
+        figures_dir = self._build_objects_dir(collection_id, build_id) / "figures"
+        for path in self._build_figure_paths(collection_id, build_id):
+            size = path.stat().st_size
+            if self.object_store.delete(
+                self._figure_storage_key(
+                    collection_id, build_id, path.stem, path.suffix
+                ),
+                path.stem,
+            ):
+                freed_bytes += size
+        for directory in (figures_dir, figures_dir.parent):
+            try:
+                directory.rmdir()
+            except OSError:
+                break
+        return freed_bytes
+
+    def _build_figure_paths(
+        self,
+        collection_id: str,
+        build_id: str,
+    ) -> tuple[Path, ...]:
+        figures_dir = self._build_objects_dir(collection_id, build_id) / "figures"
+        if not figures_dir.is_dir():
+            return ()
+        return tuple(
+            path
+            for path in sorted(figures_dir.iterdir())
+            if path.is_file()
+            and not path.is_symlink()
+            and _SHA256_PATTERN.fullmatch(path.stem)
+        )
+
+    def _asset_build_ids(self, collection_id: str) -> tuple[str, ...]:
+        source_dir = self._build_objects_dir(collection_id, "build").parent
+        if not source_dir.is_dir():
+            return ()
+        return tuple(
+            path.name
+            for path in sorted(source_dir.iterdir())
+            if path.is_dir() and not path.is_symlink()
+        )
+
+    def _build_objects_dir(self, collection_id: str, build_id: str) -> Path:
+        key = PurePosixPath(
+            self._figure_storage_key(collection_id, build_id, "0" * 64, ".png")
+        )
+        if {key.parts[0], key.parts[3]} & {".", ".."}:
+            raise ValueError("invalid figure storage key")
+        return self.root_dir.joinpath(*key.parts[:4])
+
     # define a method for creating a document collection
     def create_collection(
         self,
@@ -172,6 +248,8 @@ class CollectionService:
         return normalized.to_record()
 
     def delete_collection(self, collection_id: str) -> dict:
+        """Tombstone a collection; `purge_collection_batch` removes it later."""
+
         paths = self.get_paths(collection_id)
         target_dir = paths.collection_dir
         if self.repository.read_collection(collection_id) is None:
@@ -196,14 +274,62 @@ class CollectionService:
                 != self._input_storage_key(collection_id, stored_filename)
             ):
                 raise ValueError("invalid collection object key")
-        if not self.repository.delete_collection(collection_id):
+        deleted_at = _now_iso()
+        if not self.repository.tombstone_collection(
+            collection_id,
+            deleted_at=deleted_at,
+        ):
             raise FileNotFoundError(f"collection not found: {collection_id}")
-        self.workspace.delete_collection_dir(collection_id)
         return {
             "collection_id": collection_id,
-            "deleted_at": _now_iso(),
+            "deleted_at": deleted_at,
         }
 
+    def list_tombstoned_collections(self, limit: int = 100) -> tuple[str, ...]:
+        return self.repository.list_tombstoned_collections(limit)
+
+    def cancel_collection_builds(self, collection_id: str) -> int:
+        """Stop a tombstoned collection's unfinished builds from writing rows."""
+
+        return self.repository.cancel_collection_builds(
+            collection_id,
+            finished_at=_now_iso(),
+        )
+
+    def purge_collection_batch(
+        self,
+        collection_id: str,
+        *,
+        batch_size: int = 1000,
+        start_table: str | None = None,
+    ) -> CollectionPurgeProgress:
+        """Delete one batch of a tombstoned collection's rows.
+
+        Once no dependent rows remain, the workspace directory, file rows and
+        collection row go too. Figure objects and input files release their
+        content blobs, so bytes no other key uses are freed.
+        """
+
+        progress = self.repository.purge_collection_rows(
+            collection_id,
+            batch_size=batch_size,
+            start_table=start_table,
+        )
+        if progress.done:
+            records = self.repository.list_collection_files(collection_id)
+            for build_id in self._asset_build_ids(collection_id):
+                self.delete_build_assets(collection_id, build_id)
+            self.workspace.delete_collection_dir(collection_id)
+            if self.repository.finalize_collection_purge(collection_id):
+                for digest in {record.sha256 for record in records}:
+                    self.object_store.release(digest)
+        return progress
+
+    def collect_unreferenced_objects(self) -> int:
+        """Free content blobs left behind by keys removed without a release."""
+
+        return self.object_store.collect_unreferenced()
+
     def delete_collection_for_user(
         self, collection_id: str, owner_user_id: str
     ) -> dict:
@@ -343,14 +469,21 @@ class CollectionService:
                 stored_filename = document.stored_filename or (
                     f"{uuid4().hex}_{Path(document.original_filename).name}"
                 )
-                payload = self._build_import_payload(
-                    document=document,
-                    source_document_id=document.source_document_id,
-                    text_by_source_document=text_by_source_document,
-                )
                 storage_key = self._input_storage_key(collection_id, stored_filename)
-                payload_sha256 = sha256(payload).hexdigest()
-                self.object_store.write(storage_key, payload, payload_sha256)
+                if document.staged_payload is not None:
+                    staged = document.staged_payload
+                    self.object_store.commit_staged(storage_key, staged)
+                    payload_sha256 = staged.sha256
+                    size_bytes = staged.size_bytes
+                else:
+                    payload = self._build_import_payload(
+                        document=document,
+                        source_document_id=document.source_document_id,
+                        text_by_source_document=text_by_source_document,
+                    )
+                    payload_sha256 = sha256(payload).hexdigest()
+                    size_bytes = len(payload)
+                    self.object_store.write(storage_key, payload, payload_sha256)
                 created_files.append(
                     CollectionFileRecord(
                         file_id=f"file_{uuid4().hex[:12]}",
@@ -363,7 +496,7 @@ class CollectionService:
                         sha256=payload_sha256,
                         media_type=document.media_type,
                         status="stored",
-                        size_bytes=len(payload),
+                        size_bytes=size_bytes,
                         created_at=_now_iso(),
                     )
                 )
@@ -385,7 +518,7 @@ class CollectionService:
                 registered_keys = {record.storage_key for record in created_files}
             for record in created_files:
                 if record.storage_key not in registered_keys:
-                    self.object_store.delete(record.storage_key)
+                    self.object_store.delete(record.storage_key, record.sha256)
             raise
         return [record.to_record() for record in created_files]
 
@@ -407,6 +540,86 @@ class CollectionService:
             raise ValueError("normalized upload produced no importable documents")
         return imported[0]
 
+    def add_file_stream(
+        self,
+        collection_id: str,
+        filename: str,
+        stream: BinaryIO,
+        media_type: str | None = None,
+    ) -> dict:
+        """Import one upload by streaming it into the object store.
+
+        Zip archives import several records at once and go through
+        `add_uploads` instead.
+        """
+
+        if is_archive_upload(filename, media_type):
+            raise ValueError("upload archives must be imported as a batch")
+        imported = self.add_uploads(collection_id, ((filename, stream, media_type),))
+        return imported[0]
+
+    def add_uploads(
+        self,
+        collection_id: str,
+        uploads: Iterable[tuple[str, BinaryIO, str | None]],
+    ) -> list[dict]:
+        """Import uploaded files, expanding zip archives, as one batch.
+
+        Each file is staged while its SHA-256 is computed and then committed
+        into the object store by hard-linking its content blob, so no upload
+        is held in memory.
+        Unsupported archive members are skipped with a batch warning.
+        """
+
+        self.get_collection(collection_id)
+        staged_uploads: list[StagedUpload] = []
+        warnings: list[str] = []
+        raw_locator: str | None = None
+        try:
+            for filename, stream, media_type in uploads:
+                raw_locator = raw_locator or Path(filename or "").name or None
+                if is_archive_upload(filename, media_type):
+                    for member_name, member in iter_archive_members(stream):
+                        if not is_supported_upload(member_name):
+                            warnings.append(f"archive_member_skipped:{member_name}")
+                            continue
+                        staged_uploads.append(
+                            StagedUpload(
+                                filename=member_name,
+                                media_type=None,
+                                staged=self.object_store.stage(member),
+                            )
+                        )
+                    continue
+                if not is_supported_upload(filename, media_type):
+                    raise ValueError(
+                        f"unsupported upload type for normalization: {filename}"
+                    )
+                staged_uploads.append(
+                    StagedUpload(
+                        filename=filename,
+                        media_type=media_type,
+                        staged=self.object_store.stage(stream),
+                    )
+                )
+            if not staged_uploads:
+                raise ValueError("upload contains no importable documents")
+            batch = normalize_staged_uploads(
+                staged_uploads,
+                read_staged=self._read_staged,
+                raw_locator=raw_locator,
+                warnings=warnings,
+            )
+            return self.import_normalized_batch(collection_id, batch)
+        finally:
+            # Committed uploads have left staging; this drops only leftovers.
+            for upload in staged_uploads:
+                self.object_store.discard_staged(upload.staged)
+
+    def _read_staged(self, staged: StagedObject) -> bytes:
+        with self.object_store.open_staged(staged) as handle:
+            return handle.read()
+
     def _input_storage_key(self, collection_id: str, stored_filename: str) -> str:
         return f"{collection_id}/input/{stored_filename}"
 
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+import hashlib
+import json
 import re
 from pathlib import Path
 from typing import Any, Mapping
 from urllib.parse import quote
 
-from application.source.collection_service import CollectionService
-from domain.ports import SourceArtifactRepository
+from application.source.collection_service import (
+    CollectionService,
+    DocumentSourceUnavailableError,
+)
+from domain.ports import FigureRenderCache, SourceArtifactRepository
 from domain.source import (
     SourceDocument,
     SourceDocumentNode,
@@ -16,6 +22,10 @@ from domain.source import (
     render_markdown_table,
 )
 from application.source.artifact_input_service import load_document_tree
+from infra.source.runtime.mapping.figure_artifacts import (
+    FIGURE_CROP_GEOMETRY_KEY,
+    render_pdf_figure_crops,
+)
 from infra.source.runtime.mapping.text_quality import (
     is_garbled_pdf_text,
     normalize_display_text,
@@ -78,9 +88,11 @@ class DocumentMarkdownService:
         self,
         collection_service: CollectionService,
         source_artifact_repository: SourceArtifactRepository,
+        figure_render_cache: FigureRenderCache | None = None,
     ) -> None:
         self.collection_service = collection_service
         self.source_artifact_repository = source_artifact_repository
+        self.figure_render_cache = figure_render_cache
 
     def get_document_markdown(
         self,
@@ -153,9 +165,20 @@ class DocumentMarkdownService:
             )
         image_path = self._normalize_text(figure.image_path)
         if not image_path:
-            raise SourceFigureImageUnavailableError(
-                collection_id, document_key, figure_key
-            )
+            crop_geometry = self._deferred_crop_geometry(figure)
+            if crop_geometry is None:
+                raise SourceFigureImageUnavailableError(
+                    collection_id, document_key, figure_key
+                )
+            return {
+                "content": self._render_deferred_figure(
+                    collection_id,
+                    figure,
+                    crop_geometry,
+                ),
+                "filename": f"{figure_key}.png",
+                "media_type": "image/png",
+            }
 
         try:
             content = self.collection_service.read_figure_asset(
@@ -194,6 +217,162 @@ class DocumentMarkdownService:
             "media_type": media_type,
         }
 
+    def prewarm_figure_images(
+        self,
+        collection_id: str,
+        *,
+        document_ids: Iterable[str] | None = None,
+    ) -> dict[str, int]:
+        """Render deferred figures missing from the render cache.
+
+        Each source PDF is opened once for all of its uncached figures.
+        Figures that already have a stored image are skipped.
+        """
+        self.collection_service.get_collection(collection_id)
+        if self.figure_render_cache is None:
+            return {"rendered": 0, "cached": 0, "failed": 0}
+        wanted = {str(item) for item in document_ids} if document_ids else None
+        pending: dict[str, list[tuple[SourceFigure, dict[str, Any], str]]] = {}
+        cached = 0
+        for figure in self.source_artifact_repository.list_figures(collection_id):
+            if wanted is not None and figure.document_id not in wanted:
+                continue
+            if self._normalize_text(figure.image_path):
+                continue
+            crop_geometry = self._deferred_crop_geometry(figure)
+            if crop_geometry is None:
+                continue
+            render_key = self._figure_render_key(figure, crop_geometry)
+            if self.figure_render_cache.contains(collection_id, render_key):
+                cached += 1
+                continue
+            pending.setdefault(figure.document_id, []).append(
+                (figure, crop_geometry, render_key)
+            )
+        rendered = failed = 0
+        for document_id, items in pending.items():
+            try:
+                payload = self._document_source_payload(
+                    collection_id,
+                    document_id,
+                    items[0][0].figure_id,
+                )
+                images = render_pdf_figure_crops(
+                    payload,
+                    [crop_geometry for _, crop_geometry, _ in items],
+                )
+            except (SourceFigureImageUnavailableError, RuntimeError, ValueError):
+                failed += len(items)
+                continue
+            for (_, _, render_key), content in zip(items, images, strict=True):
+                if content is None:
+                    failed += 1
+                    continue
+                self.figure_render_cache.write(collection_id, render_key, content)
+                rendered += 1
+        return {"rendered": rendered, "cached": cached, "failed": failed}
+
+    def _render_deferred_figure(
+        self,
+        collection_id: str,
+        figure: SourceFigure,
+        crop_geometry: dict[str, Any],
+    ) -> bytes:
+        render_key = self._figure_render_key(figure, crop_geometry)
+        if self.figure_render_cache is not None:
+            cached = self.figure_render_cache.read(collection_id, render_key)
+            if cached is not None:
+                return cached
+        payload = self._document_source_payload(
+            collection_id,
+            figure.document_id,
+            figure.figure_id,
+        )
+        try:
+            content = render_pdf_figure_crops(payload, [crop_geometry])[0]
+        except (RuntimeError, ValueError) as exc:
+            raise SourceFigureImageUnavailableError(
+                collection_id,
+                figure.document_id,
+                figure.figure_id,
+                code="figure_image_render_failed",
+                message="The figure image could not be rendered from the source PDF.",
+            ) from exc
+        if content is None:
+            raise SourceFigureImageUnavailableError(
+                collection_id,
+                figure.document_id,
+                figure.figure_id,
+                code="figure_image_render_failed",
+                message="The figure image could not be rendered from the source PDF.",
+            )
+        if self.figure_render_cache is not None:
+            self.figure_render_cache.write(collection_id, render_key, content)
+        return content
+
+    def _document_source_payload(
+        self,
+        collection_id: str,
+        document_id: str,
+        figure_id: str,
+    ) -> bytes:
+        document = self.source_artifact_repository.read_document(
+            collection_id,
+            document_id,
+        )
+        try:
+            payload = self.collection_service.resolve_document_source_file(
+                collection_id,
+                document_id,
+                source_filename=(
+                    self._source_filename(document) if document is not None else None
+                ),
+            )
+        except (DocumentSourceUnavailableError, FileNotFoundError) as exc:
+            raise SourceFigureImageUnavailableError(
+                collection_id,
+                document_id,
+                figure_id,
+                code="figure_source_unavailable",
+                message="The source PDF for this figure is not available to render.",
+            ) from exc
+        return payload["content"]
+
+    def _deferred_crop_geometry(self, figure: SourceFigure) -> dict[str, Any] | None:
+        geometry = figure.metadata.get(FIGURE_CROP_GEOMETRY_KEY)
+        if not isinstance(geometry, Mapping):
+            return None
+        bbox = geometry.get("bbox")
+        try:
+            page = int(geometry.get("page"))
+            coords = [float(value) for value in bbox] if bbox is not None else []
+        except (TypeError, ValueError):
+            return None
+        if page < 1 or len(coords) != 4:
+            return None
+        return {
+            "page": page,
+            "bbox": coords,
+            "coord_origin": str(geometry.get("coord_origin") or "TOPLEFT").upper(),
+        }
+
+    def _figure_render_key(
+        self,
+        figure: SourceFigure,
+        crop_geometry: dict[str, Any],
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "document_id": figure.document_id,
+                    "figure_id": figure.figure_id,
+                    "crop_geometry": crop_geometry,
+                },
+                sort_keys=True,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        ).hexdigest()
+
     def _load_source_documents(
         self, collection_id: str
     ) -> tuple[SourceDocument, ...]:
@@ -419,7 +598,7 @@ class DocumentMarkdownService:
         if self._figure_image_available(
             collection_id=collection_id,
             document_id=document_id,
-            figure_id=figure.figure_id,
+            figure=figure,
         ):
             alt_text = label or caption or "Figure"
             image_markdown = (
@@ -443,10 +622,12 @@ class DocumentMarkdownService:
         *,
         collection_id: str,
         document_id: str,
-        figure_id: str,
+        figure: SourceFigure,
     ) -> bool:
+        if not self._normalize_text(figure.image_path):
+            return self._deferred_crop_geometry(figure) is not None
         try:
-            self.resolve_figure_image_file(collection_id, document_id, figure_id)
+            self.resolve_figure_image_file(collection_id, document_id, figure.figure_id)
         except (SourceFigureImageNotFoundError, SourceFigureImageUnavailableError):
             return False
         return True
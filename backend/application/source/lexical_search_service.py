@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
+import logging
+from threading import Lock
+
+from domain.ports import (
+    BuildRepository,
+    SourceArtifactRepository,
+    SourceLexicalIndexStore,
+)
+from domain.source import SourceDocument
+from infra.source.retrieval import LexicalEntry, LexicalHit, LexicalIndex
+
+logger = logging.getLogger(__name__)
+
+LEXICAL_BLOCK_KIND = "block"
+LEXICAL_TEXT_UNIT_KIND = "text_unit"
+_DEFAULT_CACHE_SIZE = 8
+
+
+class SourceLexicalSearchService:
+    """Build, persist, and query per-build BM25 indexes over Source text.
+
+    Indexes are derived data: a build whose index file is missing or
+    unreadable is re-indexed from its persisted Source rows on first use.
+    """
+
+    def __init__(
+        self,
+        source_artifact_repository: SourceArtifactRepository,
+        index_store: SourceLexicalIndexStore,
+        build_repository: BuildRepository | None = None,
+        *,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.source_artifact_repository = source_artifact_repository
+        self.index_store = index_store
+        self.build_repository = build_repository
+        self._cache_size = max(int(cache_size), 1)
+        self._cache: OrderedDict[tuple[str, str], LexicalIndex] = OrderedDict()
+        self._lock = Lock()
+
+    def build_index(
+        self,
+        collection_id: str,
+        build_id: str,
+        documents: Iterable[SourceDocument],
+    ) -> LexicalIndex:
+        return self.save_index(
+            collection_id,
+            build_id,
+            LexicalIndex.build(lexical_entries(documents)),
+        )
+
+    def save_index(
+        self,
+        collection_id: str,
+        build_id: str,
+        index: LexicalIndex,
+    ) -> LexicalIndex:
+        self.index_store.write_index(collection_id, build_id, index.to_bytes())
+        self._remember((collection_id, build_id), index)
+        logger.info(
+            "Source lexical index built collection_id=%s build_id=%s entry_count=%s term_count=%s",
+            collection_id,
+            build_id,
+            index.entry_count,
+            index.term_count,
+        )
+        return index
+
+    def read_index(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+        *,
+        documents: Iterable[SourceDocument] | None = None,
+    ) -> LexicalIndex | None:
+        """Return the build's index, re-indexing persisted Source rows if needed.
+
+        ``documents`` may supply already-loaded Source documents for that
+        re-indexing so callers holding them avoid a second repository read.
+        """
+        resolved_build_id = build_id or self._active_build_id(collection_id)
+        if resolved_build_id is None:
+            return None
+        key = (collection_id, resolved_build_id)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        payload = self.index_store.read_index(collection_id, resolved_build_id)
+        if payload is not None:
+            try:
+                index = LexicalIndex.from_bytes(payload)
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning(
+                    "Source lexical index unreadable collection_id=%s build_id=%s",
+                    collection_id,
+                    resolved_build_id,
+                    exc_info=True,
+                )
+            else:
+                self._remember(key, index)
+                return index
+        if documents is None:
+            documents = self.source_artifact_repository.read_collection_documents(
+                collection_id,
+                build_id=resolved_build_id,
+            )
+        documents = tuple(documents)
+        if not documents:
+            return None
+        return self.build_index(collection_id, resolved_build_id, documents)
+
+    def search(
+        self,
+        collection_id: str,
+        query: str,
+        *,
+        k: int = 10,
+        document_ids: Collection[str] | None = None,
+        kinds: Collection[str] | None = None,
+        build_id: str | None = None,
+    ) -> tuple[LexicalHit, ...]:
+        index = self.read_index(collection_id, build_id)
+        if index is None:
+            return ()
+        return index.search(query, k=k, document_ids=document_ids, kinds=kinds)
+
+    def _active_build_id(self, collection_id: str) -> str | None:
+        if self.build_repository is None:
+            return None
+        build = self.build_repository.read_active_build(collection_id)
+        return build.build_id if build is not None else None
+
+    def _remember(self, key: tuple[str, str], index: LexicalIndex) -> None:
+        with self._lock:
+            self._cache[key] = index
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+def lexical_entries(documents: Iterable[SourceDocument]) -> Iterable[LexicalEntry]:
+    for document in documents:
+        text_unit_pages: dict[str, int] = {}
+        for block in document.blocks:
+            if block.page is not None:
+                for text_unit_id in block.text_unit_ids:
+                    text_unit_pages[text_unit_id] = min(
+                        text_unit_pages.get(text_unit_id, block.page),
+                        block.page,
+                    )
+            yield LexicalEntry(
+                entry_id=block.block_id,
+                kind=LEXICAL_BLOCK_KIND,
+                document_id=document.document_id,
+                text=block.text,
+                page=block.page,
+            )
+        for text_unit in document.text_units:
+            yield LexicalEntry(
+                entry_id=text_unit.text_unit_id,
+                kind=LEXICAL_TEXT_UNIT_KIND,
+                document_id=document.document_id,
+                text=text_unit.text,
+                page=text_unit_pages.get(text_unit.text_unit_id),
+            )
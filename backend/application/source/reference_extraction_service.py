@@ -32,18 +32,15 @@ class SourceReferenceExtractionService:
     """Extract citation metadata from Source structure artifacts."""
 
     def extract(self, documents: tuple[SourceDocument, ...]) -> SourceReferenceSet:
-        blocks = tuple(block for document in documents for block in document.blocks)
-        entries = self._extract_entries(blocks)
-        mentions = self._extract_mentions(blocks, entries)
-        return SourceReferenceSet(
-            entries=tuple(entries),
-            mentions=tuple(mentions),
-            candidates=tuple(self._build_candidates(entries, mentions)),
-        )
+        collector = SourceReferenceCollector(self)
+        collector.add(documents)
+        return collector.result()
 
     def _extract_entries(
         self,
         blocks: Iterable[SourceBlock],
+        *,
+        sequence_offset: int = 0,
     ) -> list[SourceReferenceEntry]:
         entries: list[SourceReferenceEntry] = []
         blocks_by_document: dict[str, list[SourceBlock]] = defaultdict(list)
@@ -67,7 +64,7 @@ class SourceReferenceExtractionService:
                 entry = self._entry_from_block(
                     document_id=document_id,
                     block=block,
-                    sequence=len(entries) + 1,
+                    sequence=sequence_offset + len(entries) + 1,
                 )
                 if entry is not None:
                     entries.append(entry)
@@ -77,6 +74,8 @@ class SourceReferenceExtractionService:
         self,
         blocks: Iterable[SourceBlock],
         entries: list[SourceReferenceEntry],
+        *,
+        sequence_offset: int = 0,
     ) -> list[SourceReferenceMention]:
         entry_by_key = {
             (entry.document_id, entry.reference_index): entry
@@ -106,7 +105,8 @@ class SourceReferenceExtractionService:
                             SourceReferenceMention(
                                 mention_id=(
                                     f"mention-{document_id}-"
-                                    f"{block.block_id}-{len(mentions) + 1:04d}"
+                                    f"{block.block_id}-"
+                                    f"{sequence_offset + len(mentions) + 1:04d}"
                                 ),
                                 document_id=document_id,
                                 reference_id=entry.reference_id if entry else None,
@@ -197,6 +197,44 @@ class SourceReferenceExtractionService:
         )
 
 
+class SourceReferenceCollector:
+    """Accumulate references over document batches with build-wide numbering.
+
+    Each document's blocks must arrive in a single batch. Entry sequences and
+    mention ids continue across batches, so the result matches one
+    ``SourceReferenceExtractionService.extract`` call over every document.
+    """
+
+    def __init__(self, service: SourceReferenceExtractionService | None = None) -> None:
+        self.service = service or SourceReferenceExtractionService()
+        self._entries: list[SourceReferenceEntry] = []
+        self._mentions: list[SourceReferenceMention] = []
+
+    def add(self, documents: Iterable[SourceDocument]) -> None:
+        blocks = tuple(block for document in documents for block in document.blocks)
+        entries = self.service._extract_entries(
+            blocks,
+            sequence_offset=len(self._entries),
+        )
+        self._mentions.extend(
+            self.service._extract_mentions(
+                blocks,
+                entries,
+                sequence_offset=len(self._mentions),
+            )
+        )
+        self._entries.extend(entries)
+
+    def result(self) -> SourceReferenceSet:
+        return SourceReferenceSet(
+            entries=tuple(self._entries),
+            mentions=tuple(self._mentions),
+            candidates=tuple(
+                self.service._build_candidates(self._entries, self._mentions)
+            ),
+        )
+
+
 def _normalize_text(value: str) -> str:
     return _SPACE_PATTERN.sub(" ", value or "").strip()
 
@@ -10,8 +10,9 @@ from domain.pipeline import (
     PipelineRun,
     PipelineRunStatus,
 )
-from domain.ports import BuildRepository
+from domain.ports import BuildRepository, ProgressNotifier
 from domain.source import BuildStageRecord, TaskRecord
+from infra.notifications.progress import task_progress_topic
 
 
 def _now_iso() -> str:
@@ -21,8 +22,14 @@ def _now_iso() -> str:
 class TaskService:
     """Application operations over durable task and collection-build state."""
 
-    def __init__(self, repository: BuildRepository) -> None:
+    def __init__(
+        self,
+        repository: BuildRepository,
+        *,
+        progress_notifier: ProgressNotifier | None = None,
+    ) -> None:
         self.repository = repository
+        self.progress_notifier = progress_notifier
 
     def create_task(
         self,
@@ -102,6 +109,7 @@ class TaskService:
         )
         if not self.repository.update_task(record, stages=stages):
             raise FileNotFoundError(f"task not found: {task_id}")
+        self._notify(task_id)
         return self._project_task(record, stages=stages)
 
     def finish_task(self, task_id: str, *, status: str, **fields: Any) -> dict:
@@ -139,6 +147,7 @@ class TaskService:
             build_status="succeeded" if successful else "failed",
             activate=successful,
         )
+        self._notify(task_id)
         return self._project_task(record)
 
     def append_error(self, task_id: str, error: str) -> dict:
@@ -147,6 +156,10 @@ class TaskService:
             raise FileNotFoundError(f"task not found: {task_id}")
         return self.update_task(task_id, errors=[*stored.errors, str(error)])
 
+    def _notify(self, task_id: str) -> None:
+        if self.progress_notifier is not None:
+            self.progress_notifier.publish(task_progress_topic(task_id))
+
     def _build_stages(
         self,
         task_id: str,
@@ -4,6 +4,10 @@ import os
 
 from fastapi import APIRouter, HTTPException, Request, Response
 
+from application.auth.password_workers import (
+    LoginThrottledError,
+    PasswordWorkersBusyError,
+)
 from application.auth.session_service import (
     SESSION_COOKIE_NAME,
     InvalidCredentialsError,
@@ -25,10 +29,28 @@ async def login(
     response: Response,
 ) -> AuthSessionResponse:
     try:
-        session = request.app.state.auth_session_service.login(
+        session = await request.app.state.auth_session_service.login_async(
             email=payload.email,
             password=payload.password,
         )
+    except LoginThrottledError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "login_throttled",
+                "message": "Too many login attempts. Try again later.",
+            },
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        ) from exc
+    except PasswordWorkersBusyError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "login_busy",
+                "message": "Login is temporarily busy. Try again shortly.",
+            },
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        ) from exc
     except InvalidCredentialsError as exc:
         raise HTTPException(
             status_code=401,
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
 from typing import Any, Mapping
 
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from application.chat.agent_runner import ChatTurnEvent, ChatTurnEventType
 from application.chat.session_service import (
     ChatApprovalPendingError,
     ChatSessionNotFoundError,
@@ -18,11 +25,14 @@ from controllers.schemas.chat.session import (
     ChatSessionResponse,
     ChatToolCallResponse,
     ChatToolDecisionRequest,
+    ChatToolResultResponse,
     ChatTurnRequest,
     ChatTurnResponse,
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/chat-sessions", tags=["chat-sessions"])
 
 
@@ -122,17 +132,73 @@ async def post_chat_message(
     except ChatSessionNotFoundError as exc:
         raise HTTPException(status_code=404, detail=_session_not_found(exc)) from exc
     except ChatApprovalPendingError as exc:
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "code": "chat_tool_approval_pending",
-                "message": str(exc),
-                "tool_call_id": exc.tool_call_id,
-            },
-        ) from exc
+        raise HTTPException(status_code=409, detail=_approval_pending(exc)) from exc
     return _turn_response(turn)
 
 
+@router.post(
+    "/{session_id}/messages/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+    summary="Run one Research Agent turn as a server-sent event stream",
+)
+async def stream_chat_message(
+    session_id: str,
+    payload: ChatTurnRequest,
+    request: Request,
+) -> StreamingResponse:
+    """Stream answer text, tool calls, and tool results while the turn runs.
+
+    Events are `message`, `text_delta`, `tool_call`, and `tool_result`, then one
+    final `turn` event carrying the same body as the non-streaming endpoint.
+    The turn keeps running and checkpointing if the client disconnects.
+    """
+
+    service = request.app.state.chat_session_service
+    user_id = current_user_id(request)
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[ChatTurnEvent] = asyncio.Queue()
+    worker = asyncio.ensure_future(
+        run_in_threadpool(
+            service.post_message_for_user,
+            session_id,
+            user_id,
+            message=payload.message,
+            on_event=lambda event: loop.call_soon_threadsafe(
+                events.put_nowait,
+                event,
+            ),
+        )
+    )
+    # The session and approval checks run before the first checkpoint, so
+    # waiting for the first event lets them fail as ordinary HTTP errors.
+    first_event = asyncio.ensure_future(events.get())
+    await asyncio.wait({first_event, worker}, return_when=asyncio.FIRST_COMPLETED)
+    started: tuple[ChatTurnEvent, ...] = ()
+    if first_event.done():
+        started = (first_event.result(),)
+    else:
+        first_event.cancel()
+        try:
+            worker.result()
+        except ChatSessionNotFoundError as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=_session_not_found(exc),
+            ) from exc
+        except ChatApprovalPendingError as exc:
+            raise HTTPException(
+                status_code=409,
+                detail=_approval_pending(exc),
+            ) from exc
+
+    return StreamingResponse(
+        _turn_event_stream(started, events, worker),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/{session_id}/tool-calls/{tool_call_id}/decision",
     response_model=ChatTurnResponse,
@@ -175,6 +241,62 @@ async def decide_chat_tool_call(
     return _turn_response(turn)
 
 
+async def _turn_event_stream(
+    started: tuple[ChatTurnEvent, ...],
+    events: asyncio.Queue[ChatTurnEvent],
+    worker: asyncio.Future[Mapping[str, Any]],
+) -> AsyncIterator[str]:
+    for event in started:
+        yield _sse_event(event)
+    while True:
+        if not events.empty():
+            yield _sse_event(events.get_nowait())
+            continue
+        if worker.done():
+            break
+        next_event = asyncio.ensure_future(events.get())
+        await asyncio.wait({next_event, worker}, return_when=asyncio.FIRST_COMPLETED)
+        if next_event.done():
+            yield _sse_event(next_event.result())
+        else:
+            next_event.cancel()
+    try:
+        turn = worker.result()
+    except Exception:  # noqa: BLE001
+        logger.exception("Research Agent streamed turn failed")
+        yield _sse("error", {"code": "chat_turn_failed"})
+        return
+    yield _sse("turn", _turn_response(turn).model_dump(mode="json"))
+
+
+def _sse_event(event: ChatTurnEvent) -> str:
+    if event.type is ChatTurnEventType.MESSAGE:
+        data = _message_response(event.data).model_dump(mode="json")
+    elif event.type is ChatTurnEventType.TOOL_CALL:
+        data = ChatToolCallResponse.model_validate(
+            event.data.to_record()
+        ).model_dump(mode="json")
+    elif event.type is ChatTurnEventType.TOOL_RESULT:
+        data = ChatToolResultResponse.model_validate(
+            event.data.to_record()
+        ).model_dump(mode="json")
+    else:
+        data = dict(event.data)
+    return _sse(event.type.value, data)
+
+
+def _sse(event: str, data: Mapping[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _approval_pending(exc: ChatApprovalPendingError) -> dict[str, str]:
+    return {
+        "code": "chat_tool_approval_pending",
+        "message": str(exc),
+        "tool_call_id": exc.tool_call_id,
+    }
+
+
 def _turn_response(turn: Mapping[str, Any]) -> ChatTurnResponse:
     pending = turn.get("pending_approval")
     return ChatTurnResponse(
@@ -5,8 +5,10 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 
+from controllers.dependencies.progress import progress_event_response
 from controllers.schemas.core.research_objectives import (
     FindingDetailResponse,
     FindingListResponse,
@@ -16,6 +18,7 @@ from controllers.schemas.core.research_objectives import (
     PaginatedObjectiveListResponse,
     PaperStudyInventoryResponse,
 )
+from infra.notifications.progress import objective_analysis_progress_topic
 
 
 router = APIRouter(prefix="/collections", tags=["research-objectives"])
@@ -286,6 +289,46 @@ async def get_collection_objective_analysis_state(
     )
 
 
+@router.get(
+    "/{collection_id}/objectives/{objective_id}/analysis/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+    summary="Stream research objective analysis progress",
+)
+async def stream_collection_objective_analysis_events(
+    collection_id: str,
+    objective_id: str,
+    request: Request,
+) -> StreamingResponse:
+    service = request.app.state.objective_analysis_service
+
+    async def read() -> dict[str, Any]:
+        payload = await run_in_threadpool(
+            service.get_analysis_state,
+            collection_id,
+            objective_id,
+        )
+        return _to_objective_analysis_response(payload).model_dump(mode="json")
+
+    try:
+        initial = await read()
+    except FileNotFoundError as exc:
+        raise _objective_not_found(collection_id, objective_id, exc) from exc
+    return progress_event_response(
+        request,
+        topic=objective_analysis_progress_topic(collection_id, objective_id),
+        event="analysis",
+        initial=initial,
+        read=read,
+        is_terminal=_analysis_settled,
+    )
+
+
+def _analysis_settled(payload: dict[str, Any]) -> bool:
+    active = payload.get("active_analysis")
+    return active is None or active.get("status") not in {"queued", "running"}
+
+
 @router.get(
     "/{collection_id}/objectives/{objective_id}/findings",
     response_model=FindingListResponse,
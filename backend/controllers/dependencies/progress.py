@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+import json
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from infra.notifications.progress import ProgressHub
+
+PROGRESS_HEARTBEAT_S = 15.0
+# Writers can publish several progress steps in quick succession; waiting this
+# long after a notification folds a burst into one re-read.
+PROGRESS_COALESCE_S = 0.25
+
+
+def progress_hub(request: Request) -> ProgressHub:
+    hub = getattr(request.app.state, "progress_hub", None)
+    if hub is None:
+        hub = ProgressHub()
+        request.app.state.progress_hub = hub
+    return hub
+
+
+def progress_event_response(
+    request: Request,
+    *,
+    topic: str,
+    event: str,
+    initial: dict[str, Any],
+    read: Callable[[], Awaitable[dict[str, Any]]],
+    is_terminal: Callable[[dict[str, Any]], bool],
+) -> StreamingResponse:
+    """Stream `read()` as server-sent events whenever `topic` is published.
+
+    The stream re-reads state only after a notification, or once per heartbeat
+    in case a notification was missed, and ends at a terminal state.
+    """
+
+    return StreamingResponse(
+        _progress_events(
+            request,
+            progress_hub(request),
+            topic=topic,
+            event=event,
+            initial=initial,
+            read=read,
+            is_terminal=is_terminal,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _progress_events(
+    request: Request,
+    hub: ProgressHub,
+    *,
+    topic: str,
+    event: str,
+    initial: dict[str, Any],
+    read: Callable[[], Awaitable[dict[str, Any]]],
+    is_terminal: Callable[[dict[str, Any]], bool],
+) -> AsyncIterator[str]:
+    async with hub.subscribe(topic) as subscription:
+        payload = initial
+        previous: dict[str, Any] | None = None
+        # A change published between the initial read and subscribing would
+        # otherwise wait for the heartbeat, so re-read once right away.
+        refresh = True
+        while True:
+            if payload != previous:
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                previous = payload
+            if is_terminal(payload) or await request.is_disconnected():
+                return
+            if not refresh:
+                if await subscription.wait(PROGRESS_HEARTBEAT_S):
+                    await asyncio.sleep(PROGRESS_COALESCE_S)
+                else:
+                    yield ": keep-alive\n\n"
+            refresh = False
+            try:
+                payload = await read()
+            except FileNotFoundError:
+                return
+
+
+__all__ = ["progress_event_response", "progress_hub"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, File, HTTPException, Request, UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from controllers.dependencies.auth import current_user_id
 from controllers.schemas.source.collection import (
@@ -83,15 +84,17 @@ async def upload_collection_file(
     collection_service = request.app.state.collection_service
     try:
         collection_service.get_collection_for_user(collection_id, current_user_id(request))
-        content = await file.read()
-        record = collection_service.add_file(
+        record = await run_in_threadpool(
+            collection_service.add_file_stream,
             collection_id=collection_id,
             filename=file.filename or "upload.bin",
-            content=content,
+            stream=file.file,
             media_type=file.content_type,
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"文件上传失败: {exc}") from exc
     return CollectionFileResponse(
@@ -100,6 +103,42 @@ async def upload_collection_file(
     )
 
 
+@router.post(
+    "/{collection_id}/files/batch",
+    response_model=CollectionFileListResponse,
+    summary="批量上传论文到集合",
+)
+async def upload_collection_files(
+    collection_id: str,
+    request: Request,
+    files: list[UploadFile] = File(...),
+) -> CollectionFileListResponse:
+    """Import several files, or zip archives of them, as one import batch."""
+    collection_service = request.app.state.collection_service
+    try:
+        collection_service.get_collection_for_user(collection_id, current_user_id(request))
+        records = await run_in_threadpool(
+            collection_service.add_uploads,
+            collection_id,
+            [
+                (file.filename or "upload.bin", file.file, file.content_type)
+                for file in files
+            ],
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=500, detail=f"文件上传失败: {exc}") from exc
+    return CollectionFileListResponse(
+        items=[
+            CollectionFileResponse(**record, stored_path=str(record["storage_key"]))
+            for record in records
+        ]
+    )
+
+
 @router.get(
     "/{collection_id}/files",
     response_model=CollectionFileListResponse,
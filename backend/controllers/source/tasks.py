@@ -4,16 +4,21 @@ from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from controllers.dependencies.progress import progress_event_response
 from controllers.schemas.source.task import (
     ArtifactStatusResponse,
     BuildTaskCreateRequest,
     TaskListResponse,
     TaskResponse,
 )
+from infra.notifications.progress import task_progress_topic
 
 router = APIRouter(tags=["tasks"])
 logger = logging.getLogger(__name__)
+_TERMINAL_TASK_STATUSES = {"completed", "partial_success", "failed"}
 _build_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="source-build")
 
 
@@ -107,6 +112,33 @@ async def get_task(task_id: str, request: Request) -> TaskResponse:
     return TaskResponse(**record)
 
 
+@router.get(
+    "/tasks/{task_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+    summary="订阅任务进度事件",
+)
+async def stream_task_events(task_id: str, request: Request) -> StreamingResponse:
+    task_service = request.app.state.task_service
+
+    async def read() -> dict:
+        record = await run_in_threadpool(task_service.get_task, task_id)
+        return TaskResponse(**record).model_dump(mode="json")
+
+    try:
+        initial = await read()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return progress_event_response(
+        request,
+        topic=task_progress_topic(task_id),
+        event="task",
+        initial=initial,
+        read=read,
+        is_terminal=lambda payload: payload["status"] in _TERMINAL_TASK_STATUSES,
+    )
+
+
 @router.get(
     "/tasks/{task_id}/artifacts",
     response_model=ArtifactStatusResponse,
@@ -218,11 +218,84 @@ class ModelUsage:
         }
 
 
+@dataclass(frozen=True)
+class SpanTiming:
+    """Wall time and counters aggregated over every span sharing one path.
+
+    `path` joins nested span names with `/`, so `total_ms` of a parent covers
+    its children and parallel spans may add up to more than the wall time.
+    """
+
+    path: str
+    count: int
+    total_ms: float
+    max_ms: float
+    counters: Mapping[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.path.strip():
+            raise ValueError("span path cannot be empty")
+        if self.count < 1:
+            raise ValueError("span count must be positive")
+        if self.total_ms < 0 or self.max_ms < 0:
+            raise ValueError("span timings cannot be negative")
+        object.__setattr__(self, "counters", dict(self.counters))
+
+    @property
+    def depth(self) -> int:
+        return self.path.count("/")
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> "SpanTiming":
+        counters = payload.get("counters")
+        return cls(
+            path=str(payload.get("path") or "").strip(),
+            count=int(payload.get("count") or 0),
+            total_ms=float(payload.get("total_ms") or 0.0),
+            max_ms=float(payload.get("max_ms") or 0.0),
+            counters=(
+                {str(name): value for name, value in counters.items()}
+                if isinstance(counters, Mapping)
+                else {}
+            ),
+        )
+
+    @classmethod
+    def aggregate(cls, values: Iterable["SpanTiming"]) -> "SpanTiming":
+        spans = tuple(values)
+        if not spans:
+            raise ValueError("cannot aggregate empty span timings")
+        path = spans[0].path
+        if any(span.path != path for span in spans):
+            raise ValueError("cannot aggregate timings from different span paths")
+        counters: dict[str, float] = {}
+        for span in spans:
+            for name, value in span.counters.items():
+                counters[name] = counters.get(name, 0) + value
+        return cls(
+            path=path,
+            count=sum(span.count for span in spans),
+            total_ms=round(sum(span.total_ms for span in spans), 3),
+            max_ms=max(span.max_ms for span in spans),
+            counters=counters,
+        )
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "max_ms": self.max_ms,
+            "counters": dict(self.counters),
+        }
+
+
 @dataclass(frozen=True)
 class ExecutionStats:
     duration_ms: int | None = None
     model_usage: tuple[ModelUsage, ...] = ()
     prompt_versions: Mapping[str, str] = field(default_factory=dict)
+    spans: tuple[SpanTiming, ...] = ()
 
     def __post_init__(self) -> None:
         if self.duration_ms is not None and self.duration_ms < 0:
@@ -233,6 +306,7 @@ class ExecutionStats:
             "prompt_versions",
             deepcopy(dict(self.prompt_versions)),
         )
+        object.__setattr__(self, "spans", tuple(self.spans))
 
     @property
     def token_usage(self) -> TokenUsage | None:
@@ -261,6 +335,11 @@ class ExecutionStats:
                 if isinstance(source.get("prompt_versions"), Mapping)
                 else {}
             ),
+            spans=tuple(
+                SpanTiming.from_mapping(item)
+                for item in source.get("spans") or ()
+                if isinstance(item, Mapping)
+            ),
         )
 
     @classmethod
@@ -273,9 +352,12 @@ class ExecutionStats:
         stats = tuple(values)
         usage_by_model: dict[str, list[ModelUsage]] = {}
         prompt_versions: dict[str, str] = {}
+        spans_by_path: dict[str, list[SpanTiming]] = {}
         for item in stats:
             for model in item.model_usage:
                 usage_by_model.setdefault(model.model_name, []).append(model)
+            for span in item.spans:
+                spans_by_path.setdefault(span.path, []).append(span)
             for task_type, version in item.prompt_versions.items():
                 previous = prompt_versions.get(task_type)
                 if previous is not None and previous != version:
@@ -290,10 +372,13 @@ class ExecutionStats:
                 ModelUsage.aggregate(models) for models in usage_by_model.values()
             ),
             prompt_versions=prompt_versions,
+            spans=tuple(
+                SpanTiming.aggregate(spans) for spans in spans_by_path.values()
+            ),
         )
 
     def to_record(self) -> dict[str, Any]:
-        return {
+        record: dict[str, Any] = {
             "duration_ms": self.duration_ms,
             "token_usage": (
                 self.token_usage.to_record() if self.token_usage is not None else None
@@ -302,6 +387,9 @@ class ExecutionStats:
             "unreported_request_count": self.unreported_request_count,
             "prompt_versions": dict(self.prompt_versions),
         }
+        if self.spans:
+            record["spans"] = [span.to_record() for span in self.spans]
+        return record
 
 
 @dataclass(frozen=True)
@@ -631,5 +719,6 @@ __all__ = [
     "PipelineNodeStatus",
     "PipelineRun",
     "PipelineRunStatus",
+    "SpanTiming",
     "TokenUsage",
 ]
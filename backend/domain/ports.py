@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Protocol
+from typing import Any, Iterator, Mapping, Protocol
 
 from domain.core.comparison import (
     ComparisonFactSet,
@@ -20,11 +21,13 @@ from domain.pipeline import ExecutionStats
 from domain.core.finding import Finding
 from domain.source import (
     ArtifactVersionRecord,
+    BuildPurgeProgress,
     BuildStageRecord,
     CollectionBuildRecord,
     CollectionFileRecord,
     CollectionHandoffRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
     CollectionRecord,
     CollectionDocumentRecord,
     DocumentRecord,
@@ -109,6 +112,27 @@ class CollectionRepository(Protocol):
 
     def delete_collection(self, collection_id: str) -> bool: ...
 
+    def tombstone_collection(self, collection_id: str, *, deleted_at: str) -> bool: ...
+
+    def cancel_collection_builds(
+        self,
+        collection_id: str,
+        *,
+        finished_at: str,
+    ) -> int: ...
+
+    def list_tombstoned_collections(self, limit: int = 100) -> tuple[str, ...]: ...
+
+    def purge_collection_rows(
+        self,
+        collection_id: str,
+        *,
+        batch_size: int = 1000,
+        start_table: str | None = None,
+    ) -> CollectionPurgeProgress: ...
+
+    def finalize_collection_purge(self, collection_id: str) -> bool: ...
+
 
 class BuildRepository(Protocol):
     def add_task(
@@ -165,6 +189,25 @@ class BuildRepository(Protocol):
         collection_id: str,
     ) -> CollectionBuildRecord | None: ...
 
+    def list_expired_builds(
+        self,
+        *,
+        keep_last: int,
+        limit: int = 100,
+    ) -> tuple[CollectionBuildRecord, ...]: ...
+
+    def count_build_rows(self, build_id: str) -> dict[str, int]: ...
+
+    def purge_build_rows(
+        self,
+        build_id: str,
+        *,
+        batch_size: int = 1000,
+        start_table: str | None = None,
+    ) -> BuildPurgeProgress: ...
+
+    def finalize_build_purge(self, build_id: str) -> bool: ...
+
 
 class ChatRepository(Protocol):
     def add_session(self, record: ChatSession) -> None: ...
@@ -173,6 +216,14 @@ class ChatRepository(Protocol):
 
     def read_messages(self, session_id: str) -> tuple[ChatMessage, ...]: ...
 
+    def read_recent_messages(
+        self,
+        session_id: str,
+        *,
+        limit: int,
+        max_chars: int,
+    ) -> tuple[ChatMessage, ...]: ...
+
     def read_tool_call(self, tool_call_id: str) -> ChatToolCall | None: ...
 
     def save_trajectory(
@@ -213,6 +264,12 @@ class ExperimentPlanRepository(Protocol):
     ) -> tuple[ExperimentPlanRecord, ...]: ...
 
 
+class SourceDocumentWriter(Protocol):
+    """Append one batch inside `write_collection_documents`."""
+
+    def append(self, documents: tuple[SourceDocument, ...]) -> None: ...
+
+
 class SourceArtifactRepository(Protocol):
     backend_name: str
 
@@ -223,6 +280,12 @@ class SourceArtifactRepository(Protocol):
         documents: tuple[SourceDocument, ...],
     ) -> None: ...
 
+    def write_collection_documents(
+        self,
+        collection_id: str,
+        build_id: str,
+    ) -> AbstractContextManager[SourceDocumentWriter]: ...
+
     def read_collection_documents(
         self,
         collection_id: str,
@@ -236,6 +299,12 @@ class SourceArtifactRepository(Protocol):
         build_id: str | None = None,
     ) -> SourceDocumentTree: ...
 
+    def count_collection_artifacts(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+    ) -> dict[str, int]: ...
+
     def list_documents(
         self,
         collection_id: str,
@@ -243,6 +312,14 @@ class SourceArtifactRepository(Protocol):
         build_id: str | None = None,
     ) -> list[SourceDocument]: ...
 
+    def read_document(
+        self,
+        collection_id: str,
+        document_id: str,
+        *,
+        build_id: str | None = None,
+    ) -> SourceDocument | None: ...
+
     def list_text_units(
         self,
         collection_id: str,
@@ -486,6 +563,68 @@ class ObjectiveRepository(Protocol):
         limit: int = 100,
     ) -> tuple[tuple[ObjectiveEvidence, ...], int]: ...
 
+    def iter_findings_with_evidence(
+        self,
+        collection_id: str,
+        objective_id: str,
+        analysis_version: int,
+        *,
+        batch_size: int = 200,
+    ) -> Iterator[tuple[Finding, tuple[ObjectiveEvidence, ...]]]: ...
+
+
+class ObjectiveStageCache(Protocol):
+    """Rebuildable per-document analysis stage output keyed by its inputs."""
+
+    def read_stage(
+        self,
+        collection_id: str,
+        stage: str,
+        key: str,
+    ) -> tuple[dict[str, Any], ...] | None: ...
+
+    def write_stage(
+        self,
+        collection_id: str,
+        stage: str,
+        key: str,
+        records: tuple[dict[str, Any], ...],
+    ) -> None: ...
+
+
+class SourceLexicalIndexStore(Protocol):
+    """Rebuildable serialized lexical index for one collection build."""
+
+    def read_index(self, collection_id: str, build_id: str) -> bytes | None: ...
+
+    def write_index(self, collection_id: str, build_id: str, payload: bytes) -> None: ...
+
+    def index_size(self, collection_id: str, build_id: str) -> int: ...
+
+    def delete_index(self, collection_id: str, build_id: str) -> int: ...
+
+
+class FigureRenderCache(Protocol):
+    """Bounded cache of figure images rendered on demand from source PDFs."""
+
+    def read(self, collection_id: str, render_key: str) -> bytes | None: ...
+
+    def contains(self, collection_id: str, render_key: str) -> bool: ...
+
+    def write(self, collection_id: str, render_key: str, payload: bytes) -> None: ...
+
+
+class JobLock(Protocol):
+    """Exclusive right to run one pass of a background job across processes."""
+
+    def hold(self) -> AbstractContextManager[bool]: ...
+
+
+class ProgressNotifier(Protocol):
+    """Signal that the stored progress behind one topic has changed."""
+
+    def publish(self, topic: str) -> None: ...
+
 
 class ComparisonRepository(Protocol):
     backend_name: str
@@ -3,6 +3,7 @@
 from domain.source.artifact_status import ArtifactStatusRecord
 from domain.source.build import (
     ArtifactVersionRecord,
+    BuildPurgeProgress,
     BuildStageRecord,
     CollectionBuildRecord,
     TaskRecord,
@@ -48,6 +49,7 @@ from domain.source.collection import (
     CollectionHandoffRecord,
     CollectionImportDocumentRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
     CollectionRecord,
     empty_import_manifest,
 )
@@ -62,11 +64,13 @@ from domain.source.document import (
 __all__ = [
     "ArtifactVersionRecord",
     "ArtifactStatusRecord",
+    "BuildPurgeProgress",
     "BuildStageRecord",
     "CollectionFileRecord",
     "CollectionHandoffRecord",
     "CollectionImportDocumentRecord",
     "CollectionImportRecord",
+    "CollectionPurgeProgress",
     "CollectionRecord",
     "CollectionBuildRecord",
     "CollectionDocumentRecord",
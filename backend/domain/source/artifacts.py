@@ -4,6 +4,7 @@ from dataclasses import dataclass, field, replace
 import json
 import math
 import re
+import sys
 from typing import Any, Iterable, Literal, Mapping
 
 
@@ -34,7 +35,7 @@ _UNIT_HINT_PATTERN = re.compile(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceDocument:
     document_id: str
     document_order: int
@@ -56,7 +57,7 @@ class SourceDocument:
     @classmethod
     def from_record(cls, value: Mapping[str, Any]) -> "SourceDocument":
         return cls(
-            document_id=str(value.get("document_id") or value.get("id") or ""),
+            document_id=_interned_text(value.get("document_id") or value.get("id")),
             document_order=safe_int(value.get("document_order")) or 0,
             title=str(value.get("title") or ""),
             text=str(value.get("text") or ""),
@@ -106,7 +107,7 @@ class SourceDocument:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceTextUnit:
     text_unit_id: str
     text_unit_order: int
@@ -121,7 +122,7 @@ class SourceTextUnit:
             text_unit_order=safe_int(value.get("text_unit_order")) or 0,
             text=str(value.get("text") or ""),
             n_tokens=safe_int(value.get("n_tokens")),
-            document_ids=_string_tuple(value.get("document_ids")),
+            document_ids=_interned_tuple(value.get("document_ids")),
         )
 
     def to_record(self) -> dict[str, Any]:
@@ -134,7 +135,7 @@ class SourceTextUnit:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceBlock:
     block_id: str
     document_id: str
@@ -150,13 +151,13 @@ class SourceBlock:
     def from_record(cls, value: Mapping[str, Any]) -> "SourceBlock":
         return cls(
             block_id=str(value.get("block_id") or ""),
-            document_id=str(value.get("document_id") or value.get("id") or ""),
-            block_type=str(value.get("block_type") or "paragraph"),
+            document_id=_interned_text(value.get("document_id") or value.get("id")),
+            block_type=_interned_text(value.get("block_type") or "paragraph"),
             text=str(value.get("text") or ""),
             block_order=safe_int(value.get("block_order")) or 0,
-            text_unit_ids=_string_tuple(value.get("text_unit_ids")),
+            text_unit_ids=_interned_tuple(value.get("text_unit_ids")),
             page=safe_int(value.get("page")),
-            heading_path=normalize_optional_text(value.get("heading_path")),
+            heading_path=_interned_optional_text(value.get("heading_path")),
             heading_level=safe_int(value.get("heading_level")),
         )
 
@@ -174,7 +175,7 @@ class SourceBlock:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceLayoutBlock:
     block_id: str | None
     text: str | None
@@ -206,7 +207,7 @@ class SourceLayoutBlock:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceTable:
     table_id: str
     document_id: str
@@ -233,12 +234,12 @@ class SourceTable:
         header_row_count = safe_int(value.get("header_row_count"))
         return cls(
             table_id=str(value.get("table_id") or ""),
-            document_id=str(value.get("document_id") or ""),
+            document_id=_interned_text(value.get("document_id")),
             table_order=safe_int(value.get("table_order")) or 0,
             caption_text=normalize_optional_text(value.get("caption_text")),
             caption_block_id=normalize_optional_text(value.get("caption_block_id")),
             page=safe_int(value.get("page")),
-            heading_path=normalize_optional_text(value.get("heading_path")),
+            heading_path=_interned_optional_text(value.get("heading_path")),
             column_headers=_string_tuple(value.get("column_headers")),
             table_matrix=_table_matrix_tuple(value.get("table_matrix")),
             header_row_count=max(
@@ -274,7 +275,7 @@ class SourceTable:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceTableCell:
     cell_id: str
     document_id: str
@@ -297,8 +298,8 @@ class SourceTableCell:
         col_span = safe_int(value.get("col_span"))
         return cls(
             cell_id=str(value.get("cell_id") or ""),
-            document_id=str(value.get("document_id") or value.get("id") or ""),
-            table_id=str(value.get("table_id") or ""),
+            document_id=_interned_text(value.get("document_id") or value.get("id")),
+            table_id=_interned_text(value.get("table_id")),
             row_index=safe_int(value.get("row_index")) or 0,
             col_index=safe_int(value.get("col_index")) or 0,
             cell_text=str(value.get("cell_text") or ""),
@@ -307,9 +308,9 @@ class SourceTableCell:
             column_header=bool(value.get("column_header")),
             row_header=bool(value.get("row_header")),
             row_section=bool(value.get("row_section")),
-            header_path=normalize_optional_text(value.get("header_path")),
+            header_path=_interned_optional_text(value.get("header_path")),
             page=safe_int(value.get("page")),
-            unit_hint=normalize_optional_text(value.get("unit_hint")),
+            unit_hint=_interned_optional_text(value.get("unit_hint")),
         )
 
     def to_record(self) -> dict[str, Any]:
@@ -332,7 +333,7 @@ class SourceTableCell:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceTableRow:
     row_id: str
     document_id: str
@@ -346,12 +347,12 @@ class SourceTableRow:
     def from_record(cls, value: Mapping[str, Any]) -> "SourceTableRow":
         return cls(
             row_id=str(value.get("row_id") or ""),
-            document_id=str(value.get("document_id") or ""),
-            table_id=str(value.get("table_id") or ""),
+            document_id=_interned_text(value.get("document_id")),
+            table_id=_interned_text(value.get("table_id")),
             row_index=safe_int(value.get("row_index")) or 0,
             row_text=str(value.get("row_text") or ""),
             page=safe_int(value.get("page")),
-            heading_path=normalize_optional_text(value.get("heading_path")),
+            heading_path=_interned_optional_text(value.get("heading_path")),
         )
 
     def to_record(self) -> dict[str, Any]:
@@ -366,7 +367,7 @@ class SourceTableRow:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceFigure:
     figure_id: str
     document_id: str
@@ -388,15 +389,15 @@ class SourceFigure:
     def from_record(cls, value: Mapping[str, Any]) -> "SourceFigure":
         return cls(
             figure_id=str(value.get("figure_id") or ""),
-            document_id=str(value.get("document_id") or ""),
+            document_id=_interned_text(value.get("document_id")),
             figure_order=safe_int(value.get("figure_order")) or 0,
             figure_label=normalize_optional_text(value.get("figure_label")),
             caption_text=normalize_optional_text(value.get("caption_text")),
             caption_block_id=normalize_optional_text(value.get("caption_block_id")),
             page=safe_int(value.get("page")),
-            heading_path=normalize_optional_text(value.get("heading_path")),
+            heading_path=_interned_optional_text(value.get("heading_path")),
             image_path=normalize_optional_text(value.get("image_path")),
-            image_mime_type=normalize_optional_text(value.get("image_mime_type")),
+            image_mime_type=_interned_optional_text(value.get("image_mime_type")),
             image_width=safe_int(value.get("image_width")),
             image_height=safe_int(value.get("image_height")),
             asset_sha256=normalize_optional_text(value.get("asset_sha256")),
@@ -529,7 +530,7 @@ def source_documents_from_records(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceReferenceEntry:
     reference_id: str
     document_id: str
@@ -578,7 +579,7 @@ class SourceReferenceEntry:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceReferenceMention:
     mention_id: str
     document_id: str
@@ -618,7 +619,7 @@ class SourceReferenceMention:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceReferenceResolution:
     resolution_id: str
     reference_id: str
@@ -672,7 +673,7 @@ class SourceReferenceResolution:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceReferenceCandidate:
     candidate_id: str
     reference_id: str
@@ -725,7 +726,7 @@ class SourceReferenceCandidate:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceReferenceSet:
     entries: tuple[SourceReferenceEntry, ...] = ()
     mentions: tuple[SourceReferenceMention, ...] = ()
@@ -733,7 +734,7 @@ class SourceReferenceSet:
     candidates: tuple[SourceReferenceCandidate, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceDocumentNode:
     node_id: str
     document_id: str
@@ -796,7 +797,7 @@ class SourceDocumentNode:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceDocumentTree:
     document_id: str
     collection_id: str | None
@@ -1099,6 +1100,21 @@ def _string_tuple(value: Any) -> tuple[str, ...]:
     return (str(value),)
 
 
+def _interned_text(value: Any) -> str:
+    """Return `value` as a shared string; ids and labels repeat per record."""
+
+    return sys.intern(str(value or ""))
+
+
+def _interned_optional_text(value: Any) -> str | None:
+    text = normalize_optional_text(value)
+    return sys.intern(text) if text is not None else None
+
+
+def _interned_tuple(value: Any) -> tuple[str, ...]:
+    return tuple(sys.intern(item) for item in _string_tuple(value))
+
+
 def _table_matrix_tuple(value: Any) -> tuple[tuple[str, ...], ...]:
     if _is_missing_value(value):
         return ()
@@ -120,6 +120,20 @@ class CollectionBuildRecord:
     finished_at: str | None
 
 
+@dataclass(frozen=True)
+class BuildPurgeProgress:
+    """One bounded step of removing an expired build's rows.
+
+    `table` names the table the step deleted from; a purge resumes from it.
+    `done` means only the build's task, stages and build row remain.
+    """
+
+    build_id: str
+    table: str | None
+    deleted_rows: int
+    done: bool
+
+
 @dataclass(frozen=True)
 class BuildStageRecord:
     stage_id: str
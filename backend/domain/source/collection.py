@@ -190,6 +190,20 @@ class CollectionHandoffRecord:
         }
 
 
+@dataclass(frozen=True)
+class CollectionPurgeProgress:
+    """One bounded step of removing a tombstoned collection's rows.
+
+    `table` names the table the step deleted from; a purge resumes from it.
+    `done` means only the collection's files, memberships and row remain.
+    """
+
+    collection_id: str
+    table: str | None
+    deleted_rows: int
+    done: bool
+
+
 def empty_import_manifest(collection_id: str) -> dict[str, Any]:
     return {
         "schema_version": 1,
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from typing import Protocol
+from dataclasses import dataclass
+from typing import BinaryIO, Protocol
+
+
+@dataclass(frozen=True)
+class StagedObject:
+    """Bytes streamed into object-store staging, hashed on the way in."""
+
+    staging_key: str
+    sha256: str
+    size_bytes: int
 
 
 class ObjectStore(Protocol):
@@ -8,4 +18,16 @@ class ObjectStore(Protocol):
 
     def read(self, storage_key: str, sha256: str) -> bytes: ...
 
-    def delete(self, storage_key: str) -> None: ...
+    def delete(self, storage_key: str, sha256: str) -> bool: ...
+
+    def release(self, sha256: str) -> bool: ...
+
+    def collect_unreferenced(self) -> int: ...
+
+    def stage(self, stream: BinaryIO) -> StagedObject: ...
+
+    def open_staged(self, staged: StagedObject) -> BinaryIO: ...
+
+    def commit_staged(self, storage_key: str, staged: StagedObject) -> None: ...
+
+    def discard_staged(self, staged: StagedObject) -> None: ...
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Mapping
-
-from openai import OpenAI
+from types import SimpleNamespace
+from typing import Any, Callable, Mapping
 
 from application.chat.capabilities import ToolSpec
 from application.chat.model import (
@@ -16,6 +15,7 @@ from application.chat.model import (
     RESEARCH_AGENT_SYSTEM_PROMPT,
 )
 from domain.chat import ChatMessage, ChatMessageRole
+from infra.llm.transport import build_default_llm_client
 from infra.llm.usage import record_llm_completion, record_llm_prompt_version
 
 
@@ -31,9 +31,8 @@ class OpenAIChatModel:
             or os.getenv("LLM_MODEL")
             or "gpt-4o-mini"
         ).strip()
-        self.client = client or OpenAI(
-            api_key=os.getenv("LLM_API_KEY", "").strip() or "not-needed",
-            base_url=os.getenv("LLM_BASE_URL", "").strip() or None,
+        self.client = client or build_default_llm_client(
+            task_type="research_agent",
         )
 
     def respond(
@@ -42,6 +41,85 @@ class OpenAIChatModel:
         messages: tuple[ChatMessage, ...],
         tool_specs: tuple[ToolSpec, ...],
     ) -> ModelTurn:
+        completion = self.client.chat.completions.create(
+            **self._request(messages, tool_specs)
+        )
+        record_llm_prompt_version("research_agent", RESEARCH_AGENT_PROMPT_VERSION)
+        record_llm_completion(completion, requested_model=self.model)
+        if not getattr(completion, "choices", None):
+            raise ValueError("research model returned no choices")
+        message = completion.choices[0].message
+        return _model_turn(
+            str(getattr(message, "content", None) or ""),
+            tuple(
+                (
+                    str(raw_call.id),
+                    getattr(raw_call, "type", "function"),
+                    str(raw_call.function.name),
+                    str(raw_call.function.arguments or ""),
+                )
+                for raw_call in getattr(message, "tool_calls", None) or ()
+            ),
+        )
+
+    def respond_streaming(
+        self,
+        *,
+        messages: tuple[ChatMessage, ...],
+        tool_specs: tuple[ToolSpec, ...],
+        on_text_delta: Callable[[str], None],
+    ) -> ModelTurn:
+        """Stream one completion, reporting answer text as it arrives."""
+
+        request = self._request(messages, tool_specs)
+        request.update(stream=True, stream_options={"include_usage": True})
+        record_llm_prompt_version("research_agent", RESEARCH_AGENT_PROMPT_VERSION)
+        content: list[str] = []
+        # Tool call fragments arrive keyed by index: the id, type, and name in
+        # the first fragment, then the JSON arguments split across the rest.
+        tool_calls: dict[int, list[str]] = {}
+        model_name: str | None = None
+        usage: Any = None
+        saw_choice = False
+        for chunk in self.client.chat.completions.create(**request):
+            model_name = getattr(chunk, "model", None) or model_name
+            usage = getattr(chunk, "usage", None) or usage
+            for choice in getattr(chunk, "choices", None) or ():
+                saw_choice = True
+                delta = choice.delta
+                text = getattr(delta, "content", None)
+                if text:
+                    content.append(text)
+                    on_text_delta(text)
+                for fragment in getattr(delta, "tool_calls", None) or ():
+                    parts = tool_calls.setdefault(
+                        int(fragment.index),
+                        ["", "function", "", ""],
+                    )
+                    if getattr(fragment, "id", None):
+                        parts[0] = str(fragment.id)
+                    if getattr(fragment, "type", None):
+                        parts[1] = str(fragment.type)
+                    function = getattr(fragment, "function", None)
+                    if function is not None:
+                        parts[2] += str(getattr(function, "name", None) or "")
+                        parts[3] += str(getattr(function, "arguments", None) or "")
+        record_llm_completion(
+            SimpleNamespace(model=model_name, usage=usage),
+            requested_model=self.model,
+        )
+        if not saw_choice:
+            raise ValueError("research model returned no choices")
+        return _model_turn(
+            "".join(content),
+            tuple(tuple(tool_calls[index]) for index in sorted(tool_calls)),
+        )
+
+    def _request(
+        self,
+        messages: tuple[ChatMessage, ...],
+        tool_specs: tuple[ToolSpec, ...],
+    ) -> dict[str, Any]:
         request: dict[str, Any] = {
             "model": self.model,
             "temperature": 0.2,
@@ -56,34 +134,33 @@ class OpenAIChatModel:
                 tool_choice="auto",
                 parallel_tool_calls=False,
             )
-        completion = self.client.chat.completions.create(**request)
-        record_llm_prompt_version("research_agent", RESEARCH_AGENT_PROMPT_VERSION)
-        record_llm_completion(completion, requested_model=self.model)
-        if not getattr(completion, "choices", None):
-            raise ValueError("research model returned no choices")
-        message = completion.choices[0].message
-        tool_calls = tuple(getattr(message, "tool_calls", None) or ())
-        if len(tool_calls) > 1:
-            raise ValueError("research model must return exactly one tool call")
-        content = str(getattr(message, "content", None) or "").strip()
-        if not tool_calls:
-            return ModelTurn(content=content)
-
-        raw_call = tool_calls[0]
-        if getattr(raw_call, "type", "function") != "function":
-            raise ValueError("research model returned an unsupported tool call type")
-        function = raw_call.function
-        arguments = json.loads(str(function.arguments or "{}"))
-        if not isinstance(arguments, Mapping):
-            raise ValueError("research tool arguments must be a JSON object")
-        return ModelTurn(
-            content=content,
-            tool_call=ModelToolCall(
-                tool_call_id=str(raw_call.id),
-                name=str(function.name),
-                arguments=dict(arguments),
-            ),
-        )
+        return request
+
+
+def _model_turn(
+    content: str,
+    tool_calls: tuple[tuple[str, str, str, str], ...],
+) -> ModelTurn:
+    if len(tool_calls) > 1:
+        raise ValueError("research model must return exactly one tool call")
+    content = content.strip()
+    if not tool_calls:
+        return ModelTurn(content=content)
+
+    tool_call_id, call_type, name, raw_arguments = tool_calls[0]
+    if call_type != "function":
+        raise ValueError("research model returned an unsupported tool call type")
+    arguments = json.loads(raw_arguments or "{}")
+    if not isinstance(arguments, Mapping):
+        raise ValueError("research tool arguments must be a JSON object")
+    return ModelTurn(
+        content=content,
+        tool_call=ModelToolCall(
+            tool_call_id=tool_call_id,
+            name=name,
+            arguments=dict(arguments),
+        ),
+    )
 
 
 def _provider_message(message: ChatMessage) -> dict[str, Any]:
@@ -0,0 +1,95 @@
+"""Process-wide tiktoken encodings and batched token counting."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+import os
+
+import tiktoken
+
+DEFAULT_ENCODING_NAME = "cl100k_base"
+_SERIAL_BATCH_LIMIT = 16
+_MAX_BATCH_THREADS = 8
+
+EncodingRef = str | tiktoken.Encoding
+
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Return one shared encoding per name for the whole process."""
+
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=64)
+def encoding_for_model(model: str) -> tiktoken.Encoding:
+    """Return the model's encoding, falling back to ``cl100k_base``."""
+
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        encoding_name = DEFAULT_ENCODING_NAME
+    return get_encoding(encoding_name)
+
+
+def encode_texts(
+    texts: Iterable[str],
+    *,
+    encoding: EncodingRef = DEFAULT_ENCODING_NAME,
+    num_threads: int | None = None,
+) -> list[list[int]]:
+    """Encode texts in one native batch.
+
+    Special-token markers are encoded as ordinary text, so document text
+    containing strings such as ``<|endoftext|>`` is counted, not rejected.
+    Small batches stay on the calling thread because tiktoken starts a
+    thread pool per batch call.
+    """
+
+    resolved = _resolve_encoding(encoding)
+    values = [text if isinstance(text, str) else f"{text}" for text in texts]
+    if len(values) <= _SERIAL_BATCH_LIMIT:
+        return [resolved.encode_ordinary(text) for text in values]
+    return resolved.encode_ordinary_batch(
+        values,
+        num_threads=num_threads or _default_batch_threads(),
+    )
+
+
+def count_tokens(
+    texts: Iterable[str],
+    *,
+    encoding: EncodingRef = DEFAULT_ENCODING_NAME,
+    num_threads: int | None = None,
+) -> list[int]:
+    """Return the token count of each text, in input order."""
+
+    return [
+        len(tokens)
+        for tokens in encode_texts(texts, encoding=encoding, num_threads=num_threads)
+    ]
+
+
+def count_text_tokens(text: str, *, encoding: EncodingRef = DEFAULT_ENCODING_NAME) -> int:
+    return len(_resolve_encoding(encoding).encode_ordinary(text))
+
+
+def _resolve_encoding(encoding: EncodingRef) -> tiktoken.Encoding:
+    if isinstance(encoding, tiktoken.Encoding):
+        return encoding
+    return get_encoding(encoding)
+
+
+def _default_batch_threads() -> int:
+    return max(1, min(_MAX_BATCH_THREADS, os.cpu_count() or 1))
+
+
+__all__ = [
+    "DEFAULT_ENCODING_NAME",
+    "count_text_tokens",
+    "count_tokens",
+    "encode_texts",
+    "encoding_for_model",
+    "get_encoding",
+]
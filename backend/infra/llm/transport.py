@@ -0,0 +1,690 @@
+"""Shared pooled OpenAI-compatible transport with adaptive rate limiting.
+
+Every default model client in the backend sends its requests through one
+process-wide `LLMTransport` per provider endpoint. The transport owns a single
+`AsyncOpenAI` client with an explicitly sized HTTP connection pool, a
+priority-ordered token-bucket limiter on requests and tokens per minute that
+backs off on 429 responses and provider rate-limit headers, and a jittered
+retry policy bounded by a shared retry budget. Synchronous call sites keep the
+OpenAI client shape through `SyncLLMClient`, including `stream=True` requests,
+whose chunks are relayed from the transport loop as they arrive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+from collections.abc import Awaitable, Callable, Coroutine, Iterator, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, TypeVar
+
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
+
+from infra.llm.usage import current_llm_task_type
+from infra.tracing.spans import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CHAT_COMPLETIONS_CREATE = "chat.completions.create"
+CHAT_COMPLETIONS_PARSE = "beta.chat.completions.parse"
+
+INTERACTIVE_PRIORITY = 0
+ANALYSIS_PRIORITY = 1
+BULK_PRIORITY = 2
+
+# Lower values are admitted first when the limiter is saturated: interactive
+# chat turns, then confirmed-Objective analysis, then build-time bulk work.
+TASK_PRIORITIES: Mapping[str, int] = {
+    "research_agent": INTERACTIVE_PRIORITY,
+    "objective_paper_frame": ANALYSIS_PRIORITY,
+    "objective_evidence_route": ANALYSIS_PRIORITY,
+    "objective_evidence_extraction": ANALYSIS_PRIORITY,
+    "finding_synthesis": ANALYSIS_PRIORITY,
+    "paper_fact_table_matrix_repair": ANALYSIS_PRIORITY,
+    "document_profile": BULK_PRIORITY,
+    "paper_skim": BULK_PRIORITY,
+    "paper_signal_reconciliation": BULK_PRIORITY,
+    "research_axis_canonicalization": BULK_PRIORITY,
+    "paper_fact_text_window": BULK_PRIORITY,
+    "paper_fact_table_batch": BULK_PRIORITY,
+}
+
+_DEFAULT_COMPLETION_TOKEN_RESERVE = 1024
+_CHARS_PER_TOKEN = 4
+_BURST_WINDOW_S = 10.0
+_DURATION_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+@dataclass(frozen=True)
+class LLMTransportSettings:
+    """Connection, rate-limit, and retry settings for one provider endpoint."""
+
+    api_key: str
+    base_url: str | None = None
+    max_connections: int = 32
+    max_keepalive_connections: int = 16
+    keepalive_expiry_s: float = 30.0
+    connect_timeout_s: float = 10.0
+    read_timeout_s: float = 600.0
+    requests_per_minute: float = 600.0
+    tokens_per_minute: float = 400_000.0
+    max_attempts: int = 5
+    retry_base_delay_s: float = 0.5
+    retry_max_delay_s: float = 30.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_burst: float = 20.0
+
+    def __post_init__(self) -> None:
+        if self.max_connections < 1 or self.max_keepalive_connections < 0:
+            raise ValueError("LLM connection pool sizes must be positive")
+        if self.requests_per_minute <= 0 or self.tokens_per_minute <= 0:
+            raise ValueError("LLM rate limits must be positive")
+        if self.max_attempts < 1:
+            raise ValueError("LLM max_attempts must be at least 1")
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+    ) -> "LLMTransportSettings":
+        return cls(
+            api_key=(api_key or os.getenv("LLM_API_KEY", "").strip() or "not-needed"),
+            base_url=(base_url or os.getenv("LLM_BASE_URL", "").strip() or None),
+            max_connections=_env_int("LLM_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=_env_int(
+                "LLM_MAX_KEEPALIVE_CONNECTIONS",
+                cls.max_keepalive_connections,
+            ),
+            requests_per_minute=_env_float(
+                "LLM_REQUESTS_PER_MINUTE",
+                cls.requests_per_minute,
+            ),
+            tokens_per_minute=_env_float(
+                "LLM_TOKENS_PER_MINUTE",
+                cls.tokens_per_minute,
+            ),
+            max_attempts=_env_int("LLM_MAX_ATTEMPTS", cls.max_attempts),
+        )
+
+
+class AdaptiveRateLimiter:
+    """Priority-ordered request and token buckets that follow provider signals.
+
+    Both buckets refill continuously at the configured per-minute rate scaled
+    by an adaptive factor. A 429 halves the factor and pauses admission for the
+    provider's retry-after interval; every success restores a little of it.
+    Rate-limit headers clamp the local buckets to the provider's remaining
+    budget and pause admission until the reported reset when it is exhausted.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        clock: Callable[[], float] = monotonic,
+        min_rate_scale: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute)
+        self._clock = clock
+        self._min_rate_scale = min_rate_scale
+        self._recovery_step = recovery_step
+        self._request_capacity = max(
+            1.0,
+            self.requests_per_minute * _BURST_WINDOW_S / 60.0,
+        )
+        self._token_capacity = max(
+            1.0,
+            self.tokens_per_minute * _BURST_WINDOW_S / 60.0,
+        )
+        self._request_level = self._request_capacity
+        self._token_level = self._token_capacity
+        self._rate_scale = 1.0
+        self._blocked_until = 0.0
+        self._updated_at = clock()
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def rate_scale(self) -> float:
+        return self._rate_scale
+
+    async def acquire(self, *, tokens: int, priority: int) -> None:
+        condition = self._get_condition()
+        reserved_tokens = min(float(max(tokens, 0)), self._token_capacity)
+        entry = (priority, next(self._sequence))
+        async with condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    wait_s: float | None = None
+                    if self._waiters[0] == entry:
+                        wait_s = self._admission_delay(reserved_tokens)
+                        if wait_s <= 0:
+                            self._request_level -= 1.0
+                            self._token_level -= reserved_tokens
+                            heapq.heappop(self._waiters)
+                            condition.notify_all()
+                            return
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=wait_s)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    condition.notify_all()
+                raise
+
+    def settle(self, *, reserved_tokens: int, used_tokens: int | None) -> None:
+        """Refund or charge the difference between reserved and reported tokens."""
+
+        if used_tokens is None:
+            return
+        self._refill()
+        self._token_level = min(
+            self._token_capacity,
+            self._token_level
+            + min(float(reserved_tokens), self._token_capacity)
+            - float(used_tokens),
+        )
+
+    def record_success(self) -> None:
+        self._rate_scale = min(1.0, self._rate_scale + self._recovery_step)
+
+    def record_throttle(self, retry_after_s: float | None) -> None:
+        self._refill()
+        self._rate_scale = max(self._min_rate_scale, self._rate_scale * 0.5)
+        self._request_level = min(self._request_level, 0.0)
+        self._pause(retry_after_s if retry_after_s is not None else 1.0)
+        logger.warning(
+            "LLM transport throttled retry_after_s=%s rate_scale=%.2f",
+            retry_after_s,
+            self._rate_scale,
+        )
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        self._refill()
+        remaining_requests = _header_float(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_float(headers, "x-ratelimit-remaining-tokens")
+        if remaining_requests is not None:
+            self._request_level = min(self._request_level, remaining_requests)
+            if remaining_requests <= 0:
+                self._pause(
+                    _parse_duration_s(headers.get("x-ratelimit-reset-requests"))
+                )
+        if remaining_tokens is not None:
+            self._token_level = min(self._token_level, remaining_tokens)
+            if remaining_tokens <= 0:
+                self._pause(_parse_duration_s(headers.get("x-ratelimit-reset-tokens")))
+
+    def _pause(self, delay_s: float | None) -> None:
+        if delay_s is None or delay_s <= 0:
+            return
+        self._blocked_until = max(self._blocked_until, self._clock() + delay_s)
+        if self._condition is not None:
+            self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        condition = self._condition
+        if condition is None:
+            return
+
+        async def notify() -> None:
+            async with condition:
+                condition.notify_all()
+
+        try:
+            asyncio.get_running_loop().create_task(notify())
+        except RuntimeError:
+            return
+
+    def _admission_delay(self, tokens: float) -> float:
+        self._refill()
+        now = self._clock()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        request_rate = self.requests_per_minute * self._rate_scale / 60.0
+        token_rate = self.tokens_per_minute * self._rate_scale / 60.0
+        request_wait = max(0.0, (1.0 - self._request_level) / request_rate)
+        token_wait = max(0.0, (tokens - self._token_level) / token_rate)
+        return max(request_wait, token_wait)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        self._request_level = min(
+            self._request_capacity,
+            self._request_level
+            + elapsed * self.requests_per_minute * self._rate_scale / 60.0,
+        )
+        self._token_level = min(
+            self._token_capacity,
+            self._token_level
+            + elapsed * self.tokens_per_minute * self._rate_scale / 60.0,
+        )
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+
+class RetryBudget:
+    """Shared retry allowance that grows with requests and drains with retries."""
+
+    def __init__(self, *, ratio: float, burst: float) -> None:
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            return self._tokens
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class LLMTransport:
+    """One pooled async provider client shared by every model caller."""
+
+    def __init__(
+        self,
+        settings: LLMTransportSettings,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.settings = settings
+        self.limiter = AdaptiveRateLimiter(
+            requests_per_minute=settings.requests_per_minute,
+            tokens_per_minute=settings.tokens_per_minute,
+            clock=clock,
+        )
+        self.retry_budget = RetryBudget(
+            ratio=settings.retry_budget_ratio,
+            burst=settings.retry_budget_burst,
+        )
+        self._http_client = http_client
+        self._client: AsyncOpenAI | None = None
+        self._sleep = sleep
+        self._jitter = jitter
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        if self._client is None:
+            http_client = self._http_client or DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.settings.max_connections,
+                    max_keepalive_connections=self.settings.max_keepalive_connections,
+                    keepalive_expiry=self.settings.keepalive_expiry_s,
+                ),
+                timeout=httpx.Timeout(
+                    self.settings.read_timeout_s,
+                    connect=self.settings.connect_timeout_s,
+                ),
+            )
+            hooks = http_client.event_hooks
+            http_client.event_hooks = {
+                **hooks,
+                "response": [*hooks.get("response", ()), self._observe_response],
+            }
+            self._client = AsyncOpenAI(
+                api_key=self.settings.api_key,
+                base_url=self.settings.base_url,
+                http_client=http_client,
+                max_retries=0,
+            )
+        return self._client
+
+    async def request(
+        self,
+        operation: str,
+        request: Mapping[str, Any],
+        *,
+        task_type: str | None = None,
+    ) -> Any:
+        """Send one chat request under the shared limiter and retry budget."""
+
+        priority = TASK_PRIORITIES.get(str(task_type or ""), BULK_PRIORITY)
+        reserved_tokens = estimate_request_tokens(request)
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            await self.limiter.acquire(tokens=reserved_tokens, priority=priority)
+            try:
+                completion = await self._send(operation, request)
+            except Exception as exc:
+                attempt += 1
+                if (
+                    not _is_retryable(exc)
+                    or attempt >= self.settings.max_attempts
+                    or not self.retry_budget.try_spend()
+                ):
+                    raise
+                delay_s = self._retry_delay_s(attempt, exc)
+                logger.warning(
+                    "LLM transport retrying operation=%s task_type=%s attempt=%s delay_s=%.2f error=%s",
+                    operation,
+                    task_type,
+                    attempt,
+                    delay_s,
+                    type(exc).__name__,
+                )
+                await self._sleep(delay_s)
+                continue
+            self.limiter.record_success()
+            self.limiter.settle(
+                reserved_tokens=reserved_tokens,
+                used_tokens=_completion_total_tokens(completion),
+            )
+            return completion
+
+    async def stream(
+        self,
+        request: Mapping[str, Any],
+        on_chunk: Callable[[Any], None],
+        *,
+        task_type: str | None = None,
+    ) -> None:
+        """Open one streamed chat completion and pass each chunk to `on_chunk`.
+
+        Admission and retries cover opening the stream; a stream that fails
+        part-way through is not replayed.
+        """
+
+        stream = await self.request(
+            CHAT_COMPLETIONS_CREATE,
+            {**request, "stream": True},
+            task_type=task_type,
+        )
+        async for chunk in stream:
+            on_chunk(chunk)
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run one transport coroutine from synchronous code and wait for it."""
+
+        return self.submit(coroutine).result()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule one transport coroutine from synchronous code."""
+
+        loop = self._ensure_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coroutine.close()
+            raise RuntimeError("synchronous LLM call issued from the transport loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def sync_client(self, *, task_type: str | None = None) -> "SyncLLMClient":
+        return SyncLLMClient(self, task_type=task_type)
+
+    async def _send(self, operation: str, request: Mapping[str, Any]) -> Any:
+        if operation == CHAT_COMPLETIONS_CREATE:
+            return await self.client.chat.completions.create(**request)
+        if operation == CHAT_COMPLETIONS_PARSE:
+            return await self.client.beta.chat.completions.parse(**request)
+        raise ValueError(f"unsupported LLM transport operation: {operation}")
+
+    async def _observe_response(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            self.limiter.record_throttle(_retry_after_s(response.headers))
+            return
+        self.limiter.observe_headers(response.headers)
+
+    def _retry_delay_s(self, attempt: int, error: Exception) -> float:
+        ceiling = min(
+            self.settings.retry_max_delay_s,
+            self.settings.retry_base_delay_s * 2 ** (attempt - 1),
+        )
+        delay_s = ceiling * self._jitter()
+        response = getattr(error, "response", None)
+        retry_after = (
+            _retry_after_s(response.headers) if response is not None else None
+        )
+        if retry_after is not None:
+            delay_s = max(delay_s, min(retry_after, self.settings.retry_max_delay_s))
+        return delay_s
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="llm-transport",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+            return self._loop
+
+
+class SyncLLMClient:
+    """OpenAI-shaped synchronous facade over the shared async transport.
+
+    Existing call sites keep using `client.chat.completions.create(...)` and
+    `client.beta.chat.completions.parse(...)`. Requests are prioritized by the
+    facade's own task type, or else by the task type scoped around the call
+    with `llm_task_type`.
+    """
+
+    def __init__(self, transport: LLMTransport, *, task_type: str | None = None) -> None:
+        completions = _SyncCompletions(transport, task_type=task_type)
+        self.transport = transport
+        self.chat = _SyncChat(completions)
+        self.beta = _SyncBeta(completions)
+
+
+class _SyncCompletions:
+    def __init__(self, transport: LLMTransport, *, task_type: str | None) -> None:
+        self._transport = transport
+        self._task_type = task_type
+
+    def create(self, **request: Any) -> Any:
+        if request.get("stream"):
+            return self._stream(request)
+        return self._run(CHAT_COMPLETIONS_CREATE, request)
+
+    def parse(self, **request: Any) -> Any:
+        return self._run(CHAT_COMPLETIONS_PARSE, request)
+
+    def _run(self, operation: str, request: dict[str, Any]) -> Any:
+        with span("llm_wait"):
+            return self._transport.run(
+                self._transport.request(
+                    operation,
+                    request,
+                    task_type=self._task_type or current_llm_task_type(),
+                )
+            )
+
+    def _stream(self, request: dict[str, Any]) -> Iterator[Any]:
+        chunks: queue.SimpleQueue[Any] = queue.SimpleQueue()
+
+        async def pump() -> None:
+            try:
+                await self._transport.stream(
+                    request,
+                    chunks.put,
+                    task_type=self._task_type or current_llm_task_type(),
+                )
+            finally:
+                chunks.put(_STREAM_END)
+
+        future = self._transport.submit(pump())
+        try:
+            while (chunk := chunks.get()) is not _STREAM_END:
+                yield chunk
+            future.result()
+        finally:
+            future.cancel()
+
+
+_STREAM_END = object()
+
+
+class _SyncChat:
+    def __init__(self, completions: _SyncCompletions) -> None:
+        self.completions = completions
+
+
+class _SyncBeta:
+    def __init__(self, completions: _SyncCompletions) -> None:
+        self.chat = _SyncChat(completions)
+
+
+_SHARED_TRANSPORTS: dict[tuple[str, str | None], LLMTransport] = {}
+_SHARED_TRANSPORTS_LOCK = threading.Lock()
+
+
+def shared_llm_transport(
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+) -> LLMTransport:
+    """Return the process-wide transport for one provider endpoint."""
+
+    settings = LLMTransportSettings.from_env(api_key=api_key, base_url=base_url)
+    key = (settings.api_key, settings.base_url)
+    with _SHARED_TRANSPORTS_LOCK:
+        transport = _SHARED_TRANSPORTS.get(key)
+        if transport is None:
+            transport = LLMTransport(settings)
+            _SHARED_TRANSPORTS[key] = transport
+        return transport
+
+
+def build_default_llm_client(
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    task_type: str | None = None,
+) -> SyncLLMClient:
+    return shared_llm_transport(api_key=api_key, base_url=base_url).sync_client(
+        task_type=task_type
+    )
+
+
+def estimate_request_tokens(request: Mapping[str, Any]) -> int:
+    """Estimate prompt plus reserved completion tokens for limiter admission."""
+
+    messages = request.get("messages") or ()
+    prompt_chars = len(json.dumps(messages, ensure_ascii=False, default=str))
+    completion_tokens = (
+        request.get("max_completion_tokens")
+        or request.get("max_tokens")
+        or _DEFAULT_COMPLETION_TOKEN_RESERVE
+    )
+    return prompt_chars // _CHARS_PER_TOKEN + int(completion_tokens)
+
+
+def _completion_total_tokens(completion: Any) -> int | None:
+    usage = getattr(completion, "usage", None)
+    total_tokens = getattr(usage, "total_tokens", None)
+    return int(total_tokens) if total_tokens is not None else None
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(
+        error,
+        (RateLimitError, APIConnectionError, InternalServerError),
+    )
+
+
+def _retry_after_s(headers: Mapping[str, str]) -> float | None:
+    retry_after_ms = _header_float(headers, "retry-after-ms")
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000.0
+    return _header_float(headers, "retry-after")
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_duration_s(value: str | None) -> float | None:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_PATTERN.findall(text)
+    if not parts:
+        return None
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    return float(value) if value else default
+
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "LLMTransport",
+    "LLMTransportSettings",
+    "RetryBudget",
+    "SyncLLMClient",
+    "TASK_PRIORITIES",
+    "build_default_llm_client",
+    "estimate_request_tokens",
+    "shared_llm_transport",
+]
@@ -81,6 +81,10 @@ _ACTIVE_USAGE_COLLECTOR: ContextVar[LLMUsageCollector | None] = ContextVar(
     "active_llm_usage_collector",
     default=None,
 )
+_ACTIVE_TASK_TYPE: ContextVar[str | None] = ContextVar(
+    "active_llm_task_type",
+    default=None,
+)
 
 
 @contextmanager
@@ -105,6 +109,23 @@ def record_llm_prompt_version(task_type: str, prompt_version: str) -> None:
         collector.record_prompt_version(task_type, prompt_version)
 
 
+@contextmanager
+def llm_task_type(task_type: str | None) -> Iterator[None]:
+    """Scope the task type that LLM calls made inside the block are prioritized by."""
+
+    token = _ACTIVE_TASK_TYPE.set(str(task_type or "").strip() or None)
+    try:
+        yield
+    finally:
+        _ACTIVE_TASK_TYPE.reset(token)
+
+
+def current_llm_task_type() -> str | None:
+    """Return the task type scoped by the innermost `llm_task_type` block."""
+
+    return _ACTIVE_TASK_TYPE.get()
+
+
 def _provider_token_usage(payload: Any) -> TokenUsage | None:
     input_tokens = _usage_value(payload, "input_tokens", "prompt_tokens")
     output_tokens = _usage_value(payload, "output_tokens", "completion_tokens")
@@ -137,6 +158,8 @@ def _usage_value(payload: Any, *names: str) -> int | None:
 __all__ = [
     "LLMUsageCollector",
     "capture_llm_usage",
+    "current_llm_task_type",
+    "llm_task_type",
     "record_llm_completion",
     "record_llm_prompt_version",
 ]
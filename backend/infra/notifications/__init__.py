@@ -0,0 +1 @@
+"""Progress notification infrastructure package."""
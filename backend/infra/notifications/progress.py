@@ -0,0 +1,196 @@
+"""Progress change notifications for build tasks and Objective analyses.
+
+Writers publish a topic after they store new progress. `ProgressHub` fans
+each published topic out to the event-loop subscribers of this process, and
+`PostgresProgressNotifier` carries topics between API processes through
+PostgreSQL `LISTEN/NOTIFY`, delivering them to the local hub. Notifications
+carry only the topic; subscribers re-read the state they project, so a lost
+or coalesced notification delays an update but never corrupts one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import logging
+from threading import Event, Lock, Thread
+
+import psycopg
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_CHANNEL = "lens_progress"
+_LISTEN_POLL_S = 1.0
+_RECONNECT_MAX_DELAY_S = 30.0
+
+
+def task_progress_topic(task_id: str) -> str:
+    return f"task:{task_id}"
+
+
+def objective_analysis_progress_topic(collection_id: str, objective_id: str) -> str:
+    return f"objective-analysis:{collection_id}:{objective_id}"
+
+
+class ProgressSubscription:
+    """One subscriber's view of changes to a single topic."""
+
+    def __init__(self) -> None:
+        self._changed = asyncio.Event()
+
+    def _mark_changed(self) -> None:
+        self._changed.set()
+
+    async def wait(self, timeout_s: float) -> bool:
+        """Wait until the topic changes; return False when `timeout_s` passes."""
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout_s)
+        except asyncio.TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+
+class ProgressHub:
+    """Process-local fan-out of published topics to waiting subscribers.
+
+    `publish` is safe to call from any thread, so the hub doubles as the
+    in-memory notifier when no PostgreSQL listener is configured.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._subscribers: dict[
+            str,
+            set[tuple[asyncio.AbstractEventLoop, ProgressSubscription]],
+        ] = {}
+        self._listeners: list[tuple[str, Callable[[str], None]]] = []
+
+    def add_listener(self, prefix: str, callback: Callable[[str], None]) -> None:
+        """Call `callback(topic)` on the publishing thread for matching topics.
+
+        Listeners suit cheap in-memory reactions such as cache invalidation;
+        they must not block.
+        """
+
+        with self._lock:
+            self._listeners.append((prefix, callback))
+
+    def publish(self, topic: str) -> None:
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(topic, ()))
+            listeners = tuple(
+                callback
+                for prefix, callback in self._listeners
+                if topic.startswith(prefix)
+            )
+        for callback in listeners:
+            try:
+                callback(topic)
+            except Exception:  # noqa: BLE001
+                logger.warning("Topic listener failed topic=%s", topic, exc_info=True)
+        for loop, subscription in subscribers:
+            try:
+                loop.call_soon_threadsafe(subscription._mark_changed)
+            except RuntimeError:
+                # The subscriber's loop closed before it unsubscribed.
+                continue
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(topic, ()))
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[ProgressSubscription]:
+        entry = (asyncio.get_running_loop(), ProgressSubscription())
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+
+class PostgresProgressNotifier:
+    """Publish topics with `pg_notify` and relay received ones to a hub."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        hub: ProgressHub,
+        *,
+        channel: str = PROGRESS_CHANNEL,
+    ) -> None:
+        self.engine = engine
+        self.hub = hub
+        self.channel = channel
+        self._stopped = Event()
+        self._listener: Thread | None = None
+
+    def publish(self, topic: str) -> None:
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :topic)"),
+                    {"channel": self.channel, "topic": topic},
+                )
+        except Exception:  # noqa: BLE001
+            # Progress is already durable; watchers fall back to re-reading it.
+            logger.warning("Progress notification failed topic=%s", topic, exc_info=True)
+
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        self._stopped.clear()
+        self._listener = Thread(
+            target=self._listen_forever,
+            name="progress-listener",
+            daemon=True,
+        )
+        self._listener.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._listener is not None:
+            self._listener.join(timeout=_LISTEN_POLL_S * 2)
+            self._listener = None
+
+    def _listen_forever(self) -> None:
+        conninfo = self.engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        delay_s = 1.0
+        while not self._stopped.is_set():
+            try:
+                with psycopg.connect(conninfo, autocommit=True) as connection:
+                    connection.execute(f'LISTEN "{self.channel}"')
+                    delay_s = 1.0
+                    while not self._stopped.is_set():
+                        for notify in connection.notifies(timeout=_LISTEN_POLL_S):
+                            self.hub.publish(notify.payload)
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    "Progress listener disconnected; retrying delay_s=%.1f",
+                    delay_s,
+                    exc_info=True,
+                )
+                self._stopped.wait(delay_s)
+                delay_s = min(delay_s * 2, _RECONNECT_MAX_DELAY_S)
+
+
+__all__ = [
+    "PROGRESS_CHANNEL",
+    "PostgresProgressNotifier",
+    "ProgressHub",
+    "ProgressSubscription",
+    "objective_analysis_progress_topic",
+    "task_progress_topic",
+]
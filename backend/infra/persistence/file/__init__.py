@@ -1,5 +1,13 @@
 """File-backed workspace and object storage."""
 
 from infra.persistence.file.collection_workspace import FileCollectionWorkspace
+from infra.persistence.file.figure_render_cache import FileFigureRenderCache
+from infra.persistence.file.lexical_index_store import FileSourceLexicalIndexStore
+from infra.persistence.file.objective_stage_cache import FileObjectiveStageCache
 
-__all__ = ["FileCollectionWorkspace"]
+__all__ = [
+    "FileCollectionWorkspace",
+    "FileFigureRenderCache",
+    "FileObjectiveStageCache",
+    "FileSourceLexicalIndexStore",
+]
@@ -32,4 +32,6 @@ class FileCollectionWorkspace:
         return paths
 
     def delete_collection_dir(self, collection_id: str) -> None:
-        shutil.rmtree(self.get_paths(collection_id).collection_dir)
+        collection_dir = self.get_paths(collection_id).collection_dir
+        if collection_dir.exists():
+            shutil.rmtree(collection_dir)
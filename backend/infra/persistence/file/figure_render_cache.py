@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import os
+from pathlib import Path
+import re
+import tempfile
+from threading import Lock
+from typing import Protocol
+
+from domain.ports import CollectionPaths
+
+logger = logging.getLogger(__name__)
+
+_RENDER_CACHE_DIRNAME = "figure_render_cache"
+_RENDER_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_DEFAULT_MAX_BYTES_PER_COLLECTION = 256 * 1024 * 1024
+
+
+class _CollectionPathSource(Protocol):
+    def get_paths(self, collection_id: str) -> CollectionPaths: ...
+
+
+class FileFigureRenderCache:
+    """Collection-local LRU cache for figure images rendered on request.
+
+    Each collection keeps at most ``max_bytes_per_collection`` of PNG renders
+    under its output directory. Recency is tracked in memory and mirrored to
+    file mtimes so a restarted process resumes the same eviction order.
+    Entries may be deleted at any time; a miss only costs a re-render.
+    """
+
+    backend_name = "file"
+
+    def __init__(
+        self,
+        workspace: _CollectionPathSource,
+        *,
+        max_bytes_per_collection: int = _DEFAULT_MAX_BYTES_PER_COLLECTION,
+    ) -> None:
+        self.workspace = workspace
+        self.max_bytes_per_collection = max(int(max_bytes_per_collection), 1)
+        self._entries: dict[str, OrderedDict[str, int]] = {}
+        self._sizes: dict[str, int] = {}
+        self._lock = Lock()
+
+    def read(self, collection_id: str, render_key: str) -> bytes | None:
+        path = self._render_path(collection_id, render_key)
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(collection_id, render_key)
+            return None
+        with self._lock:
+            entries = self._collection_entries(collection_id)
+            if render_key in entries:
+                entries.move_to_end(render_key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def contains(self, collection_id: str, render_key: str) -> bool:
+        return self._render_path(collection_id, render_key).is_file()
+
+    def write(self, collection_id: str, render_key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes_per_collection:
+            logger.info(
+                "Figure render exceeds cache budget collection_id=%s size=%s",
+                collection_id,
+                len(payload),
+            )
+            return
+        path = self._render_path(collection_id, render_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            handle.write(payload)
+        try:
+            os.replace(handle.name, path)
+        except OSError:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            entries = self._collection_entries(collection_id)
+            self._forget(collection_id, render_key)
+            entries[render_key] = len(payload)
+            self._sizes[collection_id] = self._sizes.get(collection_id, 0) + len(payload)
+            evicted = self._evict(collection_id)
+        for key in evicted:
+            self._render_path(collection_id, key).unlink(missing_ok=True)
+
+    def _collection_entries(self, collection_id: str) -> OrderedDict[str, int]:
+        entries = self._entries.get(collection_id)
+        if entries is not None:
+            return entries
+        cache_dir = self._cache_dir(collection_id)
+        scanned: list[tuple[float, str, int]] = []
+        if cache_dir.is_dir():
+            for path in cache_dir.glob("*.png"):
+                if not _RENDER_KEY_PATTERN.fullmatch(path.stem):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                scanned.append((stat.st_mtime, path.stem, stat.st_size))
+        entries = OrderedDict(
+            (key, size) for _, key, size in sorted(scanned)
+        )
+        self._entries[collection_id] = entries
+        self._sizes[collection_id] = sum(entries.values())
+        return entries
+
+    def _forget(self, collection_id: str, render_key: str) -> None:
+        entries = self._entries.get(collection_id)
+        if entries is None:
+            return
+        size = entries.pop(render_key, None)
+        if size is not None:
+            self._sizes[collection_id] -= size
+
+    def _evict(self, collection_id: str) -> list[str]:
+        entries = self._entries[collection_id]
+        evicted: list[str] = []
+        while self._sizes[collection_id] > self.max_bytes_per_collection and entries:
+            key, size = entries.popitem(last=False)
+            self._sizes[collection_id] -= size
+            evicted.append(key)
+        return evicted
+
+    def _cache_dir(self, collection_id: str) -> Path:
+        return self.workspace.get_paths(collection_id).output_dir / _RENDER_CACHE_DIRNAME
+
+    def _render_path(self, collection_id: str, render_key: str) -> Path:
+        if not _RENDER_KEY_PATTERN.fullmatch(str(render_key)):
+            raise ValueError(f"invalid figure render key: {render_key}")
+        return self._cache_dir(collection_id) / f"{render_key}.png"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Protocol
+
+from domain.ports import CollectionPaths
+
+_LEXICAL_INDEX_DIRNAME = "lexical_index"
+_BUILD_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class _CollectionPathSource(Protocol):
+    def get_paths(self, collection_id: str) -> CollectionPaths: ...
+
+
+class FileSourceLexicalIndexStore:
+    """Collection-local storage for per-build Source lexical indexes.
+
+    Each build owns one immutable file under the collection output directory.
+    A missing file only means the index must be rebuilt from Source rows.
+    """
+
+    backend_name = "file"
+
+    def __init__(self, workspace: _CollectionPathSource) -> None:
+        self.workspace = workspace
+
+    def read_index(self, collection_id: str, build_id: str) -> bytes | None:
+        try:
+            return self._index_path(collection_id, build_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_index(self, collection_id: str, build_id: str, payload: bytes) -> None:
+        path = self._index_path(collection_id, build_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_bytes(payload)
+        temp_path.replace(path)
+
+    def index_size(self, collection_id: str, build_id: str) -> int:
+        try:
+            return self._index_path(collection_id, build_id).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def delete_index(self, collection_id: str, build_id: str) -> int:
+        """Remove a build's index file; return the bytes it occupied."""
+
+        path = self._index_path(collection_id, build_id)
+        size = self.index_size(collection_id, build_id)
+        path.unlink(missing_ok=True)
+        return size
+
+    def _index_path(self, collection_id: str, build_id: str) -> Path:
+        if not _BUILD_ID_PATTERN.fullmatch(str(build_id)) or ".." in str(build_id):
+            raise ValueError(f"invalid lexical index build id: {build_id}")
+        output_dir = self.workspace.get_paths(collection_id).output_dir
+        return output_dir / _LEXICAL_INDEX_DIRNAME / f"{build_id}.bm25.gz"
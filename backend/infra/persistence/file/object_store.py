@@ -1,35 +1,221 @@
 from __future__ import annotations
 
+import errno
 from hashlib import sha256 as hash_sha256
+import os
 from pathlib import Path, PurePosixPath
+import shutil
+from typing import BinaryIO
+from uuid import uuid4
+
+from domain.source.ports import StagedObject
+
+STAGING_DIR = ".staging"
+CONTENT_DIR = "objects"
+_CONTENT_ALGORITHM = "sha256"
+_COPY_CHUNK_BYTES = 1024 * 1024
+# Content blobs carry this mtime once their bytes were hashed. Any later write
+# to the shared inode moves the mtime, which sends reads back to hashing.
+_VERIFIED_MTIME_NS = 0
+_LINK_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
 
 
 class FileObjectStore:
+    """Immutable objects under caller-chosen keys, deduplicated by content.
+
+    Every object is one blob at ``objects/sha256/ab/cd/<digest>``; storage
+    keys are hard links to it, so the inode link count is the reference count
+    and identical bytes written under many keys occupy disk once. Deleting a
+    key drops one reference and frees the blob with the last one. Removing
+    a directory of keys only drops references; `release` and
+    `collect_unreferenced` remove blobs nothing points to any more.
+    Filesystems without hard links fall back to independent copies.
+    """
+
     def __init__(self, root_dir: Path) -> None:
         self.root_dir = Path(root_dir).resolve()
         self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.staging_dir = self.root_dir / STAGING_DIR
+        self.content_dir = self.root_dir / CONTENT_DIR / _CONTENT_ALGORITHM
 
     def write(self, storage_key: str, payload: bytes, sha256: str) -> None:
         target = self._resolve(storage_key)
         self._verify(payload, sha256)
         target.parent.mkdir(parents=True, exist_ok=True)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        temporary = self.staging_dir / uuid4().hex
+        temporary.write_bytes(payload)
+        try:
+            self._commit(storage_key, target, temporary, sha256)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    def read(self, storage_key: str, sha256: str) -> bytes:
+        path = self._resolve(storage_key)
+        self._validate_digest(sha256)
+        if self._is_verified_content(path, sha256):
+            return path.read_bytes()
+        payload = path.read_bytes()
+        self._verify(payload, sha256)
+        return payload
+
+    def delete(self, storage_key: str, sha256: str) -> bool:
+        """Drop `storage_key`; return whether its content blob was freed too."""
+
+        path = self._resolve(storage_key)
+        self._validate_digest(sha256)
+        try:
+            linked = os.path.samestat(
+                path.stat(),
+                self._blob_path(sha256).stat(),
+            )
+        except FileNotFoundError:
+            linked = False
+        path.unlink(missing_ok=True)
+        return linked and self.release(sha256)
+
+    def release(self, sha256: str) -> bool:
+        """Remove the content blob for `sha256` once no key references it."""
+
+        self._validate_digest(sha256)
+        blob = self._blob_path(sha256)
+        try:
+            if blob.stat().st_nlink > 1:
+                return False
+        except FileNotFoundError:
+            return False
+        blob.unlink(missing_ok=True)
+        return True
+
+    def collect_unreferenced(self) -> int:
+        """Remove every content blob that no storage key links to."""
+
+        removed = 0
+        if not self.content_dir.is_dir():
+            return removed
+        for blob in self.content_dir.glob("*/*/*"):
+            if blob.is_file() and blob.stat().st_nlink == 1:
+                blob.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def stage(self, stream: BinaryIO) -> StagedObject:
+        """Copy a stream into staging, hashing it in the same pass."""
+
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        staging_key = uuid4().hex
+        digest = hash_sha256()
+        size_bytes = 0
+        path = self.staging_dir / staging_key
+        try:
+            with path.open("xb") as handle:
+                while chunk := stream.read(_COPY_CHUNK_BYTES):
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size_bytes += len(chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return StagedObject(
+            staging_key=staging_key,
+            sha256=digest.hexdigest(),
+            size_bytes=size_bytes,
+        )
+
+    def open_staged(self, staged: StagedObject) -> BinaryIO:
+        return self._staged_path(staged).open("rb")
+
+    def commit_staged(self, storage_key: str, staged: StagedObject) -> None:
+        """Publish staged bytes under `storage_key` without copying or rehashing."""
+
+        target = self._resolve(storage_key)
+        self._validate_digest(staged.sha256)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._commit(storage_key, target, self._staged_path(staged), staged.sha256)
+        self.discard_staged(staged)
+
+    def discard_staged(self, staged: StagedObject) -> None:
+        self._staged_path(staged).unlink(missing_ok=True)
+
+    def _commit(
+        self,
+        storage_key: str,
+        target: Path,
+        source: Path,
+        sha256: str,
+    ) -> None:
+        """Link `target` to the content blob of already-hashed `source` bytes."""
+
+        for _attempt in range(2):
+            try:
+                blob = self._publish_blob(source, sha256)
+                os.link(blob, target)
+                return
+            except FileExistsError:
+                if self._is_verified_content(target, sha256) or self._matches(
+                    target, sha256
+                ):
+                    return
+                raise FileExistsError(
+                    f"immutable object already exists: {storage_key}"
+                ) from None
+            except FileNotFoundError:
+                # A concurrent release removed the blob between the two steps.
+                continue
+            except OSError as exc:
+                if exc.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                    raise
+                self._copy_exclusive(source, target, storage_key, sha256)
+                return
+        raise FileNotFoundError(f"content blob disappeared while linking: {sha256}")
+
+    def _publish_blob(self, source: Path, sha256: str) -> Path:
+        blob = self._blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        os.utime(source, ns=(_VERIFIED_MTIME_NS, _VERIFIED_MTIME_NS))
+        try:
+            os.link(source, blob)
+        except FileExistsError:
+            if blob.stat().st_mtime_ns != _VERIFIED_MTIME_NS:
+                if self._matches(blob, sha256):
+                    os.utime(blob, ns=(_VERIFIED_MTIME_NS, _VERIFIED_MTIME_NS))
+                else:
+                    # The shared blob was damaged; new keys get sound bytes.
+                    temporary = self.staging_dir / uuid4().hex
+                    os.link(source, temporary)
+                    os.replace(temporary, blob)
+        return blob
+
+    def _copy_exclusive(
+        self,
+        source: Path,
+        target: Path,
+        storage_key: str,
+        sha256: str,
+    ) -> None:
         try:
-            with target.open("xb") as handle:
-                handle.write(payload)
+            with source.open("rb") as reader, target.open("xb") as writer:
+                _copy_file(reader, writer)
         except FileExistsError:
-            if target.read_bytes() == payload:
+            if self._matches(target, sha256):
                 return
             raise FileExistsError(
                 f"immutable object already exists: {storage_key}"
             ) from None
 
-    def read(self, storage_key: str, sha256: str) -> bytes:
-        payload = self._resolve(storage_key).read_bytes()
-        self._verify(payload, sha256)
-        return payload
+    def _is_verified_content(self, path: Path, sha256: str) -> bool:
+        try:
+            stat = path.stat()
+            blob_stat = self._blob_path(sha256).stat()
+        except FileNotFoundError:
+            return False
+        return (
+            os.path.samestat(stat, blob_stat)
+            and stat.st_mtime_ns == _VERIFIED_MTIME_NS
+        )
 
-    def delete(self, storage_key: str) -> None:
-        self._resolve(storage_key).unlink(missing_ok=True)
+    def _blob_path(self, sha256: str) -> Path:
+        return self.content_dir / sha256[:2] / sha256[2:4] / sha256
 
     def _resolve(self, storage_key: str) -> Path:
         if not isinstance(storage_key, str) or not storage_key or "\\" in storage_key:
@@ -37,6 +223,8 @@ class FileObjectStore:
         key = PurePosixPath(storage_key)
         if key.is_absolute() or str(key) != storage_key or ".." in key.parts:
             raise ValueError("invalid storage key")
+        if not key.parts or key.parts[0] in {STAGING_DIR, CONTENT_DIR}:
+            raise ValueError("invalid storage key")
         candidate = self.root_dir / Path(*key.parts)
         target = candidate.resolve()
         try:
@@ -47,12 +235,45 @@ class FileObjectStore:
             raise ValueError("invalid storage key")
         return target
 
-    def _verify(self, payload: bytes, expected_sha256: str) -> None:
+    def _staged_path(self, staged: StagedObject) -> Path:
+        key = staged.staging_key
+        if not key or not key.isalnum():
+            raise ValueError("invalid staging key")
+        return self.staging_dir / key
+
+    @staticmethod
+    def _matches(path: Path, expected_sha256: str) -> bool:
+        digest = hash_sha256()
+        with path.open("rb") as handle:
+            while chunk := handle.read(_COPY_CHUNK_BYTES):
+                digest.update(chunk)
+        return digest.hexdigest() == expected_sha256
+
+    @staticmethod
+    def _validate_digest(expected_sha256: str) -> None:
         if (
             len(expected_sha256) != 64
             or expected_sha256.lower() != expected_sha256
             or any(character not in "0123456789abcdef" for character in expected_sha256)
         ):
             raise ValueError("invalid SHA-256")
+
+    def _verify(self, payload: bytes, expected_sha256: str) -> None:
+        self._validate_digest(expected_sha256)
         if hash_sha256(payload).hexdigest() != expected_sha256:
             raise ValueError("object SHA-256 mismatch")
+
+
+def _copy_file(reader: BinaryIO, writer: BinaryIO) -> None:
+    """Copy in the kernel where possible, which lets CoW filesystems reflink."""
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(reader.fileno(), writer.fileno(), _COPY_CHUNK_BYTES):
+                pass
+            return
+        except OSError as exc:
+            if exc.errno not in {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP}:
+                raise
+    shutil.copyfileobj(reader, writer, _COPY_CHUNK_BYTES)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+from pathlib import Path
+from threading import Lock
+import time
+from typing import Any, Protocol
+
+from domain.ports import CollectionPaths
+from infra.persistence.file._json import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+_STAGE_CACHE_DIRNAME = "objective_stage_cache"
+_STAGE_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_DEFAULT_MAX_AGE_S = 14 * 24 * 3600.0
+_DEFAULT_PRUNE_INTERVAL_S = 3600.0
+
+
+class _CollectionPathSource(Protocol):
+    def get_paths(self, collection_id: str) -> CollectionPaths: ...
+
+
+class FileObjectiveStageCache:
+    """Collection-local scratch cache for per-document Objective analysis stages.
+
+    Entries live under the collection output directory, are keyed by a digest
+    of every stage input, and may be deleted at any time. Keys change with
+    every input edit, so superseded entries are never read again. Reads
+    refresh an entry's mtime, and writes prune entries unused for
+    ``max_age_s``, at most once per ``prune_interval_s`` per collection.
+    """
+
+    backend_name = "file"
+
+    def __init__(
+        self,
+        workspace: _CollectionPathSource,
+        *,
+        max_age_s: float = _DEFAULT_MAX_AGE_S,
+        prune_interval_s: float = _DEFAULT_PRUNE_INTERVAL_S,
+    ) -> None:
+        self.workspace = workspace
+        self.max_age_s = max(float(max_age_s), 0.0)
+        self.prune_interval_s = max(float(prune_interval_s), 0.0)
+        self._last_pruned: dict[str, float] = {}
+        self._lock = Lock()
+
+    def read_stage(
+        self,
+        collection_id: str,
+        stage: str,
+        key: str,
+    ) -> tuple[dict[str, Any], ...] | None:
+        path = self._stage_path(collection_id, stage, key)
+        try:
+            payload = read_json(path, None)
+        except (OSError, ValueError):
+            logger.warning(
+                "Objective stage cache entry unreadable "
+                "collection_id=%s stage=%s key=%s",
+                collection_id,
+                stage,
+                key,
+                exc_info=True,
+            )
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("stage") != stage
+            or payload.get("key") != key
+            or not isinstance(payload.get("records"), list)
+        ):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return tuple(
+            dict(record) for record in payload["records"] if isinstance(record, dict)
+        )
+
+    def write_stage(
+        self,
+        collection_id: str,
+        stage: str,
+        key: str,
+        records: tuple[dict[str, Any], ...],
+    ) -> None:
+        write_json(
+            self._stage_path(collection_id, stage, key),
+            {
+                "stage": stage,
+                "key": key,
+                "records": list(records),
+            },
+        )
+        now = time.time()
+        with self._lock:
+            last_pruned = self._last_pruned.get(collection_id)
+            if last_pruned is not None and now - last_pruned < self.prune_interval_s:
+                return
+            self._last_pruned[collection_id] = now
+        self.prune(collection_id, now=now)
+
+    def prune(self, collection_id: str, *, now: float | None = None) -> int:
+        """Delete entries not read or written for ``max_age_s``; return the count."""
+
+        cutoff = (time.time() if now is None else now) - self.max_age_s
+        output_dir = self.workspace.get_paths(collection_id).output_dir
+        cache_dir = output_dir / _STAGE_CACHE_DIRNAME
+        removed = 0
+        for path in cache_dir.glob("*/*/*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        if removed:
+            logger.info(
+                "Objective stage cache pruned collection_id=%s removed=%d",
+                collection_id,
+                removed,
+            )
+        return removed
+
+    def _stage_path(self, collection_id: str, stage: str, key: str) -> Path:
+        if not _STAGE_PATTERN.fullmatch(stage):
+            raise ValueError(f"invalid objective stage name: {stage}")
+        if not _KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"invalid objective stage key: {key}")
+        output_dir = self.workspace.get_paths(collection_id).output_dir
+        return output_dir / _STAGE_CACHE_DIRNAME / stage / key[:2] / f"{key}.json"
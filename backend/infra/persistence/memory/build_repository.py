@@ -6,6 +6,7 @@ from threading import RLock
 
 from domain.source import (
     ArtifactVersionRecord,
+    BuildPurgeProgress,
     BuildStageRecord,
     CollectionBuildRecord,
     TaskRecord,
@@ -209,5 +210,72 @@ class MemoryBuildRepository:
             build_id = self._active_build_ids.get(collection_id)
             return deepcopy(self._builds[build_id]) if build_id is not None else None
 
+    def list_expired_builds(
+        self,
+        *,
+        keep_last: int,
+        limit: int = 100,
+    ) -> tuple[CollectionBuildRecord, ...]:
+        with self._lock:
+            active_ids = set(self._active_build_ids.values())
+            builds = sorted(
+                self._builds.values(),
+                key=lambda build: (build.collection_id, -build.build_number),
+            )
+            expired: list[CollectionBuildRecord] = []
+            seen: dict[str, int] = {}
+            for build in builds:
+                position = seen.get(build.collection_id, 0)
+                seen[build.collection_id] = position + 1
+                if (
+                    position >= max(int(keep_last), 0)
+                    and build.status in {"succeeded", "failed", "cancelled"}
+                    and build.build_id not in active_ids
+                ):
+                    expired.append(deepcopy(build))
+            return tuple(expired[: max(int(limit), 0)])
+
+    def count_build_rows(self, build_id: str) -> dict[str, int]:
+        return {}
+
+    def purge_build_rows(
+        self,
+        build_id: str,
+        *,
+        batch_size: int = 1000,
+        start_table: str | None = None,
+    ) -> BuildPurgeProgress:
+        with self._lock:
+            if build_id in self._active_build_ids.values():
+                raise ValueError(f"build is retained: {build_id}")
+        return BuildPurgeProgress(
+            build_id=build_id,
+            table=None,
+            deleted_rows=0,
+            done=True,
+        )
+
+    def finalize_build_purge(self, build_id: str) -> bool:
+        with self._lock:
+            build = self._builds.get(build_id)
+            if build is None:
+                return False
+            if build_id in self._active_build_ids.values():
+                raise ValueError(f"build is retained: {build_id}")
+            stage_ids = {
+                stage_id
+                for stage_id, stage in self._stages.items()
+                if stage.build_id == build_id
+            }
+            for artifact_id, artifact in tuple(self._artifacts.items()):
+                if artifact.build_stage_id in stage_ids:
+                    del self._artifacts[artifact_id]
+            for stage_id in stage_ids:
+                del self._stages[stage_id]
+            del self._builds[build_id]
+            self._task_build_ids.pop(build.task_id, None)
+            self._tasks.pop(build.task_id, None)
+            return True
+
 
 __all__ = ["MemoryBuildRepository"]
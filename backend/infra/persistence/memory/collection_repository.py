@@ -7,6 +7,7 @@ from domain.source import (
     CollectionFileRecord,
     CollectionHandoffRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
     CollectionRecord,
     DocumentRecord,
     DocumentVersionRecord,
@@ -26,6 +27,7 @@ class MemoryCollectionRepository:
         self._documents: dict[str, DocumentRecord] = {}
         self._document_versions: dict[str, DocumentVersionRecord] = {}
         self._collection_documents: dict[str, list[CollectionDocumentRecord]] = {}
+        self._tombstones: dict[str, str] = {}
 
     def add_collection(self, record: CollectionRecord) -> None:
         if record.collection_id in self._collections:
@@ -38,15 +40,18 @@ class MemoryCollectionRepository:
     ) -> tuple[CollectionRecord, ...]:
         return tuple(
             record
-            for _, record in sorted(self._collections.items())
-            if owner_user_id is None or record.owner_user_id == owner_user_id
+            for collection_id, record in sorted(self._collections.items())
+            if collection_id not in self._tombstones
+            and (owner_user_id is None or record.owner_user_id == owner_user_id)
         )
 
     def read_collection(self, collection_id: str) -> CollectionRecord | None:
+        if collection_id in self._tombstones:
+            return None
         return self._collections.get(collection_id)
 
     def update_collection(self, record: CollectionRecord) -> bool:
-        if record.collection_id not in self._collections:
+        if self.read_collection(record.collection_id) is None:
             return False
         self._collections[record.collection_id] = record
         return True
@@ -57,7 +62,7 @@ class MemoryCollectionRepository:
         *,
         updated_at: str,
     ) -> None:
-        collection = self._collections.get(record.collection_id)
+        collection = self.read_collection(record.collection_id)
         if collection is None:
             raise FileNotFoundError(f"collection not found: {record.collection_id}")
         if not record.documents:
@@ -159,7 +164,7 @@ class MemoryCollectionRepository:
         return tuple(self._collection_documents.get(collection_id, ()))
 
     def add_collection_handoff(self, record: CollectionHandoffRecord) -> None:
-        if record.collection_id not in self._collections:
+        if self.read_collection(record.collection_id) is None:
             raise FileNotFoundError(f"collection not found: {record.collection_id}")
         handoffs = self._handoffs.setdefault(record.collection_id, [])
         if any(item.handoff_id == record.handoff_id for item in handoffs):
@@ -173,6 +178,37 @@ class MemoryCollectionRepository:
         return tuple(self._handoffs.get(collection_id, ()))
 
     def delete_collection(self, collection_id: str) -> bool:
+        return self.finalize_collection_purge(collection_id)
+
+    def tombstone_collection(self, collection_id: str, *, deleted_at: str) -> bool:
+        if self.read_collection(collection_id) is None:
+            return False
+        self._tombstones[collection_id] = deleted_at
+        return True
+
+    def cancel_collection_builds(self, collection_id: str, *, finished_at: str) -> int:
+        return 0
+
+    def list_tombstoned_collections(self, limit: int = 100) -> tuple[str, ...]:
+        ordered = sorted(self._tombstones.items(), key=lambda item: (item[1], item[0]))
+        return tuple(collection_id for collection_id, _ in ordered[:limit])
+
+    def purge_collection_rows(
+        self,
+        collection_id: str,
+        *,
+        batch_size: int = 1000,
+        start_table: str | None = None,
+    ) -> CollectionPurgeProgress:
+        return CollectionPurgeProgress(
+            collection_id=collection_id,
+            table=None,
+            deleted_rows=0,
+            done=True,
+        )
+
+    def finalize_collection_purge(self, collection_id: str) -> bool:
+        self._tombstones.pop(collection_id, None)
         if self._collections.pop(collection_id, None) is None:
             return False
         self._files.pop(collection_id, None)
@@ -61,6 +61,14 @@ class PostgresAuthRepository:
                 )
             )
 
+    def update_user_password_hash(self, user_id: str, password_hash: str) -> None:
+        with self.session_factory.begin() as session:
+            session.execute(
+                update(AuthUser)
+                .where(AuthUser.user_id == user_id)
+                .values(password_hash=password_hash)
+            )
+
     def read_session_by_token_hash(
         self,
         token_hash: str,
@@ -79,6 +87,34 @@ class PostgresAuthRepository:
                 "revoked_at": _optional_iso(auth_session.revoked_at),
             }
 
+    def read_session_user_by_token_hash(
+        self,
+        token_hash: str,
+    ) -> dict[str, Any] | None:
+        """Read a session and its user in one joined query."""
+
+        with self.session_factory() as session:
+            row = session.execute(
+                select(AuthSession, AuthUser)
+                .join(AuthUser, AuthUser.user_id == AuthSession.user_id)
+                .where(AuthSession.token_hash == token_hash)
+            ).first()
+            if row is None:
+                return None
+            auth_session, user = row
+            return {
+                "session_id": auth_session.session_id,
+                "user_id": auth_session.user_id,
+                "created_at": _iso(auth_session.created_at),
+                "expires_at": _iso(auth_session.expires_at),
+                "revoked_at": _optional_iso(auth_session.revoked_at),
+                "user": {
+                    "user_id": user.user_id,
+                    "email": user.email,
+                    "display_name": user.display_name,
+                },
+            }
+
     def add_session(self, payload: Mapping[str, Any]) -> None:
         with self.session_factory.begin() as session:
             session.add(
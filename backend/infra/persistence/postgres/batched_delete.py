@@ -0,0 +1,143 @@
+"""Bounded, resumable deletes over the relational model graph."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from typing import Any
+
+from sqlalchemy import Table, delete, func, select, tuple_
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.persistence.postgres import models as _models  # noqa: F401
+from infra.persistence.postgres.base import Base
+from infra.persistence.postgres.build_partitions import PartitionDrop
+
+
+def dependent_tables(
+    columns: Collection[str],
+    *,
+    exclude: Collection[str] = (),
+) -> tuple[Table, ...]:
+    """Tables in scope of `columns`, dependents before what they reference.
+
+    A table is in scope when it carries any of `columns`, or when it only
+    reaches a table in scope through an ON DELETE CASCADE foreign key (chat
+    messages under a chat session, say). Listing those children explicitly
+    keeps each batch bounded instead of cascading through every child row
+    of a parent batch. Draining the tables in this order means every delete
+    only cascades into rows that are already gone, and no RESTRICT reference
+    is left dangling.
+    """
+
+    included: set[str] = set()
+    for table in Base.metadata.sorted_tables:
+        if table.name in exclude:
+            continue
+        if any(column in table.c for column in columns) or any(
+            constraint.ondelete == "CASCADE"
+            and constraint.referred_table.name in included
+            for constraint in table.foreign_key_constraints
+        ):
+            included.add(table.name)
+    return tuple(
+        table
+        for table in reversed(Base.metadata.sorted_tables)
+        if table.name in included
+    )
+
+
+def cascade_scope(
+    scope: Callable[[Table], Any],
+    columns: Collection[str],
+) -> Callable[[Table], Any]:
+    """Extend `scope` to the cascade children listed by `dependent_tables`.
+
+    A table without any of `columns` is scoped through the rows of the
+    parent it cascades from, so its batches select exactly the rows that
+    deleting those parents would have removed.
+    """
+
+    def resolve(table: Table) -> Any:
+        if any(column in table.c for column in columns):
+            return scope(table)
+        constraint = next(
+            constraint
+            for constraint in table.foreign_key_constraints
+            if constraint.ondelete == "CASCADE"
+            and _reaches_scope(constraint.referred_table, columns)
+        )
+        local = [element.parent for element in constraint.elements]
+        referred = [element.column for element in constraint.elements]
+        target = local[0] if len(local) == 1 else tuple_(*local)
+        return target.in_(
+            select(*referred).where(resolve(constraint.referred_table))
+        )
+
+    return resolve
+
+
+def _reaches_scope(table: Table, columns: Collection[str]) -> bool:
+    return any(column in table.c for column in columns) or any(
+        constraint.ondelete == "CASCADE"
+        and _reaches_scope(constraint.referred_table, columns)
+        for constraint in table.foreign_key_constraints
+    )
+
+
+def delete_next_batch(
+    session_factory: sessionmaker[Session],
+    tables: tuple[Table, ...],
+    scope: Callable[[Table], Any],
+    *,
+    batch_size: int,
+    start_table: str | None = None,
+    drop_partitions: Callable[[Session, Table], PartitionDrop] | None = None,
+) -> tuple[str | None, int]:
+    """Delete one batch from the first non-empty table at or after `start_table`.
+
+    Returns the table name and deleted row count, or `(None, 0)` once every
+    table is empty for `scope`. Each batch commits on its own. When given,
+    `drop_partitions` runs first for each table and may remove whole
+    partitions. Dropping any partition counts as that table's batch, with
+    the planner's estimate as its row count. A drop blocked on the parent's
+    lock falls back to row deletes, and the next batch retries the drop.
+    """
+
+    start = 0
+    if start_table is not None:
+        start = next(
+            (index for index, table in enumerate(tables) if table.name == start_table),
+            0,
+        )
+    for table in tables[start:]:
+        if drop_partitions is not None:
+            with session_factory.begin() as session:
+                dropped = drop_partitions(session, table)
+            if dropped.dropped:
+                return table.name, dropped.estimated_rows
+        key = tuple(table.primary_key.columns)
+        batch = select(*key).where(scope(table)).limit(max(int(batch_size), 1))
+        target = key[0] if len(key) == 1 else tuple_(*key)
+        with session_factory.begin() as session:
+            deleted = session.execute(delete(table).where(target.in_(batch))).rowcount
+        if deleted:
+            return table.name, int(deleted)
+    return None, 0
+
+
+def count_rows(
+    session: Session,
+    tables: tuple[Table, ...],
+    scope: Callable[[Table], Any],
+) -> dict[str, int]:
+    """Non-zero row counts per table for `scope`."""
+
+    counts: dict[str, int] = {}
+    for table in tables:
+        count = session.scalar(
+            select(func.count()).select_from(table).where(scope(table))
+        )
+        if count:
+            counts[table.name] = int(count)
+    return counts
+
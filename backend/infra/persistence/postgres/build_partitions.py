@@ -0,0 +1,161 @@
+"""Per-build LIST partitions for the high-volume Source structure tables.
+
+On PostgreSQL every build owns one partition of each table below. Reads
+always filter on `build_id`, so they prune to that build's partitions, and
+removing a build detaches and drops them instead of deleting row by row.
+Other dialects keep plain tables and these helpers do nothing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from hashlib import sha256
+import re
+
+from sqlalchemy import String, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+# Referenced tables first; partitions are dropped in the reverse order.
+PARTITIONED_SOURCE_TABLES = (
+    "source_text_units",
+    "source_text_unit_documents",
+    "source_blocks",
+    "source_block_text_units",
+    "source_table_cells",
+)
+# DETACH and DROP need ACCESS EXCLUSIVE on the parent. Queued behind a long
+# reader, that request would stall every later query on the table, so give
+# up quickly and let the next purge pass try again.
+DROP_LOCK_TIMEOUT = "1s"
+_LOCK_NOT_AVAILABLE = "55P03"
+_PARTITION_NAME_PATTERN = re.compile(
+    rf"^(?:{'|'.join(PARTITIONED_SOURCE_TABLES)})_(?:p[0-9a-f]{{16}}|default)$"
+)
+
+
+def partition_name(table_name: str, build_id: str) -> str:
+    """Stable partition name; build ids are hashed to respect identifier limits."""
+
+    digest = sha256(str(build_id).encode("utf-8")).hexdigest()[:16]
+    return f"{table_name}_p{digest}"
+
+
+def is_build_partition(name: str) -> bool:
+    """Whether `name` is a build or DEFAULT partition rather than a model table."""
+
+    return _PARTITION_NAME_PATTERN.fullmatch(name) is not None
+
+
+def uses_build_partitions(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def create_build_partitions(session: Session, build_id: str) -> None:
+    """Create and attach the partitions for a newly registered build.
+
+    Attaching a prepared table takes a SHARE UPDATE EXCLUSIVE lock on the
+    parent, so reads and writes of other builds' partitions carry on. It
+    also takes ACCESS EXCLUSIVE on the parent's DEFAULT partition and scans
+    it for rows that would belong to the new build, blocking every query on
+    pre-partitioning builds until the registering transaction commits. The
+    cost grows with the DEFAULT partition, so collect those legacy builds.
+
+    Every build adds one partition per table. Only build collection drops
+    them, which is why retention is always on with PostgreSQL.
+    """
+
+    if not uses_build_partitions(session):
+        return
+    dialect = session.get_bind().dialect
+    quote = dialect.identifier_preparer.quote
+    value = String().literal_processor(dialect=dialect)(str(build_id))
+    for table_name in PARTITIONED_SOURCE_TABLES:
+        partition = quote(partition_name(table_name, build_id))
+        parent = quote(table_name)
+        session.execute(
+            text(
+                f"CREATE TABLE {partition} "
+                f"(LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {parent} ATTACH PARTITION {partition} "
+                f"FOR VALUES IN ({value})"
+            )
+        )
+
+
+@dataclass(frozen=True)
+class PartitionDrop:
+    """What one `drop_build_partitions` call removed.
+
+    `estimated_rows` is the planner's estimate and is 0 for partitions that
+    were never analyzed, so callers must test `dropped` to see whether any
+    partition went. `blocked` means the parent lock was not granted within
+    `DROP_LOCK_TIMEOUT`; the remaining partitions are left for a later call.
+    """
+
+    dropped: int = 0
+    estimated_rows: int = 0
+    blocked: bool = False
+
+
+def drop_build_partitions(
+    session: Session,
+    table_name: str,
+    build_ids: Iterable[str],
+) -> PartitionDrop:
+    """Detach and drop `table_name` partitions for `build_ids`.
+
+    Rows of other tables that reference the partition must already be gone.
+    """
+
+    if table_name not in PARTITIONED_SOURCE_TABLES or not uses_build_partitions(
+        session
+    ):
+        return PartitionDrop()
+    quote = session.get_bind().dialect.identifier_preparer.quote
+    session.execute(text(f"SET LOCAL lock_timeout = '{DROP_LOCK_TIMEOUT}'"))
+    dropped = 0
+    estimated_rows = 0
+    for build_id in build_ids:
+        partition = partition_name(table_name, build_id)
+        estimate = session.scalar(
+            text(
+                "SELECT greatest(reltuples, 0)::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:partition)"
+            ),
+            {"partition": partition},
+        )
+        if estimate is None:
+            continue
+        try:
+            with session.begin_nested():
+                session.execute(
+                    text(
+                        f"ALTER TABLE {quote(table_name)} "
+                        f"DETACH PARTITION {quote(partition)}"
+                    )
+                )
+                session.execute(text(f"DROP TABLE {quote(partition)}"))
+        except OperationalError as exc:
+            if getattr(exc.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            return PartitionDrop(dropped, estimated_rows, blocked=True)
+        dropped += 1
+        estimated_rows += int(estimate)
+    return PartitionDrop(dropped, estimated_rows)
+
+
+__all__ = [
+    "PARTITIONED_SOURCE_TABLES",
+    "PartitionDrop",
+    "create_build_partitions",
+    "drop_build_partitions",
+    "is_build_partition",
+    "partition_name",
+    "uses_build_partitions",
+]
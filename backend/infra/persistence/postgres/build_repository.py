@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from itertools import groupby
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Table, delete, func, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from domain.pipeline import (
@@ -15,6 +16,7 @@ from domain.pipeline import (
 )
 from domain.source import (
     ArtifactVersionRecord,
+    BuildPurgeProgress,
     BuildStageRecord,
     CollectionBuildRecord,
     TaskRecord,
@@ -26,7 +28,35 @@ from infra.persistence.postgres.models.build import (
     CollectionBuild,
     Task,
 )
+from infra.persistence.postgres.batched_delete import (
+    cascade_scope,
+    count_rows,
+    delete_next_batch,
+    dependent_tables,
+)
+from infra.persistence.postgres.build_partitions import (
+    create_build_partitions,
+    drop_build_partitions,
+)
 from infra.persistence.postgres.models.collection import Collection
+from infra.persistence.postgres.models.evaluation import (
+    EvaluationGoldSetRecord,
+    EvaluationPredictionSnapshotRecord,
+)
+from infra.persistence.postgres.models.objective import (
+    ObjectiveAnalysisRecord,
+    ObjectiveAuthoredCandidateRecord,
+    ObjectivePaperContributionRecord,
+)
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+_TERMINAL_BUILD_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+# Stages, artifact versions and the build row go with the task in
+# `finalize_build_purge`; active builds are never purged.
+_BUILD_PURGE_TABLES = dependent_tables(
+    ("build_id",),
+    exclude=("collection_builds", "build_stages", "collection_active_builds"),
+)
 
 
 class PostgresBuildRepository:
@@ -68,6 +98,7 @@ class PostgresBuildRepository:
             session.add(build)
             if collection is None:
                 session.flush()
+            create_build_partitions(session, build.build_id)
             result = _build_record(build)
         return result
 
@@ -233,6 +264,133 @@ class PostgresBuildRepository:
             build = session.scalar(statement)
             return _build_record(build) if build is not None else None
 
+    def list_expired_builds(
+        self,
+        *,
+        keep_last: int,
+        limit: int = 100,
+    ) -> tuple[CollectionBuildRecord, ...]:
+        """Finished builds outside the retention window, oldest collections first.
+
+        Each collection keeps its newest `keep_last` builds, its active build,
+        every build a published analysis or authored candidate was derived
+        from, and the build that was current when each evaluation snapshot
+        or gold set was last written.
+        """
+
+        keep_last = max(int(keep_last), 0)
+        statement = (
+            select(CollectionBuild)
+            .join(Collection, Collection.collection_id == CollectionBuild.collection_id)
+            .where(Collection.deleted_at.is_(None))
+            .order_by(CollectionBuild.collection_id, CollectionBuild.build_number.desc())
+        )
+        with self.session_factory() as session:
+            builds = tuple(session.scalars(statement))
+            retained = _referenced_build_ids(session)
+            pins: dict[str, list[datetime]] = {}
+            for collection_id, moment in session.execute(
+                select(
+                    EvaluationPredictionSnapshotRecord.collection_id,
+                    EvaluationPredictionSnapshotRecord.created_at,
+                ).union_all(
+                    select(
+                        EvaluationGoldSetRecord.collection_id,
+                        EvaluationGoldSetRecord.updated_at,
+                    )
+                )
+            ):
+                pins.setdefault(collection_id, []).append(_datetime(moment))
+            expired: list[CollectionBuildRecord] = []
+            for collection_id, group in groupby(builds, key=lambda row: row.collection_id):
+                newest_first = list(group)
+                finished = [
+                    row
+                    for row in newest_first
+                    if row.status == "succeeded" and row.finished_at is not None
+                ]
+                for moment in pins.get(collection_id, ()):
+                    pinned = next(
+                        (row for row in finished if _datetime(row.finished_at) <= moment),
+                        None,
+                    )
+                    if pinned is not None:
+                        retained.add(pinned.build_id)
+                expired.extend(
+                    _build_record(row)
+                    for row in newest_first[keep_last:]
+                    if row.status in _TERMINAL_BUILD_STATUSES
+                    and row.build_id not in retained
+                )
+        return tuple(expired[: max(int(limit), 0)])
+
+    def count_build_rows(self, build_id: str) -> dict[str, int]:
+        with self.session_factory() as session:
+            return count_rows(
+                session,
+                _BUILD_PURGE_TABLES,
+                cascade_scope(
+                    lambda table: _build_scope(table, build_id),
+                    ("build_id",),
+                ),
+            )
+
+    def purge_build_rows(
+        self,
+        build_id: str,
+        *,
+        batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+        start_table: str | None = None,
+    ) -> BuildPurgeProgress:
+        """Delete one batch of an expired build's derived rows.
+
+        Call repeatedly, passing the returned table back as `start_table`,
+        until the progress reports `done`; then `finalize_build_purge`.
+        """
+
+        with self.session_factory() as session:
+            _require_unreferenced(session, build_id)
+        table, deleted = delete_next_batch(
+            self.session_factory,
+            _BUILD_PURGE_TABLES,
+            cascade_scope(
+                lambda target: _build_scope(target, build_id),
+                ("build_id",),
+            ),
+            batch_size=batch_size,
+            start_table=start_table,
+            drop_partitions=lambda session, target: drop_build_partitions(
+                session, target.name, (build_id,)
+            ),
+        )
+        return BuildPurgeProgress(
+            build_id=build_id,
+            table=table,
+            deleted_rows=deleted,
+            done=table is None,
+        )
+
+    def finalize_build_purge(self, build_id: str) -> bool:
+        with self.session_factory.begin() as session:
+            build = session.get(CollectionBuild, build_id)
+            if build is None:
+                return False
+            _require_unreferenced(session, build_id)
+            stage_ids = select(BuildStage.stage_id).where(
+                BuildStage.build_id == build_id
+            )
+            session.execute(
+                delete(ArtifactVersion).where(
+                    ArtifactVersion.build_stage_id.in_(stage_ids)
+                )
+            )
+            session.execute(delete(BuildStage).where(BuildStage.build_id == build_id))
+            task_id = build.task_id
+            session.delete(build)
+            session.flush()
+            session.execute(delete(Task).where(Task.task_id == task_id))
+        return True
+
     @staticmethod
     def _activate_if_newer(session: Session, build: CollectionBuild) -> None:
         collection = session.scalar(
@@ -256,6 +414,33 @@ class PostgresBuildRepository:
             active.build_id = build.build_id
 
 
+def _build_scope(table: Table, build_id: str) -> Any:
+    return table.c.build_id == build_id
+
+
+def _referenced_build_ids(session: Session, build_id: str | None = None) -> set[str]:
+    """Builds that active pointers or published Objective records depend on."""
+
+    columns = (
+        CollectionActiveBuild.build_id,
+        ObjectiveAnalysisRecord.source_build_id,
+        ObjectivePaperContributionRecord.source_build_id,
+        ObjectiveAuthoredCandidateRecord.source_build_id,
+    )
+    referenced: set[str] = set()
+    for column in columns:
+        statement = select(column).distinct()
+        if build_id is not None:
+            statement = statement.where(column == build_id)
+        referenced.update(session.scalars(statement))
+    return referenced
+
+
+def _require_unreferenced(session: Session, build_id: str) -> None:
+    if _referenced_build_ids(session, build_id):
+        raise ValueError(f"build is retained: {build_id}")
+
+
 def _task_row(record: TaskRecord) -> Task:
     return Task(
         task_id=record.task_id,
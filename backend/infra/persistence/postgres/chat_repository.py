@@ -52,26 +52,39 @@ class PostgresChatRepository:
                     .order_by(ChatMessageRow.position)
                 )
             )
-            result_ids = {
-                row.tool_call_id
-                for row in rows
-                if row.role == "tool" and row.tool_call_id is not None
-            }
-            results = {
-                row.tool_call_id: row
-                for row in session.scalars(
-                    select(ChatToolResultRow).where(
-                        ChatToolResultRow.tool_call_id.in_(result_ids)
-                    )
-                )
-            } if result_ids else {}
-            return tuple(
-                _message_record(
-                    row,
-                    results.get(row.tool_call_id) if row.role == "tool" else None,
-                )
-                for row in rows
-            )
+            return _message_records(session, rows)
+
+    def read_recent_messages(
+        self,
+        session_id: str,
+        *,
+        limit: int,
+        max_chars: int,
+    ) -> tuple[ChatMessage, ...]:
+        """Read the newest messages in order, stopping once either bound is met.
+
+        The message that crosses `max_chars` is still returned, so callers that
+        budget on a larger per-message size never see fewer messages than they
+        could have selected from the full history.
+        """
+
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        with self.session_factory() as session:
+            rows: list[ChatMessageRow] = []
+            char_count = 0
+            for row in session.scalars(
+                select(ChatMessageRow)
+                .where(ChatMessageRow.session_id == session_id)
+                .order_by(ChatMessageRow.position.desc())
+                .limit(limit)
+            ):
+                rows.append(row)
+                char_count += len(row.content)
+                if char_count >= max_chars:
+                    break
+            rows.reverse()
+            return _message_records(session, tuple(rows))
 
     def read_tool_call(self, tool_call_id: str) -> ChatToolCall | None:
         with self.session_factory() as session:
@@ -100,43 +113,84 @@ class PostgresChatRepository:
             ):
                 raise ValueError("session identity cannot be reassigned")
 
-            existing_messages = tuple(
-                database.scalars(
-                    select(ChatMessageRow)
-                    .where(ChatMessageRow.session_id == session.session_id)
-                    .order_by(ChatMessageRow.position)
-                )
-            )
-            existing_ids = tuple(row.message_id for row in existing_messages)
+            last_stored = database.execute(
+                select(ChatMessageRow.position, ChatMessageRow.message_id)
+                .where(ChatMessageRow.session_id == session.session_id)
+                .order_by(ChatMessageRow.position.desc())
+                .limit(1)
+            ).first()
             incoming_ids = tuple(message.message_id for message in messages)
-            if incoming_ids[: len(existing_ids)] != existing_ids:
-                raise ValueError("chat trajectory is append-only")
+            first_new_index = 0
+            next_position = 0
+            if last_stored is not None:
+                # Callers pass a trajectory suffix that ends with the stored
+                # history. Everything up to the last stored message must be
+                # exactly the stored tail of that length, so the check reads
+                # no more rows than the caller sent.
+                if last_stored.message_id not in incoming_ids:
+                    raise ValueError("chat trajectory is append-only")
+                first_new_index = incoming_ids.index(last_stored.message_id) + 1
+                stored_tail = tuple(
+                    database.scalars(
+                        select(ChatMessageRow.message_id)
+                        .where(ChatMessageRow.session_id == session.session_id)
+                        .order_by(ChatMessageRow.position.desc())
+                        .limit(first_new_index)
+                    )
+                )
+                if stored_tail[::-1] != incoming_ids[:first_new_index]:
+                    raise ValueError("chat trajectory is append-only")
+                next_position = last_stored.position + 1
             session_row.updated_at = _datetime(session.updated_at)
 
-            for position, message in enumerate(messages[len(existing_ids) :], len(existing_ids)):
-                if database.get(ChatMessageRow, message.message_id) is not None:
-                    raise ValueError("message identity cannot be reassigned")
-                database.add(
-                    ChatMessageRow(
-                        message_id=message.message_id,
-                        session_id=message.session_id,
-                        position=position,
-                        role=message.role.value,
-                        content=message.content,
-                        tool_call_id=message.tool_call_id,
-                        tool_name=message.tool_name,
-                        tool_arguments=(
-                            dict(message.tool_arguments)
-                            if message.tool_arguments is not None
-                            else None
-                        ),
-                        created_at=_datetime(message.created_at),
+            new_messages = messages[first_new_index:]
+            if new_messages:
+                reassigned = database.scalars(
+                    select(ChatMessageRow.message_id)
+                    .where(
+                        ChatMessageRow.message_id.in_(
+                            [message.message_id for message in new_messages]
+                        )
                     )
+                    .limit(1)
+                ).first()
+                if reassigned is not None:
+                    raise ValueError("message identity cannot be reassigned")
+                database.execute(
+                    ChatMessageRow.__table__.insert(),
+                    [
+                        {
+                            "message_id": message.message_id,
+                            "session_id": message.session_id,
+                            "position": position,
+                            "role": message.role.value,
+                            "content": message.content,
+                            "tool_call_id": message.tool_call_id,
+                            "tool_name": message.tool_name,
+                            "tool_arguments": (
+                                dict(message.tool_arguments)
+                                if message.tool_arguments is not None
+                                else None
+                            ),
+                            "created_at": _datetime(message.created_at),
+                        }
+                        for position, message in enumerate(new_messages, next_position)
+                    ],
                 )
-            database.flush()
 
+            call_ids = {call.tool_call_id for call in tool_calls} | {
+                result.tool_call_id for result in tool_results
+            }
+            call_rows = {
+                row.tool_call_id: row
+                for row in database.scalars(
+                    select(ChatToolCallRow).where(
+                        ChatToolCallRow.tool_call_id.in_(sorted(call_ids))
+                    )
+                )
+            } if call_ids else {}
             for call in tool_calls:
-                row = database.get(ChatToolCallRow, call.tool_call_id)
+                row = call_rows.get(call.tool_call_id)
                 if row is None:
                     row = ChatToolCallRow(
                         tool_call_id=call.tool_call_id,
@@ -149,6 +203,7 @@ class PostgresChatRepository:
                         status=call.status.value,
                     )
                     database.add(row)
+                    call_rows[call.tool_call_id] = row
                 elif (
                     row.session_id != call.session_id
                     or row.assistant_message_id != call.assistant_message_id
@@ -159,11 +214,21 @@ class PostgresChatRepository:
                 _update_call_row(row, call)
             database.flush()
 
+            result_rows = {
+                row.tool_call_id: row
+                for row in database.scalars(
+                    select(ChatToolResultRow).where(
+                        ChatToolResultRow.tool_call_id.in_(
+                            [result.tool_call_id for result in tool_results]
+                        )
+                    )
+                )
+            } if tool_results else {}
             for result in tool_results:
-                call_row = database.get(ChatToolCallRow, result.tool_call_id)
+                call_row = call_rows.get(result.tool_call_id)
                 if call_row is None or call_row.session_id != session.session_id:
                     raise ValueError("tool result belongs to an unknown call")
-                row = database.get(ChatToolResultRow, result.tool_call_id)
+                row = result_rows.get(result.tool_call_id)
                 if row is None:
                     row = ChatToolResultRow(
                         tool_call_id=result.tool_call_id,
@@ -229,6 +294,32 @@ class PostgresChatRepository:
             return decided
 
 
+def _message_records(
+    session: Session,
+    rows: tuple[ChatMessageRow, ...],
+) -> tuple[ChatMessage, ...]:
+    result_ids = {
+        row.tool_call_id
+        for row in rows
+        if row.role == "tool" and row.tool_call_id is not None
+    }
+    results = {
+        row.tool_call_id: row
+        for row in session.scalars(
+            select(ChatToolResultRow).where(
+                ChatToolResultRow.tool_call_id.in_(result_ids)
+            )
+        )
+    } if result_ids else {}
+    return tuple(
+        _message_record(
+            row,
+            results.get(row.tool_call_id) if row.role == "tool" else None,
+        )
+        for row in rows
+    )
+
+
 def _update_call_row(row: ChatToolCallRow, call: ChatToolCall) -> None:
     row.status = call.status.value
     row.started_at = _optional_datetime(call.started_at)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Table, delete, func, select, update
 from sqlalchemy.orm import Session, sessionmaker
 
 from domain.source import (
@@ -14,12 +14,19 @@ from domain.source import (
     CollectionHandoffRecord,
     CollectionImportDocumentRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
     CollectionRecord,
     DocumentRecord,
     DocumentVersionRecord,
     collection_document_identity,
     document_identity_for_sha256,
 )
+from infra.persistence.postgres.batched_delete import (
+    cascade_scope,
+    delete_next_batch,
+    dependent_tables,
+)
+from infra.persistence.postgres.build_partitions import drop_build_partitions
 from infra.persistence.postgres.models.collection import (
     Collection,
     CollectionFile,
@@ -29,46 +36,18 @@ from infra.persistence.postgres.models.collection import (
     StoredObject,
 )
 from infra.persistence.postgres.models.build import CollectionBuild
-from infra.persistence.postgres.models.comparison import (
-    CollectionComparableResultRecord,
-    ComparableResultRecord,
-    ComparisonBuild,
-    PairwiseComparisonRelationRecord,
-    comparable_result_anchor_links,
-    comparable_result_evidence_links,
-    comparable_result_feature_links,
-    comparable_result_observation_links,
-    pairwise_comparison_anchor_links,
-)
 from infra.persistence.postgres.models.document import (
     CollectionDocument,
     Document,
     DocumentVersion,
 )
-from infra.persistence.postgres.models.evaluation import (
-    EvaluationGoldSetRecord,
-    EvaluationPredictionSnapshotRecord,
-    EvaluationRunRecord,
-)
-from infra.persistence.postgres.models.objective import (
-    ObjectiveAnalysisRecord,
-    ObjectiveBuild,
-    ObjectivePaperContributionRecord,
-    ObjectivePaperSkim,
-    ObjectiveResearchRecord,
-    objective_build_candidates,
-    objective_document_scope,
-    objective_finding_evidence_links,
-    objective_finding_relation_evidence_links,
-)
-from infra.persistence.postgres.models.chat import ChatSessionRow
-from infra.persistence.postgres.models.objective_workspace import ObjectiveExperimentPlan
-from infra.persistence.postgres.models.source import (
-    SourceDocument,
-    SourceReferenceCandidate,
-    SourceReferenceEntry,
-    SourceReferenceMention,
-    SourceReferenceResolution,
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+# Removed together with the collection row once everything else is gone.
+_COLLECTION_PURGE_COLUMNS = ("collection_id", "build_id")
+_COLLECTION_PURGE_TABLES = dependent_tables(
+    _COLLECTION_PURGE_COLUMNS,
+    exclude=("collections", "collection_files", "collection_documents"),
 )
 
 
@@ -95,7 +74,11 @@ class PostgresCollectionRepository:
         self,
         owner_user_id: str | None = None,
     ) -> tuple[CollectionRecord, ...]:
-        statement = select(Collection).order_by(Collection.collection_id)
+        statement = (
+            select(Collection)
+            .where(Collection.deleted_at.is_(None))
+            .order_by(Collection.collection_id)
+        )
         if owner_user_id is not None:
             statement = statement.where(Collection.owner_user_id == owner_user_id)
         with self.session_factory() as session:
@@ -104,12 +87,14 @@ class PostgresCollectionRepository:
     def read_collection(self, collection_id: str) -> CollectionRecord | None:
         with self.session_factory() as session:
             row = session.get(Collection, collection_id)
-            return _to_record(row) if row is not None else None
+            if row is None or row.deleted_at is not None:
+                return None
+            return _to_record(row)
 
     def update_collection(self, record: CollectionRecord) -> bool:
         with self.session_factory.begin() as session:
             row = session.get(Collection, record.collection_id)
-            if row is None:
+            if row is None or row.deleted_at is not None:
                 return False
             row.owner_user_id = record.owner_user_id
             row.name = record.name
@@ -140,7 +125,7 @@ class PostgresCollectionRepository:
                 record.collection_id,
                 with_for_update=True,
             )
-            if collection is None:
+            if collection is None or collection.deleted_at is not None:
                 raise FileNotFoundError(f"collection not found: {record.collection_id}")
             next_file_order = (
                 int(
@@ -373,7 +358,7 @@ class PostgresCollectionRepository:
                 record.collection_id,
                 with_for_update=True,
             )
-            if collection is None:
+            if collection is None or collection.deleted_at is not None:
                 raise FileNotFoundError(f"collection not found: {record.collection_id}")
             next_handoff_order = (
                 int(
@@ -411,6 +396,98 @@ class PostgresCollectionRepository:
             return tuple(_to_handoff_record(row) for row in session.scalars(statement))
 
     def delete_collection(self, collection_id: str) -> bool:
+        """Remove a collection now, as a sequence of bounded transactions."""
+
+        with self.session_factory() as session:
+            if session.get(Collection, collection_id) is None:
+                return False
+        progress = self.purge_collection_rows(collection_id)
+        while not progress.done:
+            progress = self.purge_collection_rows(
+                collection_id,
+                start_table=progress.table,
+            )
+        return self.finalize_collection_purge(collection_id)
+
+    def tombstone_collection(self, collection_id: str, *, deleted_at: str) -> bool:
+        with self.session_factory.begin() as session:
+            row = session.get(Collection, collection_id, with_for_update=True)
+            if row is None or row.deleted_at is not None:
+                return False
+            row.deleted_at = _datetime(deleted_at)
+            return True
+
+    def cancel_collection_builds(self, collection_id: str, *, finished_at: str) -> int:
+        """Cancel the collection's queued and building builds; return how many.
+
+        Build writers refuse builds that are no longer queued or building, so
+        once this commits no new rows land under the collection's builds.
+        """
+
+        with self.session_factory.begin() as session:
+            return int(
+                session.execute(
+                    update(CollectionBuild)
+                    .where(
+                        CollectionBuild.collection_id == collection_id,
+                        CollectionBuild.status.in_(("queued", "building")),
+                    )
+                    .values(status="cancelled", finished_at=_datetime(finished_at))
+                ).rowcount
+            )
+
+    def list_tombstoned_collections(self, limit: int = 100) -> tuple[str, ...]:
+        statement = (
+            select(Collection.collection_id)
+            .where(Collection.deleted_at.is_not(None))
+            .order_by(Collection.deleted_at, Collection.collection_id)
+            .limit(limit)
+        )
+        with self.session_factory() as session:
+            return tuple(session.scalars(statement))
+
+    def purge_collection_rows(
+        self,
+        collection_id: str,
+        *,
+        batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+        start_table: str | None = None,
+    ) -> CollectionPurgeProgress:
+        """Delete up to `batch_size` rows from the next non-empty dependent table.
+
+        Tables drain children first, so each batch only cascades into rows
+        that are already gone and no statement holds locks for long.
+        """
+
+        table, deleted_rows = delete_next_batch(
+            self.session_factory,
+            _COLLECTION_PURGE_TABLES,
+            cascade_scope(
+                lambda candidate: _collection_scope(candidate, collection_id),
+                _COLLECTION_PURGE_COLUMNS,
+            ),
+            batch_size=batch_size,
+            start_table=start_table,
+            drop_partitions=lambda session, candidate: drop_build_partitions(
+                session,
+                candidate.name,
+                session.scalars(
+                    select(CollectionBuild.build_id).where(
+                        CollectionBuild.collection_id == collection_id
+                    )
+                ).all(),
+            ),
+        )
+        return CollectionPurgeProgress(
+            collection_id=collection_id,
+            table=table,
+            deleted_rows=deleted_rows,
+            done=table is None,
+        )
+
+    def finalize_collection_purge(self, collection_id: str) -> bool:
+        """Remove files, memberships and the collection row after the purge."""
+
         with self.session_factory.begin() as session:
             row = session.get(Collection, collection_id)
             if row is None:
@@ -433,165 +510,7 @@ class PostgresCollectionRepository:
                 membership.document_version_id for membership in memberships
             }
             document_ids = {membership.document_id for membership in memberships}
-            build_ids = tuple(
-                session.scalars(
-                    select(CollectionBuild.build_id).where(
-                        CollectionBuild.collection_id == collection_id
-                    )
-                )
-            )
 
-            # Remove collection-scoped derived records before their RESTRICTed
-            # source/build parents. Everything remains in this transaction.
-            session.execute(
-                delete(objective_finding_relation_evidence_links).where(
-                    objective_finding_relation_evidence_links.c.collection_id
-                    == collection_id
-                )
-            )
-            session.execute(
-                delete(objective_finding_evidence_links).where(
-                    objective_finding_evidence_links.c.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectivePaperContributionRecord).where(
-                    ObjectivePaperContributionRecord.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectiveAnalysisRecord).where(
-                    ObjectiveAnalysisRecord.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(objective_build_candidates).where(
-                    objective_build_candidates.c.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(objective_document_scope).where(
-                    objective_document_scope.c.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectivePaperSkim).where(
-                    ObjectivePaperSkim.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectiveBuild).where(
-                    ObjectiveBuild.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectiveExperimentPlan).where(
-                    ObjectiveExperimentPlan.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ChatSessionRow).where(
-                    ChatSessionRow.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(ObjectiveResearchRecord).where(
-                    ObjectiveResearchRecord.collection_id == collection_id
-                )
-            )
-
-            for table in (
-                pairwise_comparison_anchor_links,
-                comparable_result_anchor_links,
-                comparable_result_evidence_links,
-                comparable_result_feature_links,
-                comparable_result_observation_links,
-            ):
-                if build_ids:
-                    session.execute(delete(table).where(table.c.build_id.in_(build_ids)))
-            if build_ids:
-                session.execute(
-                    delete(CollectionComparableResultRecord).where(
-                        CollectionComparableResultRecord.build_id.in_(build_ids)
-                    )
-                )
-                session.execute(
-                    delete(PairwiseComparisonRelationRecord).where(
-                        PairwiseComparisonRelationRecord.build_id.in_(build_ids)
-                    )
-                )
-                session.execute(
-                    delete(ComparableResultRecord).where(
-                        ComparableResultRecord.build_id.in_(build_ids)
-                    )
-                )
-                session.execute(
-                    delete(ComparisonBuild).where(
-                        ComparisonBuild.build_id.in_(build_ids)
-                    )
-                )
-
-            session.execute(
-                delete(EvaluationRunRecord).where(
-                    EvaluationRunRecord.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(EvaluationGoldSetRecord).where(
-                    EvaluationGoldSetRecord.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(EvaluationPredictionSnapshotRecord).where(
-                    EvaluationPredictionSnapshotRecord.collection_id
-                    == collection_id
-                )
-            )
-            session.execute(
-                delete(SourceReferenceCandidate).where(
-                    SourceReferenceCandidate.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(SourceReferenceResolution).where(
-                    SourceReferenceResolution.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(SourceReferenceMention).where(
-                    SourceReferenceMention.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(SourceReferenceEntry).where(
-                    SourceReferenceEntry.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(SourceDocument).where(
-                    SourceDocument.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(CollectionBuild).where(
-                    CollectionBuild.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(CollectionImportDocument).where(
-                    CollectionImportDocument.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(CollectionHandoff).where(
-                    CollectionHandoff.collection_id == collection_id
-                )
-            )
-            session.execute(
-                delete(CollectionImport).where(
-                    CollectionImport.collection_id == collection_id
-                )
-            )
             session.execute(
                 delete(CollectionFile).where(
                     CollectionFile.collection_id == collection_id
@@ -637,6 +556,16 @@ class PostgresCollectionRepository:
             return True
 
 
+def _collection_scope(table: Table, collection_id: str) -> Any:
+    if "collection_id" in table.c:
+        return table.c.collection_id == collection_id
+    return table.c.build_id.in_(
+        select(CollectionBuild.build_id).where(
+            CollectionBuild.collection_id == collection_id
+        )
+    )
+
+
 def _to_record(row: Collection) -> CollectionRecord:
     return CollectionRecord(
         collection_id=row.collection_id,
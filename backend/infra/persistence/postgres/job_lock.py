@@ -0,0 +1,52 @@
+"""Cross-process exclusion for background jobs through advisory locks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from hashlib import sha256
+
+from sqlalchemy import Engine, text
+
+
+class PostgresJobLock:
+    """Session-level `pg_try_advisory_lock` held for one pass of a job.
+
+    Every API process starts the same background loops. The process that
+    takes the lock runs the pass and the others skip it. The lock is
+    committed out of its transaction, so the connection is not left idle in
+    a transaction while the pass runs, and it goes away with the connection
+    if the process dies mid-pass.
+    """
+
+    def __init__(self, engine: Engine, name: str) -> None:
+        self.engine = engine
+        self.name = name
+        self.key = advisory_lock_key(name)
+
+    @contextmanager
+    def hold(self) -> Iterator[bool]:
+        with self.engine.connect() as connection:
+            acquired = bool(
+                connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": self.key},
+                ).scalar()
+            )
+            connection.commit()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": self.key},
+                    )
+                    connection.commit()
+
+
+def advisory_lock_key(name: str) -> int:
+    """Map a job name onto the signed 64-bit advisory lock key space."""
+
+    digest = sha256(name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
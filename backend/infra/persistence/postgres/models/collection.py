@@ -52,6 +52,11 @@ class Collection(Base):
         DateTime(timezone=True),
         nullable=False,
     )
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+    )
 
 
 class StoredObject(Base):
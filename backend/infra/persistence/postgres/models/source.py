@@ -10,6 +10,7 @@ from sqlalchemy import (
     CheckConstraint,
     Float,
     ForeignKeyConstraint,
+    Index,
     Integer,
     String,
     Text,
@@ -22,6 +23,8 @@ from infra.persistence.postgres.base import Base
 
 
 _JSON_DOCUMENT = JSON().with_variant(JSONB(), "postgresql")
+# Each build's rows live in their own partition; see build_partitions.py.
+_BUILD_PARTITIONED = {"postgresql_partition_by": "LIST (build_id)"}
 
 
 class SourceDocument(Base):
@@ -91,6 +94,7 @@ class SourceTextUnit(Base):
             "text_unit_id",
             name="uq_source_text_units_collection_build_text_unit",
         ),
+        _BUILD_PARTITIONED,
     )
 
     build_id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -124,6 +128,12 @@ class SourceTextUnitDocument(Base):
             name="fk_source_text_unit_documents_document",
             ondelete="CASCADE",
         ),
+        Index(
+            "ix_source_text_unit_documents_document",
+            "build_id",
+            "source_document_id",
+        ),
+        _BUILD_PARTITIONED,
     )
 
     build_id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -157,6 +167,7 @@ class SourceBlock(Base):
             "block_id",
             name="uq_source_blocks_document_block",
         ),
+        _BUILD_PARTITIONED,
     )
 
     build_id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -194,6 +205,7 @@ class SourceBlockTextUnit(Base):
             name="fk_source_block_text_units_text_unit",
             ondelete="CASCADE",
         ),
+        _BUILD_PARTITIONED,
     )
 
     build_id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -306,6 +318,13 @@ class SourceTableCell(Base):
             "cell_id",
             name="uq_source_table_cells_identity",
         ),
+        Index(
+            "ix_source_table_cells_table_row",
+            "build_id",
+            "table_id",
+            "row_index",
+        ),
+        _BUILD_PARTITIONED,
     )
 
     build_id: Mapped[str] = mapped_column(String(64), primary_key=True)
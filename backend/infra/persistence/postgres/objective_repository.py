@@ -5,9 +5,9 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import and_, delete, func, or_, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from domain.core import (
@@ -1081,7 +1081,10 @@ class PostgresObjectiveRepository:
                     .limit(max(1, min(limit, 200)))
                 )
             )
-            return tuple(self._finding_record(session, row) for row in rows), total
+            return (
+                tuple(finding for finding, _ in self._finding_batch(session, rows)),
+                total,
+            )
 
     def read_finding(
         self,
@@ -1160,6 +1163,50 @@ class PostgresObjectiveRepository:
             )
             return tuple(self._evidence_record(row) for row in rows), total
 
+    def iter_findings_with_evidence(
+        self,
+        collection_id: str,
+        objective_id: str,
+        analysis_version: int,
+        *,
+        batch_size: int = 200,
+    ) -> Iterator[tuple[Finding, tuple[ObjectiveEvidence, ...]]]:
+        """Stream every Finding of one analysis version with its Evidence.
+
+        Findings come in `list_findings` order, read in keyset batches; each
+        batch costs a fixed handful of queries regardless of its size.
+        """
+        with self.session_factory() as session:
+            after: tuple[int, str] | None = None
+            while True:
+                statement = select(ObjectiveFindingRecord).where(
+                    ObjectiveFindingRecord.collection_id == collection_id,
+                    ObjectiveFindingRecord.objective_id == objective_id,
+                    ObjectiveFindingRecord.analysis_version == analysis_version,
+                )
+                if after is not None:
+                    statement = statement.where(
+                        or_(
+                            ObjectiveFindingRecord.display_rank > after[0],
+                            and_(
+                                ObjectiveFindingRecord.display_rank == after[0],
+                                ObjectiveFindingRecord.finding_id > after[1],
+                            ),
+                        )
+                    )
+                rows = tuple(
+                    session.scalars(
+                        statement.order_by(
+                            ObjectiveFindingRecord.display_rank,
+                            ObjectiveFindingRecord.finding_id,
+                        ).limit(max(1, batch_size))
+                    )
+                )
+                if not rows:
+                    return
+                yield from self._finding_batch(session, rows)
+                after = (rows[-1].display_rank, rows[-1].finding_id)
+
     @staticmethod
     def _validate_artifact_keys(
         expected_key: tuple[str, str, int],
@@ -1410,172 +1457,292 @@ class PostgresObjectiveRepository:
         session: Session,
         row: ObjectiveFindingRecord,
     ) -> Finding:
-        key_filters = (
-            row.collection_id,
-            row.objective_id,
-            row.analysis_version,
-            row.finding_id,
+        return self._finding_batch(session, (row,))[0][0]
+
+    def _finding_batch(
+        self,
+        session: Session,
+        rows: tuple[ObjectiveFindingRecord, ...],
+    ) -> list[tuple[Finding, tuple[ObjectiveEvidence, ...]]]:
+        """Assemble Findings and their linked Evidence with set-based reads.
+
+        Every child table is read once for the whole batch, so the number of
+        queries does not grow with the number of Findings.
+        """
+        if not rows:
+            return []
+        analysis_key = (
+            rows[0].collection_id,
+            rows[0].objective_id,
+            rows[0].analysis_version,
         )
-        relation_rows = tuple(
-            session.scalars(
-                select(ObjectiveFindingRelationRecord)
-                .where(
-                    ObjectiveFindingRelationRecord.collection_id == key_filters[0],
-                    ObjectiveFindingRelationRecord.objective_id == key_filters[1],
-                    ObjectiveFindingRelationRecord.analysis_version == key_filters[2],
-                    ObjectiveFindingRelationRecord.finding_id == key_filters[3],
-                )
-                .order_by(ObjectiveFindingRelationRecord.relation_order)
-            )
+        finding_ids = tuple(row.finding_id for row in rows)
+
+        relation_rows: dict[str, list[ObjectiveFindingRelationRecord]] = defaultdict(
+            list
         )
-        relation_links: dict[int, list[str]] = defaultdict(list)
+        for relation in session.scalars(
+            select(ObjectiveFindingRelationRecord)
+            .where(
+                ObjectiveFindingRelationRecord.collection_id == analysis_key[0],
+                ObjectiveFindingRelationRecord.objective_id == analysis_key[1],
+                ObjectiveFindingRelationRecord.analysis_version == analysis_key[2],
+                ObjectiveFindingRelationRecord.finding_id.in_(finding_ids),
+            )
+            .order_by(
+                ObjectiveFindingRelationRecord.finding_id,
+                ObjectiveFindingRelationRecord.relation_order,
+            )
+        ):
+            relation_rows[relation.finding_id].append(relation)
+        relation_links: dict[tuple[str, int], list[str]] = defaultdict(list)
         for link in session.execute(
             select(objective_finding_relation_evidence_links)
             .where(
                 objective_finding_relation_evidence_links.c.collection_id
-                == key_filters[0],
+                == analysis_key[0],
                 objective_finding_relation_evidence_links.c.objective_id
-                == key_filters[1],
+                == analysis_key[1],
                 objective_finding_relation_evidence_links.c.analysis_version
-                == key_filters[2],
-                objective_finding_relation_evidence_links.c.finding_id
-                == key_filters[3],
+                == analysis_key[2],
+                objective_finding_relation_evidence_links.c.finding_id.in_(
+                    finding_ids
+                ),
             )
             .order_by(
+                objective_finding_relation_evidence_links.c.finding_id,
                 objective_finding_relation_evidence_links.c.relation_order,
                 objective_finding_relation_evidence_links.c.position,
             )
         ).mappings():
-            relation_links[int(link["relation_order"])].append(str(link["evidence_id"]))
-        evidence_links: dict[str, list[str]] = defaultdict(list)
+            relation_links[
+                (str(link["finding_id"]), int(link["relation_order"]))
+            ].append(str(link["evidence_id"]))
+        evidence_links: dict[str, dict[str, list[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
         for link in session.execute(
             select(objective_finding_evidence_links)
             .where(
-                objective_finding_evidence_links.c.collection_id == key_filters[0],
-                objective_finding_evidence_links.c.objective_id == key_filters[1],
-                objective_finding_evidence_links.c.analysis_version == key_filters[2],
-                objective_finding_evidence_links.c.finding_id == key_filters[3],
+                objective_finding_evidence_links.c.collection_id == analysis_key[0],
+                objective_finding_evidence_links.c.objective_id == analysis_key[1],
+                objective_finding_evidence_links.c.analysis_version
+                == analysis_key[2],
+                objective_finding_evidence_links.c.finding_id.in_(finding_ids),
             )
             .order_by(
+                objective_finding_evidence_links.c.finding_id,
                 objective_finding_evidence_links.c.link_role,
                 objective_finding_evidence_links.c.position,
             )
         ).mappings():
-            evidence_links[str(link["link_role"])].append(str(link["evidence_id"]))
-        context_row = session.get(ObjectiveFindingContextRecord, key_filters)
-        paper_rows = tuple(
-            session.scalars(
-                select(ObjectiveFindingPaperContributionRecord)
-                .where(
-                    ObjectiveFindingPaperContributionRecord.collection_id
-                    == key_filters[0],
-                    ObjectiveFindingPaperContributionRecord.objective_id
-                    == key_filters[1],
-                    ObjectiveFindingPaperContributionRecord.analysis_version
-                    == key_filters[2],
-                    ObjectiveFindingPaperContributionRecord.finding_id
-                    == key_filters[3],
+            evidence_links[str(link["finding_id"])][str(link["link_role"])].append(
+                str(link["evidence_id"])
+            )
+        context_rows = {
+            context.finding_id: context
+            for context in session.scalars(
+                select(ObjectiveFindingContextRecord).where(
+                    ObjectiveFindingContextRecord.collection_id == analysis_key[0],
+                    ObjectiveFindingContextRecord.objective_id == analysis_key[1],
+                    ObjectiveFindingContextRecord.analysis_version
+                    == analysis_key[2],
+                    ObjectiveFindingContextRecord.finding_id.in_(finding_ids),
                 )
-                .order_by(ObjectiveFindingPaperContributionRecord.paper_order)
             )
+        }
+        paper_rows: dict[str, list[ObjectiveFindingPaperContributionRecord]] = (
+            defaultdict(list)
         )
-        if context_row is None or not paper_rows:
-            raise RuntimeError(f"incomplete persisted finding: {row.finding_id}")
+        for paper_row in session.scalars(
+            select(ObjectiveFindingPaperContributionRecord)
+            .where(
+                ObjectiveFindingPaperContributionRecord.collection_id
+                == analysis_key[0],
+                ObjectiveFindingPaperContributionRecord.objective_id
+                == analysis_key[1],
+                ObjectiveFindingPaperContributionRecord.analysis_version
+                == analysis_key[2],
+                ObjectiveFindingPaperContributionRecord.finding_id.in_(finding_ids),
+            )
+            .order_by(
+                ObjectiveFindingPaperContributionRecord.finding_id,
+                ObjectiveFindingPaperContributionRecord.paper_order,
+            )
+        ):
+            paper_rows[paper_row.finding_id].append(paper_row)
+
         linked_evidence_ids = {
             evidence_id
-            for evidence_ids in evidence_links.values()
+            for links in evidence_links.values()
+            for evidence_ids in links.values()
             for evidence_id in evidence_ids
         }
-        evidence_documents: dict[str, str] = {}
-        for evidence_id in linked_evidence_ids:
-            evidence_row = session.get(
-                ObjectiveEvidenceRecord,
-                (*key_filters[:3], evidence_id),
+        evidence_rows = (
+            tuple(
+                session.scalars(
+                    select(ObjectiveEvidenceRecord)
+                    .where(
+                        ObjectiveEvidenceRecord.collection_id == analysis_key[0],
+                        ObjectiveEvidenceRecord.objective_id == analysis_key[1],
+                        ObjectiveEvidenceRecord.analysis_version == analysis_key[2],
+                        ObjectiveEvidenceRecord.evidence_id.in_(
+                            tuple(linked_evidence_ids)
+                        ),
+                    )
+                    .order_by(
+                        ObjectiveEvidenceRecord.evidence_order,
+                        ObjectiveEvidenceRecord.evidence_id,
+                    )
+                )
             )
-            if evidence_row is None:
-                raise RuntimeError(
-                    f"persisted Finding references missing Evidence: {evidence_id}"
+            if linked_evidence_ids
+            else ()
+        )
+        evidence_by_id = {
+            evidence_row.evidence_id: self._evidence_record(evidence_row)
+            for evidence_row in evidence_rows
+        }
+        missing_evidence_ids = linked_evidence_ids - evidence_by_id.keys()
+        if missing_evidence_ids:
+            raise RuntimeError(
+                "persisted Finding references missing Evidence: "
+                f"{min(missing_evidence_ids)}"
+            )
+        evidence_position = {
+            evidence_id: position for position, evidence_id in enumerate(evidence_by_id)
+        }
+        contribution_documents = {
+            paper_row.source_document_id
+            for papers in paper_rows.values()
+            for paper_row in papers
+        }
+        contribution_statuses = {
+            document_id: analysis_status
+            for document_id, analysis_status in (
+                session.execute(
+                    select(
+                        ObjectivePaperContributionRecord.source_document_id,
+                        ObjectivePaperContributionRecord.analysis_status,
+                    ).where(
+                        ObjectivePaperContributionRecord.collection_id
+                        == analysis_key[0],
+                        ObjectivePaperContributionRecord.objective_id
+                        == analysis_key[1],
+                        ObjectivePaperContributionRecord.analysis_version
+                        == analysis_key[2],
+                        ObjectivePaperContributionRecord.source_document_id.in_(
+                            tuple(contribution_documents)
+                        ),
+                    )
                 )
-            evidence_documents[evidence_id] = evidence_row.source_document_id
-
-        def evidence_for_document(link_role: str, document_id: str) -> tuple[str, ...]:
-            return tuple(
-                evidence_id
-                for evidence_id in evidence_links.get(link_role, ())
-                if evidence_documents[evidence_id] == document_id
+                if contribution_documents
+                else ()
             )
+        }
 
-        return Finding(
-            collection_id=row.collection_id,
-            objective_id=row.objective_id,
-            analysis_version=row.analysis_version,
-            finding_id=row.finding_id,
-            statement=row.statement,
-            factors=tuple(row.factors),
-            outcome=row.outcome,
-            direction=row.direction,
-            assertion_strength=row.assertion_strength,
-            attribution_scope=row.attribution_scope,
-            synthesis_status=row.synthesis_status,
-            certainty=row.certainty,
-            display_rank=row.display_rank,
-            mechanisms=tuple(
-                FindingMechanismRelation(
-                    source_term=relation.source_term,
-                    relation_type=relation.relation_type,
-                    target_term=relation.target_term,
-                    direction=relation.direction,
-                    assertion_strength=relation.assertion_strength,
-                    supporting_evidence_ids=tuple(
-                        relation_links.get(relation.relation_order, ())
-                    ),
+        def contribution_status(document_id: str) -> str:
+            status = contribution_statuses.get(document_id)
+            if status is None:
+                raise RuntimeError(
+                    "persisted Finding references missing PaperContribution: "
+                    f"{document_id}"
                 )
-                for relation in relation_rows
-            ),
-            scientific_context=ObjectiveEvidenceContext.from_mapping(
-                context_row.scientific_context
-            ),
-            limitations=tuple(context_row.limitations),
-            paper_contributions=tuple(
-                FindingPaperContribution(
-                    document_id=paper_row.source_document_id,
-                    analysis_status=self._paper_contribution_status(
-                        session,
-                        key_filters[:3],
-                        paper_row.source_document_id,
-                    ),
-                    supporting_evidence_ids=evidence_for_document(
-                        "supporting", paper_row.source_document_id
-                    ),
-                    contradicting_evidence_ids=evidence_for_document(
-                        "contradicting", paper_row.source_document_id
-                    ),
-                    context_evidence_ids=evidence_for_document(
-                        "context", paper_row.source_document_id
-                    ),
-                    condition_boundary_evidence_ids=evidence_for_document(
-                        "boundary", paper_row.source_document_id
-                    ),
+            return status
+
+        result: list[tuple[Finding, tuple[ObjectiveEvidence, ...]]] = []
+        for row in rows:
+            finding_id = row.finding_id
+            context_row = context_rows.get(finding_id)
+            papers = paper_rows.get(finding_id, ())
+            if context_row is None or not papers:
+                raise RuntimeError(f"incomplete persisted finding: {finding_id}")
+            links = evidence_links.get(finding_id, {})
+
+            def evidence_for_document(
+                link_role: str,
+                document_id: str,
+                links: dict[str, list[str]] = links,
+            ) -> tuple[str, ...]:
+                return tuple(
+                    evidence_id
+                    for evidence_id in links.get(link_role, ())
+                    if evidence_by_id[evidence_id].document_id == document_id
                 )
-                for paper_row in paper_rows
-            ),
-        )
 
-    @staticmethod
-    def _paper_contribution_status(
-        session: Session,
-        analysis_key: tuple[str, str, int],
-        document_id: str,
-    ) -> str:
-        row = session.get(
-            ObjectivePaperContributionRecord,
-            (*analysis_key, document_id),
-        )
-        if row is None:
-            raise RuntimeError(
-                f"persisted Finding references missing PaperContribution: {document_id}"
+            finding = Finding(
+                collection_id=row.collection_id,
+                objective_id=row.objective_id,
+                analysis_version=row.analysis_version,
+                finding_id=finding_id,
+                statement=row.statement,
+                factors=tuple(row.factors),
+                outcome=row.outcome,
+                direction=row.direction,
+                assertion_strength=row.assertion_strength,
+                attribution_scope=row.attribution_scope,
+                synthesis_status=row.synthesis_status,
+                certainty=row.certainty,
+                display_rank=row.display_rank,
+                mechanisms=tuple(
+                    FindingMechanismRelation(
+                        source_term=relation.source_term,
+                        relation_type=relation.relation_type,
+                        target_term=relation.target_term,
+                        direction=relation.direction,
+                        assertion_strength=relation.assertion_strength,
+                        supporting_evidence_ids=tuple(
+                            relation_links.get(
+                                (finding_id, relation.relation_order), ()
+                            )
+                        ),
+                    )
+                    for relation in relation_rows.get(finding_id, ())
+                ),
+                scientific_context=ObjectiveEvidenceContext.from_mapping(
+                    context_row.scientific_context
+                ),
+                limitations=tuple(context_row.limitations),
+                paper_contributions=tuple(
+                    FindingPaperContribution(
+                        document_id=paper_row.source_document_id,
+                        analysis_status=contribution_status(
+                            paper_row.source_document_id
+                        ),
+                        supporting_evidence_ids=evidence_for_document(
+                            "supporting", paper_row.source_document_id
+                        ),
+                        contradicting_evidence_ids=evidence_for_document(
+                            "contradicting", paper_row.source_document_id
+                        ),
+                        context_evidence_ids=evidence_for_document(
+                            "context", paper_row.source_document_id
+                        ),
+                        condition_boundary_evidence_ids=evidence_for_document(
+                            "boundary", paper_row.source_document_id
+                        ),
+                    )
+                    for paper_row in papers
+                ),
+            )
+            finding_evidence_ids = {
+                evidence_id
+                for evidence_ids in links.values()
+                for evidence_id in evidence_ids
+            }
+            result.append(
+                (
+                    finding,
+                    tuple(
+                        evidence_by_id[evidence_id]
+                        for evidence_id in sorted(
+                            finding_evidence_ids,
+                            key=evidence_position.__getitem__,
+                        )
+                    ),
+                )
             )
-        return row.analysis_status
+        return result
 
     @staticmethod
     def _evidence_record(row: ObjectiveEvidenceRecord) -> ObjectiveEvidence:
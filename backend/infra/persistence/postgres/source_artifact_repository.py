@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session, sessionmaker
 
+from domain.ports import SourceDocumentWriter
 from domain.source import (
     SourceBlock,
     SourceDocument,
@@ -47,6 +50,18 @@ from infra.persistence.postgres.models.source import (
 )
 
 
+# Source artifact kinds counted by `count_collection_artifacts`.
+_COUNTED_ARTIFACT_ROWS = {
+    "documents": SourceDocumentRow,
+    "text_units": SourceTextUnitRow,
+    "blocks": SourceBlockRow,
+    "tables": SourceTableModel,
+    "table_rows": SourceTableRowModel,
+    "table_cells": SourceTableCellRow,
+    "figures": SourceFigureRow,
+}
+
+
 class PostgresSourceArtifactRepository:
     """Store immutable Source structure under an explicit collection build."""
 
@@ -60,6 +75,44 @@ class PostgresSourceArtifactRepository:
         collection_id: str,
         build_id: str,
         documents: tuple[SourceDocument, ...],
+    ) -> None:
+        with self.write_collection_documents(collection_id, build_id) as writer:
+            writer.append(documents)
+
+    @contextmanager
+    def write_collection_documents(
+        self,
+        collection_id: str,
+        build_id: str,
+    ) -> Iterator[SourceDocumentWriter]:
+        """Replace a build's Source documents with batches in one transaction.
+
+        Batches are flushed and released as they are appended, so memory
+        stays bounded, while readers keep seeing the previous rows until the
+        whole stream commits. An error anywhere rolls every batch back.
+        """
+
+        with self.session_factory.begin() as session:
+            build = self._require_build(session, collection_id, build_id)
+            if build.status not in {"queued", "building"}:
+                raise ValueError(f"collection build is not writable: {build_id}")
+            # Text units hang off the build, not a document, so they do not
+            # cascade with the document rows.
+            for row_type in (SourceDocumentRow, SourceTextUnitRow):
+                session.execute(delete(row_type).where(row_type.build_id == build_id))
+            yield _PostgresSourceDocumentWriter(
+                self,
+                session,
+                collection_id,
+                build_id,
+            )
+
+    def _insert_documents(
+        self,
+        session: Session,
+        collection_id: str,
+        build_id: str,
+        documents: tuple[SourceDocument, ...],
     ) -> None:
         text_units = tuple(
             {
@@ -77,158 +130,151 @@ class PostgresSourceArtifactRepository:
             item for document in documents for item in document.table_cells
         )
         figures = tuple(item for document in documents for item in document.figures)
-        with self.session_factory.begin() as session:
-            build = self._require_build(session, collection_id, build_id)
-            if build.status not in {"queued", "building"}:
-                raise ValueError(f"collection build is not writable: {build_id}")
-            lineage = self._resolve_document_lineage(
-                session,
-                collection_id,
-                documents,
-            )
-            session.execute(
-                delete(SourceDocumentRow).where(SourceDocumentRow.build_id == build_id)
-            )
-            session.add_all(
-                SourceDocumentRow(
-                    build_id=build_id,
-                    source_document_id=document.document_id,
-                    collection_id=collection_id,
-                    collection_document_id=lineage[document.document_id][0],
-                    document_version_id=lineage[document.document_id][1],
-                    document_order=document.document_order,
-                    title=document.title,
-                    text=document.text,
-                    creation_date=document.creation_date,
-                    metadata_json=dict(document.metadata),
-                )
-                for document in documents
+        lineage = self._resolve_document_lineage(
+            session,
+            collection_id,
+            documents,
+        )
+        session.add_all(
+            SourceDocumentRow(
+                build_id=build_id,
+                source_document_id=document.document_id,
+                collection_id=collection_id,
+                collection_document_id=lineage[document.document_id][0],
+                document_version_id=lineage[document.document_id][1],
+                document_order=document.document_order,
+                title=document.title,
+                text=document.text,
+                creation_date=document.creation_date,
+                metadata_json=dict(document.metadata),
             )
-            session.flush()
-            session.add_all(
-                SourceTextUnitRow(
-                    build_id=build_id,
-                    text_unit_id=text_unit.text_unit_id,
-                    collection_id=collection_id,
-                    text_unit_order=text_unit.text_unit_order,
-                    text=text_unit.text,
-                    n_tokens=text_unit.n_tokens,
-                )
-                for text_unit in text_units
+            for document in documents
+        )
+        session.flush()
+        session.add_all(
+            SourceTextUnitRow(
+                build_id=build_id,
+                text_unit_id=text_unit.text_unit_id,
+                collection_id=collection_id,
+                text_unit_order=text_unit.text_unit_order,
+                text=text_unit.text,
+                n_tokens=text_unit.n_tokens,
             )
-            session.flush()
-            session.add_all(
-                SourceTextUnitDocument(
-                    build_id=build_id,
-                    text_unit_id=text_unit.text_unit_id,
-                    source_document_id=document_id,
-                    collection_id=collection_id,
-                )
-                for text_unit in text_units
-                for document_id in text_unit.document_ids
+            for text_unit in text_units
+        )
+        session.flush()
+        session.add_all(
+            SourceTextUnitDocument(
+                build_id=build_id,
+                text_unit_id=text_unit.text_unit_id,
+                source_document_id=document_id,
+                collection_id=collection_id,
             )
-            session.add_all(
-                SourceBlockRow(
-                    build_id=build_id,
-                    block_id=block.block_id,
-                    collection_id=collection_id,
-                    source_document_id=block.document_id,
-                    block_type=str(block.block_type),
-                    text=block.text,
-                    block_order=block.block_order,
-                    page=block.page,
-                    heading_path=block.heading_path,
-                    heading_level=block.heading_level,
-                )
-                for block in blocks
+            for text_unit in text_units
+            for document_id in text_unit.document_ids
+        )
+        session.add_all(
+            SourceBlockRow(
+                build_id=build_id,
+                block_id=block.block_id,
+                collection_id=collection_id,
+                source_document_id=block.document_id,
+                block_type=str(block.block_type),
+                text=block.text,
+                block_order=block.block_order,
+                page=block.page,
+                heading_path=block.heading_path,
+                heading_level=block.heading_level,
             )
-            session.flush()
-            session.add_all(
-                SourceBlockTextUnit(
-                    build_id=build_id,
-                    block_id=block.block_id,
-                    text_unit_id=text_unit_id,
-                    collection_id=collection_id,
-                )
-                for block in blocks
-                for text_unit_id in block.text_unit_ids
+            for block in blocks
+        )
+        session.flush()
+        session.add_all(
+            SourceBlockTextUnit(
+                build_id=build_id,
+                block_id=block.block_id,
+                text_unit_id=text_unit_id,
+                collection_id=collection_id,
             )
-            session.add_all(
-                SourceTableModel(
-                    build_id=build_id,
-                    table_id=table.table_id,
-                    collection_id=collection_id,
-                    source_document_id=table.document_id,
-                    table_order=table.table_order,
-                    caption_text=table.caption_text,
-                    caption_block_id=table.caption_block_id,
-                    page=table.page,
-                    heading_path=table.heading_path,
-                    header_row_count=table.header_row_count,
-                    column_headers=list(table.column_headers),
-                    table_matrix=[list(row) for row in table.table_matrix],
-                    metadata_json=dict(table.metadata),
-                )
-                for table in tables
+            for block in blocks
+            for text_unit_id in block.text_unit_ids
+        )
+        session.add_all(
+            SourceTableModel(
+                build_id=build_id,
+                table_id=table.table_id,
+                collection_id=collection_id,
+                source_document_id=table.document_id,
+                table_order=table.table_order,
+                caption_text=table.caption_text,
+                caption_block_id=table.caption_block_id,
+                page=table.page,
+                heading_path=table.heading_path,
+                header_row_count=table.header_row_count,
+                column_headers=list(table.column_headers),
+                table_matrix=[list(row) for row in table.table_matrix],
+                metadata_json=dict(table.metadata),
             )
-            session.flush()
-            session.add_all(
-                SourceTableRowModel(
-                    build_id=build_id,
-                    row_id=row.row_id,
-                    collection_id=collection_id,
-                    source_document_id=row.document_id,
-                    table_id=row.table_id,
-                    row_index=row.row_index,
-                    row_text=row.row_text,
-                    page=row.page,
-                    heading_path=row.heading_path,
-                )
-                for row in table_rows
+            for table in tables
+        )
+        session.flush()
+        session.add_all(
+            SourceTableRowModel(
+                build_id=build_id,
+                row_id=row.row_id,
+                collection_id=collection_id,
+                source_document_id=row.document_id,
+                table_id=row.table_id,
+                row_index=row.row_index,
+                row_text=row.row_text,
+                page=row.page,
+                heading_path=row.heading_path,
             )
-            session.add_all(
-                SourceTableCellRow(
-                    build_id=build_id,
-                    cell_id=cell.cell_id,
-                    collection_id=collection_id,
-                    source_document_id=cell.document_id,
-                    table_id=cell.table_id,
-                    row_index=cell.row_index,
-                    col_index=cell.col_index,
-                    cell_text=cell.cell_text,
-                    row_span=cell.row_span,
-                    col_span=cell.col_span,
-                    column_header=cell.column_header,
-                    row_header=cell.row_header,
-                    row_section=cell.row_section,
-                    header_path=cell.header_path,
-                    page=cell.page,
-                    unit_hint=cell.unit_hint,
-                )
-                for cell in table_cells
+            for row in table_rows
+        )
+        session.add_all(
+            SourceTableCellRow(
+                build_id=build_id,
+                cell_id=cell.cell_id,
+                collection_id=collection_id,
+                source_document_id=cell.document_id,
+                table_id=cell.table_id,
+                row_index=cell.row_index,
+                col_index=cell.col_index,
+                cell_text=cell.cell_text,
+                row_span=cell.row_span,
+                col_span=cell.col_span,
+                column_header=cell.column_header,
+                row_header=cell.row_header,
+                row_section=cell.row_section,
+                header_path=cell.header_path,
+                page=cell.page,
+                unit_hint=cell.unit_hint,
             )
-            session.add_all(
-                SourceFigureRow(
-                    build_id=build_id,
-                    figure_id=figure.figure_id,
-                    collection_id=collection_id,
-                    source_document_id=figure.document_id,
-                    figure_order=figure.figure_order,
-                    figure_label=figure.figure_label,
-                    caption_text=figure.caption_text,
-                    caption_block_id=figure.caption_block_id,
-                    page=figure.page,
-                    heading_path=figure.heading_path,
-                    image_storage_key=figure.image_path,
-                    image_mime_type=figure.image_mime_type,
-                    image_width=figure.image_width,
-                    image_height=figure.image_height,
-                    asset_sha256=figure.asset_sha256,
-                    image_size_bytes=figure.image_size_bytes,
-                    metadata_json=dict(figure.metadata),
-                )
-                for figure in figures
+            for cell in table_cells
+        )
+        session.add_all(
+            SourceFigureRow(
+                build_id=build_id,
+                figure_id=figure.figure_id,
+                collection_id=collection_id,
+                source_document_id=figure.document_id,
+                figure_order=figure.figure_order,
+                figure_label=figure.figure_label,
+                caption_text=figure.caption_text,
+                caption_block_id=figure.caption_block_id,
+                page=figure.page,
+                heading_path=figure.heading_path,
+                image_storage_key=figure.image_path,
+                image_mime_type=figure.image_mime_type,
+                image_width=figure.image_width,
+                image_height=figure.image_height,
+                asset_sha256=figure.asset_sha256,
+                image_size_bytes=figure.image_size_bytes,
+                metadata_json=dict(figure.metadata),
             )
+            for figure in figures
+        )
 
     def read_collection_documents(
         self,
@@ -250,6 +296,36 @@ class PostgresSourceArtifactRepository:
             figures=tuple(self.list_figures(collection_id, build_id=build_id)),
         )
 
+    def count_collection_artifacts(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+    ) -> dict[str, int]:
+        """Row counts per Source artifact kind, without loading the rows."""
+
+        with self.session_factory() as session:
+            resolved_build_id = self._resolve_read_build(
+                session, collection_id, build_id
+            )
+            if resolved_build_id is None:
+                return {kind: 0 for kind in _COUNTED_ARTIFACT_ROWS}
+            counts = session.execute(
+                select(
+                    *(
+                        select(func.count())
+                        .select_from(model)
+                        .where(
+                            model.collection_id == collection_id,
+                            model.build_id == resolved_build_id,
+                        )
+                        .scalar_subquery()
+                        .label(kind)
+                        for kind, model in _COUNTED_ARTIFACT_ROWS.items()
+                    )
+                )
+            ).one()
+            return {kind: int(count) for kind, count in counts._mapping.items()}
+
     def read_document_tree(
         self,
         collection_id: str,
@@ -331,6 +407,60 @@ class PostgresSourceArtifactRepository:
                 for row in rows
             ]
 
+    def read_document(
+        self,
+        collection_id: str,
+        document_id: str,
+        *,
+        build_id: str | None = None,
+    ) -> SourceDocument | None:
+        with self.session_factory() as session:
+            resolved_build_id = self._resolve_read_build(
+                session, collection_id, build_id
+            )
+            if resolved_build_id is None:
+                return None
+            row = session.scalar(
+                select(SourceDocumentRow).where(
+                    SourceDocumentRow.collection_id == collection_id,
+                    SourceDocumentRow.build_id == resolved_build_id,
+                    SourceDocumentRow.source_document_id == document_id,
+                )
+            )
+            if row is None:
+                return None
+            text_unit_ids = session.scalars(
+                select(SourceTextUnitDocument.text_unit_id)
+                .join(
+                    SourceTextUnitRow,
+                    (SourceTextUnitRow.build_id == SourceTextUnitDocument.build_id)
+                    & (
+                        SourceTextUnitRow.text_unit_id
+                        == SourceTextUnitDocument.text_unit_id
+                    ),
+                )
+                .where(
+                    SourceTextUnitDocument.collection_id == collection_id,
+                    SourceTextUnitDocument.build_id == resolved_build_id,
+                    SourceTextUnitDocument.source_document_id == document_id,
+                )
+                .order_by(
+                    SourceTextUnitRow.text_unit_order,
+                    SourceTextUnitDocument.text_unit_id,
+                )
+            )
+            return SourceDocument.from_record(
+                {
+                    "document_id": row.source_document_id,
+                    "document_order": row.document_order,
+                    "title": row.title,
+                    "text": row.text,
+                    "text_unit_ids": tuple(text_unit_ids),
+                    "creation_date": row.creation_date,
+                    "metadata": row.metadata_json,
+                }
+            )
+
     def list_text_units(
         self,
         collection_id: str,
@@ -1000,4 +1130,28 @@ def _group_pairs(rows) -> dict[str, tuple[str, ...]]:
     return {key: tuple(values) for key, values in grouped.items()}
 
 
+class _PostgresSourceDocumentWriter:
+    def __init__(
+        self,
+        repository: PostgresSourceArtifactRepository,
+        session: Session,
+        collection_id: str,
+        build_id: str,
+    ) -> None:
+        self._repository = repository
+        self._session = session
+        self._collection_id = collection_id
+        self._build_id = build_id
+
+    def append(self, documents: tuple[SourceDocument, ...]) -> None:
+        self._repository._insert_documents(
+            self._session,
+            self._collection_id,
+            self._build_id,
+            documents,
+        )
+        self._session.flush()
+        self._session.expunge_all()
+
+
 __all__ = ["PostgresSourceArtifactRepository"]
@@ -213,6 +213,53 @@ class SqliteSourceArtifactRepository:
             for row in rows
         ]
 
+    def read_document(
+        self,
+        collection_id: str,
+        document_id: str,
+    ) -> SourceDocument | None:
+        self._ensure_schema()
+        with self._connection() as connection:
+            row = connection.execute(
+                """
+                SELECT
+                    document_id,
+                    document_order,
+                    title,
+                    text,
+                    creation_date,
+                    metadata_json
+                FROM source_documents
+                WHERE collection_id = ? AND document_id = ?
+                """,
+                (collection_id, document_id),
+            ).fetchone()
+            if row is None:
+                return None
+            text_unit_ids = [
+                text_unit["text_unit_id"]
+                for text_unit in connection.execute(
+                    """
+                    SELECT text_unit_id
+                    FROM source_text_unit_documents
+                    WHERE collection_id = ? AND document_id = ?
+                    ORDER BY text_unit_id ASC
+                    """,
+                    (collection_id, document_id),
+                ).fetchall()
+            ]
+        return SourceDocument.from_record(
+            {
+                "document_id": row["document_id"],
+                "document_order": row["document_order"],
+                "title": row["title"],
+                "text": row["text"],
+                "text_unit_ids": text_unit_ids,
+                "creation_date": row["creation_date"],
+                "metadata": _load_json_object(row["metadata_json"]),
+            }
+        )
+
     def list_text_units(
         self,
         collection_id: str,
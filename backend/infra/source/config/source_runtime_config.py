@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from enum import Enum
 
@@ -46,6 +47,13 @@ class ChunkStrategyType(str, Enum):
     sentence = "sentence"
 
 
+class FigureRenderMode(str, Enum):
+    """How PDF figure images are produced for the active Source runtime."""
+
+    eager = "eager"
+    lazy = "lazy"
+
+
 class StorageConfig(BaseModel):
     """Storage configuration used by Source input/output."""
 
@@ -99,12 +107,31 @@ class ChunkingConfig(BaseModel):
     chunk_size_includes_metadata: bool = False
 
 
+class FigureConfig(BaseModel):
+    """Figure image configuration used by the active Source runtime.
+
+    ``eager`` crops and encodes every figure during the build. ``lazy`` only
+    records crop geometry and leaves rendering to the first image request.
+    Any other value, including a mistyped ``SOURCE_FIGURE_RENDER_MODE``, is
+    rejected rather than silently treated as ``eager``.
+    """
+
+    render_mode: FigureRenderMode = Field(
+        default_factory=lambda: os.getenv("SOURCE_FIGURE_RENDER_MODE", "")
+        .strip()
+        .lower()
+        or FigureRenderMode.eager,
+        validate_default=True,
+    )
+
+
 class SourceRuntimeConfig(BaseModel):
     """Minimal config consumed by the active Source runtime."""
 
     root_dir: str = Field(default="")
     input: InputConfig = Field(default_factory=InputConfig)
     chunks: ChunkingConfig = Field(default_factory=ChunkingConfig)
+    figures: FigureConfig = Field(default_factory=FigureConfig)
     output: StorageConfig = Field(default_factory=StorageConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
     workflows: list[str] | None = None
@@ -5,9 +5,16 @@ from infra.source.ingestion.normalized_import import (
     NormalizedImportDocument,
     NormalizedImportSourceMetadata,
     NormalizedImportTextUnit,
+    StagedUpload,
+    is_supported_upload,
+    normalize_staged_uploads,
     normalize_upload,
 )
 from infra.source.ingestion.source_adapter import SourceAdapter, SourceAdapterRequest
+from infra.source.ingestion.upload_archive import (
+    is_archive_upload,
+    iter_archive_members,
+)
 
 __all__ = [
     "NormalizedImportBatch",
@@ -16,5 +23,10 @@ __all__ = [
     "NormalizedImportTextUnit",
     "SourceAdapter",
     "SourceAdapterRequest",
+    "StagedUpload",
+    "is_archive_upload",
+    "is_supported_upload",
+    "iter_archive_members",
+    "normalize_staged_uploads",
     "normalize_upload",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from collections.abc import Callable, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 import hashlib
@@ -8,6 +9,8 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from domain.source.ports import StagedObject
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -24,6 +27,7 @@ class NormalizedImportDocument:
     stored_filename: str | None = None
     storage_relpath: str | None = None
     storage_payload_base64: str | None = None
+    staged_payload: StagedObject | None = None
     checksum: str | None = None
     language: str | None = None
     ingest_status: str = "normalized"
@@ -67,6 +71,15 @@ class NormalizedImportBatch:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class StagedUpload:
+    """One uploaded file whose bytes already sit in object-store staging."""
+
+    filename: str
+    media_type: str | None
+    staged: StagedObject
+
+
 def normalize_upload(
     filename: str,
     content: bytes,
@@ -79,17 +92,106 @@ def normalize_upload(
 ) -> NormalizedImportBatch:
     """Normalize one upload into the shared pre-Core import handoff."""
 
+    warnings: list[str] = []
+    document, text_units = _normalize_document(
+        filename,
+        media_type,
+        checksum=hashlib.sha256(content).hexdigest(),
+        channel=channel,
+        read_content=lambda: content,
+        warnings=warnings,
+        storage_payload_base64=base64.b64encode(content).decode("ascii"),
+    )
+    return NormalizedImportBatch(
+        documents=(document,),
+        text_units=text_units,
+        source_metadata=_source_metadata(
+            channel=channel,
+            adapter_name=adapter_name,
+            adapter_version=adapter_version,
+            warnings=warnings,
+            raw_locator=document.original_filename,
+            goal_context=goal_context,
+        ),
+    )
+
+
+def normalize_staged_uploads(
+    uploads: Sequence[StagedUpload],
+    *,
+    read_staged: Callable[[StagedObject], bytes],
+    channel: str = "upload",
+    adapter_name: str = "upload",
+    adapter_version: str | None = None,
+    goal_context: dict[str, Any] | None = None,
+    raw_locator: str | None = None,
+    warnings: Sequence[str] = (),
+) -> NormalizedImportBatch:
+    """Normalize staged uploads into one batch without loading binary payloads.
+
+    Only text uploads are read back, to build their text units; PDFs keep
+    the checksum computed while they were staged.
+    """
+
+    if not uploads:
+        raise ValueError("staged upload batch must include at least one document")
+    batch_warnings = list(warnings)
+    documents: list[NormalizedImportDocument] = []
+    text_units: list[NormalizedImportTextUnit] = []
+    for upload in uploads:
+        document, document_text_units = _normalize_document(
+            upload.filename,
+            upload.media_type,
+            checksum=upload.staged.sha256,
+            channel=channel,
+            read_content=lambda staged=upload.staged: read_staged(staged),
+            warnings=batch_warnings,
+            staged_payload=upload.staged,
+        )
+        documents.append(document)
+        text_units.extend(document_text_units)
+    return NormalizedImportBatch(
+        documents=tuple(documents),
+        text_units=tuple(text_units),
+        source_metadata=_source_metadata(
+            channel=channel,
+            adapter_name=adapter_name,
+            adapter_version=adapter_version,
+            warnings=batch_warnings,
+            raw_locator=raw_locator or documents[0].original_filename,
+            goal_context=goal_context,
+        ),
+    )
+
+
+def is_supported_upload(filename: str, media_type: str | None = None) -> bool:
+    normalized_filename = Path(filename or "upload.bin").name or "upload.bin"
+    return _is_text_upload(
+        filename=normalized_filename,
+        media_type=_normalized_media_type(media_type),
+    ) or Path(normalized_filename).suffix.lower() == ".pdf"
+
+
+def _normalize_document(
+    filename: str,
+    media_type: str | None,
+    *,
+    checksum: str,
+    channel: str,
+    read_content: Callable[[], bytes],
+    warnings: list[str],
+    storage_payload_base64: str | None = None,
+    staged_payload: StagedObject | None = None,
+) -> tuple[NormalizedImportDocument, tuple[NormalizedImportTextUnit, ...]]:
     normalized_filename = Path(filename or "upload.bin").name or "upload.bin"
     suffix = Path(normalized_filename).suffix.lower()
-    normalized_media_type = str(media_type).strip() or None if media_type else None
-    warnings: list[str] = []
+    normalized_media_type = _normalized_media_type(media_type)
 
     source_document_id = f"srcdoc_{uuid4().hex[:12]}"
-    checksum = hashlib.sha256(content).hexdigest()
     text_units: tuple[NormalizedImportTextUnit, ...] = ()
 
     if _is_text_upload(filename=normalized_filename, media_type=normalized_media_type):
-        text = _decode_text_upload(content)
+        text = _decode_text_upload(read_content())
         if not text.strip():
             warnings.append("normalized_text_empty")
         text_units = (
@@ -112,25 +214,37 @@ def normalize_upload(
         media_type=normalized_media_type,
         stored_filename=_build_normalized_storage_name(normalized_filename, suffix),
         storage_relpath=None,
-        storage_payload_base64=base64.b64encode(content).decode("ascii"),
+        storage_payload_base64=storage_payload_base64,
+        staged_payload=staged_payload,
         checksum=checksum,
         language=None,
         ingest_status="normalized",
     )
-    metadata = NormalizedImportSourceMetadata(
+    return document, text_units
+
+
+def _source_metadata(
+    *,
+    channel: str,
+    adapter_name: str,
+    adapter_version: str | None,
+    warnings: list[str],
+    raw_locator: str,
+    goal_context: dict[str, Any] | None,
+) -> NormalizedImportSourceMetadata:
+    return NormalizedImportSourceMetadata(
         channel=channel,
         adapter_name=adapter_name,
         adapter_version=adapter_version,
         ingested_at=_now_iso(),
         warnings=tuple(warnings),
-        raw_locator=normalized_filename,
+        raw_locator=raw_locator,
         goal_context=dict(goal_context) if goal_context else None,
     )
-    return NormalizedImportBatch(
-        documents=(document,),
-        text_units=text_units,
-        source_metadata=metadata,
-    )
+
+
+def _normalized_media_type(media_type: str | None) -> str | None:
+    return str(media_type).strip() or None if media_type else None
 
 
 def _decode_text_upload(content: bytes) -> str:
@@ -0,0 +1,91 @@
+"""Expand zip uploads into their member files for one bulk import."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import PurePosixPath
+from typing import BinaryIO
+import zipfile
+import zlib
+
+MAX_ARCHIVE_MEMBERS = 1000
+MAX_ARCHIVE_UNCOMPRESSED_BYTES = 4 * 1024 * 1024 * 1024
+_ARCHIVE_MEDIA_TYPES = {"application/zip", "application/x-zip-compressed"}
+# What zipfile raises for a corrupt member: bad headers or CRC, a member
+# longer than declared, a truncated or undecodable deflate stream.
+_MEMBER_READ_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError)
+
+
+def is_archive_upload(filename: str, media_type: str | None = None) -> bool:
+    if PurePosixPath(filename or "").suffix.lower() == ".zip":
+        return True
+    return bool(media_type) and media_type.strip().lower() in _ARCHIVE_MEDIA_TYPES
+
+
+def iter_archive_members(stream: BinaryIO) -> Iterator[tuple[str, BinaryIO]]:
+    """Yield `(member path, open member stream)` for each file in a zip.
+
+    Directories and macOS resource forks are skipped. The declared member
+    count and uncompressed size are checked before anything is extracted.
+    A member that cannot be opened or read raises ValueError, since the
+    archive the client sent is at fault.
+    """
+
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile as exc:
+        raise ValueError("upload archive is not a valid zip file") from exc
+    with archive:
+        members = [
+            info
+            for info in archive.infolist()
+            if not info.is_dir() and not _is_archive_metadata(info.filename)
+        ]
+        if len(members) > MAX_ARCHIVE_MEMBERS:
+            raise ValueError(
+                f"upload archive has more than {MAX_ARCHIVE_MEMBERS} files"
+            )
+        if sum(info.file_size for info in members) > MAX_ARCHIVE_UNCOMPRESSED_BYTES:
+            raise ValueError("upload archive expands beyond the allowed size")
+        for info in members:
+            try:
+                member = archive.open(info)
+            except (*_MEMBER_READ_ERRORS, NotImplementedError, RuntimeError) as exc:
+                # NotImplementedError: unsupported compression method;
+                # RuntimeError: encrypted member.
+                raise ValueError(
+                    f"upload archive member cannot be read: {info.filename}"
+                ) from exc
+            with member:
+                yield info.filename, _ArchiveMember(info.filename, member)
+
+
+class _ArchiveMember:
+    """Member stream that reports corrupt content as ValueError."""
+
+    def __init__(self, name: str, stream: BinaryIO) -> None:
+        self.name = name
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._stream.read(size)
+        except _MEMBER_READ_ERRORS as exc:
+            raise ValueError(
+                f"upload archive member is corrupt: {self.name}"
+            ) from exc
+
+
+def _is_archive_metadata(name: str) -> bool:
+    parts = PurePosixPath(name).parts
+    return any(part == "__MACOSX" for part in parts) or (
+        bool(parts) and parts[-1].startswith(".")
+    )
+
+
+__all__ = [
+    "MAX_ARCHIVE_MEMBERS",
+    "MAX_ARCHIVE_UNCOMPRESSED_BYTES",
+    "is_archive_upload",
+    "iter_archive_members",
+]
@@ -0,0 +1,19 @@
+"""Runtime retrieval indexes over persisted Source text."""
+
+from infra.source.retrieval.lexical_index import (
+    LEXICAL_INDEX_FORMAT,
+    LexicalEntry,
+    LexicalHit,
+    LexicalIndex,
+    LexicalIndexBuilder,
+    tokenize_lexical,
+)
+
+__all__ = [
+    "LEXICAL_INDEX_FORMAT",
+    "LexicalEntry",
+    "LexicalHit",
+    "LexicalIndex",
+    "LexicalIndexBuilder",
+    "tokenize_lexical",
+]
@@ -0,0 +1,390 @@
+"""Compact BM25 inverted index over Source text units and blocks.
+
+One index is built per collection build. Postings are kept as flat integer
+arrays so a serialized index loads without materializing per-posting Python
+objects, and each entry carries only a short preview for display; callers
+that need full text read it from the Source artifact repository.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+import gzip
+import heapq
+import json
+import math
+import re
+import struct
+import sys
+
+LEXICAL_INDEX_FORMAT = "lens-bm25.v1"
+_PREVIEW_CHARS = 280
+_MAX_TERM_FREQUENCY = 0xFFFF
+_HEADER_SIZE = struct.Struct("<I")
+_CJK_RANGES = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(rf"[{_CJK_RANGES}]+|[^\W_{_CJK_RANGES}]+")
+_CJK_PATTERN = re.compile(rf"[{_CJK_RANGES}]")
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "been",
+        "by",
+        "for",
+        "from",
+        "has",
+        "have",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "their",
+        "this",
+        "to",
+        "was",
+        "were",
+        "which",
+        "with",
+    }
+)
+
+
+def tokenize_lexical(text: str) -> list[str]:
+    """Split text into index terms.
+
+    Latin-script runs become case-folded words with a light plural fold;
+    CJK runs become overlapping character bigrams so Chinese queries match
+    without a segmenter.
+    """
+    tokens: list[str] = []
+    for match in _TOKEN_PATTERN.finditer(str(text or "").casefold()):
+        run = match.group()
+        if _CJK_PATTERN.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[index : index + 2] for index in range(len(run) - 1))
+            continue
+        if run in _STOPWORDS or (len(run) == 1 and not run.isdigit()):
+            continue
+        tokens.append(_fold_plural(run))
+    return tokens
+
+
+def _fold_plural(token: str) -> str:
+    if (
+        len(token) > 3
+        and token.isalpha()
+        and token.endswith("s")
+        and not token.endswith(("ss", "us", "is"))
+    ):
+        return token[:-1]
+    return token
+
+
+@dataclass(frozen=True)
+class LexicalEntry:
+    entry_id: str
+    kind: str
+    document_id: str
+    text: str
+    page: int | None = None
+
+
+@dataclass(frozen=True)
+class LexicalHit:
+    entry_id: str
+    kind: str
+    document_id: str
+    score: float
+    page: int | None = None
+    preview: str = ""
+
+
+class LexicalIndex:
+    """Immutable Okapi BM25 index with document and entry-kind filters."""
+
+    def __init__(
+        self,
+        *,
+        entries: tuple[tuple[str, str, str, int | None, str], ...],
+        lengths: array,
+        terms: tuple[str, ...],
+        document_frequencies: array,
+        posting_entries: array,
+        posting_frequencies: array,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        if not (
+            len(entries) == len(lengths)
+            and len(terms) == len(document_frequencies)
+            and len(posting_entries) == len(posting_frequencies)
+            and sum(document_frequencies) == len(posting_entries)
+        ):
+            raise ValueError("inconsistent lexical index arrays")
+        self.k1 = float(k1)
+        self.b = float(b)
+        self._entries = entries
+        self._lengths = lengths
+        self._terms = terms
+        self._document_frequencies = document_frequencies
+        self._posting_entries = posting_entries
+        self._posting_frequencies = posting_frequencies
+        self._term_slices: dict[str, tuple[int, int]] = {}
+        offset = 0
+        for term, frequency in zip(terms, document_frequencies, strict=True):
+            self._term_slices[term] = (offset, offset + frequency)
+            offset += frequency
+        self._document_positions: dict[str, list[int]] = {}
+        for position, (_, _, document_id, _, _) in enumerate(entries):
+            self._document_positions.setdefault(document_id, []).append(position)
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        self._length_norms = [
+            self.k1 * (1 - self.b + self.b * length / average_length)
+            if average_length
+            else self.k1
+            for length in lengths
+        ]
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._terms)
+
+    @classmethod
+    def build(
+        cls,
+        entries: Iterable[LexicalEntry],
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "LexicalIndex":
+        builder = LexicalIndexBuilder()
+        builder.add(entries)
+        return builder.build(k1=k1, b=b)
+
+    def search(
+        self,
+        query: str,
+        *,
+        k: int = 10,
+        document_ids: Collection[str] | None = None,
+        kinds: Collection[str] | None = None,
+    ) -> tuple[LexicalHit, ...]:
+        """Return the top-k entries by BM25 score, best first.
+
+        ``document_ids`` and ``kinds`` restrict the candidates before scoring.
+        Entries that share no term with the query are never returned.
+        """
+        if k <= 0 or not self._entries:
+            return ()
+        allowed = self._allowed_positions(document_ids)
+        if allowed is not None and not allowed:
+            return ()
+        kind_filter = frozenset(kinds) if kinds is not None else None
+        entry_count = len(self._entries)
+        scores: dict[int, float] = {}
+        for term in dict.fromkeys(tokenize_lexical(query)):
+            bounds = self._term_slices.get(term)
+            if bounds is None:
+                continue
+            start, end = bounds
+            document_frequency = end - start
+            idf = math.log(
+                1 + (entry_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            weight = idf * (self.k1 + 1)
+            for offset in range(start, end):
+                position = self._posting_entries[offset]
+                if allowed is not None and position not in allowed:
+                    continue
+                if kind_filter is not None and self._entries[position][1] not in kind_filter:
+                    continue
+                frequency = self._posting_frequencies[offset]
+                scores[position] = scores.get(position, 0.0) + weight * frequency / (
+                    frequency + self._length_norms[position]
+                )
+        best = heapq.nlargest(
+            k,
+            scores.items(),
+            key=lambda item: (item[1], -item[0]),
+        )
+        return tuple(self._hit(position, score) for position, score in best)
+
+    def _allowed_positions(
+        self,
+        document_ids: Collection[str] | None,
+    ) -> frozenset[int] | None:
+        if document_ids is None:
+            return None
+        return frozenset(
+            position
+            for document_id in document_ids
+            for position in self._document_positions.get(document_id, ())
+        )
+
+    def _hit(self, position: int, score: float) -> LexicalHit:
+        entry_id, kind, document_id, page, preview = self._entries[position]
+        return LexicalHit(
+            entry_id=entry_id,
+            kind=kind,
+            document_id=document_id,
+            score=round(score, 6),
+            page=page,
+            preview=preview,
+        )
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(
+            {
+                "format": LEXICAL_INDEX_FORMAT,
+                "k1": self.k1,
+                "b": self.b,
+                "entries": [list(entry) for entry in self._entries],
+                "terms": list(self._terms),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        body = b"".join(
+            _little_endian(values)
+            for values in (
+                self._lengths,
+                self._document_frequencies,
+                self._posting_entries,
+                self._posting_frequencies,
+            )
+        )
+        return gzip.compress(_HEADER_SIZE.pack(len(header)) + header + body, mtime=0)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "LexicalIndex":
+        raw = gzip.decompress(payload)
+        (header_size,) = _HEADER_SIZE.unpack_from(raw)
+        offset = _HEADER_SIZE.size
+        header = json.loads(raw[offset : offset + header_size].decode("utf-8"))
+        if header.get("format") != LEXICAL_INDEX_FORMAT:
+            raise ValueError(f"unsupported lexical index format: {header.get('format')}")
+        offset += header_size
+        entries = tuple(
+            (str(entry_id), str(kind), str(document_id), page, str(preview))
+            for entry_id, kind, document_id, page, preview in header["entries"]
+        )
+        terms = tuple(header["terms"])
+        lengths, offset = _read_array(raw, offset, "I", len(entries))
+        document_frequencies, offset = _read_array(raw, offset, "I", len(terms))
+        posting_count = sum(document_frequencies)
+        posting_entries, offset = _read_array(raw, offset, "I", posting_count)
+        posting_frequencies, offset = _read_array(raw, offset, "H", posting_count)
+        if offset != len(raw):
+            raise ValueError("lexical index payload has trailing bytes")
+        return cls(
+            entries=entries,
+            lengths=lengths,
+            terms=terms,
+            document_frequencies=document_frequencies,
+            posting_entries=posting_entries,
+            posting_frequencies=posting_frequencies,
+            k1=float(header["k1"]),
+            b=float(header["b"]),
+        )
+
+
+class LexicalIndexBuilder:
+    """Accumulate postings from entries supplied in any number of batches.
+
+    Only the entry previews and the postings are retained, so callers can
+    feed entries one document batch at a time and release the batch.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[tuple[str, str, str, int | None, str]] = []
+        self._lengths = array("I")
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._seen: set[tuple[str, str]] = set()
+
+    def add(self, entries: Iterable[LexicalEntry]) -> None:
+        for entry in entries:
+            key = (entry.kind, entry.entry_id)
+            if not entry.entry_id or key in self._seen:
+                continue
+            self._seen.add(key)
+            tokens = tokenize_lexical(entry.text)
+            if not tokens:
+                continue
+            position = len(self._records)
+            self._records.append(
+                (
+                    entry.entry_id,
+                    entry.kind,
+                    entry.document_id,
+                    entry.page,
+                    " ".join(entry.text.split())[:_PREVIEW_CHARS],
+                )
+            )
+            self._lengths.append(len(tokens))
+            counts: dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                self._postings.setdefault(token, []).append(
+                    (position, min(count, _MAX_TERM_FREQUENCY))
+                )
+
+    def build(self, *, k1: float = 1.2, b: float = 0.75) -> LexicalIndex:
+        terms = tuple(sorted(self._postings))
+        document_frequencies = array("I")
+        posting_entries = array("I")
+        posting_frequencies = array("H")
+        for term in terms:
+            term_postings = self._postings[term]
+            document_frequencies.append(len(term_postings))
+            for position, count in term_postings:
+                posting_entries.append(position)
+                posting_frequencies.append(count)
+        return LexicalIndex(
+            entries=tuple(self._records),
+            lengths=array("I", self._lengths),
+            terms=terms,
+            document_frequencies=document_frequencies,
+            posting_entries=posting_entries,
+            posting_frequencies=posting_frequencies,
+            k1=k1,
+            b=b,
+        )
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _read_array(raw: bytes, offset: int, typecode: str, count: int) -> tuple[array, int]:
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    if end > len(raw):
+        raise ValueError("lexical index payload is truncated")
+    values.frombytes(raw[offset:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
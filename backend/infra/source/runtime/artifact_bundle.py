@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
 from dataclasses import dataclass
 import logging
+from pathlib import Path
 from typing import Any, Mapping
 
 import pandas as pd
@@ -44,6 +46,49 @@ class SourceArtifactBundle:
             table_cells=_records(self.table_cells, "table_cells"),
         )
 
+    async def document_batches(self) -> AsyncIterator[tuple[SourceDocument, ...]]:
+        yield self.to_documents()
+
+
+@dataclass(frozen=True)
+class StreamedSourceArtifacts:
+    """Source artifacts written to storage one parsed document at a time.
+
+    Nothing but counts stays in memory. ``document_batches`` reads the
+    segments back one at a time, and figure image bytes are read back from
+    pipeline storage on access.
+    """
+
+    document_count: int
+    segment_count: int
+    read_segment: Callable[[int], Awaitable[SourceArtifactBundle]]
+    figure_assets: Mapping[str, bytes]
+
+    async def document_batches(self) -> AsyncIterator[tuple[SourceDocument, ...]]:
+        for segment_index in range(self.segment_count):
+            bundle = await self.read_segment(segment_index)
+            yield bundle.to_documents()
+
+
+class StoredFigureAssets(Mapping[str, bytes]):
+    """Read-through view of figure assets written under a storage directory."""
+
+    def __init__(self, root_dir: str | Path, asset_paths: Iterable[str]) -> None:
+        self.root_dir = Path(root_dir)
+        self._asset_paths = tuple(dict.fromkeys(asset_paths))
+        self._known = frozenset(self._asset_paths)
+
+    def __getitem__(self, asset_path: str) -> bytes:
+        if asset_path not in self._known:
+            raise KeyError(asset_path)
+        return (self.root_dir / asset_path).read_bytes()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._asset_paths)
+
+    def __len__(self) -> int:
+        return len(self._asset_paths)
+
 
 def _records(frame: pd.DataFrame, artifact_kind: str) -> list[dict]:
     if frame is None or frame.empty:
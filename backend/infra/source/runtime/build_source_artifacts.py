@@ -49,7 +49,8 @@ async def build_source_artifacts(
     method : IndexingMethod default=IndexingMethod.Standard
         Styling of indexing to perform (full LLM, NLP + LLM, etc.).
     memory_profile : bool
-        Whether to enable memory profiling.
+        Whether to sample peak RSS and the top tracemalloc allocation sites
+        per workflow. Results land in ``stats.json`` and on the workflow spans.
     callbacks : list[WorkflowCallbacks] | None default=None
         A list of callbacks to register.
     additional_context : dict[str, Any] | None default=None
@@ -71,9 +72,6 @@ async def build_source_artifacts(
 
     outputs: list[PipelineRunResult] = []
 
-    if memory_profile:
-        logger.warning("New pipeline does not yet support memory profiling.")
-
     logger.info("Initializing source artifact pipeline...")
     pipeline = PipelineFactory.create_pipeline(config, method)
 
@@ -85,6 +83,7 @@ async def build_source_artifacts(
         callbacks=workflow_callbacks,
         additional_context=additional_context,
         input_documents=input_documents,
+        memory_profile=memory_profile,
     ):
         outputs.append(output)
         if output.errors and len(output.errors) > 0:
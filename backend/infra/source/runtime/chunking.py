@@ -7,17 +7,18 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any
 
 import pandas as pd
-import tiktoken
 
+from infra.llm.tokenizer import encode_texts, get_encoding
 from infra.source.runtime.callbacks.workflow_callbacks import WorkflowCallbacks
 from infra.source.runtime.progress import ProgressTicker, progress_ticker
 
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
 
 
 @dataclass(frozen=True)
@@ -28,6 +29,7 @@ class TokenChunkerOptions:
     tokens_per_chunk: int
     decode: DecodeFn
     encode: EncodeFn
+    encode_batch: EncodeBatchFn | None = None
 
 
 @dataclass
@@ -54,12 +56,12 @@ ChunkStrategy = Callable[[list[str], ChunkingConfig, ProgressTicker], Iterable[T
 
 def get_encoding_fn(encoding_name: str) -> tuple[EncodeFn, DecodeFn]:
     """Get encoder and decoder for a token encoding."""
-    encoding = tiktoken.get_encoding(encoding_name)
+    encoding = get_encoding(encoding_name)
 
     def encode(text: str) -> list[int]:
         if not isinstance(text, str):
             text = f"{text}"
-        return encoding.encode(text)
+        return encoding.encode_ordinary(text)
 
     def decode(tokens: list[int]) -> str:
         return encoding.decode(tokens)
@@ -85,15 +87,13 @@ def chunk_text(
         encoding_model=encoding_model,
     )
 
-    return cast(
-        "pd.Series",
-        input_frame.apply(
-            cast(
-                "Any",
-                lambda row: run_strategy(strategy_exec, row[column], config, tick),
-            ),
-            axis=1,
-        ),
+    return pd.Series(
+        [
+            run_strategy(strategy_exec, value, config, tick)
+            for value in input_frame[column]
+        ],
+        index=input_frame.index,
+        dtype=object,
     )
 
 
@@ -146,6 +146,10 @@ def run_tokens(
             tokens_per_chunk=config.size,
             encode=encode,
             decode=decode,
+            encode_batch=lambda texts: encode_texts(
+                texts,
+                encoding=config.encoding_model,
+            ),
         ),
         tick,
     )
@@ -175,8 +179,11 @@ def split_multiple_texts_on_tokens(
     result = []
     mapped_ids = []
 
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
+    if tokenizer.encode_batch is not None:
+        encoded_texts = tokenizer.encode_batch(texts)
+    else:
+        encoded_texts = [tokenizer.encode(text) for text in texts]
+    for source_doc_idx, encoded in enumerate(encoded_texts):
         tick(1)
         mapped_ids.append((source_doc_idx, encoded))
 
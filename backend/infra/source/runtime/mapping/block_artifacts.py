@@ -11,6 +11,7 @@ from domain.source import (
 )
 from infra.source.contracts.artifact_schemas import BLOCKS_FINAL_COLUMNS
 from infra.source.runtime.mapping.layout_binding import (
+    PageRegionIndex,
     first_bbox,
     first_page,
 )
@@ -130,7 +131,7 @@ def collect_pdf_text_items(document: Any) -> list[dict[str, Any]]:
         provenance = getattr(item, "prov", None)
         page = first_page(provenance)
         bbox = first_bbox(provenance)
-        if ref not in caption_refs and _is_inside_figure(page, bbox, figure_regions):
+        if ref not in caption_refs and figure_regions.contains(page, bbox):
             continue
         rows.append(
             {
@@ -144,54 +145,12 @@ def collect_pdf_text_items(document: Any) -> list[dict[str, Any]]:
     return rows
 
 
-def _collect_figure_regions(
-    document: Any,
-) -> list[tuple[int, Any]]:
-    regions: list[tuple[int, Any]] = []
+def _collect_figure_regions(document: Any) -> PageRegionIndex:
+    regions: list[tuple[int | None, Any]] = []
     for picture in getattr(document, "pictures", []) or []:
         provenance = getattr(picture, "prov", None)
-        page = first_page(provenance)
-        bbox = first_bbox(provenance)
-        if page is not None and bbox is not None:
-            regions.append((page, bbox))
-    return regions
-
-
-def _is_inside_figure(
-    page: int | None,
-    bbox: Any | None,
-    figure_regions: list[tuple[int, Any]],
-) -> bool:
-    if page is None or bbox is None:
-        return False
-    for figure_page, figure_bbox in figure_regions:
-        if figure_page != page:
-            continue
-        bbox_coords = _bbox_coords(bbox)
-        figure_coords = _bbox_coords(figure_bbox)
-        if bbox_coords is None or figure_coords is None:
-            continue
-        left, top, right, bottom = bbox_coords
-        figure_left, figure_top, figure_right, figure_bottom = figure_coords
-        if min(left, right) >= min(figure_left, figure_right) and max(
-            left, right
-        ) <= max(figure_left, figure_right) and min(top, bottom) >= min(
-            figure_top, figure_bottom
-        ) and max(top, bottom) <= max(figure_top, figure_bottom):
-            return True
-    return False
-
-
-def _bbox_coords(value: Any) -> tuple[float, float, float, float] | None:
-    try:
-        return (
-            float(getattr(value, "l")),
-            float(getattr(value, "t")),
-            float(getattr(value, "r")),
-            float(getattr(value, "b")),
-        )
-    except (AttributeError, TypeError, ValueError):
-        return None
+        regions.append((first_page(provenance), first_bbox(provenance)))
+    return PageRegionIndex(regions)
 
 
 def _map_docling_block_type(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 import hashlib
 from io import BytesIO
 import logging
@@ -12,13 +13,13 @@ from domain.source import (
     SourceFigure,
     build_figure_caption_blocks,
     build_heading_blocks,
-    find_nearest_caption_block,
     normalize_optional_text,
     resolve_heading_path_for_page,
 )
 from infra.source.contracts.artifact_schemas import FIGURES_FINAL_COLUMNS
 from infra.source.runtime.hashing import gen_sha512_hash
 from infra.source.runtime.mapping.layout_binding import (
+    PageCaptionIndex,
     first_bbox,
     first_page,
     normalize_label,
@@ -26,6 +27,10 @@ from infra.source.runtime.mapping.layout_binding import (
 
 logger = logging.getLogger(__name__)
 
+FIGURE_RENDER_EAGER = "eager"
+FIGURE_RENDER_LAZY = "lazy"
+FIGURE_CROP_GEOMETRY_KEY = "crop_geometry"
+
 
 def build_pdf_figures(
     *,
@@ -34,7 +39,13 @@ def build_pdf_figures(
     blocks: pd.DataFrame,
     text_items: list[dict[str, Any]],
     payload: bytes,
+    render_mode: str = FIGURE_RENDER_EAGER,
 ) -> tuple[pd.DataFrame, dict[str, bytes]]:
+    """Map Docling pictures to figure rows and their encoded image assets.
+
+    In ``lazy`` render mode no image is cropped: each row records its crop
+    geometry so the image can be rendered from the source PDF on request.
+    """
     pictures = getattr(document, "pictures", []) or []
     if not pictures:
         return pd.DataFrame(columns=FIGURES_FINAL_COLUMNS), {}
@@ -46,7 +57,7 @@ def build_pdf_figures(
         for item in text_items
         if str(item.get("ref") or "").strip()
     }
-    figure_caption_blocks = build_figure_caption_blocks(block_records)
+    figure_caption_index = PageCaptionIndex(build_figure_caption_blocks(block_records))
     used_caption_block_ids: set[str] = set()
     rows: list[dict[str, Any]] = []
     figure_assets: dict[str, bytes] = {}
@@ -65,9 +76,8 @@ def build_pdf_figures(
                 if caption_item is not None:
                     caption_block_id = normalize_optional_text(caption_item.get("block_id"))
             if caption_block_id is None:
-                fallback_block = find_nearest_caption_block(
+                fallback_block = figure_caption_index.nearest(
                     page=page,
-                    caption_blocks=figure_caption_blocks,
                     used_block_ids=used_caption_block_ids,
                 )
                 if fallback_block is not None:
@@ -79,20 +89,27 @@ def build_pdf_figures(
             if caption_block_id is not None:
                 used_caption_block_ids.add(caption_block_id)
 
-            (
-                image_bytes,
-                image_width,
-                image_height,
-                image_mime_type,
-                asset_sha256,
-                asset_source,
-                pdf_document,
-            ) = _extract_picture_asset(
-                picture=picture,
-                document=document,
-                payload=payload,
-                pdf_document=pdf_document,
-            )
+            crop_geometry = None
+            if render_mode == FIGURE_RENDER_LAZY:
+                crop_geometry = picture_crop_geometry(picture)
+                image_bytes = image_width = image_height = asset_sha256 = None
+                image_mime_type = "image/png" if crop_geometry is not None else None
+                asset_source = "deferred_pdf_crop" if crop_geometry else "missing"
+            else:
+                (
+                    image_bytes,
+                    image_width,
+                    image_height,
+                    image_mime_type,
+                    asset_sha256,
+                    asset_source,
+                    pdf_document,
+                ) = _extract_picture_asset(
+                    picture=picture,
+                    document=document,
+                    payload=payload,
+                    pdf_document=pdf_document,
+                )
 
             figure_id = gen_sha512_hash(
                 {
@@ -107,6 +124,14 @@ def build_pdf_figures(
             if image_bytes is not None:
                 image_path = f"image_assets/{figure_id}.png"
                 figure_assets[image_path] = image_bytes
+            metadata: dict[str, Any] = {
+                "docling_ref": f"#/pictures/{figure_order - 1}",
+                "picture_label": normalize_label(getattr(picture, "label", None)),
+                "caption_linkage_method": linkage_method,
+                "asset_source": asset_source,
+            }
+            if crop_geometry is not None:
+                metadata[FIGURE_CROP_GEOMETRY_KEY] = crop_geometry
 
             rows.append(
                 SourceFigure(
@@ -123,12 +148,7 @@ def build_pdf_figures(
                     image_width=image_width,
                     image_height=image_height,
                     asset_sha256=asset_sha256,
-                    metadata={
-                        "docling_ref": f"#/pictures/{figure_order - 1}",
-                        "picture_label": normalize_label(getattr(picture, "label", None)),
-                        "caption_linkage_method": linkage_method,
-                        "asset_source": asset_source,
-                    },
+                    metadata=metadata,
                 ).to_record()
             )
     finally:
@@ -204,22 +224,84 @@ def _open_pdf_document(payload: bytes) -> Any:
     return fitz.open(stream=payload, filetype="pdf")
 
 
+def picture_crop_geometry(picture: Any) -> dict[str, Any] | None:
+    """Return the JSON-safe page and bbox needed to crop a picture later."""
+    provenance = getattr(picture, "prov", None)
+    page_number = first_page(provenance)
+    bbox = first_bbox(provenance)
+    if page_number is None or bbox is None:
+        return None
+    try:
+        coords = [
+            float(getattr(bbox, "l")),
+            float(getattr(bbox, "t")),
+            float(getattr(bbox, "r")),
+            float(getattr(bbox, "b")),
+        ]
+    except (AttributeError, TypeError, ValueError):
+        return None
+    coord_origin = normalize_label(getattr(bbox, "coord_origin", None))
+    return {
+        "page": page_number,
+        "bbox": coords,
+        "coord_origin": (coord_origin or "TOPLEFT").upper(),
+    }
+
+
+def render_pdf_figure_crops(
+    payload: bytes,
+    crop_geometries: Sequence[Mapping[str, Any]],
+) -> list[bytes | None]:
+    """Render PNG crops from one PDF, opening the document once."""
+    if not crop_geometries:
+        return []
+    pdf_document = _open_pdf_document(payload)
+    try:
+        rendered: list[bytes | None] = []
+        for geometry in crop_geometries:
+            try:
+                image = _crop_geometry_from_pdf(
+                    pdf_document=pdf_document,
+                    geometry=geometry,
+                )
+            except Exception:  # noqa: BLE001
+                logger.warning("Deferred PDF figure crop failed", exc_info=True)
+                image = None
+            rendered.append(_serialize_png_image(image) if image is not None else None)
+        return rendered
+    finally:
+        pdf_document.close()
+
+
 def _crop_picture_from_pdf(*, pdf_document: Any, picture: Any) -> Any | None:
+    geometry = picture_crop_geometry(picture)
+    if geometry is None:
+        return None
+    return _crop_geometry_from_pdf(pdf_document=pdf_document, geometry=geometry)
+
+
+def _crop_geometry_from_pdf(
+    *,
+    pdf_document: Any,
+    geometry: Mapping[str, Any],
+) -> Any | None:
     from PIL import Image
     import fitz
 
-    page_number = first_page(getattr(picture, "prov", None))
-    bbox = first_bbox(getattr(picture, "prov", None))
-    if page_number is None or bbox is None:
-        return None
-    page_index = page_number - 1
+    page_index = int(geometry["page"]) - 1
     if page_index < 0 or page_index >= len(pdf_document):
         return None
     page = pdf_document.load_page(page_index)
-    clip_bbox = bbox
-    if hasattr(bbox, "to_top_left_origin"):
-        clip_bbox = bbox.to_top_left_origin(page_height=float(page.rect.height))
-    clip = fitz.Rect(*clip_bbox.as_tuple())
+    left, top, right, bottom = (float(value) for value in geometry["bbox"])
+    if str(geometry.get("coord_origin") or "").upper() == "BOTTOMLEFT":
+        page_height = float(page.rect.height)
+        top, bottom = page_height - top, page_height - bottom
+    clip = fitz.Rect(
+        min(left, right),
+        min(top, bottom),
+        max(left, right),
+        max(top, bottom),
+    )
     if clip.width <= 0 or clip.height <= 0:
         return None
     pixmap = page.get_pixmap(clip=clip, alpha=False)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Iterable
 from typing import Any
 
-from domain.source import normalize_optional_text
+from domain.source import SourceLayoutBlock, normalize_optional_text, safe_int
+
+BBoxExtent = tuple[float, float, float, float]
 
 
 def first_page(provenance: Any) -> int | None:
@@ -20,8 +24,115 @@ def first_bbox(provenance: Any) -> Any | None:
     return getattr(first, "bbox", None)
 
 
+def bbox_extent(value: Any) -> BBoxExtent | None:
+    """Return ``(x0, y0, x1, y1)`` with ``x0 <= x1`` and ``y0 <= y1``.
+
+    Docling bboxes may use either coordinate origin, so the extent is
+    normalized per axis and comparisons stay origin-agnostic.
+    """
+    try:
+        left = float(getattr(value, "l"))
+        top = float(getattr(value, "t"))
+        right = float(getattr(value, "r"))
+        bottom = float(getattr(value, "b"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return (
+        min(left, right),
+        min(top, bottom),
+        max(left, right),
+        max(top, bottom),
+    )
+
+
 def normalize_label(value: Any) -> str | None:
     if value is None:
         return None
     normalized = getattr(value, "value", value)
     return normalize_optional_text(normalized)
+
+
+class PageRegionIndex:
+    """Per-page layout regions, parsed once and sorted by left edge.
+
+    Containment only has to scan regions on the queried page whose left
+    edge is at or before the item's, instead of every region in the
+    document.
+    """
+
+    def __init__(self, regions: Iterable[tuple[int | None, Any]] = ()) -> None:
+        by_page: dict[int, list[BBoxExtent]] = {}
+        for page, bbox in regions:
+            extent = bbox_extent(bbox) if page is not None else None
+            if extent is not None:
+                by_page.setdefault(int(page), []).append(extent)
+        self._extents: dict[int, list[BBoxExtent]] = {}
+        self._left_edges: dict[int, list[float]] = {}
+        for page, extents in by_page.items():
+            extents.sort()
+            self._extents[page] = extents
+            self._left_edges[page] = [extent[0] for extent in extents]
+
+    def __len__(self) -> int:
+        return sum(len(extents) for extents in self._extents.values())
+
+    def contains(self, page: int | None, bbox: Any | None) -> bool:
+        if page is None or bbox is None:
+            return False
+        extents = self._extents.get(int(page))
+        if not extents:
+            return False
+        extent = bbox_extent(bbox)
+        if extent is None:
+            return False
+        x0, y0, x1, y1 = extent
+        for index in range(bisect_right(self._left_edges[int(page)], x0)):
+            region_x0, region_y0, region_x1, region_y1 = extents[index]
+            if x1 <= region_x1 and y0 >= region_y0 and y1 <= region_y1:
+                return True
+        return False
+
+
+class PageCaptionIndex:
+    """Caption blocks grouped by page in block order for fallback linkage.
+
+    ``used_block_ids`` only grows while a document is mapped, so each page
+    cursor skips consumed captions once instead of rescanning them per
+    figure or table.
+    """
+
+    def __init__(
+        self,
+        caption_blocks: Iterable[SourceLayoutBlock],
+    ) -> None:
+        ordered = sorted(
+            (block for block in caption_blocks if block.block_id),
+            key=lambda item: item.block_order,
+        )
+        self._all = ordered
+        self._by_page: dict[int | None, list[SourceLayoutBlock]] = {}
+        for block in ordered:
+            self._by_page.setdefault(block.page, []).append(block)
+        self._cursors: dict[object, int] = {}
+
+    def nearest(
+        self,
+        *,
+        page: int | None,
+        used_block_ids: set[str],
+    ) -> SourceLayoutBlock | None:
+        normalized_page = safe_int(page)
+        if normalized_page is None:
+            key: object = _ALL_PAGES
+            candidates = self._all
+        else:
+            key = normalized_page
+            candidates = self._by_page.get(normalized_page, [])
+        cursor = self._cursors.get(key, 0)
+        while cursor < len(candidates) and candidates[cursor].block_id in used_block_ids:
+            cursor += 1
+        self._cursors[key] = cursor
+        return candidates[cursor] if cursor < len(candidates) else None
+
+
+_ALL_PAGES = object()
@@ -11,7 +11,6 @@ from domain.source import (
     build_source_table_rows_from_cells,
     build_table_caption_blocks,
     extract_unit_hint,
-    find_nearest_caption_block,
     make_table_id,
     normalize_optional_text,
     resolve_heading_path_for_page,
@@ -23,7 +22,11 @@ from infra.source.contracts.artifact_schemas import (
     TABLE_ROWS_FINAL_COLUMNS,
 )
 from infra.source.runtime.hashing import gen_sha512_hash
-from infra.source.runtime.mapping.layout_binding import first_page, normalize_label
+from infra.source.runtime.mapping.layout_binding import (
+    PageCaptionIndex,
+    first_page,
+    normalize_label,
+)
 
 
 def build_pdf_tables(
@@ -44,7 +47,7 @@ def build_pdf_tables(
         for item in text_items
         if str(item.get("ref") or "").strip()
     }
-    table_caption_blocks = build_table_caption_blocks(block_records)
+    table_caption_index = PageCaptionIndex(build_table_caption_blocks(block_records))
     used_caption_block_ids: set[str] = set()
     rows: list[dict[str, Any]] = []
 
@@ -61,9 +64,8 @@ def build_pdf_tables(
             if caption_item is not None:
                 caption_block_id = normalize_optional_text(caption_item.get("block_id"))
         if caption_block_id is None:
-            fallback_block = find_nearest_caption_block(
+            fallback_block = table_caption_index.nearest(
                 page=page,
-                caption_blocks=table_caption_blocks,
                 used_block_ids=used_caption_block_ids,
             )
             if fallback_block is not None:
@@ -0,0 +1,218 @@
+"""Per-workflow memory sampling for the Source runtime pipeline.
+
+`trace_allocations()` keeps tracemalloc running for a whole pipeline run and
+`WorkflowMemoryProbe` measures one workflow inside it: peak resident set size
+from a background sampler plus the kernel high-water mark, the traced Python
+heap peak, and the source lines that grew the heap the most.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import resource
+import sys
+import threading
+from threading import Event, Thread
+import tracemalloc
+from typing import Any
+
+DEFAULT_TOP_ALLOCATIONS = 10
+DEFAULT_SAMPLE_INTERVAL_S = 0.05
+_TRACEMALLOC_FRAMES = 1
+# The RSS sampler's own waits allocate inside threading.py.
+_IGNORED_ALLOCATION_FILES = (
+    tracemalloc.__file__,
+    threading.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Heap growth attributed to one source line during a workflow."""
+
+    location: str
+    size_bytes: int
+    count: int
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "location": self.location,
+            "size_bytes": self.size_bytes,
+            "count": self.count,
+        }
+
+
+@dataclass(frozen=True)
+class WorkflowMemoryProfile:
+    peak_rss_bytes: int | None
+    rss_delta_bytes: int | None
+    traced_peak_bytes: int
+    traced_delta_bytes: int
+    top_allocations: tuple[AllocationSite, ...] = ()
+
+    def counters(self) -> dict[str, float]:
+        """Numeric fields, as stored in stats.json and span counters."""
+
+        values: dict[str, float] = {
+            "traced_peak_bytes": self.traced_peak_bytes,
+            "traced_delta_bytes": self.traced_delta_bytes,
+        }
+        if self.peak_rss_bytes is not None:
+            values["peak_rss_bytes"] = self.peak_rss_bytes
+        if self.rss_delta_bytes is not None:
+            values["rss_delta_bytes"] = self.rss_delta_bytes
+        return values
+
+
+@contextmanager
+def trace_allocations() -> Iterator[None]:
+    """Run tracemalloc for the enclosed block unless it is already tracing."""
+
+    if tracemalloc.is_tracing():
+        yield
+        return
+    tracemalloc.start(_TRACEMALLOC_FRAMES)
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+class WorkflowMemoryProbe:
+    """Measure memory for one workflow; read `profile` after the block exits.
+
+    Must run inside `trace_allocations()`. The RSS sampler polls
+    `/proc/self/statm`; spikes shorter than the interval are still caught
+    when they raise the process-wide `ru_maxrss` high-water mark.
+    """
+
+    def __init__(
+        self,
+        *,
+        top_n: int = DEFAULT_TOP_ALLOCATIONS,
+        sample_interval_s: float = DEFAULT_SAMPLE_INTERVAL_S,
+    ) -> None:
+        self.top_n = max(int(top_n), 0)
+        self.sample_interval_s = sample_interval_s
+        self.profile: WorkflowMemoryProfile | None = None
+        self._stop = Event()
+        self._sampler: Thread | None = None
+        self._start_rss: int | None = None
+        self._peak_rss: int | None = None
+        self._start_max_rss = 0
+        self._start_traced = 0
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+
+    def __enter__(self) -> WorkflowMemoryProbe:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("workflow memory probes require trace_allocations()")
+        self._start_snapshot = _filtered_snapshot() if self.top_n else None
+        tracemalloc.reset_peak()
+        self._start_traced = tracemalloc.get_traced_memory()[0]
+        self._start_max_rss = max_rss_bytes()
+        self._start_rss = current_rss_bytes()
+        self._peak_rss = self._start_rss
+        if self._start_rss is not None:
+            self._sampler = Thread(
+                target=self._sample_rss,
+                name="workflow-memory-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+        end_rss = current_rss_bytes()
+        self._observe_rss(end_rss)
+        peak_rss = self._peak_rss
+        end_max_rss = max_rss_bytes()
+        if end_max_rss > self._start_max_rss:
+            peak_rss = max(peak_rss or 0, end_max_rss)
+        self.profile = WorkflowMemoryProfile(
+            peak_rss_bytes=peak_rss,
+            rss_delta_bytes=(
+                end_rss - self._start_rss
+                if end_rss is not None and self._start_rss is not None
+                else None
+            ),
+            traced_peak_bytes=traced_peak,
+            traced_delta_bytes=traced_current - self._start_traced,
+            top_allocations=self._top_allocations(),
+        )
+        self._start_snapshot = None
+
+    def _sample_rss(self) -> None:
+        while not self._stop.wait(self.sample_interval_s):
+            self._observe_rss(current_rss_bytes())
+
+    def _observe_rss(self, value: int | None) -> None:
+        if value is not None and (self._peak_rss is None or value > self._peak_rss):
+            self._peak_rss = value
+
+    def _top_allocations(self) -> tuple[AllocationSite, ...]:
+        if self._start_snapshot is None:
+            return ()
+        differences = _filtered_snapshot().compare_to(self._start_snapshot, "lineno")
+        sites: list[AllocationSite] = []
+        for difference in differences:
+            if difference.size_diff <= 0:
+                continue
+            frame = difference.traceback[0]
+            sites.append(
+                AllocationSite(
+                    location=f"{frame.filename}:{frame.lineno}",
+                    size_bytes=difference.size_diff,
+                    count=difference.count_diff,
+                )
+            )
+            if len(sites) >= self.top_n:
+                break
+        return tuple(sites)
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None where /proc is unavailable."""
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def max_rss_bytes() -> int:
+    """Process-lifetime peak resident set size."""
+
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports ru_maxrss in bytes, Linux in KiB.
+    return int(value) if sys.platform == "darwin" else int(value) * 1024
+
+
+def _filtered_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, filename)
+            for filename in _IGNORED_ALLOCATION_FILES
+        ]
+    )
+
+
+__all__ = [
+    "AllocationSite",
+    "WorkflowMemoryProbe",
+    "WorkflowMemoryProfile",
+    "current_rss_bytes",
+    "max_rss_bytes",
+    "trace_allocations",
+]
@@ -7,6 +7,7 @@ from typing import Any
 import pandas as pd
 
 from domain.source import SourceDocument, SourceTextUnit
+from infra.llm.tokenizer import count_tokens
 from infra.source.config.source_runtime_config import SourceRuntimeConfig
 from infra.source.contracts.artifact_schemas import (
     BLOCKS_FINAL_COLUMNS,
@@ -18,7 +19,6 @@ from infra.source.contracts.artifact_schemas import (
     TEXT_UNITS_FINAL_COLUMNS,
 )
 from infra.source.runtime.artifact_bundle import SourceArtifactBundle
-from infra.source.runtime.chunking import get_encoding_fn
 from infra.source.runtime.hashing import gen_sha512_hash
 from infra.source.runtime.mapping.block_artifacts import (
     build_pdf_blocks,
@@ -81,6 +81,7 @@ def build_pdf_bundle(
         blocks=final_blocks,
         text_items=text_items,
         payload=payload,
+        render_mode=_figure_render_mode(config),
     )
     final_tables = build_pdf_tables(
         document_id=document_id,
@@ -109,6 +110,11 @@ def build_pdf_bundle(
     )
 
 
+def _figure_render_mode(config: SourceRuntimeConfig) -> str:
+    render_mode = config.figures.render_mode
+    return str(getattr(render_mode, "value", render_mode)).strip().lower()
+
+
 def build_pdf_converter() -> Any:
     from docling.datamodel.base_models import InputFormat
     from docling.datamodel.pipeline_options import AcceleratorOptions, PdfPipelineOptions
@@ -141,10 +147,10 @@ def build_pdf_text_units(
     text_items: list[dict[str, Any]],
     config: SourceRuntimeConfig,
 ) -> pd.DataFrame:
-    encode, _ = get_encoding_fn(config.chunks.encoding_model)
+    texts = [str(item["text"]).strip() for item in text_items]
+    token_counts = count_tokens(texts, encoding=config.chunks.encoding_model)
     rows: list[dict[str, Any]] = []
-    for item in text_items:
-        text = str(item["text"]).strip()
+    for item, text, n_tokens in zip(text_items, texts, token_counts, strict=True):
         row_id = gen_sha512_hash(
             {
                 "document_id": document_id,
@@ -158,7 +164,7 @@ def build_pdf_text_units(
                 text_unit_id=row_id,
                 text_unit_order=len(rows),
                 text=text,
-                n_tokens=len(encode(text)),
+                n_tokens=n_tokens,
                 document_ids=(document_id,),
             ).to_record()
         )
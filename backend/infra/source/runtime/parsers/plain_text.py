@@ -25,6 +25,7 @@ from infra.source.runtime.workflows.create_base_text_units import create_base_te
 from infra.source.runtime.workflows.create_final_documents import create_final_documents
 from infra.source.runtime.workflows.create_final_text_units import create_final_text_units
 from infra.source.runtime.workflows.create_table_cells import create_table_cells
+from infra.tracing.spans import span
 
 
 def build_text_bundle(
@@ -49,22 +50,25 @@ def build_text_bundle(
         ]
     )
 
-    base_text_units = create_base_text_units(
-        document_frame,
-        callbacks,
-        config.chunks.group_by_columns,
-        config.chunks.size,
-        config.chunks.overlap,
-        config.chunks.encoding_model,
-        strategy=config.chunks.strategy,
-        prepend_metadata=config.chunks.prepend_metadata,
-        chunk_size_includes_metadata=config.chunks.chunk_size_includes_metadata,
-    )
-    final_documents = create_final_documents(document_frame, base_text_units)
-    final_text_units = create_final_text_units(base_text_units)
-    final_blocks = build_blocks(final_documents, final_text_units)
-    final_table_rows = build_table_rows(final_documents, final_text_units)
-    final_table_cells = create_table_cells(final_documents, final_text_units)
+    with span("tokenize_chunks") as current:
+        base_text_units = create_base_text_units(
+            document_frame,
+            callbacks,
+            config.chunks.group_by_columns,
+            config.chunks.size,
+            config.chunks.overlap,
+            config.chunks.encoding_model,
+            strategy=config.chunks.strategy,
+            prepend_metadata=config.chunks.prepend_metadata,
+            chunk_size_includes_metadata=config.chunks.chunk_size_includes_metadata,
+        )
+        current.add("text_unit_count", len(base_text_units))
+    with span("build_evidence"):
+        final_documents = create_final_documents(document_frame, base_text_units)
+        final_text_units = create_final_text_units(base_text_units)
+        final_blocks = build_blocks(final_documents, final_text_units)
+        final_table_rows = build_table_rows(final_documents, final_text_units)
+        final_table_cells = create_table_cells(final_documents, final_text_units)
     return SourceArtifactBundle(
         documents=final_documents.loc[:, DOCUMENTS_FINAL_COLUMNS],
         text_units=final_text_units.loc[:, TEXT_UNITS_FINAL_COLUMNS],
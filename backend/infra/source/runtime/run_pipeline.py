@@ -7,6 +7,7 @@ import json
 import logging
 import time
 from collections.abc import AsyncIterable
+from contextlib import ExitStack, nullcontext
 from dataclasses import asdict
 from typing import Any
 
@@ -15,12 +16,14 @@ import pandas as pd
 from infra.source.runtime.cache.factory import create_cache_from_config
 from infra.source.config.source_runtime_config import SourceRuntimeConfig
 from infra.source.runtime.callbacks.workflow_callbacks import WorkflowCallbacks
+from infra.source.runtime.memory_profile import WorkflowMemoryProbe, trace_allocations
 from infra.source.runtime.run_context import create_run_context
 from infra.source.runtime.storage.factory import create_storage_from_config
 from infra.source.runtime.storage.table_io import write_table_to_storage
 from infra.source.runtime.typing.context import PipelineRunContext
 from infra.source.runtime.typing.pipeline import Pipeline
 from infra.source.runtime.typing.pipeline_run_result import PipelineRunResult
+from infra.tracing.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ async def run_pipeline(
     callbacks: WorkflowCallbacks,
     additional_context: dict[str, Any] | None = None,
     input_documents: pd.DataFrame | None = None,
+    memory_profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run all workflows using a simplified pipeline."""
     root_dir = config.root_dir
@@ -65,6 +69,7 @@ async def run_pipeline(
         pipeline=pipeline,
         config=config,
         context=context,
+        memory_profile=memory_profile,
     ):
         yield table
 
@@ -73,6 +78,7 @@ async def _run_pipeline(
     pipeline: Pipeline,
     config: SourceRuntimeConfig,
     context: PipelineRunContext,
+    memory_profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
@@ -82,19 +88,34 @@ async def _run_pipeline(
         await _dump_json(context)
 
         logger.info("Executing pipeline...")
-        for name, workflow_function in pipeline.run():
-            last_workflow = name
-            context.callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(config, context)
-            context.callbacks.workflow_end(name, result)
-            yield PipelineRunResult(
-                workflow=name, result=result.result, state=context.state, errors=None
-            )
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
-            if result.stop:
-                logger.info("Halting pipeline at workflow request")
-                break
+        with ExitStack() as profiling:
+            if memory_profile:
+                profiling.enter_context(trace_allocations())
+            for name, workflow_function in pipeline.run():
+                last_workflow = name
+                context.callbacks.workflow_start(name, None)
+                work_time = time.time()
+                probe = WorkflowMemoryProbe() if memory_profile else None
+                with span(name) as current:
+                    with probe or nullcontext():
+                        result = await workflow_function(config, context)
+                    memory = _record_memory_profile(context, name, probe)
+                    for counter, value in memory.items():
+                        current.add(counter, value)
+                context.callbacks.workflow_end(name, result)
+                context.stats.workflows[name] = {
+                    "overall": time.time() - work_time,
+                    **memory,
+                }
+                yield PipelineRunResult(
+                    workflow=name,
+                    result=result.result,
+                    state=context.state,
+                    errors=None,
+                )
+                if result.stop:
+                    logger.info("Halting pipeline at workflow request")
+                    break
 
         context.stats.total_runtime = time.time() - start_time
         logger.info("Indexing pipeline complete.")
@@ -107,6 +128,27 @@ async def _run_pipeline(
         )
 
 
+def _record_memory_profile(
+    context: PipelineRunContext,
+    name: str,
+    probe: WorkflowMemoryProbe | None,
+) -> dict[str, float]:
+    profile = probe.profile if probe is not None else None
+    if profile is None:
+        return {}
+    context.stats.top_allocations[name] = [
+        site.to_record() for site in profile.top_allocations
+    ]
+    logger.info(
+        "Workflow %s memory peak_rss_bytes=%s traced_peak_bytes=%s top_allocation=%s",
+        name,
+        profile.peak_rss_bytes,
+        profile.traced_peak_bytes,
+        profile.top_allocations[0].location if profile.top_allocations else None,
+    )
+    return profile.counters()
+
+
 async def _dump_json(context: PipelineRunContext) -> None:
     """Dump the stats and context state to the storage."""
     await context.output_storage.set(
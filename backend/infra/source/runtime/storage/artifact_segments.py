@@ -0,0 +1,163 @@
+"""Append-only segment storage for streamed Source artifact tables."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import partial
+import re
+
+import pandas as pd
+
+from infra.source.contracts.artifact_schemas import (
+    BLOCKS_FINAL_COLUMNS,
+    DOCUMENTS_FINAL_COLUMNS,
+    FIGURES_FINAL_COLUMNS,
+    TABLE_CELLS_FINAL_COLUMNS,
+    TABLES_FINAL_COLUMNS,
+    TABLE_ROWS_FINAL_COLUMNS,
+    TEXT_UNITS_FINAL_COLUMNS,
+)
+from infra.source.runtime.artifact_bundle import (
+    SourceArtifactBundle,
+    StoredFigureAssets,
+    StreamedSourceArtifacts,
+)
+from infra.source.runtime.storage.file_pipeline_storage import FilePipelineStorage
+from infra.source.runtime.storage.pipeline_storage import PipelineStorage
+from infra.source.runtime.storage.table_io import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+
+SEGMENTED_TABLES = (
+    ("documents", DOCUMENTS_FINAL_COLUMNS),
+    ("text_units", TEXT_UNITS_FINAL_COLUMNS),
+    ("blocks", BLOCKS_FINAL_COLUMNS),
+    ("figures", FIGURES_FINAL_COLUMNS),
+    ("tables", TABLES_FINAL_COLUMNS),
+    ("table_rows", TABLE_ROWS_FINAL_COLUMNS),
+    ("table_cells", TABLE_CELLS_FINAL_COLUMNS),
+)
+SEGMENT_DIR_SUFFIX = ".parts"
+FIGURE_ASSET_DIR = "image_assets"
+
+
+class SourceArtifactSegmentWriter:
+    """Write each parsed document's tables as numbered storage segments.
+
+    ``document_order`` and ``text_unit_order`` are assigned from running
+    offsets, so no collection-wide concatenation is needed. Figure bytes go
+    to storage immediately. Only document ids and counts are kept.
+    """
+
+    def __init__(self, storage: PipelineStorage) -> None:
+        self.storage = storage
+        self.segment_count = 0
+        self._document_ids: set[str] = set()
+        self._text_unit_count = 0
+        self._figure_asset_paths: list[str] = []
+        self._figure_asset_bytes: dict[str, bytes] = {}
+
+    async def reset(self) -> None:
+        """Drop segments and figure assets left by a previous run."""
+        directories = [f"{name}{SEGMENT_DIR_SUFFIX}" for name, _ in SEGMENTED_TABLES]
+        for directory in (*directories, FIGURE_ASSET_DIR):
+            await _clear_directory_storage(self.storage, directory)
+
+    async def append(self, bundle: SourceArtifactBundle) -> None:
+        documents = _with_running_order(
+            bundle.documents,
+            "document_order",
+            len(self._document_ids),
+        )
+        text_units = _with_running_order(
+            bundle.text_units,
+            "text_unit_order",
+            self._text_unit_count,
+        )
+        ordered = SourceArtifactBundle(
+            documents=documents,
+            text_units=text_units,
+            blocks=bundle.blocks,
+            figures=bundle.figures,
+            tables=bundle.tables,
+            table_rows=bundle.table_rows,
+            table_cells=bundle.table_cells,
+            figure_assets=bundle.figure_assets,
+        )
+        document_ids = (
+            []
+            if documents is None or documents.empty
+            else [str(document_id) for document_id in documents["id"]]
+        )
+        unique_ids = set(document_ids)
+        if len(unique_ids) != len(document_ids) or unique_ids & self._document_ids:
+            raise ValueError("source documents contain duplicate document ids")
+
+        segment_name = _segment_name(self.segment_count)
+        for name, columns in SEGMENTED_TABLES:
+            frame = getattr(ordered, name)
+            if frame is None or frame.empty:
+                continue
+            await write_table_to_storage(
+                frame.loc[:, columns],
+                f"{name}{SEGMENT_DIR_SUFFIX}/{segment_name}",
+                self.storage,
+            )
+        for asset_path, asset_bytes in bundle.figure_assets.items():
+            await self.storage.set(asset_path, asset_bytes)
+            self._figure_asset_paths.append(asset_path)
+            if not isinstance(self.storage, FilePipelineStorage):
+                self._figure_asset_bytes[asset_path] = asset_bytes
+
+        self.segment_count += 1
+        self._text_unit_count += len(text_units)
+        self._document_ids.update(document_ids)
+
+    def result(self) -> StreamedSourceArtifacts:
+        return StreamedSourceArtifacts(
+            document_count=len(self._document_ids),
+            segment_count=self.segment_count,
+            read_segment=partial(read_artifact_segment, self.storage),
+            figure_assets=self._figure_assets(),
+        )
+
+    def _figure_assets(self) -> Mapping[str, bytes]:
+        if isinstance(self.storage, FilePipelineStorage):
+            return StoredFigureAssets(self.storage.root_dir, self._figure_asset_paths)
+        return dict(self._figure_asset_bytes)
+
+
+async def read_artifact_segment(
+    storage: PipelineStorage,
+    segment_index: int,
+) -> SourceArtifactBundle:
+    """Load one written segment back as a bundle without figure bytes."""
+    frames: dict[str, pd.DataFrame] = {}
+    for name, columns in SEGMENTED_TABLES:
+        table_name = f"{name}{SEGMENT_DIR_SUFFIX}/{_segment_name(segment_index)}"
+        if await storage_has_table(table_name, storage):
+            frames[name] = await load_table_from_storage(table_name, storage)
+        else:
+            frames[name] = pd.DataFrame(columns=columns)
+    return SourceArtifactBundle(**frames, figure_assets={})
+
+
+def _segment_name(segment_index: int) -> str:
+    return f"part-{segment_index:06d}"
+
+
+def _with_running_order(frame: pd.DataFrame, column: str, offset: int) -> pd.DataFrame:
+    if frame is None or frame.empty:
+        return frame
+    ordered = frame.copy()
+    ordered[column] = range(offset, offset + len(ordered))
+    return ordered
+
+
+async def _clear_directory_storage(storage: PipelineStorage, directory: str) -> None:
+    pattern = re.compile(r"^(?P<path>.+)$")
+    keys = [key for key, _ in storage.find(pattern, base_dir=directory)]
+    for key in keys:
+        await storage.delete(key)
@@ -36,6 +36,10 @@ class FilePipelineStorage(PipelineStorage):
         logger.debug("Creating file storage at %s", self._root_dir)
         Path(self._root_dir).mkdir(parents=True, exist_ok=True)
 
+    @property
+    def root_dir(self) -> Path:
+        return Path(self._root_dir)
+
     def find(
         self,
         file_pattern: re.Pattern[str],
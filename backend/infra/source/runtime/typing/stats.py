@@ -4,6 +4,7 @@
 """Pipeline stats types."""
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -20,4 +21,12 @@ class PipelineRunStats:
     """Float representing the input load time."""
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
-    """A dictionary of workflows."""
+    """A dictionary of workflows.
+
+    Each entry holds the ``overall`` runtime and, when memory profiling is
+    enabled, ``peak_rss_bytes``, ``rss_delta_bytes``, ``traced_peak_bytes``
+    and ``traced_delta_bytes``.
+    """
+
+    top_allocations: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    """Largest heap growth sites per workflow when memory profiling is enabled."""
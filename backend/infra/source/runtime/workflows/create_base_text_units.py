@@ -9,7 +9,8 @@ from typing import Any, cast
 
 import pandas as pd
 
-from infra.source.runtime.chunking import chunk_text, get_encoding_fn
+from infra.llm.tokenizer import count_text_tokens
+from infra.source.runtime.chunking import chunk_text
 from infra.source.config.source_runtime_config import SourceRuntimeConfig
 from infra.source.runtime.callbacks.workflow_callbacks import WorkflowCallbacks
 from infra.source.runtime.hashing import gen_sha512_hash
@@ -100,8 +101,10 @@ def create_base_text_units(
                 )
 
             if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
-                metadata_tokens = len(encode(metadata_str))
+                metadata_tokens = count_text_tokens(
+                    metadata_str,
+                    encoding=encoding_model,
+                )
                 if metadata_tokens >= size:
                     message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
                     raise ValueError(message)
@@ -7,30 +7,19 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-import re
 from typing import Any
 
 import pandas as pd
 
 from infra.source.config.source_runtime_config import SourceRuntimeConfig
-from infra.source.contracts.artifact_schemas import (
-    BLOCKS_FINAL_COLUMNS,
-    DOCUMENTS_FINAL_COLUMNS,
-    FIGURES_FINAL_COLUMNS,
-    TABLE_CELLS_FINAL_COLUMNS,
-    TABLES_FINAL_COLUMNS,
-    TABLE_ROWS_FINAL_COLUMNS,
-    TEXT_UNITS_FINAL_COLUMNS,
-)
-from infra.source.runtime.artifact_bundle import SourceArtifactBundle
+from infra.source.runtime.artifact_bundle import StreamedSourceArtifacts
 from infra.source.runtime.parsers.docling_pdf import build_pdf_bundle, build_pdf_converter
 from infra.source.runtime.parsers.plain_text import build_text_bundle
-from infra.source.runtime.storage.table_io import (
-    load_table_from_storage,
-    write_table_to_storage,
-)
+from infra.source.runtime.storage.artifact_segments import SourceArtifactSegmentWriter
+from infra.source.runtime.storage.table_io import load_table_from_storage
 from infra.source.runtime.typing.context import PipelineRunContext
 from infra.source.runtime.typing.workflow import WorkflowFunctionOutput
+from infra.tracing.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -48,17 +37,7 @@ async def run_workflow(
         context=context,
     )
 
-    context.stats.num_documents = len(output.documents)
-    await write_table_to_storage(output.documents, "documents", context.output_storage)
-    await write_table_to_storage(output.text_units, "text_units", context.output_storage)
-    await write_table_to_storage(output.blocks, "blocks", context.output_storage)
-    await write_table_to_storage(output.figures, "figures", context.output_storage)
-    await write_table_to_storage(output.tables, "tables", context.output_storage)
-    await write_table_to_storage(output.table_rows, "table_rows", context.output_storage)
-    await write_table_to_storage(output.table_cells, "table_cells", context.output_storage)
-    await _clear_directory_storage(context.output_storage, "image_assets")
-    for asset_path, asset_bytes in output.figure_assets.items():
-        await context.output_storage.set(asset_path, asset_bytes)
+    context.stats.num_documents = output.document_count
     logger.info("Workflow completed: create_source_artifacts")
     return WorkflowFunctionOutput(result=output)
 
@@ -68,10 +47,14 @@ async def create_source_artifacts(
     inventory: pd.DataFrame,
     config: SourceRuntimeConfig,
     context: PipelineRunContext,
-) -> SourceArtifactBundle:
-    """Build all final Source artifacts in one pass over the raw inputs."""
-    bundles: list[SourceArtifactBundle] = []
-    figure_assets: dict[str, bytes] = {}
+) -> StreamedSourceArtifacts:
+    """Build all final Source artifacts in one pass over the raw inputs.
+
+    Each parsed document is appended to per-table storage segments and
+    released before the next input is parsed.
+    """
+    writer = SourceArtifactSegmentWriter(context.output_storage)
+    await writer.reset()
     pdf_converter: Any | None = None
 
     for _, row in inventory.iterrows():
@@ -79,73 +62,38 @@ async def create_source_artifacts(
         suffix = Path(source_path).suffix.lower()
         if source_path and suffix == ".pdf":
             if pdf_converter is None:
-                pdf_converter = build_pdf_converter()
-            payload = await context.input_storage.get(source_path, as_bytes=True)
+                with span("load_pdf_converter"):
+                    pdf_converter = build_pdf_converter()
+            with span("read_input") as current:
+                payload = await context.input_storage.get(source_path, as_bytes=True)
+                current.add("bytes", len(payload or b""))
             if payload is None:
                 raise FileNotFoundError(f"input document not found: {source_path}")
-            bundles.append(
-                build_pdf_bundle(
+            with span("parse_pdf"):
+                bundle = build_pdf_bundle(
                     row=row,
                     payload=payload,
                     config=config,
                     converter=pdf_converter,
                 )
-            )
-            figure_assets.update(bundles[-1].figure_assets)
-            continue
-
-        text = row.get("text")
-        if text is None and source_path:
-            text = await context.input_storage.get(source_path, encoding=config.input.encoding)
-        bundles.append(
-            build_text_bundle(
-                row=row,
-                text=str(text or ""),
-                config=config,
-                callbacks=context.callbacks,
-            )
-        )
-        figure_assets.update(bundles[-1].figure_assets)
-
-    documents = _concat_frames([bundle.documents for bundle in bundles], DOCUMENTS_FINAL_COLUMNS)
-    text_units = _concat_frames([bundle.text_units for bundle in bundles], TEXT_UNITS_FINAL_COLUMNS)
-    blocks = _concat_frames([bundle.blocks for bundle in bundles], BLOCKS_FINAL_COLUMNS)
-    figures = _concat_frames([bundle.figures for bundle in bundles], FIGURES_FINAL_COLUMNS)
-    tables = _concat_frames([bundle.tables for bundle in bundles], TABLES_FINAL_COLUMNS)
-    table_rows = _concat_frames([bundle.table_rows for bundle in bundles], TABLE_ROWS_FINAL_COLUMNS)
-    table_cells = _concat_frames(
-        [bundle.table_cells for bundle in bundles],
-        TABLE_CELLS_FINAL_COLUMNS,
-    )
-
-    if not documents.empty:
-        documents = documents.copy()
-        documents["document_order"] = range(len(documents))
-    if not text_units.empty:
-        text_units = text_units.copy()
-        text_units["text_unit_order"] = range(len(text_units))
-
-    return SourceArtifactBundle(
-        documents=documents.loc[:, DOCUMENTS_FINAL_COLUMNS],
-        text_units=text_units.loc[:, TEXT_UNITS_FINAL_COLUMNS],
-        blocks=blocks.loc[:, BLOCKS_FINAL_COLUMNS],
-        figures=figures.loc[:, FIGURES_FINAL_COLUMNS],
-        tables=tables.loc[:, TABLES_FINAL_COLUMNS],
-        table_rows=table_rows.loc[:, TABLE_ROWS_FINAL_COLUMNS],
-        table_cells=table_cells.loc[:, TABLE_CELLS_FINAL_COLUMNS],
-        figure_assets=dict(figure_assets),
-    )
-
-
-def _concat_frames(frames: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
-    usable = [frame.loc[:, columns] for frame in frames if frame is not None and not frame.empty]
-    if not usable:
-        return pd.DataFrame(columns=columns)
-    return pd.concat(usable, ignore_index=True)
-
+            del payload
+        else:
+            text = row.get("text")
+            if text is None and source_path:
+                with span("read_input"):
+                    text = await context.input_storage.get(
+                        source_path,
+                        encoding=config.input.encoding,
+                    )
+            with span("parse_text", chars=len(str(text or ""))):
+                bundle = build_text_bundle(
+                    row=row,
+                    text=str(text or ""),
+                    config=config,
+                    callbacks=context.callbacks,
+                )
+        with span("append_segment"):
+            await writer.append(bundle)
+        del bundle
 
-async def _clear_directory_storage(storage: Any, directory: str) -> None:
-    pattern = re.compile(r"^(?P<path>.+)$")
-    keys = [key for key, _ in storage.find(pattern, base_dir=directory)]
-    for key in keys:
-        await storage.delete(key)
+    return writer.result()
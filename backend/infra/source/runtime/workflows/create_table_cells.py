@@ -45,11 +45,17 @@ def create_table_cells(
         "row_index",
         "col_index",
         "cell_text",
+        "column_header",
+        "row_header",
+        "row_section",
         "header_path",
         "page",
         "unit_hint",
     ):
         if column not in normalized.columns:
             normalized[column] = None
+    for column in ("row_span", "col_span"):
+        if column not in normalized.columns:
+            normalized[column] = 1
     normalized["id"] = normalized.get("document_id")
     return normalized.loc[:, TABLE_CELLS_FINAL_COLUMNS]
@@ -0,0 +1 @@
+"""Execution tracing infrastructure package."""
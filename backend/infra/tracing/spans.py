@@ -0,0 +1,219 @@
+"""Nested timing spans for pipeline nodes and Objective analysis runs.
+
+`capture_spans()` activates a recorder for the calling context, and `span()`
+blocks opened underneath it record wall time and counters under a `/`-joined
+path of their enclosing span names. Spans opened without an active recorder
+cost one context-variable lookup, so hot paths can stay instrumented.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+import json
+import logging
+import os
+from pathlib import Path
+import re
+from threading import Lock, get_native_id
+from time import perf_counter_ns
+from typing import Any
+
+from domain.pipeline import ExecutionStats, SpanTiming
+
+logger = logging.getLogger(__name__)
+
+TRACE_DIR_ENV = "PIPELINE_TRACE_DIR"
+DEFAULT_MAX_TRACE_EVENTS = 50_000
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class Span:
+    """Counters attached to one open span."""
+
+    __slots__ = ("counters",)
+
+    def __init__(self, counters: dict[str, float] | None = None) -> None:
+        self.counters: dict[str, float] = dict(counters or {})
+
+    def add(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+class _DisabledSpan(Span):
+    __slots__ = ()
+
+    def add(self, name: str, value: float = 1) -> None:
+        return None
+
+
+_DISABLED_SPAN = _DisabledSpan()
+
+
+class SpanRecorder:
+    """Aggregate closed spans by path and keep a bounded raw event log."""
+
+    def __init__(self, *, max_events: int = DEFAULT_MAX_TRACE_EVENTS) -> None:
+        self.max_events = max_events
+        self._lock = Lock()
+        self._origin_ns = perf_counter_ns()
+        self._timings: dict[str, SpanTiming] = {}
+        self._events: list[dict[str, Any]] = []
+        self.dropped_event_count = 0
+
+    def record(
+        self,
+        path: str,
+        *,
+        started_ns: int,
+        duration_ns: int,
+        counters: dict[str, float],
+    ) -> None:
+        duration_ms = duration_ns / 1_000_000
+        timing = SpanTiming(
+            path=path,
+            count=1,
+            total_ms=round(duration_ms, 3),
+            max_ms=round(duration_ms, 3),
+            counters=counters,
+        )
+        with self._lock:
+            previous = self._timings.get(path)
+            self._timings[path] = (
+                timing
+                if previous is None
+                else SpanTiming.aggregate((previous, timing))
+            )
+            if len(self._events) >= self.max_events:
+                self.dropped_event_count += 1
+                return
+            self._events.append(
+                {
+                    "name": path.rsplit("/", 1)[-1],
+                    "cat": path.split("/", 1)[0],
+                    "ph": "X",
+                    "ts": (started_ns - self._origin_ns) / 1000,
+                    "dur": duration_ns / 1000,
+                    "pid": os.getpid(),
+                    "tid": get_native_id(),
+                    "args": {"path": path, **counters},
+                }
+            )
+
+    def timings(self) -> tuple[SpanTiming, ...]:
+        with self._lock:
+            return tuple(timing for _path, timing in sorted(self._timings.items()))
+
+    def execution_stats(self, stats: ExecutionStats) -> ExecutionStats:
+        """Return `stats` with this recorder's span timings attached."""
+
+        return replace(stats, spans=self.timings())
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the recorded spans in Chrome trace-event JSON form."""
+
+        with self._lock:
+            events = [dict(event) for event in self._events]
+            dropped_event_count = self.dropped_event_count
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_event_count": dropped_event_count},
+        }
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.chrome_trace(), separators=(",", ":")),
+            encoding="utf-8",
+        )
+        return path
+
+
+_ACTIVE_SPAN_RECORDER: ContextVar[SpanRecorder | None] = ContextVar(
+    "active_span_recorder",
+    default=None,
+)
+_ACTIVE_SPAN: ContextVar[tuple[str, Span] | None] = ContextVar(
+    "active_span",
+    default=None,
+)
+
+
+@contextmanager
+def capture_spans(
+    *,
+    max_events: int = DEFAULT_MAX_TRACE_EVENTS,
+) -> Iterator[SpanRecorder]:
+    recorder = SpanRecorder(max_events=max_events)
+    recorder_token = _ACTIVE_SPAN_RECORDER.set(recorder)
+    span_token = _ACTIVE_SPAN.set(None)
+    try:
+        yield recorder
+    finally:
+        _ACTIVE_SPAN.reset(span_token)
+        _ACTIVE_SPAN_RECORDER.reset(recorder_token)
+
+
+@contextmanager
+def span(name: str, **counters: float) -> Iterator[Span]:
+    """Time the enclosed block as a child of the currently open span."""
+
+    recorder = _ACTIVE_SPAN_RECORDER.get()
+    if recorder is None:
+        yield _DISABLED_SPAN
+        return
+    parent = _ACTIVE_SPAN.get()
+    path = f"{parent[0]}/{name}" if parent is not None else name
+    current = Span(counters)
+    token = _ACTIVE_SPAN.set((path, current))
+    started_ns = perf_counter_ns()
+    try:
+        yield current
+    finally:
+        duration_ns = perf_counter_ns() - started_ns
+        _ACTIVE_SPAN.reset(token)
+        recorder.record(
+            path,
+            started_ns=started_ns,
+            duration_ns=duration_ns,
+            counters=current.counters,
+        )
+
+
+def add_span_counter(name: str, value: float = 1) -> None:
+    """Add to a counter on the innermost open span, if any."""
+
+    active = _ACTIVE_SPAN.get()
+    if active is not None:
+        active[1].add(name, value)
+
+
+def export_chrome_trace(recorder: SpanRecorder, name: str) -> Path | None:
+    """Write `recorder` to `PIPELINE_TRACE_DIR` when trace export is enabled."""
+
+    trace_dir = os.getenv(TRACE_DIR_ENV, "").strip()
+    if not trace_dir:
+        return None
+    filename = _UNSAFE_FILENAME_CHARS.sub("_", name).strip("._") or "trace"
+    try:
+        path = recorder.write_chrome_trace(
+            Path(trace_dir).expanduser() / f"{filename}.trace.json"
+        )
+    except OSError:
+        logger.warning("Span trace export failed name=%s", name, exc_info=True)
+        return None
+    logger.info("Span trace written name=%s path=%s", name, path)
+    return path
+
+
+__all__ = [
+    "Span",
+    "SpanRecorder",
+    "add_span_counter",
+    "capture_spans",
+    "export_chrome_trace",
+    "span",
+]
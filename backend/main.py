@@ -7,7 +7,12 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from application.auth import AuthSessionService, SessionNotFoundError
+from application.auth import (
+    SESSION_REVOKED_TOPIC_PREFIX,
+    AuthSessionService,
+    SessionNotFoundError,
+)
+from application.auth.session_service import SESSION_COOKIE_NAME
 from application.chat import (
     CapabilityRegistry,
     ChatSessionService,
@@ -18,6 +23,7 @@ from application.chat.capabilities import (
     GetCollectionContextCapability,
     ProposeObjectiveDraftsCapability,
     QueryPublishedFindingsCapability,
+    SearchSourceTextCapability,
 )
 from application.core.document_profiles.service import (
     DocumentProfileService,
@@ -41,8 +47,18 @@ from application.goal.brief_service import GoalService
 from application.goal.experiment_plan_service import ExperimentPlanService
 from application.pipeline.collection_build.service import CollectionBuildPipelineService
 from application.source.artifact_registry_service import ArtifactRegistryService
+from application.source.build_collector import (
+    BUILD_COLLECTOR_LOCK_NAME,
+    BuildGarbageCollector,
+)
+from application.source.build_retention_service import (
+    BuildRetentionPolicy,
+    BuildRetentionService,
+)
+from application.source.collection_reaper import CollectionReaper
 from application.source.collection_service import CollectionService
 from application.source.document_markdown_service import DocumentMarkdownService
+from application.source.lexical_search_service import SourceLexicalSearchService
 from application.source.reference_workflow_service import SourceReferenceWorkflowService
 from application.source.task_service import TaskService
 from config import DATA_DIR
@@ -66,12 +82,18 @@ from domain.ports import (
     SourceArtifactRepository,
 )
 from infra.llm.chat_model import OpenAIChatModel
+from infra.notifications.progress import PostgresProgressNotifier, ProgressHub
 from infra.persistence.database import (
     DatabaseSettings,
     build_database_engine,
     build_session_factory,
 )
-from infra.persistence.file import FileCollectionWorkspace
+from infra.persistence.file import (
+    FileCollectionWorkspace,
+    FileFigureRenderCache,
+    FileObjectiveStageCache,
+    FileSourceLexicalIndexStore,
+)
 from infra.persistence.postgres.auth_repository import PostgresAuthRepository
 from infra.persistence.postgres.build_repository import PostgresBuildRepository
 from infra.persistence.postgres.chat_repository import PostgresChatRepository
@@ -81,6 +103,7 @@ from infra.persistence.postgres.collection_repository import (
 from infra.persistence.postgres.finding_review_repository import (
     PostgresFindingReviewRepository,
 )
+from infra.persistence.postgres.job_lock import PostgresJobLock
 from infra.persistence.postgres.objective_repository import (
     PostgresObjectiveRepository,
 )
@@ -132,10 +155,15 @@ def create_app(
     experiment_plan_repository: ExperimentPlanRepository | None = None,
     chat_repository: ChatRepository | None = None,
     chat_session_service: ChatSessionService | None = None,
+    progress_hub: ProgressHub | None = None,
 ) -> FastAPI:
     @asynccontextmanager
     async def lifespan(application: FastAPI) -> AsyncIterator[None]:
         engine = None
+        postgres_progress_notifier = None
+        active_auth_session_service = None
+        collection_reaper = None
+        build_collector = None
         try:
             session_factory = None
             if (
@@ -151,19 +179,47 @@ def create_app(
             ):
                 engine = build_database_engine(DatabaseSettings())
                 session_factory = build_session_factory(engine)
+            active_progress_hub = progress_hub or ProgressHub()
+            application.state.progress_hub = active_progress_hub
+            progress_notifier = active_progress_hub
+            if engine is not None:
+                postgres_progress_notifier = PostgresProgressNotifier(
+                    engine,
+                    active_progress_hub,
+                )
+                postgres_progress_notifier.start()
+                progress_notifier = postgres_progress_notifier
             if auth_session_service is None:
                 active_auth_session_service = AuthSessionService(
-                    PostgresAuthRepository(session_factory)
+                    PostgresAuthRepository(session_factory),
+                    session_events=progress_notifier,
                 )
                 application.state.auth_session_service = active_auth_session_service
                 active_auth_session_service.ensure_bootstrap_user()
+            session_cache = getattr(
+                application.state.auth_session_service,
+                "session_cache",
+                None,
+            )
+            if session_cache is not None:
+                active_progress_hub.add_listener(
+                    SESSION_REVOKED_TOPIC_PREFIX,
+                    session_cache.invalidate_topic,
+                )
 
             active_collection_service = collection_service or CollectionService(
                 repository=PostgresCollectionRepository(session_factory),
                 workspace=FileCollectionWorkspace(),
             )
+            if collection_service is None:
+                collection_reaper = CollectionReaper(
+                    active_collection_service,
+                    lock=PostgresJobLock(engine, "collection-reaper"),
+                )
+                collection_reaper.start()
             active_task_service = task_service or TaskService(
-                PostgresBuildRepository(session_factory)
+                PostgresBuildRepository(session_factory),
+                progress_notifier=progress_notifier,
             )
             active_source_artifact_repository = (
                 source_artifact_repository
@@ -191,6 +247,30 @@ def create_app(
                     else None
                 )
             )
+            lexical_index_store = FileSourceLexicalIndexStore(active_collection_service)
+            lexical_search_service = SourceLexicalSearchService(
+                active_source_artifact_repository,
+                lexical_index_store,
+                active_task_service.repository,
+            )
+            retention_policy = BuildRetentionPolicy.from_env(
+                required=engine is not None and engine.dialect.name == "postgresql"
+            )
+            if (
+                retention_policy is not None
+                and collection_service is None
+                and task_service is None
+            ):
+                build_collector = BuildGarbageCollector(
+                    BuildRetentionService(
+                        active_task_service.repository,
+                        active_collection_service,
+                        lexical_index_store,
+                        retention_policy,
+                    ),
+                    lock=PostgresJobLock(engine, BUILD_COLLECTOR_LOCK_NAME),
+                )
+                build_collector.start()
             artifact_registry_service = ArtifactRegistryService(
                 active_task_service.repository,
                 active_source_artifact_repository,
@@ -216,6 +296,10 @@ def create_app(
                 finding_synthesis_service=finding_synthesis_service,
                 paper_skim_service=PaperSkimService(),
                 objective_candidate_service=ObjectiveCandidateService(),
+                objective_stage_cache=FileObjectiveStageCache(
+                    active_collection_service
+                ),
+                lexical_search_service=lexical_search_service,
             )
             workspace_service = WorkspaceService(
                 collection_service=active_collection_service,
@@ -237,6 +321,7 @@ def create_app(
             application.state.document_markdown_service = DocumentMarkdownService(
                 collection_service=active_collection_service,
                 source_artifact_repository=active_source_artifact_repository,
+                figure_render_cache=FileFigureRenderCache(active_collection_service),
             )
             application.state.reference_workflow_service = (
                 SourceReferenceWorkflowService(
@@ -252,11 +337,13 @@ def create_app(
                 source_artifact_repository=active_source_artifact_repository,
                 document_profile_service=document_profile_service,
                 research_objective_service=research_objective_service,
+                lexical_search_service=lexical_search_service,
             )
             application.state.goal_service = GoalService(active_collection_service)
             objective_analysis_service = ObjectiveAnalysisService(
                 objective_repository=active_objective_repository,
                 research_objective_service=research_objective_service,
+                progress_notifier=progress_notifier,
             )
             application.state.chat_session_service = (
                 chat_session_service
@@ -276,6 +363,10 @@ def create_app(
                                     objective_repository=active_objective_repository,
                                     objective_analysis_service=objective_analysis_service,
                                 ),
+                                SearchSourceTextCapability(
+                                    collection_service=active_collection_service,
+                                    lexical_search_service=lexical_search_service,
+                                ),
                                 ProposeObjectiveDraftsCapability(
                                     collection_service=active_collection_service,
                                     objective_repository=active_objective_repository,
@@ -295,6 +386,14 @@ def create_app(
             application.state.objective_analysis_service = objective_analysis_service
             yield
         finally:
+            if build_collector is not None:
+                build_collector.stop()
+            if collection_reaper is not None:
+                collection_reaper.stop()
+            if postgres_progress_notifier is not None:
+                postgres_progress_notifier.stop()
+            if active_auth_session_service is not None:
+                active_auth_session_service.password_workers.shutdown()
             if engine is not None:
                 engine.dispose()
 
@@ -369,8 +468,8 @@ def create_app(
             return await call_next(request)
 
         try:
-            user = request.app.state.auth_session_service.resolve_session(
-                request.cookies.get("lens_session")
+            user = await request.app.state.auth_session_service.resolve_session_async(
+                request.cookies.get(SESSION_COOKIE_NAME)
             )
         except SessionNotFoundError:
             return JSONResponse(
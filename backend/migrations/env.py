@@ -6,16 +6,23 @@ from sqlalchemy.engine import Connection
 from infra.persistence.database import DatabaseSettings, build_database_engine
 from infra.persistence.postgres import models as _postgres_models  # noqa: F401
 from infra.persistence.postgres.base import Base
+from infra.persistence.postgres.build_partitions import is_build_partition
 
 
 config = context.config
 
 
+def include_name(name: str | None, type_: str, _parent_names: dict) -> bool:
+    # Build partitions are created at runtime and are not part of the models.
+    return not (type_ == "table" and name is not None and is_build_partition(name))
+
+
 def run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=Base.metadata,
         compare_type=True,
+        include_name=include_name,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,38 @@
+"""Tombstone deleted collections for background purging.
+
+Revision ID: 20261019_0036
+Revises: 20260821_0035
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_0036"
+down_revision: str | Sequence[str] | None = "20260821_0035"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("collections") as batch_op:
+        batch_op.add_column(
+            sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+        )
+    op.create_index(
+        op.f("ix_collections_deleted_at"),
+        "collections",
+        ["deleted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_collections_deleted_at"), table_name="collections")
+    with op.batch_alter_table("collections") as batch_op:
+        batch_op.drop_column("deleted_at")
@@ -0,0 +1,190 @@
+"""Partition high-volume Source structure tables by build.
+
+On PostgreSQL, text units, blocks, table cells and their link tables become
+LIST-partitioned on build_id with one partition per existing build and a
+DEFAULT partition. Constraints, indexes and foreign keys keep their names.
+Other dialects only gain the two secondary indexes.
+
+Revision ID: 20261019_0037
+Revises: 20261019_0036
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from hashlib import sha256
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_0037"
+down_revision: str | Sequence[str] | None = "20261019_0036"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Referenced tables first, matching infra.persistence.postgres.build_partitions.
+_PARTITIONED_TABLES = (
+    "source_text_units",
+    "source_text_unit_documents",
+    "source_blocks",
+    "source_block_text_units",
+    "source_table_cells",
+)
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_source_text_unit_documents_document",
+        "source_text_unit_documents",
+        ["build_id", "source_document_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_source_table_cells_table_row",
+        "source_table_cells",
+        ["build_id", "table_id", "row_index"],
+        unique=False,
+    )
+    connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        return
+    foreign_keys = _foreign_keys(connection)
+    for name, table_name, _definition in foreign_keys:
+        op.execute(f'ALTER TABLE "{table_name}" DROP CONSTRAINT "{name}"')
+    build_ids = connection.scalars(
+        sa.text("SELECT build_id FROM collection_builds ORDER BY build_id")
+    ).all()
+    # DDL takes no bind parameters; partition bounds are inlined as literals.
+    literal = sa.String().literal_processor(dialect=connection.dialect)
+    for table_name in _PARTITIONED_TABLES:
+        saved = _rebuild(connection, table_name, "PARTITION BY LIST (build_id)")
+        op.execute(
+            f'CREATE TABLE "{table_name}_default" PARTITION OF "{table_name}" DEFAULT'
+        )
+        for build_id in build_ids:
+            op.execute(
+                f'CREATE TABLE "{_partition_name(table_name, build_id)}" '
+                f'PARTITION OF "{table_name}" FOR VALUES IN ({literal(build_id)})'
+            )
+        _restore(table_name, *saved)
+    for name, table_name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        foreign_keys = _foreign_keys(connection)
+        for name, table_name, _definition in foreign_keys:
+            op.execute(f'ALTER TABLE "{table_name}" DROP CONSTRAINT "{name}"')
+        for table_name in _PARTITIONED_TABLES:
+            _restore(table_name, *_rebuild(connection, table_name, ""))
+        for name, table_name, definition in foreign_keys:
+            op.execute(
+                f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{name}" {definition}'
+            )
+    op.drop_index("ix_source_table_cells_table_row", table_name="source_table_cells")
+    op.drop_index(
+        "ix_source_text_unit_documents_document",
+        table_name="source_text_unit_documents",
+    )
+
+
+def _foreign_keys(connection) -> list[tuple[str, str, str]]:
+    """Every foreign key from or to a partitioned table, with its definition."""
+
+    rows = connection.execute(
+        sa.text(
+            """
+            SELECT c.conname, src.relname, pg_get_constraintdef(c.oid)
+            FROM pg_constraint c
+            JOIN pg_class src ON src.oid = c.conrelid
+            JOIN pg_class dst ON dst.oid = c.confrelid
+            WHERE c.contype = 'f'
+              AND c.conparentid = 0
+              AND (src.relname = ANY(:tables) OR dst.relname = ANY(:tables))
+              AND src.relnamespace = to_regnamespace(current_schema())
+            ORDER BY c.conname
+            """
+        ),
+        {"tables": list(_PARTITIONED_TABLES)},
+    )
+    return [
+        (str(name), str(table), str(definition)) for name, table, definition in rows
+    ]
+
+
+def _rebuild(
+    connection,
+    table_name: str,
+    partition_clause: str,
+) -> tuple[list[tuple[str, str]], list[str]]:
+    """Recreate `table_name` with the same columns, moving the old one aside.
+
+    Returns the old table's constraints and indexes; they go with it in
+    `_restore`, after which the new table takes their names back.
+    """
+
+    constraints = [
+        (str(name), str(definition))
+        for name, definition in connection.execute(
+            sa.text(
+                """
+                SELECT conname, pg_get_constraintdef(oid)
+                FROM pg_constraint
+                WHERE conrelid = to_regclass(:table_name)
+                  AND contype IN ('p', 'u', 'c')
+                ORDER BY contype DESC, conname
+                """
+            ),
+            {"table_name": table_name},
+        )
+    ]
+    indexes = [
+        str(definition)
+        for (definition,) in connection.execute(
+            sa.text(
+                """
+                SELECT pg_get_indexdef(i.indexrelid)
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE i.indrelid = to_regclass(:table_name)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM pg_constraint k
+                      WHERE k.conrelid = i.indrelid AND k.conindid = i.indexrelid
+                  )
+                ORDER BY c.relname
+                """
+            ),
+            {"table_name": table_name},
+        )
+    ]
+    legacy = f"{table_name}_legacy"
+    op.execute(f'ALTER TABLE "{table_name}" RENAME TO "{legacy}"')
+    op.execute(
+        f'CREATE TABLE "{table_name}" (LIKE "{legacy}" INCLUDING DEFAULTS) '
+        f"{partition_clause}"
+    )
+    return constraints, indexes
+
+
+def _restore(
+    table_name: str,
+    constraints: list[tuple[str, str]],
+    indexes: list[str],
+) -> None:
+    legacy = f"{table_name}_legacy"
+    op.execute(f'INSERT INTO "{table_name}" SELECT * FROM "{legacy}"')
+    op.execute(f'DROP TABLE "{legacy}" CASCADE')
+    for name, definition in constraints:
+        op.execute(f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{name}" {definition}')
+    for definition in indexes:
+        op.execute(definition.replace(" ON ONLY ", " ON "))
+
+
+def _partition_name(table_name: str, build_id: str) -> str:
+    digest = sha256(str(build_id).encode("utf-8")).hexdigest()[:16]
+    return f"{table_name}_p{digest}"
@@ -293,6 +293,7 @@ def summarize_timings(samples: list[float]) -> dict[str, Any]:
             "min_s": 0.0,
             "p50_s": 0.0,
             "p95_s": 0.0,
+            "p99_s": 0.0,
             "max_s": 0.0,
             "avg_s": 0.0,
         }
@@ -303,6 +304,7 @@ def summarize_timings(samples: list[float]) -> dict[str, Any]:
         "min_s": _round(min(samples)),
         "p50_s": _round(_percentile(samples, 0.50)),
         "p95_s": _round(_percentile(samples, 0.95)),
+        "p99_s": _round(_percentile(samples, 0.99)),
         "max_s": _round(max(samples)),
         "avg_s": _round(sum(samples) / len(samples)),
     }
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""Offline OpenAI-compatible stand-in that records and replays chat completions.
+
+Completions are keyed by the SHA-256 of the canonical request body and stored
+in a JSONL cassette. In replay mode a cassette miss either fails loudly or is
+answered with the smallest response that satisfies the request's JSON schema,
+so pipeline orchestration can still be measured without a provider. Synthetic
+latency and deterministic error injection make retry and throttling paths
+reproducible.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+from threading import Lock, Thread
+import time
+from typing import Any
+
+import httpx
+
+from _common import payload_hash, stable_json_dumps
+
+
+LLM_MODES = ("replay", "record")
+ON_MISS_POLICIES = ("synthesize", "error")
+DEFAULT_HOST = "127.0.0.1"
+_SCHEMA_ANCHOR = "JSON schema:\n"
+_THROTTLE_RETRY_AFTER_MS = 50
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    mode: str = "replay"
+    on_miss: str = "synthesize"
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 429
+    seed: int = 0
+    upstream_base_url: str | None = None
+    upstream_api_key: str | None = None
+    upstream_timeout_s: float = 180.0
+
+    def __post_init__(self) -> None:
+        if self.mode not in LLM_MODES:
+            raise ValueError(f"unsupported stand-in mode: {self.mode}")
+        if self.on_miss not in ON_MISS_POLICIES:
+            raise ValueError(f"unsupported cassette miss policy: {self.on_miss}")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if self.latency_ms < 0 or self.latency_jitter_ms < 0:
+            raise ValueError("synthetic latency cannot be negative")
+        if self.mode == "record" and not self.upstream_base_url:
+            raise ValueError("record mode requires an upstream base URL")
+
+
+class ReplayCassette:
+    """Append-only JSONL store of completions keyed by request hash."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path.expanduser().resolve() if path is not None else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = Lock()
+        if self.path is not None and self.path.is_file():
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries[str(entry["key"])] = entry["response"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, request: dict[str, Any], response: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = response
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(
+                    stable_json_dumps(
+                        {"key": key, "request": request, "response": response}
+                    )
+                    + "\n"
+                )
+
+
+class LLMStandIn:
+    """Answer chat completion requests from a cassette with synthetic latency."""
+
+    def __init__(self, cassette: ReplayCassette, config: StandInConfig) -> None:
+        self.cassette = cassette
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._lock = Lock()
+        self._stats: dict[str, Any] = {
+            "request_count": 0,
+            "replayed_count": 0,
+            "recorded_count": 0,
+            "synthesized_count": 0,
+            "missed_count": 0,
+            "injected_error_count": 0,
+            "requests_by_response_format": {},
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    def handle(self, body: dict[str, Any]) -> tuple[int, dict[str, str], dict[str, Any]]:
+        key = request_key(body)
+        with self._lock:
+            self._stats["request_count"] += 1
+            formats = self._stats["requests_by_response_format"]
+            format_name = _response_format_name(body)
+            formats[format_name] = formats.get(format_name, 0) + 1
+            inject_error = self._random.random() < self.config.error_rate
+            delay_s = (
+                self.config.latency_ms
+                + self._random.uniform(0.0, self.config.latency_jitter_ms)
+            ) / 1000.0
+        if delay_s > 0:
+            time.sleep(delay_s)
+        if inject_error:
+            self._count("injected_error_count")
+            return _error_response(self.config.error_status)
+
+        response = self.cassette.get(key)
+        if response is not None:
+            self._count("replayed_count")
+            return 200, {}, response
+        if self.config.mode == "record":
+            response = self._forward(body)
+            self.cassette.put(key, body, response)
+            self._count("recorded_count")
+            return 200, {}, response
+        self._count("missed_count")
+        if self.config.on_miss == "error":
+            return (
+                404,
+                {},
+                {
+                    "error": {
+                        "type": "cassette_miss",
+                        "message": f"no recorded completion for request {key}",
+                    }
+                },
+            )
+        self._count("synthesized_count")
+        return 200, {}, synthesize_completion(body, key=key)
+
+    def _forward(self, body: dict[str, Any]) -> dict[str, Any]:
+        response = httpx.post(
+            f"{str(self.config.upstream_base_url).rstrip('/')}/chat/completions",
+            json=body,
+            headers={
+                "Authorization": f"Bearer {self.config.upstream_api_key or 'not-needed'}"
+            },
+            timeout=self.config.upstream_timeout_s,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+class LLMStandInServer:
+    """Serve one `LLMStandIn` on a local port from a background thread."""
+
+    def __init__(
+        self,
+        stand_in: LLMStandIn,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+    ) -> None:
+        self.stand_in = stand_in
+        self._server = ThreadingHTTPServer((host, port), _build_handler(stand_in))
+        self._server.daemon_threads = True
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "LLMStandInServer":
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            name="llm-stand-in",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LLMStandInServer":
+        return self.start()
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.stop()
+
+
+def request_key(body: dict[str, Any]) -> str:
+    return payload_hash(body)
+
+
+def synthesize_completion(body: dict[str, Any], *, key: str) -> dict[str, Any]:
+    """Return a chat completion whose content satisfies the request schema."""
+
+    schema = request_json_schema(body)
+    content = stable_json_dumps(
+        synthesize_from_schema(schema) if schema is not None else {}
+    )
+    prompt_chars = len(stable_json_dumps(body.get("messages") or []))
+    prompt_tokens = max(1, prompt_chars // 4)
+    completion_tokens = max(1, len(content) // 4)
+    return {
+        "id": f"chatcmpl-{key[:24]}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": str(body.get("model") or "stand-in"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def request_json_schema(body: dict[str, Any]) -> dict[str, Any] | None:
+    """Find the response schema in `response_format` or a schema-anchored prompt."""
+
+    response_format = body.get("response_format")
+    if isinstance(response_format, dict) and response_format.get("type") == "json_schema":
+        schema = (response_format.get("json_schema") or {}).get("schema")
+        if isinstance(schema, dict):
+            return schema
+    for message in reversed(body.get("messages") or []):
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, str) or _SCHEMA_ANCHOR not in content:
+            continue
+        schema_text = content.rsplit(_SCHEMA_ANCHOR, 1)[1].lstrip()
+        try:
+            schema, _ = json.JSONDecoder().raw_decode(schema_text)
+        except json.JSONDecodeError:
+            return None
+        return schema if isinstance(schema, dict) else None
+    return None
+
+
+def synthesize_from_schema(
+    schema: dict[str, Any],
+    *,
+    root: dict[str, Any] | None = None,
+) -> Any:
+    """Build the smallest deterministic instance accepted by a JSON schema."""
+
+    root = root or schema
+    if "$ref" in schema:
+        return synthesize_from_schema(_resolve_ref(root, schema["$ref"]), root=root)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    for combinator in ("anyOf", "oneOf"):
+        options = schema.get(combinator)
+        if options:
+            for option in options:
+                if option.get("type") == "null":
+                    return None
+            return synthesize_from_schema(options[0], root=root)
+    if schema.get("allOf"):
+        merged: dict[str, Any] = {}
+        for part in schema["allOf"]:
+            resolved = synthesize_from_schema(part, root=root)
+            if isinstance(resolved, dict):
+                merged.update(resolved)
+        return merged
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        if "null" in schema_type:
+            return None
+        schema_type = schema_type[0]
+    if schema_type == "object" or "properties" in schema:
+        properties = schema.get("properties") or {}
+        return {
+            name: synthesize_from_schema(properties[name], root=root)
+            for name in schema.get("required") or ()
+            if name in properties
+        }
+    if schema_type == "array":
+        item_schema = schema.get("items") or {}
+        return [
+            synthesize_from_schema(item_schema, root=root)
+            for _ in range(int(schema.get("minItems") or 0))
+        ]
+    if schema_type == "string":
+        return "x" * int(schema.get("minLength") or 0)
+    if schema_type in {"integer", "number"}:
+        value = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        if "exclusiveMinimum" in schema and "minimum" not in schema:
+            value = value + 1 if schema_type == "integer" else value + 1e-6
+        return int(value) if schema_type == "integer" else float(value)
+    if schema_type == "boolean":
+        return False
+    return None
+
+
+def _resolve_ref(root: dict[str, Any], ref: str) -> dict[str, Any]:
+    if not ref.startswith("#/"):
+        raise ValueError(f"unsupported JSON schema reference: {ref}")
+    node: Any = root
+    for part in ref[2:].split("/"):
+        node = node[part]
+    return node
+
+
+def _response_format_name(body: dict[str, Any]) -> str:
+    response_format = body.get("response_format")
+    if not isinstance(response_format, dict):
+        return "text"
+    if response_format.get("type") == "json_schema":
+        return str((response_format.get("json_schema") or {}).get("name") or "json_schema")
+    return str(response_format.get("type") or "text")
+
+
+def _error_response(status: int) -> tuple[int, dict[str, str], dict[str, Any]]:
+    headers = (
+        {"retry-after-ms": str(_THROTTLE_RETRY_AFTER_MS)} if status == 429 else {}
+    )
+    return (
+        status,
+        headers,
+        {"error": {"type": "injected_error", "message": f"injected HTTP {status}"}},
+    )
+
+
+def _build_handler(stand_in: LLMStandIn) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send(404, {}, {"error": {"message": f"unknown path: {self.path}"}})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                self._send(400, {}, {"error": {"message": "request body is not JSON"}})
+                return
+            try:
+                status, headers, payload = stand_in.handle(body)
+            except httpx.HTTPError as exc:
+                status, headers, payload = 502, {}, {"error": {"message": str(exc)}}
+            self._send(status, headers, payload)
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.rstrip("/").endswith("/models"):
+                self._send(
+                    200,
+                    {},
+                    {"object": "list", "data": [{"id": "stand-in", "object": "model"}]},
+                )
+                return
+            self._send(404, {}, {"error": {"message": f"unknown path: {self.path}"}})
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+        def _send(self, status: int, headers: dict[str, str], payload: Any) -> None:
+            encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+    return Handler
+
+
+def add_stand_in_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        help="JSONL cassette of recorded completions keyed by request hash.",
+    )
+    parser.add_argument(
+        "--llm-mode",
+        choices=LLM_MODES,
+        default="replay",
+        help="Replay recorded completions, or record misses from --upstream-base-url.",
+    )
+    parser.add_argument(
+        "--on-miss",
+        choices=ON_MISS_POLICIES,
+        default="synthesize",
+        help="Replay behavior for unrecorded requests. Defaults to synthesize.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Synthetic latency added to every stand-in response.",
+    )
+    parser.add_argument(
+        "--latency-jitter-ms",
+        type=float,
+        default=0.0,
+        help="Uniform random latency added on top of --latency-ms.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with --error-status before lookup.",
+    )
+    parser.add_argument(
+        "--error-status",
+        type=int,
+        default=429,
+        help="HTTP status used for injected errors. Defaults to 429.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for latency jitter and error injection.",
+    )
+    parser.add_argument(
+        "--upstream-base-url",
+        help="Provider base URL used to record cassette misses in record mode.",
+    )
+    parser.add_argument(
+        "--upstream-api-key",
+        help="Provider API key used in record mode.",
+    )
+
+
+def stand_in_config_from_args(args: argparse.Namespace) -> StandInConfig:
+    try:
+        return StandInConfig(
+            mode=args.llm_mode,
+            on_miss=args.on_miss,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+            upstream_base_url=args.upstream_base_url,
+            upstream_api_key=args.upstream_api_key,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serve an offline OpenAI-compatible chat completion stand-in backed by "
+            "a record/replay cassette."
+        )
+    )
+    add_stand_in_arguments(parser)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=8089)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    stand_in = LLMStandIn(ReplayCassette(args.cassette), stand_in_config_from_args(args))
+    server = LLMStandInServer(stand_in, host=args.host, port=args.port)
+    print(f"LLM stand-in serving {server.base_url} cassette_entries={len(stand_in.cassette)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(stand_in.stats(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
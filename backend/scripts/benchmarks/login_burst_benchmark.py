@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""API latency under a login burst.
+
+A burst of concurrent logins hits the auth router while a probe loop keeps
+calling a trivial async route on the same event loop. The JSON summary
+reports login and probe latency percentiles for the current off-loop login
+path and, for comparison, a route that verifies passwords on the loop.
+Probe latency is measured from each request's scheduled send time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import tempfile
+from time import perf_counter
+from typing import Any
+
+from fastapi import FastAPI, Request
+import httpx
+
+from _common import (
+    DEFAULT_BACKEND_ROOT,
+    ensure_backend_root_on_path,
+    summarize_timings,
+    write_json_output,
+)
+
+
+BENCHMARK_USER_EMAIL = "login-burst@example.com"
+BENCHMARK_PASSWORD = "login burst password"
+DEFAULT_LOGINS = 32
+DEFAULT_USERS = 8
+DEFAULT_PROBE_INTERVAL_S = 0.005
+MODES = ("offloop", "inline")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure p50/p95/p99 latency of unrelated API requests while a burst "
+            "of logins runs on the same worker."
+        )
+    )
+    parser.add_argument("--backend-root", type=Path, default=DEFAULT_BACKEND_ROOT)
+    parser.add_argument("--logins", type=int, default=DEFAULT_LOGINS)
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=DEFAULT_USERS,
+        help="Distinct accounts the burst is spread over.",
+    )
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=DEFAULT_PROBE_INTERVAL_S,
+        help="Seconds between probe requests.",
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=MODES,
+        help="Login path to measure. Repeat for several; defaults to both.",
+    )
+    parser.add_argument("--summary-output", type=Path)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    ensure_backend_root_on_path(args.backend_root.expanduser().resolve())
+    with tempfile.TemporaryDirectory(prefix="login-burst-") as work_dir:
+        service = build_auth_service(Path(work_dir), users=args.users)
+        try:
+            results = {
+                mode: asyncio.run(
+                    run_burst(
+                        service,
+                        mode=mode,
+                        logins=args.logins,
+                        users=args.users,
+                        probe_interval_s=args.probe_interval,
+                    )
+                )
+                for mode in args.mode or MODES
+            }
+        finally:
+            service.password_workers.shutdown()
+    summary = {
+        "logins": args.logins,
+        "users": args.users,
+        "password_workers": service.password_workers.max_workers,
+        "password_max_pending": service.password_workers.max_pending,
+        "modes": results,
+    }
+    write_json_output(args.summary_output, summary)
+    for mode, result in results.items():
+        print(
+            f"{mode}: probe p99={result['probe']['p99_s']}s "
+            f"login p99={result['login']['p99_s']}s "
+            f"status={result['login_status_counts']}",
+            flush=True,
+        )
+    return 0
+
+
+def build_auth_service(work_dir: Path, *, users: int) -> Any:
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import URL, create_engine
+
+    from application.auth import AuthSessionService, LoginThrottle
+    from infra.persistence.database import build_session_factory
+    from infra.persistence.postgres.auth_repository import PostgresAuthRepository
+
+    engine = create_engine(
+        URL.create("sqlite+pysqlite", database=str(work_dir / "auth.sqlite")),
+        connect_args={"check_same_thread": False},
+    )
+    config = Config(str(DEFAULT_BACKEND_ROOT / "alembic.ini"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+    service = AuthSessionService(
+        PostgresAuthRepository(build_session_factory(engine)),
+        # The burst deliberately reuses accounts; measure hashing, not throttling.
+        login_throttle=LoginThrottle(max_attempts=1_000_000),
+    )
+    for index in range(users):
+        service.create_user(email=_user_email(index), password=BENCHMARK_PASSWORD)
+    return service
+
+
+async def run_burst(
+    service: Any,
+    *,
+    mode: str,
+    logins: int,
+    users: int,
+    probe_interval_s: float,
+) -> dict[str, Any]:
+    from controllers import auth
+
+    app = FastAPI()
+    app.state.auth_session_service = service
+    app.include_router(auth.router)
+
+    @app.get("/probe")
+    async def probe() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/inline-login")
+    async def inline_login(request: Request) -> dict[str, bool]:
+        payload = await request.json()
+        request.app.state.auth_session_service.login(
+            email=payload["email"],
+            password=payload["password"],
+        )
+        return {"ok": True}
+
+    login_path = "/auth/login" if mode == "offloop" else "/inline-login"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login_samples: list[float] = []
+        probe_samples: list[float] = []
+        status_counts: dict[str, int] = {}
+        burst_done = asyncio.Event()
+
+        async def _login(index: int) -> None:
+            started = perf_counter()
+            response = await client.post(
+                login_path,
+                json={"email": _user_email(index % users), "password": BENCHMARK_PASSWORD},
+            )
+            login_samples.append(perf_counter() - started)
+            key = str(response.status_code)
+            status_counts[key] = status_counts.get(key, 0) + 1
+
+        async def _probe() -> None:
+            # Latency counts from the scheduled send time, so requests that
+            # could not even start while the loop was blocked are included.
+            origin = perf_counter()
+            tick = 0
+            while not burst_done.is_set():
+                scheduled = origin + tick * probe_interval_s
+                await asyncio.sleep(max(0.0, scheduled - perf_counter()))
+                await client.get("/probe")
+                probe_samples.append(perf_counter() - scheduled)
+                tick += 1
+
+        probe_task = asyncio.create_task(_probe())
+        started = perf_counter()
+        await asyncio.gather(*(_login(index) for index in range(logins)))
+        wall_s = perf_counter() - started
+        burst_done.set()
+        await probe_task
+
+    return {
+        "wall_s": round(wall_s, 6),
+        "login": summarize_timings(login_samples),
+        "probe": summarize_timings(probe_samples),
+        "login_status_counts": status_counts,
+    }
+
+
+def _user_email(index: int) -> str:
+    local, _, domain = BENCHMARK_USER_EMAIL.partition("@")
+    return f"{local}-{index}@{domain}"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
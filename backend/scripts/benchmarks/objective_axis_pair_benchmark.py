@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+from time import perf_counter
+from typing import Any
+
+from _common import (
+    DEFAULT_BACKEND_ROOT,
+    ensure_backend_root_on_path,
+    summarize_timings,
+    write_json_output,
+)
+
+
+DEFAULT_SIZES = (500, 1000, 2500, 5000, 10000)
+DEFAULT_REPEATS = 3
+DEFAULT_SEED = 20260419
+RELATIONSHIPS_PER_DOCUMENT = 8
+
+_MATERIALS = (
+    "316L stainless steel",
+    "316L",
+    "AISI 316L",
+    "Ti-6Al-4V",
+    "Ti64",
+    "AlSi10Mg",
+    "IN718",
+    "17-4PH stainless steel",
+    "not reported",
+)
+_PROCESS_TERMS = (
+    "laser power",
+    "scan speed",
+    "scanning speed",
+    "hatch spacing",
+    "layer thickness",
+    "volumetric energy density",
+    "build orientation",
+    "base plate preheating",
+    "annealing temperature",
+    "annealing duration",
+    "heat treatment temperature",
+    "hot isostatic pressing",
+    "powder feed rate",
+    "scan strategy",
+    "scanning strategy",
+)
+_OUTCOME_TERMS = (
+    "relative density",
+    "porosity",
+    "yield strength",
+    "ultimate tensile strength",
+    "UTS",
+    "elongation",
+    "microhardness",
+    "surface roughness",
+    "residual stress",
+    "grain size",
+    "corrosion potential",
+    "fatigue limit",
+)
+_QUALIFIERS = (
+    "",
+    "",
+    "",
+    "nominal",
+    "effective",
+    "local",
+    "average",
+    "maximum",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure cross-paper axis pair discovery on synthetic relationship "
+            "inventories. This script runs offline and does not call a model."
+        )
+    )
+    parser.add_argument(
+        "--backend-root",
+        type=Path,
+        help="Optional backend root override. Defaults to the repo-local backend root.",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help=(
+            "Comma-separated relationship counts. Defaults to "
+            f"{','.join(str(size) for size in DEFAULT_SIZES)}."
+        ),
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help=f"Timed repeats per size. Defaults to {DEFAULT_REPEATS}.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Synthetic inventory seed. Defaults to {DEFAULT_SEED}.",
+    )
+    parser.add_argument("--summary-output", type=Path)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    backend_root = (
+        args.backend_root.expanduser().resolve()
+        if args.backend_root is not None
+        else DEFAULT_BACKEND_ROOT
+    )
+    sizes = parse_sizes(args.sizes)
+    if args.repeats <= 0:
+        raise SystemExit("--repeats must be greater than 0")
+    ensure_backend_root_on_path(backend_root)
+
+    summary = {
+        "benchmark": "objective_axis_pair_discovery",
+        "seed": args.seed,
+        "repeats": args.repeats,
+        "results": [
+            run_size(size, repeats=args.repeats, seed=args.seed) for size in sizes
+        ],
+    }
+    write_json_output(args.summary_output, summary)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+def parse_sizes(value: str) -> list[int]:
+    sizes = [int(item) for item in str(value).split(",") if item.strip()]
+    if not sizes or any(size <= 0 for size in sizes):
+        raise SystemExit("--sizes must list positive relationship counts")
+    return sizes
+
+
+def build_synthetic_paper_skims(
+    relationship_count: int,
+    *,
+    seed: int,
+) -> tuple[Any, ...]:
+    """Return deterministic paper skims with about `relationship_count` relationships."""
+
+    from domain.core import PaperSkim
+
+    generator = random.Random(seed)
+    skims = []
+    for document_index in range(
+        max(1, -(-relationship_count // RELATIONSHIPS_PER_DOCUMENT))
+    ):
+        first_relationship = document_index * RELATIONSHIPS_PER_DOCUMENT
+        relationship_indexes = range(
+            first_relationship,
+            min(relationship_count, first_relationship + RELATIONSHIPS_PER_DOCUMENT),
+        )
+        material_scope = generator.sample(_MATERIALS, k=generator.randint(1, 2))
+        skims.append(
+            PaperSkim.from_mapping(
+                {
+                    "document_id": f"doc-{document_index:05d}",
+                    "doc_role": "experimental",
+                    "evidence_density": "high",
+                    "confidence": 0.9,
+                    "studies": [
+                        {
+                            "study_id": f"study-{document_index:05d}",
+                            "material_scope": material_scope,
+                            "process_context": ["laser powder bed fusion"],
+                            "relationships": [
+                                {
+                                    "relationship_id": (
+                                        f"relationship-{relationship_index:06d}"
+                                    ),
+                                    "varied_factors": [
+                                        _synthetic_label(generator, _PROCESS_TERMS)
+                                        for _ in range(generator.randint(1, 2))
+                                    ],
+                                    "outcome": _synthetic_label(
+                                        generator,
+                                        _OUTCOME_TERMS,
+                                    ),
+                                    "source_refs": [
+                                        {
+                                            "source_kind": "block",
+                                            "source_ref": (
+                                                f"block-{relationship_index:06d}"
+                                            ),
+                                        }
+                                    ],
+                                    "confidence": 0.9,
+                                }
+                                for relationship_index in relationship_indexes
+                            ],
+                        }
+                    ],
+                }
+            )
+        )
+    return tuple(skims)
+
+
+def run_size(relationship_count: int, *, repeats: int, seed: int) -> dict[str, Any]:
+    from application.core.objectives.objective_candidate_service import (
+        ObjectiveCandidateService,
+    )
+
+    service = ObjectiveCandidateService()
+    inventory = service._relationship_inventory(
+        build_synthetic_paper_skims(relationship_count, seed=seed)
+    )
+    axis_candidates = service._build_relationship_axis_candidates(inventory)
+    supported_samples: list[float] = []
+    pair_samples: list[float] = []
+    supported_pairs: frozenset[Any] = frozenset()
+    axis_pairs: dict[str, Any] = {}
+    for _ in range(repeats):
+        started = perf_counter()
+        supported_pairs = service._supported_cross_paper_axis_pairs(inventory)
+        supported_samples.append(perf_counter() - started)
+        started = perf_counter()
+        axis_pairs = service._build_axis_candidate_pairs(
+            axis_candidates,
+            relationship_inventory=inventory,
+        )
+        pair_samples.append(perf_counter() - started)
+    return {
+        "relationship_count": len(inventory),
+        "axis_value_counts": {
+            axis_type: len(values) for axis_type, values in axis_candidates.items()
+        },
+        "supported_cross_paper_pair_count": len(supported_pairs),
+        "axis_pair_count": len(axis_pairs),
+        "supported_cross_paper_pairs": summarize_timings(supported_samples),
+        "axis_candidate_pairs": summarize_timings(pair_samples),
+    }
+
+
+def _synthetic_label(generator: random.Random, terms: tuple[str, ...]) -> str:
+    qualifier = generator.choice(_QUALIFIERS)
+    term = generator.choice(terms)
+    label = f"{qualifier} {term}".strip()
+    if generator.random() < 0.25:
+        label = f"{label} variant {generator.randint(1, 400)}"
+    return label
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""Offline end-to-end collection build and Objective analysis benchmark.
+
+Each fixture collection is uploaded, built through the default collection build
+pipeline, and analyzed for one Objective against a local OpenAI-compatible
+stand-in. The JSON summary reports stage timings, LLM call counts, peak RSS,
+and database row counts so before/after runs can be compared in review.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import resource
+import tempfile
+from time import perf_counter
+from typing import Any, Iterator
+
+from _common import (
+    DEFAULT_BACKEND_ROOT,
+    ensure_backend_root_on_path,
+    write_json_output,
+)
+from llm_replay_server import (
+    LLMStandIn,
+    LLMStandInServer,
+    ReplayCassette,
+    add_stand_in_arguments,
+    stand_in_config_from_args,
+)
+
+
+DEFAULT_FIXTURE_DIR = DEFAULT_BACKEND_ROOT / "tests" / "fixtures" / "pipeline_benchmark"
+DEFAULT_MODEL = "offline-stand-in"
+BENCHMARK_USER_EMAIL = "offline-benchmark@example.com"
+BENCHMARK_TOOL_CALL_ID = "offline-benchmark"
+# The stand-in answers instantly; keep the shared transport limiter out of the
+# measurement unless the caller configures provider limits explicitly.
+_UNTHROTTLED_LLM_ENV = {
+    "LLM_REQUESTS_PER_MINUTE": "1000000",
+    "LLM_TOKENS_PER_MINUTE": "1000000000",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run the collection build plus one Objective analysis over fixture "
+            "collections against an offline LLM stand-in."
+        )
+    )
+    parser.add_argument(
+        "--backend-root",
+        type=Path,
+        help="Optional backend root override. Defaults to the repo-local backend root.",
+    )
+    parser.add_argument(
+        "--fixture",
+        type=Path,
+        action="append",
+        help=(
+            "Fixture collection JSON. Repeat for several collections. Defaults to "
+            "every fixture under tests/fixtures/pipeline_benchmark/."
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        help=(
+            "SQLAlchemy URL to migrate and use. Defaults to a SQLite file in the "
+            "work directory."
+        ),
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Directory for collection files and the default SQLite database.",
+    )
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_MODEL,
+        help=f"Model name sent to the stand-in. Defaults to {DEFAULT_MODEL}.",
+    )
+    parser.add_argument(
+        "--extraction-mode",
+        default="provider_parse",
+        help=(
+            "CORE_LLM_EXTRACTION_MODE for the run. provider_parse sends response "
+            "schemas the stand-in can satisfy on cassette misses."
+        ),
+    )
+    parser.add_argument(
+        "--skip-analysis",
+        action="store_true",
+        help="Only run the collection build for each fixture.",
+    )
+    add_stand_in_arguments(parser)
+    parser.add_argument(
+        "--summary-output",
+        type=Path,
+        help="Optional JSON output path for the benchmark summary.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    backend_root = (
+        args.backend_root.expanduser().resolve()
+        if args.backend_root is not None
+        else DEFAULT_BACKEND_ROOT
+    )
+    ensure_backend_root_on_path(backend_root)
+    fixtures = load_fixtures(args.fixture or sorted(DEFAULT_FIXTURE_DIR.glob("*.json")))
+    stand_in = LLMStandIn(ReplayCassette(args.cassette), stand_in_config_from_args(args))
+
+    with _work_dir(args.work_dir) as work_dir, LLMStandInServer(stand_in) as server:
+        with _llm_environment(
+            base_url=server.base_url,
+            model=args.model,
+            extraction_mode=args.extraction_mode,
+        ):
+            summary = run_benchmark(
+                fixtures,
+                stand_in=stand_in,
+                backend_root=backend_root,
+                work_dir=work_dir,
+                database_url=args.database_url,
+                run_analysis=not args.skip_analysis,
+            )
+    summary["config"] = {
+        "llm_mode": stand_in.config.mode,
+        "on_miss": stand_in.config.on_miss,
+        "cassette": str(stand_in.cassette.path) if stand_in.cassette.path else None,
+        "latency_ms": stand_in.config.latency_ms,
+        "latency_jitter_ms": stand_in.config.latency_jitter_ms,
+        "error_rate": stand_in.config.error_rate,
+        "error_status": stand_in.config.error_status,
+        "seed": stand_in.config.seed,
+        "extraction_mode": args.extraction_mode,
+        "database": "sqlite" if args.database_url is None else "external",
+    }
+    write_json_output(args.summary_output, summary)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+def load_fixtures(paths: list[Path]) -> list[dict[str, Any]]:
+    if not paths:
+        raise SystemExit("no fixture collections found")
+    fixtures = []
+    for path in paths:
+        fixture = json.loads(path.expanduser().resolve().read_text(encoding="utf-8"))
+        if not fixture.get("papers"):
+            raise SystemExit(f"fixture has no papers: {path}")
+        fixtures.append(fixture)
+    return fixtures
+
+
+def run_benchmark(
+    fixtures: list[dict[str, Any]],
+    *,
+    stand_in: LLMStandIn,
+    backend_root: Path,
+    work_dir: Path,
+    database_url: str | None,
+    run_analysis: bool,
+) -> dict[str, Any]:
+    from fastapi.testclient import TestClient
+
+    engine = build_migrated_engine(
+        database_url or f"sqlite+pysqlite:///{work_dir / 'benchmark.sqlite'}",
+        backend_root=backend_root,
+    )
+    try:
+        app, repositories = build_application(engine, work_dir=work_dir)
+        with TestClient(app):
+            user = app.state.auth_session_service.create_user(
+                email=BENCHMARK_USER_EMAIL,
+                password="offline-benchmark",
+            )
+            results = [
+                run_collection(
+                    fixture,
+                    app=app,
+                    repositories=repositories,
+                    stand_in=stand_in,
+                    user_id=str(user["user_id"]),
+                    run_analysis=run_analysis,
+                )
+                for fixture in fixtures
+            ]
+        db_rows = count_database_rows(engine)
+    finally:
+        engine.dispose()
+    return {
+        "benchmark": "offline_pipeline",
+        "collections": results,
+        "llm_stand_in": stand_in.stats(),
+        "peak_rss_mb": peak_rss_mb(),
+        "db_rows": db_rows,
+        "db_row_total": sum(db_rows.values()),
+    }
+
+
+def build_migrated_engine(database_url: str, *, backend_root: Path) -> Any:
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+    if is_sqlite:
+        # Repository replacements rely on ON DELETE CASCADE.
+        @event.listens_for(engine, "connect")
+        def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    config = Config(str(backend_root / "alembic.ini"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+    return engine
+
+
+def build_application(engine: Any, *, work_dir: Path) -> tuple[Any, dict[str, Any]]:
+    """Compose the production app around explicit repositories for one engine."""
+
+    from application.auth import AuthSessionService
+    from application.source.collection_service import CollectionService
+    from application.source.task_service import TaskService
+    from infra.persistence.database import build_session_factory
+    from infra.persistence.file import FileCollectionWorkspace
+    from infra.persistence.postgres.auth_repository import PostgresAuthRepository
+    from infra.persistence.postgres.build_repository import PostgresBuildRepository
+    from infra.persistence.postgres.chat_repository import PostgresChatRepository
+    from infra.persistence.postgres.collection_repository import (
+        PostgresCollectionRepository,
+    )
+    from infra.persistence.postgres.experiment_plan_repository import (
+        PostgresExperimentPlanRepository,
+    )
+    from infra.persistence.postgres.finding_review_repository import (
+        PostgresFindingReviewRepository,
+    )
+    from infra.persistence.postgres.objective_repository import (
+        PostgresObjectiveRepository,
+    )
+    from infra.persistence.postgres.paper_fact_repository import (
+        PostgresPaperFactRepository,
+    )
+    from infra.persistence.postgres.source_artifact_repository import (
+        PostgresSourceArtifactRepository,
+    )
+    from main import create_app
+
+    session_factory = build_session_factory(engine)
+    repositories = {
+        "source_artifact_repository": PostgresSourceArtifactRepository(session_factory),
+        "objective_repository": PostgresObjectiveRepository(session_factory),
+    }
+    app = create_app(
+        auth_session_service=AuthSessionService(
+            PostgresAuthRepository(session_factory)
+        ),
+        collection_service=CollectionService(
+            repository=PostgresCollectionRepository(session_factory),
+            workspace=FileCollectionWorkspace(work_dir / "collections"),
+        ),
+        task_service=TaskService(PostgresBuildRepository(session_factory)),
+        paper_fact_repository=PostgresPaperFactRepository(session_factory),
+        finding_review_repository=PostgresFindingReviewRepository(session_factory),
+        experiment_plan_repository=PostgresExperimentPlanRepository(session_factory),
+        chat_repository=PostgresChatRepository(session_factory),
+        **repositories,
+    )
+    return app, repositories
+
+
+def run_collection(
+    fixture: dict[str, Any],
+    *,
+    app: Any,
+    repositories: dict[str, Any],
+    stand_in: LLMStandIn,
+    user_id: str,
+    run_analysis: bool,
+) -> dict[str, Any]:
+    state = app.state
+    collection = state.collection_service.create_collection(
+        str(fixture["name"]),
+        fixture.get("description"),
+        owner_user_id=user_id,
+    )
+    collection_id = str(collection["collection_id"])
+    for paper in fixture["papers"]:
+        state.collection_service.add_file(
+            collection_id=collection_id,
+            filename=str(paper["filename"]),
+            content=str(paper["text"]).encode("utf-8"),
+            media_type="text/plain",
+        )
+
+    llm_before = stand_in.stats()
+    task = state.task_service.create_task(collection_id, "build")
+    started_at = perf_counter()
+    state.build_pipeline_service.run_task_blocking(task["task_id"], collection_id)
+    build_wall_s = perf_counter() - started_at
+    pipeline_run = state.task_service.read_pipeline_run(task["task_id"])
+    result: dict[str, Any] = {
+        "name": fixture["name"],
+        "paper_count": len(fixture["papers"]),
+        "build": {
+            "status": str(pipeline_run.status),
+            "wall_s": round(build_wall_s, 6),
+            "stages": [_stage_summary(node) for node in pipeline_run.nodes],
+            "llm": stats_delta(stand_in.stats(), llm_before),
+            "peak_rss_mb": peak_rss_mb(),
+        },
+    }
+    if run_analysis:
+        llm_before = stand_in.stats()
+        result["objective_analysis"] = run_objective_analysis(
+            fixture,
+            app=app,
+            repositories=repositories,
+            collection_id=collection_id,
+            user_id=user_id,
+        )
+        result["objective_analysis"]["llm"] = stats_delta(
+            stand_in.stats(),
+            llm_before,
+        )
+        result["objective_analysis"]["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def run_objective_analysis(
+    fixture: dict[str, Any],
+    *,
+    app: Any,
+    repositories: dict[str, Any],
+    collection_id: str,
+    user_id: str,
+) -> dict[str, Any]:
+    """Analyze the first discovered candidate, or the fixture's authored one."""
+
+    objective_repository = repositories["objective_repository"]
+    objectives = objective_repository.list_objectives(collection_id)
+    objective = objectives[0] if objectives else None
+    source = "discovered"
+    if objective is None:
+        objective = objective_repository.create_authored_candidate(
+            _fixture_objective(
+                fixture,
+                collection_id=collection_id,
+                user_id=user_id,
+                document_ids=[
+                    document.document_id
+                    for document in repositories[
+                        "source_artifact_repository"
+                    ].read_collection_documents(collection_id)
+                ],
+            ),
+            created_by_user_id=user_id,
+            created_by_tool_call_id=_benchmark_tool_call_id(collection_id),
+        )
+        source = "fixture"
+
+    service = app.state.objective_analysis_service
+    service.confirm_objective(collection_id, objective.objective_id)
+    queued = service.queue_analysis(collection_id, objective.objective_id)
+    analysis_version = queued["analysis"].analysis_version
+    started_at = perf_counter()
+    service.execute_queued_analysis(
+        collection_id,
+        objective.objective_id,
+        analysis_version,
+    )
+    wall_s = perf_counter() - started_at
+    analysis = objective_repository.read_analysis(
+        collection_id,
+        objective.objective_id,
+        analysis_version,
+    )
+    return {
+        "objective_source": source,
+        "status": analysis.status if analysis is not None else None,
+        "error_code": analysis.error_code if analysis is not None else None,
+        "wall_s": round(wall_s, 6),
+        "stats": analysis.stats.to_record() if analysis is not None else None,
+    }
+
+
+def stats_delta(after: dict[str, Any], before: dict[str, Any]) -> dict[str, Any]:
+    """Subtract two stand-in stat snapshots, dropping zero counters."""
+
+    delta: dict[str, Any] = {}
+    for name, value in after.items():
+        if isinstance(value, dict):
+            nested = stats_delta(value, before.get(name) or {})
+            delta[name] = nested
+        else:
+            delta[name] = value - before.get(name, 0)
+    return {
+        name: value
+        for name, value in delta.items()
+        if isinstance(value, dict) or value
+    }
+
+
+def count_database_rows(engine: Any) -> dict[str, int]:
+    from sqlalchemy import func, inspect, select, table
+
+    counts: dict[str, int] = {}
+    with engine.connect() as connection:
+        for table_name in sorted(inspect(connection).get_table_names()):
+            if table_name == "alembic_version":
+                continue
+            count = connection.execute(
+                select(func.count()).select_from(table(table_name))
+            ).scalar_one()
+            if count:
+                counts[table_name] = int(count)
+    return counts
+
+
+def peak_rss_mb() -> float:
+    # Linux reports ru_maxrss in KiB.
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 3)
+
+
+def _fixture_objective(
+    fixture: dict[str, Any],
+    *,
+    collection_id: str,
+    user_id: str,
+    document_ids: list[str],
+) -> Any:
+    from domain.core import ResearchObjective
+
+    objective = fixture.get("objective")
+    if not isinstance(objective, dict):
+        raise SystemExit(
+            f"fixture {fixture['name']!r} discovered no Objective and defines none"
+        )
+    return ResearchObjective.from_mapping(
+        {
+            **objective,
+            "collection_id": collection_id,
+            "seed_document_ids": document_ids,
+            "confidence": 0,
+            "origin": "chat_assisted",
+            "created_by_user_id": user_id,
+            "created_by_tool_call_id": _benchmark_tool_call_id(collection_id),
+            "reason": "Offline benchmark fixture Objective.",
+        }
+    )
+
+
+def _benchmark_tool_call_id(collection_id: str) -> str:
+    return f"{BENCHMARK_TOOL_CALL_ID}-{collection_id}"
+
+
+def _stage_summary(node: Any) -> dict[str, Any]:
+    return {
+        "name": node.name,
+        "status": str(node.status),
+        "duration_ms": node.stats.duration_ms,
+        "llm_request_count": sum(
+            usage.request_count for usage in node.stats.model_usage
+        ),
+        "warnings": list(node.warnings),
+        "errors": list(node.errors),
+    }
+
+
+@contextmanager
+def _work_dir(work_dir: Path | None) -> Iterator[Path]:
+    if work_dir is not None:
+        resolved = work_dir.expanduser().resolve()
+        resolved.mkdir(parents=True, exist_ok=True)
+        yield resolved
+        return
+    with tempfile.TemporaryDirectory(prefix="lens-offline-benchmark-") as directory:
+        yield Path(directory)
+
+
+@contextmanager
+def _llm_environment(
+    *,
+    base_url: str,
+    model: str,
+    extraction_mode: str,
+) -> Iterator[None]:
+    overrides = {
+        "LLM_BASE_URL": base_url,
+        "LLM_API_KEY": "offline-benchmark",
+        "LLM_MODEL": model,
+        "CORE_LLM_EXTRACTION_MODE": extraction_mode,
+        **{
+            name: value
+            for name, value in _UNTHROTTLED_LLM_ENV.items()
+            if not os.getenv(name)
+        },
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
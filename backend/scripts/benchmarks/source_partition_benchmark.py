@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""Document-tree reads and build deletes over large Source structure tables.
+
+Seeds several builds of synthetic Source structure (text units, blocks,
+their link rows, and table cells) into a migrated scratch database, then
+times per-document block and text-unit reads against one build and the
+removal of whole builds. One build is purged through
+`PostgresBuildRepository.purge_build_rows`, which drops its partitions on
+PostgreSQL; another is drained with plain batched deletes for comparison.
+Pass `--database-url` for a PostgreSQL run; the SQLite default only checks
+the script end to end.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import json
+from hashlib import sha256
+from pathlib import Path
+import tempfile
+from time import perf_counter
+from typing import Any, Iterator
+
+from _common import (
+    DEFAULT_BACKEND_ROOT,
+    ensure_backend_root_on_path,
+    summarize_timings,
+    write_json_output,
+)
+
+
+BENCHMARK_COLLECTION_ID = "col_partition_benchmark"
+BENCHMARK_USER_ID = "user_partition_benchmark"
+BENCHMARK_NOW = "2026-10-19T00:00:00+00:00"
+DEFAULT_BUILDS = 4
+DEFAULT_DOCUMENTS = 20
+DEFAULT_BLOCKS_PER_DOCUMENT = 2500
+DEFAULT_TABLE_COLUMNS = 5
+DEFAULT_REPEAT = 3
+DEFAULT_BATCH_SIZE = 5000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure document-tree reads and build deletes over partitioned "
+            "Source structure tables. Defaults seed about 1.2M rows."
+        )
+    )
+    parser.add_argument("--backend-root", type=Path, default=DEFAULT_BACKEND_ROOT)
+    parser.add_argument(
+        "--database-url",
+        help="Scratch database to migrate and seed. Defaults to SQLite in a temp dir.",
+    )
+    parser.add_argument("--builds", type=int, default=DEFAULT_BUILDS)
+    parser.add_argument("--documents", type=int, default=DEFAULT_DOCUMENTS)
+    parser.add_argument(
+        "--blocks-per-document",
+        type=int,
+        default=DEFAULT_BLOCKS_PER_DOCUMENT,
+        help="Blocks and text units per document; table cells match this count.",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--summary-output", type=Path)
+    args = parser.parse_args()
+    if args.builds < 2:
+        parser.error("--builds must be at least 2 to compare delete paths")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    backend_root = args.backend_root.expanduser().resolve()
+    ensure_backend_root_on_path(backend_root)
+    with _database_url(args.database_url) as database_url:
+        engine = build_migrated_engine(database_url, backend_root=backend_root)
+        try:
+            summary = run_benchmark(engine, args)
+        finally:
+            engine.dispose()
+    write_json_output(args.summary_output, summary)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+def run_benchmark(engine: Any, args: argparse.Namespace) -> dict[str, Any]:
+    from infra.persistence.database import build_session_factory
+    from infra.persistence.postgres.build_repository import PostgresBuildRepository
+    from infra.persistence.postgres.source_artifact_repository import (
+        PostgresSourceArtifactRepository,
+    )
+
+    sessions = build_session_factory(engine)
+    builds = PostgresBuildRepository(sessions)
+    source = PostgresSourceArtifactRepository(sessions)
+    document_ids = seed_collection(sessions, documents=args.documents)
+
+    seed_started = perf_counter()
+    build_ids = []
+    for build_index in range(args.builds):
+        build_id = f"build_partition_{build_index:03d}"
+        builds.add_task(_task(f"task_partition_{build_index:03d}"), build_id=build_id)
+        source.replace_collection_documents(
+            BENCHMARK_COLLECTION_ID,
+            build_id,
+            synthetic_documents(
+                document_ids,
+                blocks_per_document=args.blocks_per_document,
+            ),
+        )
+        build_ids.append(build_id)
+    seed_s = perf_counter() - seed_started
+    row_counts = builds.count_build_rows(build_ids[0])
+
+    read_build_id = build_ids[-1]
+    block_reads: list[float] = []
+    text_unit_reads: list[float] = []
+    for _ in range(max(args.repeat, 1)):
+        for document_id in document_ids:
+            started = perf_counter()
+            source.list_blocks(
+                BENCHMARK_COLLECTION_ID, document_id, build_id=read_build_id
+            )
+            block_reads.append(perf_counter() - started)
+            started = perf_counter()
+            source.list_text_units(
+                BENCHMARK_COLLECTION_ID, document_id, build_id=read_build_id
+            )
+            text_unit_reads.append(perf_counter() - started)
+
+    return {
+        "dialect": engine.dialect.name,
+        "config": {
+            "builds": args.builds,
+            "documents": args.documents,
+            "blocks_per_document": args.blocks_per_document,
+            "repeat": args.repeat,
+            "batch_size": args.batch_size,
+        },
+        "seed_s": round(seed_s, 4),
+        "rows_per_build": row_counts,
+        "rows_total": sum(row_counts.values()) * args.builds,
+        "document_block_reads": summarize_timings(block_reads),
+        "document_text_unit_reads": summarize_timings(text_unit_reads),
+        "build_delete": {
+            "repository": purge_with_repository(
+                builds, build_ids[0], batch_size=args.batch_size
+            ),
+            "batched": purge_with_batched_deletes(
+                builds, build_ids[1], batch_size=args.batch_size
+            ),
+        },
+    }
+
+
+def purge_with_repository(
+    builds: Any,
+    build_id: str,
+    *,
+    batch_size: int,
+) -> dict[str, Any]:
+    """Purge through the retention path, which drops partitions when it can."""
+
+    started = perf_counter()
+    batches = 0
+    table = None
+    while True:
+        progress = builds.purge_build_rows(
+            build_id, batch_size=batch_size, start_table=table
+        )
+        if progress.done:
+            break
+        batches += 1
+        table = progress.table
+    builds.finalize_build_purge(build_id)
+    return {"batches": batches, "elapsed_s": round(perf_counter() - started, 4)}
+
+
+def purge_with_batched_deletes(
+    builds: Any,
+    build_id: str,
+    *,
+    batch_size: int,
+) -> dict[str, Any]:
+    """Purge row by row in bounded batches, as every dialect did before."""
+
+    from infra.persistence.postgres.batched_delete import (
+        delete_next_batch,
+        dependent_tables,
+    )
+    from infra.persistence.postgres.build_partitions import (
+        PARTITIONED_SOURCE_TABLES,
+        drop_build_partitions,
+    )
+
+    tables = dependent_tables(
+        ("build_id",),
+        exclude=("collection_builds", "build_stages", "collection_active_builds"),
+    )
+    started = perf_counter()
+    batches = 0
+    table = None
+    while True:
+        table, deleted = delete_next_batch(
+            builds.session_factory,
+            tables,
+            lambda target: target.c.build_id == build_id,
+            batch_size=batch_size,
+            start_table=table,
+        )
+        if table is None:
+            break
+        batches += 1
+    elapsed_s = perf_counter() - started
+    # Drop the now empty partitions so the build can be finalized.
+    with builds.session_factory.begin() as session:
+        for table_name in reversed(PARTITIONED_SOURCE_TABLES):
+            drop_build_partitions(session, table_name, (build_id,))
+    builds.finalize_build_purge(build_id)
+    return {"batches": batches, "elapsed_s": round(elapsed_s, 4)}
+
+
+def seed_collection(sessions: Any, *, documents: int) -> list[str]:
+    from domain.source import CollectionRecord
+    from infra.persistence.postgres.auth_repository import PostgresAuthRepository
+    from infra.persistence.postgres.collection_repository import (
+        PostgresCollectionRepository,
+    )
+
+    PostgresAuthRepository(sessions).add_user(
+        {
+            "user_id": BENCHMARK_USER_ID,
+            "email": "partition-benchmark@example.com",
+            "display_name": None,
+            "password_hash": "synthetic-password-hash",
+            "created_at": BENCHMARK_NOW,
+        }
+    )
+    collections = PostgresCollectionRepository(sessions)
+    collections.add_collection(
+        CollectionRecord(
+            collection_id=BENCHMARK_COLLECTION_ID,
+            owner_user_id=BENCHMARK_USER_ID,
+            name="Partition benchmark",
+            description=None,
+            status="idle",
+            paper_count=documents,
+            created_at=BENCHMARK_NOW,
+            updated_at=BENCHMARK_NOW,
+        )
+    )
+    document_ids = []
+    for index in range(documents):
+        stored_filename = _stored_filename(index)
+        collections.add_collection_import(
+            _collection_import(stored_filename), updated_at=BENCHMARK_NOW
+        )
+        document_ids.append(f"srcdoc_{index:05d}")
+    return document_ids
+
+
+def synthetic_documents(
+    document_ids: list[str],
+    *,
+    blocks_per_document: int,
+) -> tuple[Any, ...]:
+    from domain.source import (
+        SourceBlock,
+        SourceDocument,
+        SourceTable,
+        SourceTableCell,
+        SourceTableRow,
+        SourceTextUnit,
+        assemble_source_documents,
+    )
+
+    documents = []
+    text_units = []
+    blocks = []
+    tables = []
+    table_rows = []
+    table_cells = []
+    row_count = max(blocks_per_document // DEFAULT_TABLE_COLUMNS, 1)
+    for order, document_id in enumerate(document_ids):
+        documents.append(
+            SourceDocument(
+                document_id=document_id,
+                document_order=order,
+                title=f"Paper {order}",
+                text="",
+                creation_date=BENCHMARK_NOW,
+                metadata={"source_path": _stored_filename(order)},
+            )
+        )
+        for block_order in range(blocks_per_document):
+            text_unit_id = f"tu_{document_id}_{block_order:06d}"
+            text = f"Paragraph {block_order} of {document_id}."
+            text_units.append(
+                SourceTextUnit(
+                    text_unit_id=text_unit_id,
+                    text_unit_order=order * blocks_per_document + block_order,
+                    text=text,
+                    n_tokens=6,
+                    document_ids=(document_id,),
+                )
+            )
+            blocks.append(
+                SourceBlock(
+                    block_id=f"blk_{document_id}_{block_order:06d}",
+                    document_id=document_id,
+                    block_type="paragraph",
+                    text=text,
+                    block_order=block_order,
+                    text_unit_ids=(text_unit_id,),
+                    page=block_order // 50,
+                    heading_path="Results",
+                    heading_level=1,
+                )
+            )
+        table_id = f"tbl_{document_id}"
+        tables.append(
+            SourceTable(
+                table_id=table_id,
+                document_id=document_id,
+                table_order=0,
+                caption_text="Table 1",
+                caption_block_id=None,
+                page=0,
+                heading_path="Results",
+                column_headers=tuple(
+                    f"col_{column}" for column in range(DEFAULT_TABLE_COLUMNS)
+                ),
+                table_matrix=(),
+                header_row_count=0,
+            )
+        )
+        for row_index in range(row_count):
+            table_rows.append(
+                SourceTableRow(
+                    row_id=f"row_{table_id}_{row_index:06d}",
+                    document_id=document_id,
+                    table_id=table_id,
+                    row_index=row_index,
+                    row_text=f"row {row_index}",
+                    page=0,
+                    heading_path="Results",
+                )
+            )
+            for column in range(DEFAULT_TABLE_COLUMNS):
+                table_cells.append(
+                    SourceTableCell(
+                        cell_id=f"cell_{table_id}_{row_index:06d}_{column}",
+                        document_id=document_id,
+                        table_id=table_id,
+                        row_index=row_index,
+                        col_index=column,
+                        cell_text=str(row_index * column),
+                        row_span=1,
+                        col_span=1,
+                        row_header=column == 0,
+                        header_path=f"col_{column}",
+                        page=0,
+                        unit_hint=None,
+                    )
+                )
+    return assemble_source_documents(
+        documents=tuple(documents),
+        text_units=tuple(text_units),
+        blocks=tuple(blocks),
+        tables=tuple(tables),
+        table_rows=tuple(table_rows),
+        table_cells=tuple(table_cells),
+    )
+
+
+def build_migrated_engine(database_url: str, *, backend_root: Path) -> Any:
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+    if is_sqlite:
+        # Build purges rely on ON DELETE CASCADE.
+        @event.listens_for(engine, "connect")
+        def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    config = Config(str(backend_root / "alembic.ini"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+    return engine
+
+
+def _collection_import(stored_filename: str) -> Any:
+    from domain.source import (
+        CollectionFileRecord,
+        CollectionImportDocumentRecord,
+        CollectionImportRecord,
+    )
+
+    digest = sha256(stored_filename.encode("utf-8")).hexdigest()
+    suffix = digest[:12]
+    return CollectionImportRecord(
+        import_id=f"imp_{suffix}",
+        collection_id=BENCHMARK_COLLECTION_ID,
+        channel="upload",
+        adapter_name="upload",
+        adapter_version=None,
+        raw_locator=stored_filename,
+        goal_context=None,
+        warnings=(),
+        ingested_at=BENCHMARK_NOW,
+        documents=(
+            CollectionImportDocumentRecord(
+                source_document_id=f"srcdoc_{suffix}",
+                origin_channel="upload",
+                file=CollectionFileRecord(
+                    file_id=f"file_{suffix}",
+                    collection_id=BENCHMARK_COLLECTION_ID,
+                    object_id=f"obj_{suffix}",
+                    object_kind="source_input",
+                    original_filename=stored_filename,
+                    stored_filename=stored_filename,
+                    storage_key=f"{BENCHMARK_COLLECTION_ID}/input/{stored_filename}",
+                    sha256=digest,
+                    media_type="application/pdf",
+                    status="stored",
+                    size_bytes=100,
+                    created_at=BENCHMARK_NOW,
+                ),
+                language=None,
+                ingest_status="normalized",
+                text_units=(),
+            ),
+        ),
+    )
+
+
+def _task(task_id: str) -> Any:
+    from domain.source import TaskRecord
+
+    return TaskRecord(
+        task_id=task_id,
+        collection_id=BENCHMARK_COLLECTION_ID,
+        task_type="build",
+        status="queued",
+        current_stage="queued",
+        progress_percent=0,
+        progress_detail=None,
+        output_path=None,
+        errors=(),
+        warnings=(),
+        created_at=BENCHMARK_NOW,
+        updated_at=BENCHMARK_NOW,
+        started_at=None,
+        finished_at=None,
+    )
+
+
+def _stored_filename(index: int) -> str:
+    return f"partition-paper-{index:05d}.pdf"
+
+
+@contextmanager
+def _database_url(database_url: str | None) -> Iterator[str]:
+    if database_url is not None:
+        yield database_url
+        return
+    with tempfile.TemporaryDirectory(prefix="source-partition-") as work_dir:
+        yield f"sqlite+pysqlite:///{Path(work_dir) / 'benchmark.sqlite'}"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
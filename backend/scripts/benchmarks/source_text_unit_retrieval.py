@@ -5,7 +5,9 @@ import argparse
 import json
 import os
 from pathlib import Path
+import statistics
 import sys
+from time import perf_counter
 from typing import Any
 
 import numpy as np
@@ -21,8 +23,8 @@ EMBEDDING_BATCH_SIZE = 64
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
-            "Compare TF-IDF and embedding retrieval over canonical PostgreSQL "
-            "Source text units. This benchmark does not change runtime retrieval."
+            "Compare the runtime BM25 lexical index with TF-IDF and embedding "
+            "retrieval over canonical PostgreSQL Source text units."
         )
     )
     parser.add_argument("--collection-id", required=True)
@@ -32,9 +34,80 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--embedding-model")
     parser.add_argument("--embedding-base-url")
     parser.add_argument("--embedding-api-key")
+    parser.add_argument(
+        "--skip-embeddings",
+        action="store_true",
+        help="compare only the lexical methods; no embedding provider is called",
+    )
+    parser.add_argument("--latency-repeats", type=int, default=20)
     return parser.parse_args()
 
 
+def rank_bm25(
+    corpus: list[dict[str, str]],
+    queries: list[dict[str, Any]],
+) -> dict[str, list[str]]:
+    index = _build_bm25_index(corpus)
+    text_unit_ids = sorted(item["text_unit_id"] for item in corpus)
+    rankings: dict[str, list[str]] = {}
+    for query in queries:
+        ranked = [hit.entry_id for hit in index.search(query["query"], k=len(corpus))]
+        matched = set(ranked)
+        rankings[query["id"]] = ranked + [
+            text_unit_id for text_unit_id in text_unit_ids if text_unit_id not in matched
+        ]
+    return rankings
+
+
+def measure_bm25_latency(
+    corpus: list[dict[str, str]],
+    queries: list[dict[str, Any]],
+    *,
+    k: int,
+    repeats: int,
+) -> dict[str, Any]:
+    started = perf_counter()
+    index = _build_bm25_index(corpus)
+    build_ms = (perf_counter() - started) * 1000
+    payload = index.to_bytes()
+    started = perf_counter()
+    type(index).from_bytes(payload)
+    load_ms = (perf_counter() - started) * 1000
+    query_ms: list[float] = []
+    for _ in range(max(repeats, 1)):
+        for query in queries:
+            started = perf_counter()
+            index.search(query["query"], k=k)
+            query_ms.append((perf_counter() - started) * 1000)
+    return {
+        "build_ms": round(build_ms, 3),
+        "load_ms": round(load_ms, 3),
+        "index_bytes": len(payload),
+        "query_count": len(query_ms),
+        "query_p50_ms": round(statistics.median(query_ms), 4),
+        "query_p95_ms": round(_percentile(query_ms, 0.95), 4),
+    }
+
+
+def _build_bm25_index(corpus: list[dict[str, str]]) -> Any:
+    from infra.source.retrieval import LexicalEntry, LexicalIndex  # noqa: PLC0415
+
+    return LexicalIndex.build(
+        LexicalEntry(
+            entry_id=item["text_unit_id"],
+            kind="text_unit",
+            document_id=item.get("document_id", ""),
+            text=item["text"],
+        )
+        for item in corpus
+    )
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
 def rank_tfidf(
     corpus: list[dict[str, str]],
     queries: list[dict[str, Any]],
@@ -283,7 +356,11 @@ def main() -> int:
         if filtered_document_ids.intersection(text_unit.document_ids)
     ]
     corpus = [
-        {"text_unit_id": text_unit.text_unit_id, "text": text_unit.text}
+        {
+            "text_unit_id": text_unit.text_unit_id,
+            "text": text_unit.text,
+            "document_id": next(iter(text_unit.document_ids), ""),
+        }
         for text_unit in text_units
     ]
     validate_fixture(
@@ -293,33 +370,37 @@ def main() -> int:
         locators=locators,
     )
 
-    model = args.embedding_model or os.getenv("EMBEDDING_MODEL", "").strip()
-    base_url = normalize_embedding_base_url(
-        args.embedding_base_url or os.getenv("EMBEDDING_BASE_URL", "").strip()
-    )
-    api_key = args.embedding_api_key or os.getenv("EMBEDDING_API_KEY", "").strip()
-    if not model:
-        raise SystemExit("EMBEDDING_MODEL is unresolved; set it or pass --embedding-model")
-    if not api_key and base_url:
-        api_key = "not-needed"
-    if not api_key:
-        raise SystemExit(
-            "EMBEDDING_API_KEY is unresolved; set it or pass --embedding-api-key"
-        )
-
     queries = fixture["queries"]
-    client = OpenAI(api_key=api_key, base_url=base_url or None)
-    corpus_vectors = embed_texts(client, model, [item["text"] for item in corpus])
-    query_vectors = embed_texts(client, model, [query["query"] for query in queries])
     rankings = {
+        "bm25": rank_bm25(corpus, queries),
         "tfidf": rank_tfidf(corpus, queries),
-        "embedding": rank_embeddings(
+    }
+    model = None
+    if not args.skip_embeddings:
+        model = args.embedding_model or os.getenv("EMBEDDING_MODEL", "").strip()
+        base_url = normalize_embedding_base_url(
+            args.embedding_base_url or os.getenv("EMBEDDING_BASE_URL", "").strip()
+        )
+        api_key = args.embedding_api_key or os.getenv("EMBEDDING_API_KEY", "").strip()
+        if not model:
+            raise SystemExit(
+                "EMBEDDING_MODEL is unresolved; set it or pass --embedding-model"
+            )
+        if not api_key and base_url:
+            api_key = "not-needed"
+        if not api_key:
+            raise SystemExit(
+                "EMBEDDING_API_KEY is unresolved; set it or pass --embedding-api-key"
+            )
+        client = OpenAI(api_key=api_key, base_url=base_url or None)
+        corpus_vectors = embed_texts(client, model, [item["text"] for item in corpus])
+        query_vectors = embed_texts(client, model, [query["query"] for query in queries])
+        rankings["embedding"] = rank_embeddings(
             text_unit_ids=[item["text_unit_id"] for item in corpus],
             corpus_vectors=corpus_vectors,
             query_ids=[query["id"] for query in queries],
             query_vectors=query_vectors,
-        ),
-    }
+        )
     output = {
         "schema_version": 1,
         "collection_id": args.collection_id,
@@ -328,6 +409,12 @@ def main() -> int:
         "corpus_text_unit_count": len(corpus),
         "k": args.k,
         "embedding_model": model,
+        "bm25_latency": measure_bm25_latency(
+            corpus,
+            queries,
+            k=args.k,
+            repeats=args.latency_repeats,
+        ),
         "methods": build_results(
             fixture=fixture,
             rankings=rankings,
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# ruff: noqa: E402
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+
+DEFAULT_BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(DEFAULT_BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_BACKEND_ROOT))
+
+from application.source.build_collector import (
+    BUILD_COLLECTOR_LOCK_NAME,
+    BuildGarbageCollector,
+)
+from application.source.build_retention_service import (
+    DEFAULT_KEEP_LAST_BUILDS,
+    BuildRetentionPolicy,
+    BuildRetentionService,
+)
+from application.source.collection_service import CollectionService
+from infra.persistence.database import (
+    DatabaseSettings,
+    build_database_engine,
+    build_session_factory,
+)
+from infra.persistence.file import FileCollectionWorkspace, FileSourceLexicalIndexStore
+from infra.persistence.postgres.build_repository import PostgresBuildRepository
+from infra.persistence.postgres.collection_repository import (
+    PostgresCollectionRepository,
+)
+from infra.persistence.postgres.job_lock import PostgresJobLock
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Report or delete collection builds outside the retention policy. "
+            "Runs as a dry run unless --execute is given."
+        )
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=DEFAULT_KEEP_LAST_BUILDS,
+        help="Newest builds each collection keeps besides pinned builds.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum number of expired builds to report.",
+    )
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Delete the expired builds instead of only reporting them.",
+    )
+    parser.add_argument(
+        "--backend-root",
+        type=Path,
+        default=DEFAULT_BACKEND_ROOT,
+        help="Backend root. Defaults to the repo-local backend directory.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    backend_root = args.backend_root.expanduser().resolve()
+    engine = build_database_engine(DatabaseSettings())
+    try:
+        session_factory = build_session_factory(engine)
+        collection_service = CollectionService(
+            PostgresCollectionRepository(session_factory),
+            FileCollectionWorkspace(backend_root / "data" / "collections"),
+        )
+        service = BuildRetentionService(
+            PostgresBuildRepository(session_factory),
+            collection_service,
+            FileSourceLexicalIndexStore(collection_service),
+            BuildRetentionPolicy(keep_last=args.keep_last),
+        )
+        report = service.dry_run(args.limit)
+        if args.execute:
+            collector = BuildGarbageCollector(service)
+            with PostgresJobLock(engine, BUILD_COLLECTOR_LOCK_NAME).hold() as held:
+                # An API process already collecting would race these deletes.
+                report["collector_busy"] = not held
+                while held and collector.run_once().made_progress:
+                    pass
+            report["collected_builds"] = collector.collected_builds
+            report["deleted_rows"] = collector.deleted_rows
+            report["freed_bytes"] = collector.freed_bytes
+        print(json.dumps(report, indent=2), flush=True)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
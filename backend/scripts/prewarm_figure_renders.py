@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# ruff: noqa: E402
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+
+DEFAULT_BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(DEFAULT_BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_BACKEND_ROOT))
+
+from application.source.collection_service import CollectionService
+from application.source.document_markdown_service import DocumentMarkdownService
+from infra.persistence.database import (
+    DatabaseSettings,
+    build_database_engine,
+    build_session_factory,
+)
+from infra.persistence.file import FileCollectionWorkspace, FileFigureRenderCache
+from infra.persistence.postgres.collection_repository import (
+    PostgresCollectionRepository,
+)
+from infra.persistence.postgres.source_artifact_repository import (
+    PostgresSourceArtifactRepository,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Render lazily built figure images into the figure render cache so "
+            "the first document views of hot collections do not wait on PDF crops."
+        )
+    )
+    parser.add_argument(
+        "--collection-id",
+        action="append",
+        required=True,
+        help="Collection to pre-warm. Repeat for several collections.",
+    )
+    parser.add_argument(
+        "--document-id",
+        action="append",
+        help="Optional document id filter. Repeat for several documents.",
+    )
+    parser.add_argument(
+        "--backend-root",
+        type=Path,
+        default=DEFAULT_BACKEND_ROOT,
+        help="Backend root. Defaults to the repo-local backend directory.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    backend_root = args.backend_root.expanduser().resolve()
+    engine = build_database_engine(DatabaseSettings())
+    try:
+        session_factory = build_session_factory(engine)
+        collection_service = CollectionService(
+            PostgresCollectionRepository(session_factory),
+            FileCollectionWorkspace(backend_root / "data" / "collections"),
+        )
+        service = DocumentMarkdownService(
+            collection_service=collection_service,
+            source_artifact_repository=PostgresSourceArtifactRepository(
+                session_factory
+            ),
+            figure_render_cache=FileFigureRenderCache(collection_service),
+        )
+        for collection_id in args.collection_id:
+            summary = service.prewarm_figure_images(
+                collection_id,
+                document_ids=args.document_id,
+            )
+            print(json.dumps({"collection_id": collection_id, **summary}), flush=True)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ from concurrent.futures import ThreadPoolExecutor
 from alembic import command
 from alembic.config import Config
 import pytest
-from sqlalchemy import URL, create_engine, event
+from sqlalchemy import URL, create_engine, event, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.exc import IntegrityError
 
@@ -29,10 +29,21 @@ from domain.source import (
 )
 from infra.persistence.database import build_session_factory
 from infra.persistence.postgres.auth_repository import PostgresAuthRepository
+from infra.persistence.postgres.build_partitions import (
+    PARTITIONED_SOURCE_TABLES,
+    PartitionDrop,
+    drop_build_partitions,
+    partition_name,
+)
 from infra.persistence.postgres.build_repository import PostgresBuildRepository
 from infra.persistence.postgres.collection_repository import (
     PostgresCollectionRepository,
 )
+from infra.persistence.postgres.models.evaluation import (
+    EvaluationPredictionSnapshotRecord,
+)
+from infra.persistence.postgres.models.objective import ObjectiveBuild
+from infra.persistence.postgres.models.source import SourceTextUnit
 from tests.integration.persistence.database_cleanup import reset_postgres_schema
 
 
@@ -357,3 +368,194 @@ def test_postgresql_serializes_concurrent_successful_activation() -> None:
     finally:
         reset_postgres_schema(engine)
         engine.dispose()
+
+
+def _finish(build_repository, task_id: str, finished_at: str):
+    task = _task(task_id, created_at="2026-07-19T10:00:00+00:00")
+    build = build_repository.add_task(task, build_id=task_id.replace("task", "build"))
+    build_repository.update_task(
+        task,
+        stages=(
+            replace(
+                _stage(build.build_id, "source_artifacts", 0),
+                stage_id=f"stage_{task_id}",
+            ),
+        ),
+    )
+    return build_repository.finish_build(
+        replace(
+            task,
+            status="completed",
+            current_stage="artifacts_ready",
+            progress_percent=100,
+            updated_at=finished_at,
+            finished_at=finished_at,
+        ),
+        build_status="succeeded",
+        activate=True,
+    )
+
+
+def test_expired_builds_are_purged_in_batches_around_pinned_builds(
+    build_repository,
+) -> None:
+    pinned = _finish(build_repository, "task_pinned", "2026-07-19T11:00:00+00:00")
+    expired = _finish(build_repository, "task_expired", "2026-07-19T12:00:00+00:00")
+    active = _finish(build_repository, "task_active", "2026-07-19T13:00:00+00:00")
+    with build_repository.session_factory.begin() as session:
+        session.add(
+            EvaluationPredictionSnapshotRecord(
+                snapshot_id="snapshot_pinned",
+                collection_id="col_builds",
+                target_layer="core",
+                fact_source="paper_facts",
+                system_context={},
+                artifact_counts={},
+                created_at=datetime(2026, 7, 19, 11, 30, tzinfo=timezone.utc),
+            )
+        )
+        session.add_all(
+            ObjectiveBuild(
+                build_id=build.build_id,
+                collection_id="col_builds",
+                research_objectives_ready=True,
+            )
+            for build in (pinned, expired)
+        )
+
+    assert build_repository.list_expired_builds(keep_last=1) == (expired,)
+    assert build_repository.count_build_rows(expired.build_id) == {
+        "objective_builds": 1
+    }
+    with pytest.raises(ValueError, match="build is retained"):
+        build_repository.purge_build_rows(active.build_id)
+
+    progress = build_repository.purge_build_rows(expired.build_id, batch_size=1)
+    assert (progress.table, progress.deleted_rows, progress.done) == (
+        "objective_builds",
+        1,
+        False,
+    )
+    assert build_repository.purge_build_rows(
+        expired.build_id,
+        start_table=progress.table,
+    ).done
+    assert build_repository.finalize_build_purge(expired.build_id) is True
+
+    assert build_repository.read_task(expired.task_id) is None
+    assert build_repository.list_stages(expired.task_id) == ()
+    assert build_repository.count_build_rows(pinned.build_id) == {
+        "objective_builds": 1
+    }
+    assert build_repository.read_active_build("col_builds") == active
+    assert build_repository.list_expired_builds(keep_last=1) == ()
+
+
+def test_postgresql_build_purge_drops_source_partitions() -> None:
+    database_url = os.getenv("LENS_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("LENS_TEST_DATABASE_URL is not configured")
+    url = make_url(database_url)
+    if url.drivername != "postgresql+psycopg" or not str(url.database).endswith(
+        "_test"
+    ):
+        pytest.fail(
+            "LENS_TEST_DATABASE_URL must use postgresql+psycopg and a *_test database"
+        )
+
+    engine = create_engine(url)
+    try:
+        reset_postgres_schema(engine)
+        repository, _collections = _prepare_database(engine)
+        expired = _finish(repository, "task_expired", "2026-07-19T12:00:00+00:00")
+        active = _finish(repository, "task_active", "2026-07-19T13:00:00+00:00")
+        with repository.session_factory.begin() as session:
+            session.add_all(
+                SourceTextUnit(
+                    build_id=build.build_id,
+                    text_unit_id="tu-1",
+                    collection_id="col_builds",
+                    text_unit_order=0,
+                    text="Result",
+                    n_tokens=1,
+                )
+                for build in (expired, active)
+            )
+
+        def partitions(build_id: str) -> set[str]:
+            with engine.connect() as connection:
+                return {
+                    table_name
+                    for table_name in PARTITIONED_SOURCE_TABLES
+                    if connection.scalar(
+                        text("SELECT to_regclass(:name)"),
+                        {"name": partition_name(table_name, build_id)},
+                    )
+                }
+
+        assert partitions(expired.build_id) == set(PARTITIONED_SOURCE_TABLES)
+        table = None
+        while True:
+            progress = repository.purge_build_rows(
+                expired.build_id, start_table=table
+            )
+            if progress.done:
+                break
+            table = progress.table
+        assert repository.finalize_build_purge(expired.build_id) is True
+
+        assert partitions(expired.build_id) == set()
+        assert partitions(active.build_id) == set(PARTITIONED_SOURCE_TABLES)
+        assert repository.count_build_rows(active.build_id) == {
+            "source_text_units": 1
+        }
+    finally:
+        reset_postgres_schema(engine)
+        engine.dispose()
+
+
+def test_postgresql_partition_drop_gives_up_while_the_parent_is_in_use() -> None:
+    database_url = os.getenv("LENS_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("LENS_TEST_DATABASE_URL is not configured")
+    url = make_url(database_url)
+    if url.drivername != "postgresql+psycopg" or not str(url.database).endswith(
+        "_test"
+    ):
+        pytest.fail(
+            "LENS_TEST_DATABASE_URL must use postgresql+psycopg and a *_test database"
+        )
+
+    engine = create_engine(url)
+    try:
+        reset_postgres_schema(engine)
+        repository, _collections = _prepare_database(engine)
+        expired = _finish(repository, "task_expired", "2026-07-19T12:00:00+00:00")
+        partition = partition_name("source_table_cells", expired.build_id)
+
+        with engine.connect() as reader:
+            reader.execute(text("SELECT count(*) FROM source_table_cells"))
+            with repository.session_factory.begin() as session:
+                blocked = drop_build_partitions(
+                    session,
+                    "source_table_cells",
+                    (expired.build_id,),
+                )
+            reader.rollback()
+        with repository.session_factory.begin() as session:
+            dropped = drop_build_partitions(
+                session,
+                "source_table_cells",
+                (expired.build_id,),
+            )
+
+        assert blocked == PartitionDrop(blocked=True)
+        assert dropped == PartitionDrop(dropped=1, estimated_rows=0)
+        with engine.connect() as connection:
+            assert connection.scalar(
+                text("SELECT to_regclass(:name)"),
+                {"name": partition},
+            ) is None
+    finally:
+        reset_postgres_schema(engine)
+        engine.dispose()
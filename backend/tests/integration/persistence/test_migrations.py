@@ -18,12 +18,16 @@ from sqlalchemy.orm import sessionmaker
 
 from domain.core import Finding, ObjectiveEvidence, PaperContribution
 from infra.persistence.postgres.base import Base
+from infra.persistence.postgres.build_partitions import (
+    is_build_partition,
+    partition_name,
+)
 from infra.persistence.postgres.objective_repository import PostgresObjectiveRepository
 from tests.integration.persistence.database_cleanup import reset_postgres_schema
 
 
 BACKEND_ROOT = Path(__file__).resolve().parents[3]
-HEAD_REVISION = "20260821_0035"
+HEAD_REVISION = "20261019_0037"
 EXPECTED_TABLES = {
     "alembic_version",
     "artifact_versions",
@@ -1951,7 +1955,11 @@ def test_postgresql_migration_lifecycle_matches_models() -> None:
                 MigrationContext.configure(connection).get_current_revision()
                 == HEAD_REVISION
             )
-            assert set(inspect(connection).get_table_names()) == EXPECTED_TABLES
+            table_names = set(inspect(connection).get_table_names())
+            assert {
+                name for name in table_names if not is_build_partition(name)
+            } == EXPECTED_TABLES
+            assert partition_name("source_blocks", "build-evidence-pg") in table_names
             assert connection.execute(
                 text(
                     "SELECT active_analysis_version, published_analysis_version "
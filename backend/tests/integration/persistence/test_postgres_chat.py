@@ -158,3 +158,82 @@ def test_chat_repository_round_trips_trajectory_and_resumable_approval(
         )
         == approved
     )
+
+
+def test_chat_repository_appends_trajectory_deltas_and_reads_a_bounded_tail(
+    auth_session_service,
+    collection_service,
+) -> None:
+    user = auth_session_service.create_user(
+        email="tail-reader@example.com",
+        password="test-password",
+    )
+    collection = collection_service.create_collection(
+        "Long agent collection",
+        owner_user_id=user["user_id"],
+    )
+    repository = PostgresChatRepository(
+        auth_session_service.repository.session_factory
+    )
+    chat = ChatSession.create(
+        session_id="chat-tail",
+        user_id=user["user_id"],
+        collection_id=collection["collection_id"],
+        created_at="2026-08-19T00:00:00+00:00",
+    )
+    repository.add_session(chat)
+    messages = tuple(
+        ChatMessage.user(
+            message_id=f"tail-msg-{index}",
+            session_id=chat.session_id,
+            content="x" * 100,
+            created_at=f"2026-08-19T00:00:{index:02d}+00:00",
+        )
+        for index in range(6)
+    )
+
+    repository.save_trajectory(
+        session=chat,
+        messages=messages[:3],
+        tool_calls=(),
+        tool_results=(),
+    )
+    repository.save_trajectory(
+        session=chat,
+        messages=messages[2:],
+        tool_calls=(),
+        tool_results=(),
+    )
+
+    assert repository.read_messages(chat.session_id) == messages
+    assert repository.read_recent_messages(
+        chat.session_id,
+        limit=4,
+        max_chars=10_000,
+    ) == messages[2:]
+    assert repository.read_recent_messages(
+        chat.session_id,
+        limit=4,
+        max_chars=150,
+    ) == messages[4:]
+    with pytest.raises(ValueError, match="append-only"):
+        repository.save_trajectory(
+            session=chat,
+            messages=messages[:3],
+            tool_calls=(),
+            tool_results=(),
+        )
+    with pytest.raises(ValueError, match="append-only"):
+        repository.save_trajectory(
+            session=chat,
+            messages=(messages[3], messages[2], messages[5]),
+            tool_calls=(),
+            tool_results=(),
+        )
+    with pytest.raises(ValueError, match="identity cannot be reassigned"):
+        repository.save_trajectory(
+            session=chat,
+            messages=(messages[-1], messages[0]),
+            tool_calls=(),
+            tool_results=(),
+        )
@@ -28,6 +28,7 @@ from infra.persistence.postgres.collection_repository import (
 from tests.integration.persistence.database_cleanup import reset_postgres_schema
 from infra.persistence.postgres.models.collection import StoredObject
 from infra.persistence.postgres.models.build import CollectionBuild, Task
+from infra.persistence.postgres.models.chat import ChatMessageRow, ChatSessionRow
 from infra.persistence.postgres.models.source import SourceDocument
 
 
@@ -184,10 +185,7 @@ def test_collection_repository_updates_and_deletes_existing_record(
     assert collection_repository.delete_collection("col_update") is False
 
 
-def test_collection_delete_removes_build_source_documents_before_memberships(
-    collection_repository,
-) -> None:
-    collection_id = "col_delete_built_source"
+def _add_built_source(collection_repository, collection_id: str) -> None:
     collection_repository.add_collection(_collection(collection_id))
     import_record = _collection_import(
         collection_id,
@@ -249,6 +247,13 @@ def test_collection_delete_removes_build_source_documents_before_memberships(
             )
         )
 
+
+def test_collection_delete_removes_build_source_documents_before_memberships(
+    collection_repository,
+) -> None:
+    collection_id = "col_delete_built_source"
+    _add_built_source(collection_repository, collection_id)
+
     assert collection_repository.delete_collection(collection_id) is True
     with collection_repository.session_factory() as session:
         assert session.get(CollectionBuild, "build_delete_built_source") is None
@@ -258,6 +263,124 @@ def test_collection_delete_removes_build_source_documents_before_memberships(
         ) is None
 
 
+def test_collection_tombstone_hides_collection_until_batched_purge_finishes(
+    collection_repository,
+) -> None:
+    collection_id = "col_tombstoned"
+    _add_built_source(collection_repository, collection_id)
+
+    assert collection_repository.tombstone_collection(
+        collection_id,
+        deleted_at="2026-07-19T09:00:00+00:00",
+    ) is True
+    assert collection_repository.read_collection(collection_id) is None
+    assert collection_repository.list_collections() == ()
+    assert collection_repository.list_tombstoned_collections() == (collection_id,)
+    with pytest.raises(FileNotFoundError, match="collection not found"):
+        collection_repository.add_collection_import(
+            _collection_import(
+                collection_id,
+                "after-delete",
+                ingested_at="2026-07-19T09:01:00+00:00",
+            ),
+            updated_at="2026-07-19T09:01:00+00:00",
+        )
+
+    purged_tables: list[str] = []
+    progress = collection_repository.purge_collection_rows(collection_id, batch_size=1)
+    while not progress.done:
+        assert progress.deleted_rows == 1
+        purged_tables.append(progress.table)
+        progress = collection_repository.purge_collection_rows(
+            collection_id,
+            batch_size=1,
+            start_table=progress.table,
+        )
+
+    assert purged_tables.index("source_documents") < purged_tables.index(
+        "collection_builds"
+    )
+    assert purged_tables.index("collection_builds") < purged_tables.index("tasks")
+    assert collection_repository.list_tombstoned_collections() == (collection_id,)
+    assert collection_repository.finalize_collection_purge(collection_id) is True
+    assert collection_repository.list_tombstoned_collections() == ()
+    assert collection_repository.list_collection_files(collection_id) == ()
+
+
+def test_collection_build_cancel_stops_unfinished_builds_once(
+    collection_repository,
+) -> None:
+    collection_id = "col_cancel_builds"
+    _add_built_source(collection_repository, collection_id)
+    with collection_repository.session_factory.begin() as session:
+        session.get(CollectionBuild, "build_delete_built_source").status = "building"
+
+    finished_at = "2026-07-19T09:00:00+00:00"
+    assert (
+        collection_repository.cancel_collection_builds(
+            collection_id,
+            finished_at=finished_at,
+        )
+        == 1
+    )
+    assert (
+        collection_repository.cancel_collection_builds(
+            collection_id,
+            finished_at=finished_at,
+        )
+        == 0
+    )
+    with collection_repository.session_factory() as session:
+        build = session.get(CollectionBuild, "build_delete_built_source")
+        assert build.status == "cancelled"
+
+
+def test_collection_purge_batches_cascade_children_before_their_parent(
+    collection_repository,
+) -> None:
+    collection_id = "col_chat_purge"
+    created_at = datetime(2026, 7, 19, tzinfo=timezone.utc)
+    collection_repository.add_collection(_collection(collection_id))
+    with collection_repository.session_factory.begin() as session:
+        session.add(
+            ChatSessionRow(
+                session_id="chat_purge",
+                user_id="user_a",
+                collection_id=collection_id,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+        session.flush()
+        session.add_all(
+            ChatMessageRow(
+                message_id=f"message_{position}",
+                session_id="chat_purge",
+                position=position,
+                role="user",
+                content="question",
+                created_at=created_at,
+            )
+            for position in range(3)
+        )
+    collection_repository.tombstone_collection(
+        collection_id,
+        deleted_at="2026-07-19T09:00:00+00:00",
+    )
+
+    purged: list[tuple[str, int]] = []
+    progress = collection_repository.purge_collection_rows(collection_id, batch_size=1)
+    while not progress.done:
+        purged.append((progress.table, progress.deleted_rows))
+        progress = collection_repository.purge_collection_rows(
+            collection_id,
+            batch_size=1,
+            start_table=progress.table,
+        )
+
+    assert purged == [("chat_messages", 1)] * 3 + [("chat_sessions", 1)]
+
+
 @pytest.mark.parametrize(
     "record",
     [
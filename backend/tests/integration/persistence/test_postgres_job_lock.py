@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from infra.persistence.postgres.job_lock import PostgresJobLock
+
+
+def test_postgresql_job_lock_admits_one_holder_at_a_time() -> None:
+    database_url = os.getenv("LENS_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("LENS_TEST_DATABASE_URL is not configured")
+    url = make_url(database_url)
+    if url.drivername != "postgresql+psycopg" or not str(url.database).endswith(
+        "_test"
+    ):
+        pytest.fail(
+            "LENS_TEST_DATABASE_URL must use postgresql+psycopg and a *_test database"
+        )
+
+    engine = create_engine(url)
+    first = PostgresJobLock(engine, "job-lock-test")
+    second = PostgresJobLock(engine, "job-lock-test")
+    try:
+        with first.hold() as first_held:
+            with second.hold() as second_held:
+                assert first_held
+                assert not second_held
+        with second.hold() as second_held:
+            assert second_held
+    finally:
+        engine.dispose()
@@ -7,7 +7,7 @@ import os
 from alembic import command
 from alembic.config import Config
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import make_url
 
 from domain.core import (
@@ -1377,6 +1377,64 @@ def test_publish_is_atomic_and_reads_findings_and_exact_evidence(source_reposito
     }
 
 
+def test_iter_findings_with_evidence_streams_in_batches_with_fixed_queries(
+    source_repositories,
+) -> None:
+    source_repository, builds = source_repositories
+    repository = _prepare_studies(source_repository, builds)
+    _objective_row, claimed = _queue_and_claim(repository)
+    version = claimed.analysis_version
+    findings = tuple(
+        replace(_finding(version), finding_id=f"finding-{index}", display_rank=rank)
+        for index, rank in ((1, 0), (2, 1), (3, 1), (4, 2), (5, 2))
+    )
+    repository.publish_analysis(
+        "col_source",
+        "objective-1",
+        version,
+        contributions=_analysis_contributions(version),
+        evidence_records=_analysis_evidence(version),
+        findings=findings,
+    )
+    statements: list[str] = []
+    engine = repository.session_factory.kw["bind"]
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        streamed = tuple(
+            repository.iter_findings_with_evidence(
+                "col_source",
+                "objective-1",
+                version,
+                batch_size=2,
+            )
+        )
+        batched_statements = len(statements)
+        statements.clear()
+        single_batch = tuple(
+            repository.iter_findings_with_evidence("col_source", "objective-1", version)
+        )
+        single_batch_statements = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert streamed == single_batch
+    assert tuple(finding for finding, _ in streamed) == findings
+    for finding, evidence in streamed:
+        assert evidence == repository.list_evidence(
+            "col_source",
+            "objective-1",
+            version,
+            finding_id=finding.finding_id,
+        )[0]
+    # Three batches plus the empty terminating read, against one batch plus it.
+    assert batched_statements == 3 * (single_batch_statements - 1) + 1
+
+
 def test_failed_retry_preserves_previous_published_version(source_repositories) -> None:
     source_repository, builds = source_repositories
     repository = _prepare_studies(source_repository, builds)
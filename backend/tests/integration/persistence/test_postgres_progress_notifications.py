@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from infra.notifications.progress import (
+    PostgresProgressNotifier,
+    ProgressHub,
+    task_progress_topic,
+)
+
+
+def test_postgresql_progress_notifications_reach_local_subscribers() -> None:
+    database_url = os.getenv("LENS_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("LENS_TEST_DATABASE_URL is not configured")
+    url = make_url(database_url)
+    if url.drivername != "postgresql+psycopg" or not str(url.database).endswith(
+        "_test"
+    ):
+        pytest.fail(
+            "LENS_TEST_DATABASE_URL must use postgresql+psycopg and a *_test database"
+        )
+
+    engine = create_engine(url)
+    hub = ProgressHub()
+    notifier = PostgresProgressNotifier(engine, hub, channel="lens_progress_test")
+    topic = task_progress_topic("task-notify")
+
+    async def scenario() -> bool:
+        async with hub.subscribe(topic) as subscription:
+            # LISTEN is issued on the listener thread; publish until it lands.
+            for _ in range(50):
+                await asyncio.to_thread(notifier.publish, topic)
+                if await subscription.wait(0.2):
+                    return True
+        return False
+
+    notifier.start()
+    try:
+        assert asyncio.run(scenario())
+    finally:
+        notifier.stop()
+        engine.dispose()
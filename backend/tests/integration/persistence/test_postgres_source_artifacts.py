@@ -454,6 +454,26 @@ def test_source_repository_round_trips_structure_with_document_lineage(
         "col_source", build_id="build_source"
     )
     assert restored == _artifacts()
+    assert repository.count_collection_artifacts("col_source") == {
+        "documents": 0,
+        "text_units": 0,
+        "blocks": 0,
+        "tables": 0,
+        "table_rows": 0,
+        "table_cells": 0,
+        "figures": 0,
+    }
+    assert repository.count_collection_artifacts(
+        "col_source", build_id="build_source"
+    ) == {
+        "documents": 1,
+        "text_units": 1,
+        "blocks": 1,
+        "tables": 1,
+        "table_rows": 1,
+        "table_cells": 1,
+        "figures": 0,
+    }
     tree = repository.read_document_tree(
         "col_source", "srcdoc_runtime", build_id="build_source"
     )
@@ -467,6 +487,24 @@ def test_source_repository_round_trips_structure_with_document_lineage(
         assert row.build_id == "build_source"
 
 
+def test_streamed_document_writes_roll_back_together(source_repositories) -> None:
+    repository, builds = source_repositories
+    builds.add_task(_task("task_source"), build_id="build_source")
+    repository.replace_collection_documents(
+        "col_source", "build_source", _artifacts("Previous")
+    )
+
+    with pytest.raises(RuntimeError, match="segment read failed"):
+        with repository.write_collection_documents(
+            "col_source", "build_source"
+        ) as writer:
+            writer.append(_artifacts("Streamed"))
+            raise RuntimeError("segment read failed")
+
+    documents = repository.list_documents("col_source", build_id="build_source")
+    assert [document.title for document in documents] == ["Previous"]
+
+
 def test_default_reads_keep_last_successful_build_when_next_build_fails(
     source_repositories,
 ) -> None:
@@ -495,7 +533,10 @@ def test_default_reads_keep_last_successful_build_when_next_build_fails(
         == "Pending"
     )
     _finish(builds, second_task, success=False)
-    assert repository.list_documents("col_source")[0].title == "First"
+    listed = repository.list_documents("col_source")[0]
+    assert listed.title == "First"
+    assert repository.read_document("col_source", listed.document_id) == listed
+    assert repository.read_document("col_source", "missing") is None
 
 
 def test_source_repository_versions_figures_and_references_with_the_source_build(
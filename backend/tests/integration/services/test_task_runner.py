@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -42,6 +43,7 @@ from infra.source.runtime.source_evidence import (
 from tests.support.collection_service import build_test_collection_service
 from tests.support.objective_extractor import FakeObjectiveExtractor
 from tests.support.objective_repository import MemoryObjectiveRepository
+from tests.support.source_artifact_repository import count_source_artifacts
 from tests.support.paper_fact_repository import MemoryPaperFactRepository
 
 
@@ -70,6 +72,12 @@ class MemorySourceArtifactRepository:
     ) -> None:
         self._documents[(collection_id, build_id)] = documents
 
+    @contextmanager
+    def write_collection_documents(self, collection_id: str, build_id: str):  # noqa: ANN201
+        written: list[SourceDocument] = []
+        yield SimpleNamespace(append=written.extend)
+        self._documents[(collection_id, build_id)] = tuple(written)
+
     def read_collection_documents(
         self,
         collection_id: str,
@@ -98,6 +106,15 @@ class MemorySourceArtifactRepository:
             return SourceReferenceSet()
         return self._references.get((collection_id, build_id), SourceReferenceSet())
 
+    def count_collection_artifacts(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+    ) -> dict[str, int]:
+        return count_source_artifacts(
+            self.read_collection_documents(collection_id, build_id=build_id)
+        )
+
     def read_document_tree(
         self,
         collection_id: str,
@@ -340,6 +357,49 @@ def test_build_pipeline_service_builds_collection_artifacts(monkeypatch, tmp_pat
     assert objective_facts.paper_skims
 
 
+def test_build_pipeline_completes_when_lexical_index_build_fails(
+    monkeypatch,
+    tmp_path,
+):
+    import application.pipeline.collection_build.service as task_runner_module
+
+    collection_service = build_test_collection_service(tmp_path / "collections")
+    build_repository = MemoryBuildRepository()
+    task_service = TaskService(build_repository)
+    runner, _artifact_registry = _build_runner(
+        tmp_path,
+        collection_service,
+        build_repository,
+    )
+    collection = collection_service.create_collection("Unindexed Collection")
+    paths = collection_service.get_paths(collection["collection_id"])
+    collection_service.add_file(
+        collection["collection_id"],
+        "paper.txt",
+        b"Experimental Section\nMix and anneal.",
+    )
+
+    async def fake_build_source_artifacts(**kwargs):  # noqa: ANN003, ARG001
+        return [
+            DummyWorkflowOutput(result=_write_source_artifact_outputs(paths.output_dir))
+        ]
+
+    def failing_save_index(*args):  # noqa: ANN002, ANN202
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(
+        task_runner_module, "build_source_artifacts", fake_build_source_artifacts
+    )
+    runner.lexical_search_service = SimpleNamespace(save_index=failing_save_index)
+
+    task = task_service.create_task(collection["collection_id"], "build")
+    result = asyncio.run(runner.run_task(task["task_id"], collection["collection_id"]))
+
+    assert result["status"] == "completed"
+    pipeline_run = task_service.read_pipeline_run(task["task_id"])
+    assert pipeline_run.node("source_artifacts").output_summary["document_count"] == 1
+
+
 def test_build_pipeline_removes_parser_nul_before_source_persistence(
     monkeypatch,
     tmp_path,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import sys
 import threading
 import time
@@ -27,6 +28,7 @@ from infra.source.runtime.source_evidence import (
 )
 from tests.support.paper_fact_repository import MemoryPaperFactRepository
 from tests.support.objective_repository import MemoryObjectiveRepository
+from tests.support.source_artifact_repository import count_source_artifacts
 from tests.support.objective_review_repository import InMemoryObjectiveReviewRepository
 from tests.support.experiment_plan_repository import (
     InMemoryExperimentPlanRepository,
@@ -70,6 +72,12 @@ class MemorySourceArtifactRepository:
     ) -> None:
         self._documents[(collection_id, build_id)] = documents
 
+    @contextmanager
+    def write_collection_documents(self, collection_id: str, build_id: str):  # noqa: ANN201
+        written: list[SourceDocument] = []
+        yield SimpleNamespace(append=written.extend)
+        self._documents[(collection_id, build_id)] = tuple(written)
+
     def read_collection_documents(
         self,
         collection_id: str,
@@ -98,6 +106,15 @@ class MemorySourceArtifactRepository:
             return SourceReferenceSet()
         return self._references.get((collection_id, build_id), SourceReferenceSet())
 
+    def count_collection_artifacts(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+    ) -> dict[str, int]:
+        return count_source_artifacts(
+            self.read_collection_documents(collection_id, build_id=build_id)
+        )
+
     def read_document_tree(
         self,
         collection_id: str,
@@ -378,6 +395,52 @@ def test_build_task_route_schedules_blocking_entry_without_waiting(
         finished.wait(timeout=2)
 
 
+def test_batch_upload_imports_every_file_in_one_import(app_client):
+    create_resp = app_client.post(
+        f"{API_V1_PREFIX}/collections", json={"name": "Batch Upload Set"}
+    )
+    assert create_resp.status_code == 200
+    collection_id = create_resp.json()["collection_id"]
+
+    upload_resp = app_client.post(
+        f"{API_V1_PREFIX}/collections/{collection_id}/files/batch",
+        files=[
+            ("files", ("a.txt", b"Experimental Section\nMix.", "text/plain")),
+            ("files", ("b.pdf", b"%PDF-1.4 batch", "application/pdf")),
+        ],
+    )
+
+    assert upload_resp.status_code == 200
+    items = upload_resp.json()["items"]
+    assert [item["original_filename"] for item in items] == ["a.txt", "b.pdf"]
+    assert items[1]["size_bytes"] == len(b"%PDF-1.4 batch")
+    listed = app_client.get(f"{API_V1_PREFIX}/collections/{collection_id}/files")
+    assert len(listed.json()["items"]) == 2
+
+
+def test_batch_upload_rejects_invalid_archives_as_client_errors(app_client):
+    create_resp = app_client.post(
+        f"{API_V1_PREFIX}/collections", json={"name": "Bad Upload Set"}
+    )
+    assert create_resp.status_code == 200
+    collection_id = create_resp.json()["collection_id"]
+
+    bad_zip = app_client.post(
+        f"{API_V1_PREFIX}/collections/{collection_id}/files/batch",
+        files=[("files", ("papers.zip", b"not a zip", "application/zip"))],
+    )
+    unsupported = app_client.post(
+        f"{API_V1_PREFIX}/collections/{collection_id}/files/batch",
+        files=[("files", ("notes.exe", b"MZ", "application/octet-stream"))],
+    )
+
+    assert bad_zip.status_code == 400
+    assert "not a valid zip" in bad_zip.json()["detail"]
+    assert unsupported.status_code == 400
+    listed = app_client.get(f"{API_V1_PREFIX}/collections/{collection_id}/files")
+    assert listed.json()["items"] == []
+
+
 def test_legacy_index_task_route_is_not_registered(app_client):
     create_resp = app_client.post(
         f"{API_V1_PREFIX}/collections", json={"name": "Legacy Route"}
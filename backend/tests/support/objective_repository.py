@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import replace
 from datetime import datetime, timezone
 
@@ -362,6 +363,31 @@ class MemoryObjectiveRepository:
         start = max(0, offset)
         return records[start : start + max(1, min(limit, 500))], len(records)
 
+    def iter_findings_with_evidence(
+        self,
+        collection_id: str,
+        objective_id: str,
+        analysis_version: int,
+        *,
+        batch_size: int = 200,
+    ) -> Iterator[tuple[Finding, tuple[ObjectiveEvidence, ...]]]:
+        key = (collection_id, objective_id, analysis_version)
+        evidence_records = self._evidence.get(key, ())
+        for finding in sorted(
+            self._findings.get(key, ()),
+            key=lambda item: (item.display_rank, item.finding_id),
+        ):
+            evidence_ids = {
+                *finding.supporting_evidence_ids,
+                *finding.contradicting_evidence_ids,
+                *finding.context_evidence_ids,
+            }
+            yield finding, tuple(
+                evidence
+                for evidence in evidence_records
+                if evidence.evidence_id in evidence_ids
+            )
+
     def _require_objective(
         self,
         collection_id: str,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 from domain.source import (
     SourceDocument,
     SourceReferenceSet,
@@ -21,6 +24,12 @@ class MemorySourceArtifactRepository:
     ) -> None:
         self._documents[(collection_id, build_id)] = documents
 
+    @contextmanager
+    def write_collection_documents(self, collection_id: str, build_id: str):  # noqa: ANN201
+        written: list[SourceDocument] = []
+        yield SimpleNamespace(append=written.extend)
+        self._documents[(collection_id, build_id)] = tuple(written)
+
     def read_collection_documents(
         self,
         collection_id: str,
@@ -47,6 +56,15 @@ class MemorySourceArtifactRepository:
             (collection_id, selected_build_id), SourceReferenceSet()
         )
 
+    def count_collection_artifacts(
+        self,
+        collection_id: str,
+        build_id: str | None = None,
+    ) -> dict[str, int]:
+        return count_source_artifacts(
+            self.read_collection_documents(collection_id, build_id=build_id)
+        )
+
     def read_document_tree(
         self,
         collection_id: str,
@@ -76,4 +94,24 @@ class MemorySourceArtifactRepository:
         self.active_build_id = build_id
 
 
-__all__ = ["MemorySourceArtifactRepository"]
+def count_source_artifacts(documents: tuple[SourceDocument, ...]) -> dict[str, int]:
+    """Per-kind counts matching `SourceArtifactRepository.count_collection_artifacts`."""
+
+    return {
+        "documents": len(documents),
+        "text_units": len(
+            {
+                text_unit.text_unit_id
+                for document in documents
+                for text_unit in document.text_units
+            }
+        ),
+        "blocks": sum(len(document.blocks) for document in documents),
+        "tables": sum(len(document.tables) for document in documents),
+        "table_rows": sum(len(document.table_rows) for document in documents),
+        "table_cells": sum(len(document.table_cells) for document in documents),
+        "figures": sum(len(document.figures) for document in documents),
+    }
+
+
+__all__ = ["MemorySourceArtifactRepository", "count_source_artifacts"]
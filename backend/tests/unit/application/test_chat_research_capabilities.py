@@ -21,6 +21,7 @@ from application.chat.capabilities import (
     ProposeObjectiveDraftsArguments,
     ProposeObjectiveDraftsCapability,
     QueryPublishedFindingsCapability,
+    SearchSourceTextCapability,
 )
 from application.core.objectives.research_objective_service import (
     ResearchObjectiveService,
@@ -31,6 +32,7 @@ from domain.core import (
     PaperStudyDisposition,
     ResearchObjective,
 )
+from infra.source.retrieval import LexicalEntry, LexicalIndex
 
 
 def _objective(
@@ -340,6 +342,47 @@ def test_missing_published_results_is_a_successful_scientific_absence() -> None:
     assert "No selected Objective has a published analysis." in result.warnings
 
 
+def test_source_text_search_returns_bounded_passages_from_the_active_index() -> None:
+    index = LexicalIndex.build(
+        (
+            LexicalEntry(
+                "blk-1",
+                "block",
+                "paper-1",
+                "Higher energy input lowered elongation of Ti-6Al-4V.",
+                page=6,
+            ),
+            LexicalEntry("blk-2", "block", "paper-2", "Powder feedstock was sieved."),
+        )
+    )
+    search_service = SimpleNamespace(read_index=lambda collection_id: index)
+    capability = SearchSourceTextCapability(
+        collection_service=_CollectionService(),
+        lexical_search_service=search_service,
+    )
+
+    result = capability.execute(
+        _context(),
+        capability.spec.input_model(query="  energy   input elongation ", limit=3),
+    )
+
+    assert result.status.value == "succeeded"
+    assert result.data["query"] == "energy input elongation"
+    assert [item["block_id"] for item in result.data["matches"]] == ["blk-1"]
+    assert result.data["matches"][0]["page"] == 6
+    assert [ref.href for ref in result.resource_refs] == [
+        "/collections/col-1/documents/paper-1"
+    ]
+
+    unbuilt = SearchSourceTextCapability(
+        collection_service=_CollectionService(),
+        lexical_search_service=SimpleNamespace(read_index=lambda collection_id: None),
+    ).execute(_context(), capability.spec.input_model(query="energy"))
+
+    assert unbuilt.data["match_count"] == 0
+    assert unbuilt.warnings == ("The collection has no built Source text to search yet.",)
+
+
 def test_objective_drafts_are_transient_and_paper_skim_is_not_evidence() -> None:
     capability = ProposeObjectiveDraftsCapability(
         collection_service=_CollectionService(),
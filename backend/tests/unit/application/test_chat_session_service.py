@@ -9,6 +9,7 @@ from pydantic import BaseModel, ConfigDict
 from application.chat import (
     AgentContext,
     CapabilityRegistry,
+    ChatContextBuilder,
     ModelToolCall,
     ModelTurn,
     ResearchAgentRunner,
@@ -83,6 +84,7 @@ class _Repository:
         self.trajectory_snapshots: list[
             tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]
         ] = []
+        self.recent_reads: list[tuple[int, int]] = []
 
     def add_session(self, record: ChatSession) -> None:
         self.sessions[record.session_id] = record
@@ -94,6 +96,16 @@ class _Repository:
     def read_messages(self, session_id: str) -> tuple[ChatMessage, ...]:
         return self.messages.get(session_id, ())
 
+    def read_recent_messages(
+        self,
+        session_id: str,
+        *,
+        limit: int,
+        max_chars: int,
+    ) -> tuple[ChatMessage, ...]:
+        self.recent_reads.append((limit, max_chars))
+        return self.messages.get(session_id, ())[-limit:]
+
     def read_tool_call(self, tool_call_id: str) -> ChatToolCall | None:
         return self.calls.get(tool_call_id)
 
@@ -181,6 +193,39 @@ def test_chat_session_service_persists_ordinary_conversation() -> None:
         service.get_session_for_user(session.session_id, "user-2")
 
 
+def test_chat_session_service_continues_from_a_bounded_history_tail() -> None:
+    repository = _Repository()
+    service = ChatSessionService(
+        collection_service=_CollectionService(),
+        repository=repository,
+        runner=ResearchAgentRunner(
+            model=_Model(ModelTurn(content="继续。")),
+            capabilities=CapabilityRegistry(()),
+            context_builder=ChatContextBuilder(max_messages=4, max_chars=2_000),
+        ),
+    )
+    session = service.create_session(collection_id="col-1", user_id="user-1")
+    repository.messages[session.session_id] = tuple(
+        ChatMessage.user(
+            message_id=f"msg-{index}",
+            session_id=session.session_id,
+            content=f"message {index}",
+            created_at="2026-08-19T00:00:00+00:00",
+        )
+        for index in range(10)
+    )
+
+    result = service.post_message_for_user(
+        session.session_id,
+        "user-1",
+        message="继续",
+    )
+
+    assert repository.recent_reads == [(4, 2_000)]
+    assert [item.role.value for item in result["messages"]] == ["user", "assistant"]
+    assert repository.trajectory_snapshots[0] == (("user",) * 5, (), ())
+
+
 def test_chat_session_service_checkpoints_every_agent_step() -> None:
     repository = _Repository()
     capability = _WriteCapability()
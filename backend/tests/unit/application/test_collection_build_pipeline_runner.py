@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
 from hashlib import sha256
 from types import SimpleNamespace
 
@@ -22,6 +23,7 @@ from application.pipeline.collection_build.service import CollectionBuildPipelin
 from controllers.schemas.source.task import TaskResponse
 from domain.pipeline import ModelUsage, PipelineRun, TokenUsage
 from infra.llm.usage import record_llm_completion, record_llm_prompt_version
+from infra.tracing.spans import span
 from infra.source.config.source_runtime_config import SourceRuntimeConfig
 from infra.source.runtime.artifact_bundle import SourceArtifactBundle
 
@@ -261,6 +263,49 @@ def test_collection_build_pipeline_runner_persists_provider_usage_per_node():
     assert result.stats.prompt_versions == {"paper_framing": "paper_framing.v1"}
 
 
+def test_collection_build_pipeline_runner_records_nested_spans_per_node(
+    tmp_path,
+    monkeypatch,
+):
+    monkeypatch.setenv("PIPELINE_TRACE_DIR", str(tmp_path))
+    task_service = MemoryTaskService()
+    definitions = (
+        CollectionBuildNodeDefinition(
+            "model_node",
+            20,
+            "Model node done.",
+            "model_node_started",
+            "model_node_completed",
+        ),
+    )
+
+    def model_node(context, config):  # noqa: ANN001, ARG001
+        for _ in range(2):
+            with span("load_inputs", row_count=3):
+                pass
+        with span("persist"):
+            pass
+
+    context = build_context(task_service)
+    result = asyncio.run(
+        CollectionBuildPipelineRunner(
+            {"model_node": model_node},
+            definitions=definitions,
+        ).run(context, build_config(), build_run({"model_node": ()}))
+    )
+
+    spans = {item.path: item for item in result.node("model_node").stats.spans}
+    assert list(spans) == [
+        "model_node",
+        "model_node/load_inputs",
+        "model_node/persist",
+    ]
+    assert spans["model_node/load_inputs"].count == 2
+    assert spans["model_node/load_inputs"].counters == {"row_count": 6}
+    assert result.stats.spans == result.node("model_node").stats.spans
+    assert (tmp_path / f"build-{context.task_id}-model_node.trace.json").is_file()
+
+
 def test_objective_candidate_node_reports_permanent_source_unit_failures():
     paper_skim = SimpleNamespace(
         source_unit_coverage=(
@@ -421,8 +466,11 @@ def test_source_node_persists_figure_metadata_and_references_before_activation()
     async def build_source_artifacts(**kwargs):  # noqa: ANN003, ARG001
         return [SimpleNamespace(result=bundle, errors=[])]
 
-    def replace_artifacts(collection_id, build_id, artifacts):  # noqa: ANN001
-        calls.append(("artifacts", collection_id, build_id, artifacts))
+    @contextmanager
+    def write_artifacts(collection_id, build_id):  # noqa: ANN001, ANN202
+        written = []
+        yield SimpleNamespace(append=written.extend)
+        calls.append(("artifacts", collection_id, build_id, tuple(written)))
 
     def replace_references(collection_id, build_id, references):  # noqa: ANN001
         calls.append(("references", collection_id, build_id, references))
@@ -440,7 +488,7 @@ def test_source_node_persists_figure_metadata_and_references_before_activation()
         ),
         artifact_registry_service=SimpleNamespace(),
         source_artifact_repository=SimpleNamespace(
-            replace_collection_documents=replace_artifacts,
+            write_collection_documents=write_artifacts,
             replace_collection_references=replace_references,
         ),
         document_profile_service=SimpleNamespace(),
@@ -410,6 +410,19 @@ def test_objective_analysis_publishes_one_complete_version() -> None:
     assert repository.published_calls == 1
 
 
+def test_objective_analysis_publishes_progress_for_each_stored_transition() -> None:
+    service, _repository, _analyzer = _service()
+    published: list[str] = []
+    service.progress_notifier = SimpleNamespace(publish=published.append)
+
+    service.queue_analysis("collection-1", "objective-1")
+    service.execute_queued_analysis("collection-1", "objective-1", 1)
+    service.execute_queued_analysis("collection-1", "objective-1", 1)
+
+    assert len(published) >= 3
+    assert set(published) == {"objective-analysis:collection-1:objective-1"}
+
+
 def test_objective_analysis_aggregates_persisted_contribution_warnings() -> None:
     repository = FakeObjectiveRepository(published=True)
     contribution = _artifacts(1).contributions[0]
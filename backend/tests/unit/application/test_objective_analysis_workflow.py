@@ -26,6 +26,7 @@ from domain.core import (
 )
 from domain.pipeline import ExecutionStats, ModelUsage, TokenUsage
 from domain.source import source_documents_from_records
+from infra.persistence.file import FileObjectiveStageCache
 from tests.support.collection_service import build_test_collection_service
 from tests.support.objective_extractor import (
     FakeObjectiveExtractor as _ObjectiveExtractor,
@@ -940,3 +941,161 @@ def test_queued_analysis_uses_its_source_build_objective_scope_after_rebuild(
             "outcome": "corrosion current",
         }
     ]
+
+
+def _corrosion_source_documents(*, second_paper_note: str):
+    return source_documents_from_records(
+        documents=[
+            {
+                "id": document_id,
+                "title": f"LPBF 316L Heat Treatment Corrosion Study {document_id}",
+                "text": "LPBF 316L was heat treated and corrosion current was measured.",
+                "metadata": {"source_filename": f"{document_id}.pdf"},
+            }
+            for document_id in ("paper-1", "paper-2")
+        ],
+        blocks=[
+            {
+                "block_id": f"b-{document_id}",
+                "document_id": document_id,
+                "block_type": "paragraph",
+                "text": (
+                    "LPBF 316L was heat treated."
+                    if document_id == "paper-1"
+                    else f"LPBF 316L was heat treated. {second_paper_note}"
+                ),
+                "block_order": 1,
+            }
+            for document_id in ("paper-1", "paper-2")
+        ],
+        tables=[
+            {
+                "table_id": f"table-{document_id}",
+                "document_id": document_id,
+                "caption_text": "Corrosion current results",
+                "column_headers": ["sample", "corrosion current"],
+                "table_matrix": [
+                    ["sample", "corrosion current"],
+                    ["as-built", "1.2 uA/cm2"],
+                    ["heat-treated", "0.4 uA/cm2"],
+                ],
+            }
+            for document_id in ("paper-1", "paper-2")
+        ],
+    )
+
+
+def test_objective_analysis_reuses_unchanged_document_stages(tmp_path):
+    collection_service = build_test_collection_service(tmp_path / "collections")
+    collection = collection_service.create_collection("Objective stage reuse")
+    collection_id = collection["collection_id"]
+    extractor = _ObjectiveExtractor()
+    service = _build_research_objective_service(
+        collection_service=collection_service,
+        response_client=extractor,
+        objective_stage_cache=FileObjectiveStageCache(collection_service.workspace),
+    )
+    service.finding_synthesis_service.assertion_judge = extractor
+    service.source_artifact_repository.replace_collection_documents(
+        collection_id,
+        "build_test",
+        _corrosion_source_documents(second_paper_note="Samples were polished."),
+    )
+    _seed_document_profiles(service, collection_id)
+    objective = _research_objective(
+        {
+            "collection_id": collection_id,
+            "objective_id": "obj_corrosion",
+            "question": "How does heat treatment affect corrosion current?",
+            "material_scope": ["316L stainless steel"],
+            "variables": ["heat treatment"],
+            "outcomes": ["corrosion current"],
+            "constraints": ["LPBF"],
+            "requested_comparator": "Compare corrosion current before and after heat treatment.",
+            "seed_document_ids": ["paper-1", "paper-2"],
+            "source_relationship_ids": [
+                _relationship_id(document_id, "corrosion current")
+                for document_id in ("paper-1", "paper-2")
+            ],
+            "rank": 1,
+            "confidence": 0.9,
+        }
+    )
+    paper_skims = tuple(
+        _paper_skim(
+            document_id=document_id,
+            varied_factors=("heat treatment",),
+            outcomes=("corrosion current",),
+            material_scope=("316L stainless steel",),
+            process_context=("LPBF", "heat treatment"),
+            source_ref=f"b-{document_id}",
+        )
+        for document_id in ("paper-1", "paper-2")
+    )
+    service.objective_repository.replace(
+        collection_id,
+        "build_test",
+        ObjectiveFactSet(
+            research_objectives_ready=True,
+            paper_skims=paper_skims,
+            research_objectives=(objective,),
+            study_dispositions=tuple(
+                PaperStudyDisposition(
+                    document_id=paper_skim.document_id,
+                    study_id=study.study_id,
+                    relationship_id=relationship.relationship_id,
+                    status=PaperStudyDispositionStatus.PROMOTED,
+                    objective_id=objective.objective_id,
+                )
+                for paper_skim in paper_skims
+                for study in paper_skim.studies
+                for relationship in study.relationships
+            ),
+        ),
+    )
+    analysis = _queue_running_analysis(service, collection_id, objective.objective_id)
+
+    first = service.generate_objective_analysis_artifacts(collection_id, analysis)
+    first_calls = (
+        len(extractor.frame_payloads),
+        len(extractor.route_payloads),
+        len(extractor.unit_payloads),
+    )
+    second = service.generate_objective_analysis_artifacts(collection_id, analysis)
+
+    assert first_calls[0] and first_calls[1]
+    assert first.evidence_records
+    assert (
+        len(extractor.frame_payloads),
+        len(extractor.route_payloads),
+        len(extractor.unit_payloads),
+    ) == first_calls
+    assert second.evidence_records == first.evidence_records
+    assert second.contributions == first.contributions
+
+    service.source_artifact_repository.replace_collection_documents(
+        collection_id,
+        "build_test",
+        _corrosion_source_documents(second_paper_note="Samples were ground."),
+    )
+    service.generate_objective_analysis_artifacts(collection_id, analysis)
+
+    rescreened_document_ids = {
+        payload["document"]["document_id"]
+        for payload in extractor.frame_payloads[first_calls[0] :]
+    }
+    rerouted_document_ids = {
+        payload["paper_frame"]["document_id"]
+        for payload in extractor.route_payloads[first_calls[1] :]
+    }
+    assert rescreened_document_ids == {"paper-2"}
+    assert rerouted_document_ids == {"paper-2"}
+
+    screened_before_model_change = len(extractor.frame_payloads)
+    extractor.model = "replacement-model"
+    service.generate_objective_analysis_artifacts(collection_id, analysis)
+
+    assert {
+        payload["document"]["document_id"]
+        for payload in extractor.frame_payloads[screened_before_model_change:]
+    } == {"paper-1", "paper-2"}
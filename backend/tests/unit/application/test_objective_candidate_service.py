@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from itertools import permutations
+from itertools import combinations, permutations
 from typing import Any
 
 import pytest
@@ -1834,6 +1834,110 @@ def test_cross_paper_topic_candidates_require_a_focused_shared_signal():
     }
 
 
+def test_indexed_axis_candidate_positions_cover_every_pairwise_match():
+    service = ObjectiveCandidateService()
+    axis_candidates = {
+        "material": [
+            "316L stainless steel",
+            "AISI 316L",
+            "SS316L powder",
+            "Ti-6Al-4V",
+            "Ti64",
+            "IN718",
+        ],
+        "variable": [
+            "scan speed",
+            "scanning speed",
+            "laser scan speed",
+            "volumetric energy density",
+            "VED",
+            "hatch spacing",
+            "hatch distance",
+            "base plate preheating",
+            "preheating temperature",
+            "annealing temperature",
+            "annealing temprature",
+            "build orientation",
+        ],
+        "outcome": [
+            "UTS",
+            "ultimate tensile strength",
+            "relative density",
+            "density",
+            "densification",
+            "porosity",
+            "elongation",
+            "ductility",
+        ],
+    }
+
+    for axis_type, values in axis_candidates.items():
+        expected = {
+            (left, right)
+            for left, right in combinations(range(len(values)), 2)
+            if service._axis_pair_might_be_equivalent(
+                axis_type,
+                values[left],
+                values[right],
+            )
+        }
+        indexed = service._indexed_axis_candidate_positions(
+            axis_type,
+            values,
+            supported_cross_paper_pairs=frozenset(),
+        )
+
+        assert expected
+        assert expected <= indexed
+        assert len(indexed) < len(values) * (len(values) - 1) // 2
+
+
+def test_cross_paper_axis_pairs_use_first_compatible_occurrence_class():
+    skims = (
+        _paper_skim(
+            document_id="paper-a",
+            relationship_id="relationship-a",
+            factors=("annealing duration",),
+            outcome="elongation",
+            material_scope=("Ti-6Al-4V",),
+        ),
+        _paper_skim(
+            document_id="paper-a",
+            relationship_id="relationship-a-same-paper",
+            factors=("heat treatment temperature",),
+            outcome="elongation",
+            material_scope=("316L stainless steel",),
+        ),
+        _paper_skim(
+            document_id="paper-b",
+            relationship_id="relationship-b-incompatible",
+            factors=("heat treatment temperature",),
+            outcome="elongation",
+            material_scope=("IN718",),
+        ),
+        _paper_skim(
+            document_id="paper-c",
+            relationship_id="relationship-c",
+            factors=("heat treatment temperature",),
+            outcome="elongation",
+            material_scope=("Ti64",),
+        ),
+    )
+    service = ObjectiveCandidateService()
+
+    supported = service._supported_cross_paper_axis_pairs(
+        service._relationship_inventory(skims)
+    )
+
+    assert supported == {
+        service._axis_relation_key(
+            "variable",
+            "annealing duration",
+            "heat treatment temperature",
+        )
+    }
+
+
 def test_shared_variable_does_not_propose_unrelated_outcome_pairs():
     skims = (
         _paper_skim(
@@ -10,6 +10,7 @@ from application.core.objectives.analysis.evidence_routing import (
 )
 from application.core.objectives.analysis.source_screening import PaperAnalysisFrame
 from domain.source import SourceDocumentNode, SourceDocumentTree
+from infra.source.retrieval import LexicalEntry, LexicalIndex
 from tests.support.objective_extractor import (
     FakeObjectiveExtractor as _ObjectiveExtractor,
 )
@@ -1786,3 +1787,76 @@ def test_research_objective_service_keeps_numeric_mechanism_text_candidates():
         "melt-pool-ratio",
         "residual-stress",
     }
+
+
+def test_research_objective_ranked_text_candidates_are_narrowed_by_lexical_index():
+    frame = PaperAnalysisFrame.from_mapping(
+        {
+            "objective_id": "obj-structure",
+            "document_id": "paper-1",
+            "relevance": "high",
+            "paper_role": "primary_experiment",
+            "material_match": ["316L stainless steel"],
+            "changed_variables": ["scanning speed"],
+            "measured_property_scope": ["densification"],
+        }
+    )
+    objective_context = _research_objective(
+        {
+            "objective_id": "obj-structure",
+            "material_scope": ["316L stainless steel"],
+            "variables": ["scanning speed"],
+            "outcomes": ["densification"],
+        }
+    )
+    blocks = [
+        SimpleNamespace(
+            block_id=f"adhesion-{index}",
+            document_id="paper-1",
+            block_order=index,
+            block_type="paragraph",
+            heading_path="3. Results",
+            text="Coating adhesion results were observed after grit blasting.",
+            page=2,
+        )
+        for index in range(12)
+    ]
+    blocks.append(
+        SimpleNamespace(
+            block_id="speed-results",
+            document_id="paper-1",
+            block_order=50,
+            block_type="paragraph",
+            heading_path="3. Results",
+            text="Higher scanning speed showed lower densification of 316L.",
+            page=4,
+        )
+    )
+    lexical_index = LexicalIndex.build(
+        LexicalEntry(
+            entry_id=block.block_id,
+            kind="block",
+            document_id=block.document_id,
+            text=block.text,
+            page=block.page,
+        )
+        for block in blocks
+    )
+
+    unfiltered = evidence_routing._build_route_source_candidates(
+        frame=frame,
+        objective_context=objective_context,
+        blocks=blocks,
+        tables=[],
+    )
+    narrowed = evidence_routing._build_route_source_candidates(
+        frame=frame,
+        objective_context=objective_context,
+        blocks=blocks,
+        tables=[],
+        lexical_index=lexical_index,
+    )
+
+    assert "speed-results" in {candidate["source_ref"] for candidate in unfiltered}
+    assert len(unfiltered) > 1
+    assert [candidate["source_ref"] for candidate in narrowed] == ["speed-results"]
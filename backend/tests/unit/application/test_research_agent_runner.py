@@ -52,6 +52,20 @@ class _Model:
         return self.turns.popleft()
 
 
+class _StreamingModel(_Model):
+    def respond_streaming(
+        self,
+        *,
+        messages: tuple,
+        tool_specs: tuple[ToolSpec, ...],
+        on_text_delta,  # noqa: ANN001
+    ) -> ModelTurn:
+        turn = self.respond(messages=messages, tool_specs=tool_specs)
+        for word in turn.content.split():
+            on_text_delta(word)
+        return turn
+
+
 class _Capability:
     def __init__(
         self,
@@ -162,6 +176,65 @@ def test_read_capability_result_returns_to_the_model_before_final_answer() -> No
     assert capability.executed_call_ids == ["call-1"]
 
 
+def test_turn_events_stream_text_and_follow_each_durable_checkpoint() -> None:
+    capability = _Capability("get_collection_context", ToolRisk.READ)
+    runner = ResearchAgentRunner(
+        model=_StreamingModel(
+            ModelTurn(
+                tool_call=ModelToolCall(
+                    tool_call_id="call-1",
+                    name="get_collection_context",
+                    arguments={},
+                )
+            ),
+            ModelTurn(content="papers study ductility"),
+        ),
+        capabilities=CapabilityRegistry((capability,)),
+    )
+    timeline: list[tuple[str, object]] = []
+
+    result = runner.run_turn(
+        context=_context(),
+        previous_messages=(),
+        user_message="what do these papers study?",
+        checkpoint=lambda messages, calls, results: timeline.append(
+            ("checkpoint", len(messages))
+        ),
+        on_event=lambda event: timeline.append((event.type.value, event.data)),
+    )
+
+    kinds = [kind for kind, _data in timeline]
+    assert kinds == [
+        "checkpoint",
+        "message",
+        "checkpoint",
+        "tool_call",
+        "message",
+        "checkpoint",
+        "tool_call",
+        "checkpoint",
+        "tool_call",
+        "tool_result",
+        "message",
+        "text_delta",
+        "text_delta",
+        "text_delta",
+        "checkpoint",
+        "message",
+    ]
+    assert [data.status for kind, data in timeline if kind == "tool_call"] == [
+        ToolCallStatus.REQUESTED,
+        ToolCallStatus.RUNNING,
+        ToolCallStatus.SUCCEEDED,
+    ]
+    assert [data for kind, data in timeline if kind == "text_delta"] == [
+        {"delta": "papers"},
+        {"delta": "study"},
+        {"delta": "ductility"},
+    ]
+    assert timeline[-1][1] == result.messages[-1]
+
+
 def test_authorization_is_deterministic_and_not_granted_by_prompt_text() -> None:
     assert not evaluate_authorization(ToolRisk.READ).requires_approval
     assert not evaluate_authorization(ToolRisk.DRAFT).requires_approval
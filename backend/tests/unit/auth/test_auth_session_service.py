@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import select
@@ -9,7 +11,15 @@ from sqlalchemy import select
 from application.auth import (
     AuthSessionService,
     InvalidCredentialsError,
+    LoginThrottle,
+    LoginThrottledError,
     SessionNotFoundError,
+    SessionResolutionCache,
+)
+from application.auth.passwords import (
+    hash_password,
+    password_needs_rehash,
+    verify_password,
 )
 from infra.persistence.postgres.models.auth import AuthSession
 
@@ -91,3 +101,137 @@ def test_auth_session_service_rejects_expired_session(auth_session_service):
 
     with pytest.raises(SessionNotFoundError):
         service.resolve_session(bearer_token)
+
+
+def test_auth_session_service_rehashes_outdated_password_on_login(
+    auth_session_service,
+):
+    service = auth_session_service
+    user = service.create_user(email="reader@example.com", password="correct horse")
+    legacy_hash = hash_password("correct horse", iterations=1_000)
+    service.repository.update_user_password_hash(user["user_id"], legacy_hash)
+
+    asyncio.run(
+        service.login_async(email="Reader@example.com", password="correct horse")
+    )
+
+    stored_hash = service.repository.read_user(user["user_id"])["password_hash"]
+    assert stored_hash != legacy_hash
+    assert not password_needs_rehash(stored_hash)
+    assert verify_password("correct horse", stored_hash)
+
+
+def test_auth_session_service_throttles_repeated_logins_per_email(
+    auth_session_service,
+):
+    service = AuthSessionService(
+        auth_session_service.repository,
+        login_throttle=LoginThrottle(max_attempts=2, window_seconds=60),
+    )
+    service.create_user(email="reader@example.com", password="correct horse")
+    service.create_user(email="other@example.com", password="correct horse")
+
+    for _ in range(2):
+        with pytest.raises(InvalidCredentialsError):
+            asyncio.run(
+                service.login_async(email="reader@example.com", password="wrong")
+            )
+    with pytest.raises(LoginThrottledError) as exc_info:
+        asyncio.run(
+            service.login_async(email="READER@example.com", password="correct horse")
+        )
+
+    assert exc_info.value.retry_after_seconds >= 1
+    session = asyncio.run(
+        service.login_async(email="other@example.com", password="correct horse")
+    )
+    assert session["user"]["email"] == "other@example.com"
+
+
+def test_auth_session_service_caches_resolution_until_logout(auth_session_service):
+    published: list[str] = []
+    service = AuthSessionService(
+        auth_session_service.repository,
+        session_events=SimpleNamespace(publish=published.append),
+    )
+    user = service.create_user(email="reader@example.com", password="correct horse")
+    bearer_token = service.login(
+        email="reader@example.com",
+        password="correct horse",
+    )["session_id"]
+    reads: list[str] = []
+    read_session_user = service.repository.read_session_user_by_token_hash
+
+    def _counting_read(token_hash: str):
+        reads.append(token_hash)
+        return read_session_user(token_hash)
+
+    service.repository.read_session_user_by_token_hash = _counting_read
+
+    first = asyncio.run(service.resolve_session_async(bearer_token))
+    second = service.resolve_session(bearer_token)
+    service.logout(bearer_token)
+
+    token_hash = sha256(bearer_token.encode("utf-8")).hexdigest()
+    assert first == second == user
+    assert reads == [token_hash]
+    assert published == [f"auth-session-revoked:{token_hash}"]
+    with pytest.raises(SessionNotFoundError):
+        service.resolve_session(bearer_token)
+    assert reads == [token_hash, token_hash]
+
+
+def test_auth_session_service_does_not_cache_session_revoked_during_read(
+    auth_session_service,
+):
+    service = AuthSessionService(auth_session_service.repository)
+    service.create_user(email="reader@example.com", password="correct horse")
+    bearer_token = service.login(
+        email="reader@example.com",
+        password="correct horse",
+    )["session_id"]
+    read_session_user = service.repository.read_session_user_by_token_hash
+
+    def _read_then_logout(token_hash: str):
+        session = read_session_user(token_hash)
+        service.logout(bearer_token)
+        return session
+
+    service.repository.read_session_user_by_token_hash = _read_then_logout
+    service.resolve_session(bearer_token)
+    service.repository.read_session_user_by_token_hash = read_session_user
+
+    token_hash = sha256(bearer_token.encode("utf-8")).hexdigest()
+    assert service.session_cache.get(token_hash) is None
+    with pytest.raises(SessionNotFoundError):
+        service.resolve_session(bearer_token)
+
+
+def test_session_resolution_cache_bounds_entries_by_ttl_expiry_and_size():
+    now = [0.0]
+    cache = SessionResolutionCache(ttl_seconds=30, max_entries=2, clock=lambda: now[0])
+    user = {"user_id": "user-1", "email": "reader@example.com", "display_name": None}
+    soon = datetime.now(timezone.utc) + timedelta(seconds=5)
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    cache.put("expiring", user, expires_at=soon)
+    cache.put("long-lived", user, expires_at=later)
+    now[0] = 10.0
+    assert cache.get("expiring") is None
+    assert cache.get("long-lived") == user
+
+    cache.put("a", user, expires_at=later)
+    cache.put("b", user, expires_at=later)
+    assert cache.get("long-lived") is None
+    cache.invalidate_topic("auth-session-revoked:a")
+    assert cache.get("a") is None
+    assert cache.get("b") == user
+    now[0] = 45.0
+    assert cache.get("b") is None
+
+    generation = cache.generation()
+    cache.invalidate("c")
+    cache.put("c", user, expires_at=later, generation=generation)
+    assert cache.get("c") is None
+    cache.put("c", user, expires_at=later, generation=cache.generation())
+    assert cache.get("c") == user
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Event
+
+import pytest
+
+from application.auth import (
+    LoginThrottle,
+    LoginThrottledError,
+    PasswordWorkerPool,
+    PasswordWorkersBusyError,
+)
+
+
+def test_password_worker_pool_rejects_work_beyond_queue_depth():
+    pool = PasswordWorkerPool(max_workers=1, max_pending=1)
+    release = Event()
+
+    async def _run() -> None:
+        blocked = asyncio.create_task(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+        assert pool.pending == 1
+        with pytest.raises(PasswordWorkersBusyError):
+            await pool.verify_password("secret", "pbkdf2_sha256:1:AA==:AA==")
+        release.set()
+        assert await blocked is True
+        assert pool.pending == 0
+
+    try:
+        asyncio.run(_run())
+    finally:
+        pool.shutdown()
+
+
+def test_login_throttle_uses_sliding_window_and_resets_on_success():
+    now = [0.0]
+    throttle = LoginThrottle(max_attempts=2, window_seconds=10, clock=lambda: now[0])
+
+    throttle.acquire("reader@example.com")
+    throttle.acquire("Reader@Example.com ")
+    with pytest.raises(LoginThrottledError) as exc_info:
+        throttle.acquire("reader@example.com")
+    assert exc_info.value.retry_after_seconds == 10
+
+    now[0] = 10.5
+    throttle.acquire("reader@example.com")
+    throttle.reset("reader@example.com")
+    throttle.acquire("reader@example.com")
+    throttle.acquire("reader@example.com")
@@ -244,6 +244,48 @@ def test_source_table_cell_record_preserves_logical_topology():
     assert restored.row_section is True
 
 
+def test_source_records_are_slotted_and_share_repeated_strings():
+    first, second = (
+        SourceTableCell.from_record(
+            {
+                "cell_id": f"cell-{index}",
+                "document_id": "".join(["doc-", "1"]),
+                "table_id": "".join(["tbl-", "doc-1"]),
+                "row_index": index,
+                "col_index": 0,
+                "cell_text": "12",
+                "header_path": "".join(["Strength / ", "MPa"]),
+                "unit_hint": "".join(["M", "Pa"]),
+            }
+        )
+        for index in range(2)
+    )
+    blocks = [
+        SourceBlock.from_record(
+            {
+                "block_id": f"block-{index}",
+                "document_id": "".join(["doc-", "1"]),
+                "block_type": "".join(["para", "graph"]),
+                "text": "Body",
+                "block_order": index,
+                "text_unit_ids": ["".join(["tu-", "1"])],
+                "heading_path": "".join(["Results / ", "Tensile"]),
+            }
+        )
+        for index in range(2)
+    ]
+
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(blocks[0], "__dict__")
+    assert first.document_id is second.document_id
+    assert first.table_id is second.table_id
+    assert first.header_path is second.header_path
+    assert first.unit_hint is second.unit_hint
+    assert blocks[0].block_type is blocks[1].block_type
+    assert blocks[0].heading_path is blocks[1].heading_path
+    assert blocks[0].text_unit_ids[0] is blocks[1].text_unit_ids[0]
+
+
 def test_source_document_tree_builds_section_parent_child_links():
     document = SourceDocument(
         document_id="doc-1",
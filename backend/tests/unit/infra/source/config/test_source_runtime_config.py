@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pydantic import ValidationError
+import pytest
+
+from infra.source.config.source_runtime_config import FigureConfig, FigureRenderMode
+
+
+def test_figure_render_mode_reads_environment_case_insensitively(monkeypatch) -> None:
+    monkeypatch.setenv("SOURCE_FIGURE_RENDER_MODE", " Lazy ")
+
+    assert FigureConfig().render_mode is FigureRenderMode.lazy
+
+
+def test_figure_render_mode_defaults_to_eager(monkeypatch) -> None:
+    monkeypatch.delenv("SOURCE_FIGURE_RENDER_MODE", raising=False)
+
+    assert FigureConfig().render_mode is FigureRenderMode.eager
+
+
+def test_figure_render_mode_rejects_unknown_environment_values(monkeypatch) -> None:
+    monkeypatch.setenv("SOURCE_FIGURE_RENDER_MODE", "lazzy")
+
+    with pytest.raises(ValidationError, match="render_mode"):
+        FigureConfig()
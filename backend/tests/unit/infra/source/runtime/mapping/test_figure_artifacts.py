@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pandas as pd
+
+from infra.source.runtime.mapping.figure_artifacts import build_pdf_figures
+
+
+def test_lazy_figure_mapping_records_crop_geometry_without_rendering() -> None:
+    def get_image(_document):  # noqa: ANN001, ANN202
+        raise AssertionError("lazy mode must not crop figures during the build")
+
+    picture = SimpleNamespace(
+        prov=[
+            SimpleNamespace(
+                page_no=2,
+                bbox=SimpleNamespace(
+                    l=76,
+                    t=714,
+                    r=535,
+                    b=379,
+                    coord_origin=SimpleNamespace(value="BOTTOMLEFT"),
+                ),
+            )
+        ],
+        captions=[],
+        label="picture",
+        get_image=get_image,
+    )
+
+    figures, assets = build_pdf_figures(
+        document_id="doc-1",
+        document=SimpleNamespace(pictures=[picture]),
+        blocks=pd.DataFrame(),
+        text_items=[],
+        payload=b"",
+        render_mode="lazy",
+    )
+
+    assert assets == {}
+    record = figures.to_dict(orient="records")[0]
+    assert record["image_path"] is None
+    assert record["image_mime_type"] == "image/png"
+    assert record["metadata"]["asset_source"] == "deferred_pdf_crop"
+    assert record["metadata"]["crop_geometry"] == {
+        "page": 2,
+        "bbox": [76.0, 714.0, 535.0, 379.0],
+        "coord_origin": "BOTTOMLEFT",
+    }
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from domain.source import SourceLayoutBlock, find_nearest_caption_block
+from infra.source.runtime.mapping.layout_binding import (
+    PageCaptionIndex,
+    PageRegionIndex,
+    bbox_extent,
+)
+
+
+def _bbox(l: float, t: float, r: float, b: float) -> SimpleNamespace:
+    return SimpleNamespace(l=l, t=t, r=r, b=b)
+
+
+def test_page_region_index_checks_containment_on_the_queried_page_only() -> None:
+    index = PageRegionIndex(
+        [
+            (1, _bbox(76, 714, 535, 379)),
+            (1, _bbox(300, 300, 500, 100)),
+            (2, _bbox(0, 800, 600, 0)),
+            (None, _bbox(0, 800, 600, 0)),
+            (3, object()),
+        ]
+    )
+
+    assert len(index) == 3
+    assert bbox_extent(_bbox(10, 5, 2, 20)) == (2.0, 5.0, 10.0, 20.0)
+    assert index.contains(1, _bbox(160, 397, 180, 392))
+    assert index.contains(1, _bbox(310, 150, 490, 120))
+    assert not index.contains(1, _bbox(72, 760, 540, 730))
+    assert not index.contains(1, _bbox(60, 397, 180, 392))
+    assert index.contains(2, _bbox(72, 760, 540, 730))
+    assert not index.contains(3, _bbox(72, 760, 540, 730))
+    assert not index.contains(None, _bbox(160, 397, 180, 392))
+    assert not index.contains(1, None)
+
+
+def test_page_caption_index_matches_nearest_caption_fallback() -> None:
+    captions = [
+        SourceLayoutBlock(f"cap-{order}", f"Figure {order}", page, order, "figure_caption", None)
+        for order, page in ((4, 2), (1, 1), (3, 2), (2, 1), (5, None))
+    ]
+    captions.append(SourceLayoutBlock(None, "Figure 9", 1, 0, "figure_caption", None))
+    index = PageCaptionIndex(captions)
+    used: set[str] = set()
+
+    for page in (2, 1, None, 1, 2, 1, None, 2):
+        expected = find_nearest_caption_block(
+            page=page,
+            caption_blocks=captions,
+            used_block_ids=used,
+        )
+        assert index.nearest(page=page, used_block_ids=used) == expected
+        if expected is not None:
+            used.add(str(expected.block_id))
+
+    assert used == {"cap-1", "cap-2", "cap-3", "cap-4", "cap-5"}
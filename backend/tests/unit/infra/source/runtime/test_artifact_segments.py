@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from infra.source.contracts.artifact_schemas import (
+    BLOCKS_FINAL_COLUMNS,
+    DOCUMENTS_FINAL_COLUMNS,
+    FIGURES_FINAL_COLUMNS,
+    TABLE_CELLS_FINAL_COLUMNS,
+    TABLES_FINAL_COLUMNS,
+    TABLE_ROWS_FINAL_COLUMNS,
+    TEXT_UNITS_FINAL_COLUMNS,
+)
+from infra.source.runtime.artifact_bundle import SourceArtifactBundle
+from infra.source.runtime.storage.artifact_segments import SourceArtifactSegmentWriter
+from infra.source.runtime.storage.file_pipeline_storage import FilePipelineStorage
+
+
+def _frame(records: list[dict], columns: list[str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{column: record.get(column) for column in columns} for record in records],
+        columns=columns,
+    ).astype(object)
+
+
+def _bundle(document_id: str, *, with_figure: bool = False) -> SourceArtifactBundle:
+    figure_path = f"image_assets/{document_id}-fig.png"
+    return SourceArtifactBundle(
+        documents=_frame(
+            [{"id": document_id, "document_order": 0, "title": document_id, "text": ""}],
+            DOCUMENTS_FINAL_COLUMNS,
+        ),
+        text_units=_frame(
+            [
+                {
+                    "id": f"{document_id}-tu-{index}",
+                    "text_unit_order": index,
+                    "text": f"unit {index}",
+                    "n_tokens": 2,
+                    "document_ids": [document_id],
+                }
+                for index in range(2)
+            ],
+            TEXT_UNITS_FINAL_COLUMNS,
+        ),
+        blocks=_frame([], BLOCKS_FINAL_COLUMNS),
+        figures=_frame(
+            (
+                [
+                    {
+                        "figure_id": f"{document_id}-fig",
+                        "document_id": document_id,
+                        "figure_order": 1,
+                        "image_path": figure_path,
+                        "metadata": {},
+                    }
+                ]
+                if with_figure
+                else []
+            ),
+            FIGURES_FINAL_COLUMNS,
+        ),
+        tables=_frame([], TABLES_FINAL_COLUMNS),
+        table_rows=_frame([], TABLE_ROWS_FINAL_COLUMNS),
+        table_cells=_frame([], TABLE_CELLS_FINAL_COLUMNS),
+        figure_assets={figure_path: b"png-bytes"} if with_figure else {},
+    )
+
+
+def test_segment_writer_streams_documents_with_running_order(tmp_path) -> None:
+    storage = FilePipelineStorage(base_dir=str(tmp_path / "output"))
+    stale = tmp_path / "output" / "documents.parts" / "part-000009.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("{}")
+    writer = SourceArtifactSegmentWriter(storage)
+
+    async def _run() -> list[tuple]:
+        await writer.reset()
+        await writer.append(_bundle("doc-a"))
+        await writer.append(_bundle("doc-b", with_figure=True))
+        return [batch async for batch in writer.result().document_batches()]
+
+    batches = asyncio.run(_run())
+    result = writer.result()
+    documents = [document for batch in batches for document in batch]
+
+    assert result.document_count == 2
+    assert [len(batch) for batch in batches] == [1, 1]
+    assert [document.document_id for document in documents] == ["doc-a", "doc-b"]
+    assert [document.document_order for document in documents] == [0, 1]
+    assert [
+        unit.text_unit_order
+        for document in documents
+        for unit in document.text_units
+    ] == [0, 1, 2, 3]
+    assert [figure.image_path for figure in documents[1].figures] == [
+        "image_assets/doc-b-fig.png"
+    ]
+    assert sorted(path.name for path in stale.parent.iterdir()) == [
+        "part-000000.json",
+        "part-000001.json",
+    ]
+    segment = json.loads(
+        (tmp_path / "output" / "text_units.parts" / "part-000001.json").read_text()
+    )
+    assert [record["text_unit_order"] for record in segment["records"]] == [2, 3]
+    assert not (tmp_path / "output" / "figures.parts" / "part-000000.json").exists()
+    assert list(result.figure_assets) == ["image_assets/doc-b-fig.png"]
+    assert result.figure_assets["image_assets/doc-b-fig.png"] == b"png-bytes"
+    assert result.figure_assets.get("image_assets/missing.png") is None
+
+
+def test_segment_writer_rejects_duplicate_documents_across_segments(tmp_path) -> None:
+    writer = SourceArtifactSegmentWriter(
+        FilePipelineStorage(base_dir=str(tmp_path / "output"))
+    )
+
+    async def _run() -> None:
+        await writer.append(_bundle("doc-a"))
+        await writer.append(_bundle("doc-a"))
+
+    with pytest.raises(ValueError, match="duplicate document ids"):
+        asyncio.run(_run())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tracemalloc
+
+import pytest
+
+from infra.source.config.source_runtime_config import SourceRuntimeConfig
+from infra.source.runtime.memory_profile import WorkflowMemoryProbe, trace_allocations
+from infra.source.runtime.run_context import create_run_context
+from infra.source.runtime.run_pipeline import _run_pipeline
+from infra.source.runtime.typing.pipeline import Pipeline
+from infra.source.runtime.typing.workflow import WorkflowFunctionOutput
+from infra.tracing.spans import capture_spans
+
+
+def _allocate() -> list[bytes]:
+    return [bytes(4096) for _ in range(256)]
+
+
+def test_workflow_memory_probe_reports_heap_growth_sites() -> None:
+    with trace_allocations():
+        with WorkflowMemoryProbe(top_n=3) as probe:
+            retained = _allocate()
+
+    assert not tracemalloc.is_tracing()
+    profile = probe.profile
+    assert profile is not None
+    assert len(retained) == 256
+    assert profile.traced_peak_bytes >= 256 * 4096
+    assert profile.traced_delta_bytes >= 256 * 4096
+    assert profile.top_allocations
+    assert profile.top_allocations[0].location.endswith(
+        f"test_memory_profile.py:{_allocate.__code__.co_firstlineno + 1}"
+    )
+    assert len(profile.top_allocations) <= 3
+
+
+def test_workflow_memory_probe_requires_active_tracing() -> None:
+    with pytest.raises(RuntimeError, match="trace_allocations"):
+        with WorkflowMemoryProbe():
+            pass
+
+
+def test_run_pipeline_records_memory_profile_in_stats_and_spans() -> None:
+    async def allocate_workflow(config, context):  # noqa: ANN001, ARG001
+        context.state["retained"] = len(_allocate())
+        return WorkflowFunctionOutput(result=None)
+
+    context = create_run_context()
+
+    async def _collect() -> list:
+        return [
+            output
+            async for output in _run_pipeline(
+                Pipeline([("allocate", allocate_workflow)]),
+                SourceRuntimeConfig(),
+                context,
+                memory_profile=True,
+            )
+        ]
+
+    with capture_spans() as spans:
+        outputs = asyncio.run(_collect())
+
+    assert [output.errors for output in outputs] == [None]
+    stats = json.loads(asyncio.run(context.output_storage.get("stats.json")))
+    workflow = stats["workflows"]["allocate"]
+    assert workflow["overall"] >= 0
+    assert workflow["traced_peak_bytes"] >= 256 * 4096
+    assert "peak_rss_bytes" in workflow
+    assert stats["top_allocations"]["allocate"][0]["size_bytes"] > 0
+    (timing,) = spans.timings()
+    assert timing.path == "allocate"
+    assert timing.counters["traced_peak_bytes"] == workflow["traced_peak_bytes"]
+
+
+def test_run_pipeline_skips_memory_profile_by_default() -> None:
+    async def noop_workflow(config, context):  # noqa: ANN001, ARG001
+        return WorkflowFunctionOutput(result=None)
+
+    context = create_run_context()
+
+    async def _drain() -> None:
+        async for _output in _run_pipeline(
+            Pipeline([("noop", noop_workflow)]),
+            SourceRuntimeConfig(),
+            context,
+        ):
+            pass
+
+    asyncio.run(_drain())
+
+    assert set(context.stats.workflows["noop"]) == {"overall"}
+    assert context.stats.top_allocations == {}
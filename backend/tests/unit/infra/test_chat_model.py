@@ -145,3 +145,63 @@ def test_openai_chat_model_rejects_multiple_or_non_object_tool_arguments() -> No
 
     with pytest.raises(ValueError, match="JSON object"):
         model.respond(messages=(_message(),), tool_specs=())
+
+
+def _chunk(*, content: str | None = None, tool_calls: list | None = None, usage=None):  # noqa: ANN001, ANN202
+    choices = (
+        []
+        if content is None and tool_calls is None
+        else [SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))]
+    )
+    return SimpleNamespace(model="test-model", choices=choices, usage=usage)
+
+
+def _fragment(*, id=None, name=None, arguments=None):  # noqa: A002, ANN001, ANN202
+    return SimpleNamespace(
+        index=0,
+        id=id,
+        type="function" if id else None,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def test_openai_chat_model_streams_answer_text_and_assembles_tool_calls() -> None:
+    client, completions = _client(
+        [
+            _chunk(content="你好，"),
+            _chunk(content="我可以帮助分析文献。"),
+            _chunk(usage=SimpleNamespace(prompt_tokens=3, completion_tokens=4)),
+        ]
+    )
+    model = OpenAIChatModel(client=client, model="test-model")
+    deltas: list[str] = []
+
+    turn = model.respond_streaming(
+        messages=(_message(),),
+        tool_specs=(),
+        on_text_delta=deltas.append,
+    )
+
+    assert deltas == ["你好，", "我可以帮助分析文献。"]
+    assert turn.content == "你好，我可以帮助分析文献。"
+    assert completions.calls[0]["stream"] is True
+    assert completions.calls[0]["stream_options"] == {"include_usage": True}
+
+    client, _completions = _client(
+        [
+            _chunk(tool_calls=[_fragment(id="call-1", name="get_collection_context")]),
+            _chunk(tool_calls=[_fragment(arguments='{"include_')]),
+            _chunk(tool_calls=[_fragment(arguments='documents":true}')]),
+        ]
+    )
+    model = OpenAIChatModel(client=client, model="test-model")
+
+    turn = model.respond_streaming(
+        messages=(_message(),),
+        tool_specs=(),
+        on_text_delta=deltas.append,
+    )
+
+    assert turn.tool_call is not None
+    assert turn.tool_call.tool_call_id == "call-1"
+    assert turn.tool_call.arguments == {"include_documents": True}
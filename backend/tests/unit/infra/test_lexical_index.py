@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from infra.source.retrieval import (
+    LexicalEntry,
+    LexicalIndex,
+    LexicalIndexBuilder,
+    tokenize_lexical,
+)
+
+
+def _index() -> LexicalIndex:
+    return LexicalIndex.build(
+        (
+            LexicalEntry("b1", "block", "doc-1", "Scan speed controls melt pool overlap."),
+            LexicalEntry("b2", "block", "doc-1", "Corrosion resistance after heat treatment."),
+            LexicalEntry(
+                "b3",
+                "block",
+                "doc-2",
+                "Higher scanning speeds reduce the melt pool size.",
+                page=3,
+            ),
+            LexicalEntry("tu-1", "text_unit", "doc-2", "激光功率影响致密度和熔池尺寸"),
+            LexicalEntry("empty", "block", "doc-2", "of the"),
+        )
+    )
+
+
+def test_tokenizer_folds_case_plurals_and_splits_cjk_into_bigrams() -> None:
+    assert tokenize_lexical("The Samples of 316L showed cracks; a 5 mm gap") == [
+        "sample",
+        "316l",
+        "showed",
+        "crack",
+        "5",
+        "mm",
+        "gap",
+    ]
+    assert tokenize_lexical("激光功率") == ["激光", "光功", "功率"]
+
+
+def test_lexical_index_ranks_by_bm25_and_applies_filters() -> None:
+    index = _index()
+
+    hits = index.search("scanning speed and melt pool size", k=5)
+
+    assert [hit.entry_id for hit in hits] == ["b3", "b1"]
+    assert hits[0].page == 3
+    assert hits[0].preview == "Higher scanning speeds reduce the melt pool size."
+    assert [hit.entry_id for hit in index.search("melt pool", document_ids={"doc-1"})] == [
+        "b1"
+    ]
+    assert index.search("熔池", kinds={"block"}) == ()
+    assert [hit.entry_id for hit in index.search("熔池尺寸")] == ["tu-1"]
+    assert index.search("melt pool", document_ids={"doc-missing"}) == ()
+    assert index.search("unmatched vocabulary") == ()
+    assert index.entry_count == 4
+
+
+def test_lexical_index_round_trips_its_compact_serialization() -> None:
+    index = _index()
+
+    payload = index.to_bytes()
+    restored = LexicalIndex.from_bytes(payload)
+
+    assert payload == index.to_bytes()
+    assert restored.search("melt pool", k=3) == index.search("melt pool", k=3)
+    assert restored.term_count == index.term_count
+    with pytest.raises(ValueError, match="truncated"):
+        LexicalIndex.from_bytes(gzip.compress(gzip.decompress(payload)[:-4]))
+
+
+def test_lexical_index_builder_matches_a_single_pass_build() -> None:
+    index = _index()
+    builder = LexicalIndexBuilder()
+
+    builder.add(
+        (
+            LexicalEntry("b1", "block", "doc-1", "Scan speed controls melt pool overlap."),
+            LexicalEntry("b2", "block", "doc-1", "Corrosion resistance after heat treatment."),
+        )
+    )
+    builder.add(
+        (
+            LexicalEntry(
+                "b3",
+                "block",
+                "doc-2",
+                "Higher scanning speeds reduce the melt pool size.",
+                page=3,
+            ),
+            LexicalEntry("b1", "block", "doc-1", "Duplicate ids are skipped."),
+            LexicalEntry("tu-1", "text_unit", "doc-2", "激光功率影响致密度和熔池尺寸"),
+            LexicalEntry("empty", "block", "doc-2", "of the"),
+        )
+    )
+
+    assert builder.build().to_bytes() == index.to_bytes()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai import InternalServerError
+
+from infra.llm.transport import (
+    AdaptiveRateLimiter,
+    LLMTransport,
+    LLMTransportSettings,
+    RetryBudget,
+    estimate_request_tokens,
+)
+from infra.llm.usage import (
+    current_llm_task_type,
+    llm_task_type,
+    record_llm_prompt_version,
+)
+
+_COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "test-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+}
+_REQUEST = {"model": "test-model", "messages": [{"role": "user", "content": "hi"}]}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _transport(responses, **settings):  # noqa: ANN001, ANN003
+    calls: list[httpx.Request] = []
+    sleeps: list[float] = []
+    pending = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return pending.pop(0)
+
+    async def sleep(delay_s: float) -> None:
+        sleeps.append(delay_s)
+
+    transport = LLMTransport(
+        LLMTransportSettings(api_key="test", base_url="http://llm.test/v1", **settings),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        sleep=sleep,
+        jitter=lambda: 0.0,
+    )
+    return transport, calls, sleeps
+
+
+def test_transport_retries_throttled_requests_after_retry_after():
+    transport, calls, sleeps = _transport(
+        [
+            httpx.Response(429, headers={"retry-after-ms": "20"}, json={"error": {}}),
+            httpx.Response(200, json=_COMPLETION),
+        ]
+    )
+
+    completion = asyncio.run(
+        transport.request(
+            "chat.completions.create",
+            _REQUEST,
+            task_type="paper_skim",
+        )
+    )
+
+    assert completion.choices[0].message.content == "ok"
+    assert len(calls) == 2
+    assert sleeps == [pytest.approx(0.02)]
+    assert transport.limiter.rate_scale == pytest.approx(0.55)
+
+
+def test_transport_stops_retrying_when_the_retry_budget_is_spent():
+    transport, calls, sleeps = _transport(
+        [
+            httpx.Response(500, json={"error": {}}),
+            httpx.Response(500, json={"error": {}}),
+            httpx.Response(200, json=_COMPLETION),
+        ],
+        retry_budget_ratio=0.0,
+        retry_budget_burst=1.0,
+    )
+
+    with pytest.raises(InternalServerError):
+        asyncio.run(transport.request("chat.completions.create", _REQUEST))
+
+    assert len(calls) == 2
+    assert len(sleeps) == 1
+    assert transport.retry_budget.available == 0.0
+
+
+def test_sync_client_prioritizes_by_scoped_task_type():
+    transport, calls, _sleeps = _transport(
+        [httpx.Response(200, json=_COMPLETION), httpx.Response(200, json=_COMPLETION)]
+    )
+    seen: list[str | None] = []
+    request = transport.request
+
+    async def recording_request(operation, payload, *, task_type=None):  # noqa: ANN001, ANN202
+        seen.append(task_type)
+        return await request(operation, payload, task_type=task_type)
+
+    transport.request = recording_request  # type: ignore[method-assign]
+    client = transport.sync_client()
+
+    with llm_task_type("finding_synthesis"):
+        record_llm_prompt_version("finding_synthesis", "v1")
+        completion = client.chat.completions.create(**_REQUEST)
+    assert current_llm_task_type() is None
+    record_llm_prompt_version("paper_framing", "v1")
+    client.chat.completions.create(**_REQUEST)
+
+    assert completion.usage.total_tokens == 5
+    assert seen == ["finding_synthesis", None]
+    assert len(calls) == 2
+
+
+def test_rate_limiter_pauses_until_reported_reset_and_clamps_buckets():
+    clock = _Clock()
+    limiter = AdaptiveRateLimiter(
+        requests_per_minute=600,
+        tokens_per_minute=60_000,
+        clock=clock,
+    )
+
+    limiter.observe_headers(
+        {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "1m0.5s",
+            "x-ratelimit-remaining-tokens": "500",
+        }
+    )
+
+    assert limiter._admission_delay(100) == pytest.approx(60.5)
+    clock.now += 60.5
+    assert limiter._admission_delay(100) == pytest.approx(0.0)
+    assert limiter._admission_delay(50_000) > 0
+
+
+def test_rate_limiter_admits_waiters_in_priority_order():
+    async def scenario() -> list[str]:
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=60_000,
+            tokens_per_minute=6_000_000,
+        )
+        limiter.observe_headers(
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "30ms",
+            }
+        )
+        admitted: list[str] = []
+
+        async def acquire(name: str, priority: int) -> None:
+            await limiter.acquire(tokens=10, priority=priority)
+            admitted.append(name)
+
+        tasks = []
+        for name, priority in (("bulk", 2), ("analysis", 1), ("chat", 0)):
+            tasks.append(asyncio.create_task(acquire(name, priority)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return admitted
+
+    assert asyncio.run(scenario()) == ["chat", "analysis", "bulk"]
+
+
+def test_retry_budget_refills_with_requests_up_to_burst():
+    budget = RetryBudget(ratio=0.5, burst=1.0)
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+    budget.record_request()
+    budget.record_request()
+    budget.record_request()
+    assert budget.available == 1.0
+
+
+def test_estimate_request_tokens_reserves_completion_budget():
+    assert estimate_request_tokens(
+        {"messages": [{"role": "user", "content": "x" * 400}], "max_completion_tokens": 50}
+    ) == pytest.approx(160, abs=10)
+
+
+def test_sync_client_relays_streamed_chunks_from_the_transport_loop():
+    chunks = [
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "test-model",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        }
+        for text in ("o", "k")
+    ]
+    body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks)
+    transport, calls, _sleeps = _transport(
+        [
+            httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=f"{body}data: [DONE]\n\n".encode(),
+            )
+        ]
+    )
+    client = transport.sync_client(task_type="research_agent")
+
+    stream = client.chat.completions.create(**_REQUEST, stream=True)
+
+    assert [chunk.choices[0].delta.content for chunk in stream] == ["o", "k"]
+    assert json.loads(calls[0].content)["stream"] is True
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from infra.notifications.progress import (
+    ProgressHub,
+    objective_analysis_progress_topic,
+    task_progress_topic,
+)
+
+
+def test_progress_hub_wakes_subscribers_of_the_published_topic_only() -> None:
+    hub = ProgressHub()
+
+    async def scenario() -> tuple[bool, bool, bool]:
+        async with (
+            hub.subscribe(task_progress_topic("task-1")) as watched,
+            hub.subscribe(task_progress_topic("task-2")) as other,
+        ):
+            publisher = threading.Thread(
+                target=hub.publish,
+                args=(task_progress_topic("task-1"),),
+            )
+            publisher.start()
+            publisher.join()
+            woke = await watched.wait(1.0)
+            other_woke = await other.wait(0.05)
+            woke_again = await watched.wait(0.05)
+        return woke, other_woke, woke_again
+
+    assert asyncio.run(scenario()) == (True, False, False)
+    assert hub.subscriber_count(task_progress_topic("task-1")) == 0
+
+
+def test_progress_hub_coalesces_bursts_and_ignores_unwatched_topics() -> None:
+    hub = ProgressHub()
+    topic = objective_analysis_progress_topic("col-1", "obj-1")
+    hub.publish(topic)
+
+    async def scenario() -> tuple[bool, bool]:
+        async with hub.subscribe(topic) as subscription:
+            for _ in range(5):
+                hub.publish(topic)
+            await asyncio.sleep(0)
+            return await subscription.wait(1.0), await subscription.wait(0.05)
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert topic == "objective-analysis:col-1:obj-1"
+
+
+def test_progress_hub_calls_prefix_listeners_on_publish() -> None:
+    hub = ProgressHub()
+    received: list[str] = []
+    hub.add_listener("auth-session-revoked:", received.append)
+
+    def _failing_listener(topic: str) -> None:
+        raise RuntimeError(topic)
+
+    hub.add_listener("auth-session-revoked:", _failing_listener)
+    hub.publish(task_progress_topic("task-1"))
+    hub.publish("auth-session-revoked:abc")
+
+    assert received == ["auth-session-revoked:abc"]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import tiktoken
+
+from infra.llm.tokenizer import count_text_tokens, count_tokens, encode_texts
+from infra.source.runtime.chunking import (
+    TokenChunkerOptions,
+    split_multiple_texts_on_tokens,
+)
+
+
+def _byte_encoding() -> tiktoken.Encoding:
+    return tiktoken.Encoding(
+        name="test_bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([value]): value for value in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+
+
+def test_count_tokens_batches_in_input_order_and_ignores_special_markers() -> None:
+    encoding = _byte_encoding()
+    texts = [f"text {index}" * (index % 3 + 1) for index in range(40)]
+
+    counts = count_tokens(texts, encoding=encoding, num_threads=4)
+
+    assert counts == [len(text.encode("utf-8")) for text in texts]
+    assert count_tokens(texts[:2], encoding=encoding) == counts[:2]
+    assert count_tokens([], encoding=encoding) == []
+    assert count_text_tokens("<|endoftext|>", encoding=encoding) == 13
+
+
+def test_token_chunker_uses_batch_encoding_when_available() -> None:
+    encoding = _byte_encoding()
+    batch_calls: list[list[str]] = []
+
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        batch_calls.append(list(texts))
+        return encode_texts(texts, encoding=encoding)
+
+    ticks: list[int] = []
+    chunks = split_multiple_texts_on_tokens(
+        ["abcdef", "ghij"],
+        TokenChunkerOptions(
+            chunk_overlap=2,
+            tokens_per_chunk=6,
+            decode=encoding.decode,
+            encode=encoding.encode_ordinary,
+            encode_batch=encode_batch,
+        ),
+        ticks.append,
+    )
+
+    assert batch_calls == [["abcdef", "ghij"]]
+    assert ticks == [1, 1]
+    assert [(chunk.text_chunk, chunk.n_tokens) for chunk in chunks] == [
+        ("abcdef", 6),
+        ("efghij", 6),
+    ]
+    assert sorted(chunks[1].source_doc_indices) == [0, 1]
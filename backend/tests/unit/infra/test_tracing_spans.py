@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+import json
+
+from domain.pipeline import ExecutionStats, SpanTiming
+from infra.tracing.spans import (
+    add_span_counter,
+    capture_spans,
+    export_chrome_trace,
+    span,
+)
+
+
+def test_spans_aggregate_nested_paths_and_counters() -> None:
+    with capture_spans() as recorder:
+        with span("paper_facts"):
+            for _ in range(3):
+                with span("extract", job_count=2):
+                    add_span_counter("retries")
+            with span("persist") as current:
+                current.add("row_count", 7)
+
+    timings = {timing.path: timing for timing in recorder.timings()}
+
+    assert list(timings) == [
+        "paper_facts",
+        "paper_facts/extract",
+        "paper_facts/persist",
+    ]
+    assert timings["paper_facts/extract"].count == 3
+    assert timings["paper_facts/extract"].counters == {"job_count": 6, "retries": 3}
+    assert timings["paper_facts/persist"].counters == {"row_count": 7}
+    assert timings["paper_facts"].total_ms >= timings["paper_facts/extract"].total_ms
+
+
+def test_spans_follow_copied_context_into_worker_threads() -> None:
+    def job() -> None:
+        with span("job"):
+            with span("llm_wait"):
+                pass
+
+    with capture_spans() as recorder:
+        with span("extract"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(copy_context().run, job) for _ in range(4)]
+                for future in futures:
+                    future.result()
+
+    timings = {timing.path: timing for timing in recorder.timings()}
+
+    assert timings["extract/job"].count == 4
+    assert timings["extract/job/llm_wait"].count == 4
+
+
+def test_spans_are_inert_without_an_active_recorder() -> None:
+    with span("unrecorded") as current:
+        current.add("row_count", 3)
+        add_span_counter("row_count")
+
+    with capture_spans() as recorder:
+        pass
+
+    assert recorder.timings() == ()
+
+
+def test_span_timings_attach_to_execution_stats_and_round_trip() -> None:
+    with capture_spans() as recorder:
+        with span("node", row_count=2):
+            pass
+
+    stats = recorder.execution_stats(ExecutionStats(duration_ms=5))
+    record = stats.to_record()
+
+    assert [item["path"] for item in record["spans"]] == ["node"]
+    assert ExecutionStats.from_mapping(record) == stats
+    assert "spans" not in ExecutionStats(duration_ms=5).to_record()
+
+
+def test_execution_stats_aggregate_merges_spans_by_path() -> None:
+    stats = ExecutionStats.aggregate(
+        (
+            ExecutionStats(spans=(SpanTiming("node/load", 1, 4.0, 4.0, {"rows": 2}),)),
+            ExecutionStats(spans=(SpanTiming("node/load", 2, 6.0, 5.0, {"rows": 1}),)),
+        )
+    )
+
+    assert stats.spans == (SpanTiming("node/load", 3, 10.0, 5.0, {"rows": 3}),)
+
+
+def test_chrome_trace_export_is_opt_in_and_bounded(tmp_path, monkeypatch) -> None:
+    with capture_spans(max_events=2) as recorder:
+        for _ in range(3):
+            with span("step"):
+                pass
+
+    monkeypatch.delenv("PIPELINE_TRACE_DIR", raising=False)
+    assert export_chrome_trace(recorder, "build-task/1") is None
+
+    monkeypatch.setenv("PIPELINE_TRACE_DIR", str(tmp_path))
+    path = export_chrome_trace(recorder, "build-task/1")
+
+    assert path == tmp_path / "build-task_1.trace.json"
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    assert [event["name"] for event in trace["traceEvents"]] == ["step", "step"]
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert trace["otherData"] == {"dropped_event_count": 1}
+    assert recorder.timings()[0].count == 3
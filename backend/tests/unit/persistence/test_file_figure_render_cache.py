@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+
+import pytest
+
+from infra.persistence.file import FileCollectionWorkspace, FileFigureRenderCache
+
+
+def _key(value: str) -> str:
+    return sha256(value.encode("utf-8")).hexdigest()
+
+
+def test_figure_render_cache_evicts_least_recently_used_renders(tmp_path) -> None:
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    cache = FileFigureRenderCache(workspace, max_bytes_per_collection=10)
+
+    cache.write("col-1", _key("a"), b"aaaa")
+    cache.write("col-1", _key("b"), b"bbbb")
+    assert cache.read("col-1", _key("a")) == b"aaaa"
+    cache.write("col-1", _key("c"), b"cccc")
+
+    assert cache.contains("col-1", _key("a"))
+    assert not cache.contains("col-1", _key("b"))
+    assert cache.read("col-1", _key("c")) == b"cccc"
+    cache.write("col-1", _key("huge"), b"x" * 11)
+    assert not cache.contains("col-1", _key("huge"))
+
+    restarted = FileFigureRenderCache(workspace, max_bytes_per_collection=10)
+    restarted.write("col-1", _key("d"), b"dddd")
+    assert sum(
+        restarted.contains("col-1", _key(name)) for name in ("a", "c", "d")
+    ) == 2
+    assert restarted.contains("col-1", _key("d"))
+    assert (
+        workspace.get_paths("col-1").output_dir / "figure_render_cache"
+    ).is_dir()
+
+
+def test_figure_render_cache_rejects_unsafe_keys(tmp_path) -> None:
+    cache = FileFigureRenderCache(FileCollectionWorkspace(tmp_path / "collections"))
+
+    with pytest.raises(ValueError):
+        cache.write("col-1", "../escape", b"")
+
+
+def test_figure_render_cache_concurrent_writes_use_separate_temp_files(
+    tmp_path,
+) -> None:
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    cache = FileFigureRenderCache(workspace)
+    payloads = [bytes([index]) * 4096 for index in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda payload: cache.write("col-1", _key("same"), payload),
+                payloads,
+            )
+        )
+
+    assert cache.read("col-1", _key("same")) in payloads
+    cache_dir = workspace.get_paths("col-1").output_dir / "figure_render_cache"
+    assert [path.name for path in cache_dir.iterdir()] == [f"{_key('same')}.png"]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from hashlib import sha256
+import io
+import shutil
 
 import pytest
 
@@ -77,8 +79,8 @@ def test_file_object_store_delete_is_idempotent(tmp_path):
     digest = _digest(payload)
     store.write(storage_key, payload, digest)
 
-    store.delete(storage_key)
-    store.delete(storage_key)
+    assert store.delete(storage_key, digest) is True
+    assert store.delete(storage_key, digest) is False
 
     with pytest.raises(FileNotFoundError):
         store.read(storage_key, digest)
@@ -138,3 +140,104 @@ def test_file_object_store_rejects_invalid_sha256(tmp_path, digest):
 
     with pytest.raises(ValueError, match="invalid SHA-256"):
         store.write("col_demo/input/paper.pdf", b"paper bytes", digest)
+
+
+def test_file_object_store_commits_staged_stream_without_rehashing(tmp_path):
+    root = tmp_path / "objects"
+    store = FileObjectStore(root)
+    payload = b"streamed paper bytes" * 100_000
+    storage_key = "col_demo/input/paper.pdf"
+
+    staged = store.stage(io.BytesIO(payload))
+    store.commit_staged(storage_key, staged)
+    store.discard_staged(staged)
+
+    assert staged.sha256 == _digest(payload)
+    assert staged.size_bytes == len(payload)
+    assert store.read(storage_key, staged.sha256) == payload
+    assert list((root / ".staging").iterdir()) == []
+
+
+def test_file_object_store_staged_commit_keeps_immutable_bytes(tmp_path):
+    store = FileObjectStore(tmp_path / "objects")
+    storage_key = "col_demo/input/paper.pdf"
+    original = b"original bytes"
+    store.write(storage_key, original, _digest(original))
+
+    same = store.stage(io.BytesIO(original))
+    store.commit_staged(storage_key, same)
+    replacement = store.stage(io.BytesIO(b"replacement bytes"))
+    with pytest.raises(FileExistsError, match="immutable object already exists"):
+        store.commit_staged(storage_key, replacement)
+    store.discard_staged(replacement)
+
+    assert store.read(storage_key, _digest(original)) == original
+    assert list((tmp_path / "objects" / ".staging").iterdir()) == []
+
+
+def test_file_object_store_stores_identical_bytes_once(tmp_path):
+    root = tmp_path / "objects"
+    store = FileObjectStore(root)
+    payload = b"shared paper bytes"
+    digest = _digest(payload)
+
+    store.write("col_a/input/paper.pdf", payload, digest)
+    store.commit_staged("col_b/input/paper.pdf", store.stage(io.BytesIO(payload)))
+
+    first = (root / "col_a/input/paper.pdf").stat()
+    second = (root / "col_b/input/paper.pdf").stat()
+    blob = root / "objects" / "sha256" / digest[:2] / digest[2:4] / digest
+    assert first.st_ino == second.st_ino == blob.stat().st_ino
+    assert blob.stat().st_nlink == 3
+
+
+def test_file_object_store_reads_verified_content_without_rehashing(
+    tmp_path,
+    monkeypatch,
+):
+    store = FileObjectStore(tmp_path / "objects")
+    payload = b"paper bytes"
+    digest = _digest(payload)
+    store.write("col_demo/input/paper.pdf", payload, digest)
+
+    def _fail_hash(*_args, **_kwargs):
+        raise AssertionError("verified content was rehashed")
+
+    monkeypatch.setattr(
+        "infra.persistence.file.object_store.hash_sha256",
+        _fail_hash,
+    )
+
+    assert store.read("col_demo/input/paper.pdf", digest) == payload
+
+
+def test_file_object_store_releases_content_after_the_last_reference(tmp_path):
+    root = tmp_path / "objects"
+    store = FileObjectStore(root)
+    payload = b"paper bytes"
+    digest = _digest(payload)
+    blob = root / "objects" / "sha256" / digest[:2] / digest[2:4] / digest
+    store.write("col_a/input/paper.pdf", payload, digest)
+    store.write("col_b/input/paper.pdf", payload, digest)
+
+    assert store.delete("col_a/input/paper.pdf", digest) is False
+    assert blob.exists()
+    assert store.delete("col_b/input/paper.pdf", digest) is True
+    assert not blob.exists()
+
+    store.write("col_c/input/paper.pdf", payload, digest)
+    (root / "col_c" / "input" / "paper.pdf").unlink()
+    assert store.release(digest) is True
+    store.write("col_d/input/paper.pdf", payload, digest)
+    shutil.rmtree(root / "col_d")
+    assert store.collect_unreferenced() == 1
+    assert not blob.exists()
+
+
+@pytest.mark.parametrize("storage_key", ["objects/sha256/paper.pdf", ".staging/x"])
+def test_file_object_store_reserves_internal_directories(tmp_path, storage_key):
+    store = FileObjectStore(tmp_path / "objects")
+    payload = b"paper bytes"
+
+    with pytest.raises(ValueError, match="invalid storage key"):
+        store.write(storage_key, payload, _digest(payload))
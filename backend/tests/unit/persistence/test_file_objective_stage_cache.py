@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from hashlib import sha256
+import os
+import time
+
+import pytest
+
+from infra.persistence.file import FileCollectionWorkspace, FileObjectiveStageCache
+
+
+def _key(value: str) -> str:
+    return sha256(value.encode("utf-8")).hexdigest()
+
+
+def test_file_objective_stage_cache_round_trips_records(tmp_path):
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    cache = FileObjectiveStageCache(workspace)
+    key = _key("paper-1")
+
+    assert cache.read_stage("col_demo", "paper_frame", key) is None
+
+    cache.write_stage(
+        "col_demo",
+        "paper_frame",
+        key,
+        ({"document_id": "paper-1", "relevance": "relevant"},),
+    )
+
+    assert cache.read_stage("col_demo", "paper_frame", key) == (
+        {"document_id": "paper-1", "relevance": "relevant"},
+    )
+    assert cache.read_stage("col_other", "paper_frame", key) is None
+    assert (
+        workspace.get_paths("col_demo").output_dir
+        / "objective_stage_cache"
+        / "paper_frame"
+        / key[:2]
+        / f"{key}.json"
+    ).is_file()
+
+
+def test_file_objective_stage_cache_treats_unreadable_entries_as_misses(tmp_path):
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    cache = FileObjectiveStageCache(workspace)
+    key = _key("paper-1")
+    cache.write_stage("col_demo", "evidence_route", key, ())
+    path = (
+        workspace.get_paths("col_demo").output_dir
+        / "objective_stage_cache"
+        / "evidence_route"
+        / key[:2]
+        / f"{key}.json"
+    )
+    path.write_text("{not json", encoding="utf-8")
+
+    assert cache.read_stage("col_demo", "evidence_route", key) is None
+
+
+@pytest.mark.parametrize(
+    ("stage", "key"),
+    [
+        ("../paper_frame", _key("paper-1")),
+        ("paper_frame", "../../escape"),
+        ("paper_frame", "ABC"),
+    ],
+)
+def test_file_objective_stage_cache_rejects_unsafe_paths(tmp_path, stage, key):
+    cache = FileObjectiveStageCache(FileCollectionWorkspace(tmp_path / "collections"))
+
+    with pytest.raises(ValueError):
+        cache.write_stage("col_demo", stage, key, ())
+
+
+def test_file_objective_stage_cache_prunes_entries_unused_past_max_age(tmp_path):
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    cache = FileObjectiveStageCache(workspace, max_age_s=60, prune_interval_s=0)
+    stale, used = _key("stale"), _key("used")
+    cache.write_stage("col_demo", "paper_frame", stale, ())
+    cache.write_stage("col_demo", "paper_frame", used, ())
+    stage_dir = workspace.get_paths("col_demo").output_dir / "objective_stage_cache"
+    past = time.time() - 120
+    for key in (stale, used):
+        os.utime(stage_dir / "paper_frame" / key[:2] / f"{key}.json", (past, past))
+
+    assert cache.read_stage("col_demo", "paper_frame", used) == ()
+    cache.write_stage("col_demo", "evidence_route", _key("fresh"), ())
+
+    assert cache.read_stage("col_demo", "paper_frame", stale) is None
+    assert cache.read_stage("col_demo", "paper_frame", used) == ()
+    assert cache.read_stage("col_demo", "evidence_route", _key("fresh")) == ()
+    assert cache.prune("col_demo") == 0
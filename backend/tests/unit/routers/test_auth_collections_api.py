@@ -122,7 +122,10 @@ def test_app_disposes_owned_database_engine_when_bootstrap_fails(monkeypatch) ->
     monkeypatch.setattr("main.build_database_engine", lambda _settings: engine)
     monkeypatch.setattr("main.build_session_factory", lambda _engine: object())
     monkeypatch.setattr("main.PostgresAuthRepository", lambda _factory: object())
-    monkeypatch.setattr("main.AuthSessionService", lambda _repository: service)
+    monkeypatch.setattr(
+        "main.AuthSessionService",
+        lambda _repository, **_options: service,
+    )
 
     with pytest.raises(RuntimeError, match="bootstrap failed"):
         with TestClient(create_app()):
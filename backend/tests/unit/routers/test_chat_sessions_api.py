@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from types import SimpleNamespace
 
 import pytest
@@ -11,6 +12,7 @@ try:
 except ImportError:  # pragma: no cover
     pytest.skip("fastapi not installed", allow_module_level=True)
 
+from application.chat import ChatTurnEvent, ChatTurnEventType
 from application.chat.session_service import (
     ChatApprovalPendingError,
     ChatSessionNotFoundError,
@@ -80,11 +82,17 @@ class _Service:
         user_id: str,
         *,
         message: str,
+        on_event=None,  # noqa: ANN001
     ) -> dict:
         self.get_session_for_user(session_id, user_id)
         if message == "blocked":
             raise ChatApprovalPendingError(self.pending.tool_call_id)
         assert message == "你好"
+        if on_event is not None:
+            on_event(ChatTurnEvent(ChatTurnEventType.MESSAGE, self.messages[0]))
+            for delta in ("你好，", "我可以帮助分析文献。"):
+                on_event(ChatTurnEvent(ChatTurnEventType.TEXT_DELTA, {"delta": delta}))
+            on_event(ChatTurnEvent(ChatTurnEventType.MESSAGE, self.messages[1]))
         return {
             "status": "completed",
             "messages": self.messages,
@@ -210,6 +218,9 @@ class _AuthService:
             raise SessionNotFoundError("authentication required")
         return {"user_id": "user-1", "email": "researcher@example.com"}
 
+    async def resolve_session_async(self, session_id: str | None) -> dict:
+        return self.resolve_session(session_id)
+
 
 def test_chat_http_routes_require_authentication_and_run_an_ordinary_turn() -> None:
     service = _Service()
@@ -246,3 +257,61 @@ def test_chat_http_routes_require_authentication_and_run_an_ordinary_turn() -> N
     assert created.json()["session_id"] == "chat-1"
     assert turn.status_code == 200
     assert turn.json()["status"] == "completed"
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append(
+            (name.removeprefix("event: "), json.loads(data.removeprefix("data: ")))
+        )
+    return events
+
+
+def test_chat_http_stream_route_relays_turn_events_then_the_turn() -> None:
+    service = _Service()
+    inert_task_service = SimpleNamespace(repository=object())
+    app = create_app(
+        auth_session_service=_AuthService(),
+        collection_service=SimpleNamespace(),
+        task_service=inert_task_service,
+        source_artifact_repository=object(),
+        paper_fact_repository=object(),
+        objective_repository=object(),
+        finding_review_repository=object(),
+        experiment_plan_repository=object(),
+        chat_session_service=service,
+    )
+
+    with TestClient(app) as client:
+        client.cookies.set("lens_session", "browser-session")
+        streamed = client.post(
+            "/api/v1/chat-sessions/chat-1/messages/stream",
+            json={"message": "你好"},
+        )
+        blocked = client.post(
+            "/api/v1/chat-sessions/chat-1/messages/stream",
+            json={"message": "blocked"},
+        )
+        missing = client.post(
+            "/api/v1/chat-sessions/chat-2/messages/stream",
+            json={"message": "你好"},
+        )
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(streamed.text)
+    assert [name for name, _data in events] == [
+        "message",
+        "text_delta",
+        "text_delta",
+        "message",
+        "turn",
+    ]
+    assert events[1][1] == {"delta": "你好，"}
+    assert events[3][1]["role"] == "assistant"
+    assert events[-1][1]["status"] == "completed"
+    assert blocked.status_code == 409
+    assert blocked.json()["detail"]["code"] == "chat_tool_approval_pending"
+    assert missing.status_code == 404
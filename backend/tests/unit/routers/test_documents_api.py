@@ -843,7 +843,7 @@ def test_document_figure_image_route_reports_unavailable_object_bytes(
         digest,
     )
     if failure == "missing":
-        collection_service.object_store.delete(storage_key)
+        collection_service.object_store.delete(storage_key, digest)
     else:
         (collection_service.root_dir / storage_key).write_bytes(b"corrupt")
     markdown_service.source_artifact_repository.replace_collection_documents(
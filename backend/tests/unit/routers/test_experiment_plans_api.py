@@ -6,6 +6,7 @@ from types import SimpleNamespace
 from pydantic import ValidationError
 import pytest
 
+from application.evaluation import FindingSourceIndex
 from application.goal.experiment_plan_service import ExperimentPlanService
 from controllers.goal import experiment_plans as experiment_plans_controller
 from controllers.schemas.goal.experiment_plan import (
@@ -18,6 +19,9 @@ from tests.support.experiment_plan_repository import (
 
 
 class _FindingFeedbackService:
+    def source_snapshot_index(self, **_kwargs):
+        return FindingSourceIndex(analysis_version=1, findings={})
+
     def source_snapshot_validity(self, **_kwargs):
         return "current", []
 
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from fastapi.testclient import TestClient
+except ImportError:  # pragma: no cover
+    pytest.skip("fastapi not installed", allow_module_level=True)
+
+from application.source.task_service import TaskService
+from infra.notifications.progress import ProgressHub, task_progress_topic
+from infra.persistence.memory import MemoryBuildRepository
+from main import create_app
+
+
+class _AuthService:
+    def ensure_bootstrap_user(self) -> None:
+        return None
+
+    def resolve_session(self, session_id: str | None) -> dict:
+        if session_id != "browser-session":
+            from application.auth import SessionNotFoundError
+
+            raise SessionNotFoundError("authentication required")
+        return {"user_id": "user-1", "email": "researcher@example.com"}
+
+    async def resolve_session_async(self, session_id: str | None) -> dict:
+        return self.resolve_session(session_id)
+
+
+class _CountingBuildRepository(MemoryBuildRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.task_reads = 0
+
+    def read_task(self, task_id: str):  # noqa: ANN201
+        self.task_reads += 1
+        return super().read_task(task_id)
+
+
+def _client(task_service: TaskService, hub: ProgressHub) -> TestClient:
+    client = TestClient(
+        create_app(
+            auth_session_service=_AuthService(),
+            collection_service=SimpleNamespace(),
+            task_service=task_service,
+            source_artifact_repository=object(),
+            paper_fact_repository=object(),
+            objective_repository=object(),
+            finding_review_repository=object(),
+            experiment_plan_repository=object(),
+            chat_session_service=SimpleNamespace(),
+            progress_hub=hub,
+        )
+    )
+    client.cookies.set("lens_session", "browser-session")
+    return client
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = [line for line in block.split("\n") if not line.startswith(":")]
+        if lines:
+            events.append(
+                (
+                    lines[0].removeprefix("event: "),
+                    json.loads(lines[1].removeprefix("data: ")),
+                )
+            )
+    return events
+
+
+def test_task_events_push_each_stored_update_until_the_task_finishes() -> None:
+    hub = ProgressHub()
+    repository = _CountingBuildRepository()
+    task_service = TaskService(repository, progress_notifier=hub)
+    task_id = task_service.create_task("col-1", "build")["task_id"]
+
+    def run_build() -> None:
+        deadline = time.monotonic() + 5
+        while (
+            hub.subscriber_count(task_progress_topic(task_id)) == 0
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        time.sleep(0.1)
+        task_service.update_task(task_id, status="running", progress_percent=40)
+        time.sleep(0.5)
+        task_service.finish_task(task_id, status="completed")
+
+    builder = threading.Thread(target=run_build)
+    with _client(task_service, hub) as client:
+        builder.start()
+        response = client.get(f"/api/v1/tasks/{task_id}/events")
+        missing = client.get("/api/v1/tasks/task-missing/events")
+    builder.join()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert {name for name, _payload in events} == {"task"}
+    assert [payload["status"] for _name, payload in events] == [
+        "queued",
+        "running",
+        "completed",
+    ]
+    # One read for the initial state, one catch-up read after subscribing,
+    # then one per published update, with no polling in between.
+    assert repository.task_reads <= 2 + 2 + 2 * 2
+    assert missing.status_code == 404
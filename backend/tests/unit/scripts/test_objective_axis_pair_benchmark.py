@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _load_benchmark_module():
+    backend_root = Path(__file__).resolve().parents[3]
+    script_dir = backend_root / "scripts" / "benchmarks"
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+    spec = importlib.util.spec_from_file_location(
+        "objective_axis_pair_benchmark",
+        script_dir / "objective_axis_pair_benchmark.py",
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_synthetic_paper_skims_are_deterministic_and_sized() -> None:
+    benchmark = _load_benchmark_module()
+
+    first = benchmark.build_synthetic_paper_skims(21, seed=7)
+    second = benchmark.build_synthetic_paper_skims(21, seed=7)
+
+    assert [skim.to_record() for skim in first] == [
+        skim.to_record() for skim in second
+    ]
+    assert sum(
+        len(study.relationships) for skim in first for study in skim.studies
+    ) == 21
+    assert len({skim.document_id for skim in first}) == 3
+
+
+def test_run_size_reports_pair_counts_and_timings() -> None:
+    benchmark = _load_benchmark_module()
+
+    result = benchmark.run_size(40, repeats=2, seed=11)
+
+    assert result["relationship_count"] == 40
+    assert result["axis_pair_count"] >= result["supported_cross_paper_pair_count"] > 0
+    assert result["supported_cross_paper_pairs"]["count"] == 2
+    assert result["axis_candidate_pairs"]["count"] == 2
+
+
+def test_parse_sizes_rejects_non_positive_counts() -> None:
+    benchmark = _load_benchmark_module()
+
+    assert benchmark.parse_sizes("500, 10000") == [500, 10000]
+    with pytest.raises(SystemExit):
+        benchmark.parse_sizes("0")
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Literal
+
+import httpx
+from pydantic import BaseModel, Field
+
+
+def _load_benchmark_module(name: str):
+    backend_root = Path(__file__).resolve().parents[3]
+    script_dir = backend_root / "scripts" / "benchmarks"
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+    spec = importlib.util.spec_from_file_location(name, script_dir / f"{name}.py")
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Evidence(BaseModel):
+    quote: str = Field(min_length=3)
+    page: int | None = None
+
+
+class _Bundle(BaseModel):
+    kind: Literal["finding"]
+    status: Literal["supported", "unsupported"]
+    evidence: list[_Evidence] = Field(min_length=1)
+    note: str | None = None
+    confidence: float = Field(ge=0.5)
+
+
+def _request(content: str, **extra) -> dict:  # noqa: ANN003
+    return {
+        "model": "offline",
+        "messages": [{"role": "user", "content": content}],
+        **extra,
+    }
+
+
+def test_synthesized_values_validate_against_pydantic_schemas() -> None:
+    stand_in = _load_benchmark_module("llm_replay_server")
+
+    value = stand_in.synthesize_from_schema(_Bundle.model_json_schema())
+    parsed = _Bundle.model_validate(value)
+
+    assert parsed.kind == "finding"
+    assert parsed.status == "supported"
+    assert len(parsed.evidence) == 1
+    assert parsed.note is None
+
+
+def test_request_json_schema_reads_response_format_and_prompt_anchor() -> None:
+    stand_in = _load_benchmark_module("llm_replay_server")
+    schema = _Bundle.model_json_schema()
+
+    parse_request = _request(
+        "extract",
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"name": "_Bundle", "schema": schema},
+        },
+    )
+    text_request = _request(f"extract\nJSON schema:\n{json.dumps(schema)}")
+
+    assert stand_in.request_json_schema(parse_request) == schema
+    assert stand_in.request_json_schema(text_request) == schema
+    assert stand_in.request_json_schema(_request("hello")) is None
+
+
+def test_stand_in_replays_records_and_injects_errors(tmp_path: Path) -> None:
+    stand_in = _load_benchmark_module("llm_replay_server")
+    cassette_path = tmp_path / "cassette.jsonl"
+    request = _request("hello")
+
+    with stand_in.LLMStandInServer(
+        stand_in.LLMStandIn(
+            stand_in.ReplayCassette(None),
+            stand_in.StandInConfig(),
+        )
+    ) as upstream:
+        recorder = stand_in.LLMStandIn(
+            stand_in.ReplayCassette(cassette_path),
+            stand_in.StandInConfig(
+                mode="record",
+                upstream_base_url=upstream.base_url,
+            ),
+        )
+        status, _headers, recorded = recorder.handle(request)
+
+    assert status == 200
+    assert recorder.stats()["recorded_count"] == 1
+    assert len(cassette_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    replayer = stand_in.LLMStandIn(
+        stand_in.ReplayCassette(cassette_path),
+        stand_in.StandInConfig(on_miss="error"),
+    )
+    assert replayer.handle(request) == (200, {}, recorded)
+    status, _headers, payload = replayer.handle(_request("unseen"))
+    assert status == 404
+    assert payload["error"]["type"] == "cassette_miss"
+
+    throttled = stand_in.LLMStandIn(
+        stand_in.ReplayCassette(cassette_path),
+        stand_in.StandInConfig(error_rate=1.0),
+    )
+    status, headers, _payload = throttled.handle(request)
+    assert status == 429
+    assert headers == {"retry-after-ms": "50"}
+    assert throttled.stats()["injected_error_count"] == 1
+
+
+def test_stand_in_server_answers_openai_compatible_requests() -> None:
+    stand_in = _load_benchmark_module("llm_replay_server")
+    schema = _Bundle.model_json_schema()
+
+    with stand_in.LLMStandInServer(
+        stand_in.LLMStandIn(
+            stand_in.ReplayCassette(None),
+            stand_in.StandInConfig(),
+        )
+    ) as server:
+        response = httpx.post(
+            f"{server.base_url}/chat/completions",
+            json=_request(f"extract\nJSON schema:\n{json.dumps(schema)}"),
+        )
+        stats = server.stand_in.stats()
+
+    assert response.status_code == 200
+    content = response.json()["choices"][0]["message"]["content"]
+    assert _Bundle.model_validate_json(content).kind == "finding"
+    assert stats["synthesized_count"] == 1
+
+
+def test_stats_delta_drops_unchanged_counters() -> None:
+    benchmark = _load_benchmark_module("offline_pipeline_benchmark")
+
+    delta = benchmark.stats_delta(
+        {
+            "request_count": 7,
+            "replayed_count": 2,
+            "requests_by_response_format": {"json_object": 5, "text": 2},
+        },
+        {
+            "request_count": 3,
+            "replayed_count": 2,
+            "requests_by_response_format": {"json_object": 1, "text": 2},
+        },
+    )
+
+    assert delta == {
+        "request_count": 4,
+        "requests_by_response_format": {"json_object": 4},
+    }
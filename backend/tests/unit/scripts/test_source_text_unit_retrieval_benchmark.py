@@ -40,6 +40,24 @@ def test_rank_tfidf_returns_most_relevant_text_unit_first() -> None:
     assert set(rankings["q1"]) == {"tu-a", "tu-b", "tu-c"}
 
 
+def test_rank_bm25_ranks_matches_first_and_reports_latency() -> None:
+    benchmark = _load_benchmark_module()
+    corpus = [
+        {"text_unit_id": "tu-b", "text": "scan speed controls melt pool overlap"},
+        {"text_unit_id": "tu-a", "text": "corrosion resistance after heat treatment"},
+        {"text_unit_id": "tu-c", "text": "higher scanning speed reduces melt pool size"},
+    ]
+    queries = [{"id": "q1", "query": "scanning speed and melt pool size"}]
+
+    rankings = benchmark.rank_bm25(corpus, queries)
+    latency = benchmark.measure_bm25_latency(corpus, queries, k=2, repeats=3)
+
+    assert rankings["q1"] == ["tu-c", "tu-b", "tu-a"]
+    assert latency["query_count"] == 3
+    assert latency["index_bytes"] > 0
+    assert latency["query_p95_ms"] >= latency["query_p50_ms"] >= 0
+
+
 def test_rank_embeddings_uses_cosine_similarity_and_stable_ties() -> None:
     benchmark = _load_benchmark_module()
 
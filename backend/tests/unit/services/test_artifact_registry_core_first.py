@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
 from unittest.mock import Mock
 
 from application.source.artifact_registry_service import ArtifactRegistryService
 from infra.persistence.memory import MemoryBuildRepository
 
 
-def _registry(*, source_documents: tuple[object, ...] = ()) -> ArtifactRegistryService:
+_NO_ARTIFACTS = {
+    "documents": 0,
+    "text_units": 0,
+    "blocks": 0,
+    "tables": 0,
+    "table_rows": 0,
+    "table_cells": 0,
+    "figures": 0,
+}
+
+
+def _registry(*, counts: dict[str, int] = _NO_ARTIFACTS) -> ArtifactRegistryService:
     source_repository = Mock()
-    source_repository.read_collection_documents.return_value = source_documents
+    source_repository.count_collection_artifacts.return_value = dict(counts)
     return ArtifactRegistryService(
         MemoryBuildRepository(),
         source_artifact_repository=source_repository,
@@ -27,14 +37,9 @@ def test_artifact_registry_marks_absent_source_artifacts_not_ready(tmp_path):
 
 
 def test_artifact_registry_reports_available_source_artifacts(tmp_path):
-    source_document = SimpleNamespace(
-        blocks=(object(),),
-        figures=(object(),),
-        table_rows=(object(),),
-        table_cells=(object(),),
-    )
+    registry = _registry(counts={kind: 2 for kind in _NO_ARTIFACTS})
 
-    payload = _registry(source_documents=(source_document,)).build_registry(
+    payload = registry.build_registry(
         "col_demo",
         tmp_path / "output",
     )
@@ -44,3 +49,24 @@ def test_artifact_registry_reports_available_source_artifacts(tmp_path):
     assert payload["figures_ready"] is True
     assert payload["table_rows_ready"] is True
     assert payload["table_cells_ready"] is True
+    registry.source_artifact_repository.read_collection_documents.assert_not_called()
+
+
+def test_artifact_registry_keeps_documents_without_figures_partial(tmp_path):
+    registry = _registry(counts={**_NO_ARTIFACTS, "documents": 1, "blocks": 3})
+
+    payload = registry.build_registry(
+        "col_demo",
+        tmp_path / "output",
+        build_id="build_demo",
+    )
+
+    source_repository = registry.source_artifact_repository
+    source_repository.count_collection_artifacts.assert_called_once_with(
+        "col_demo",
+        build_id="build_demo",
+    )
+    assert payload["figures_generated"] is True
+    assert payload["blocks_ready"] is True
+    assert payload["figures_ready"] is False
+    assert payload["table_cells_ready"] is False
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from types import SimpleNamespace
+
+import pytest
+
+from application.source.build_collector import (
+    BuildCollectionPass,
+    BuildGarbageCollector,
+)
+from application.source.build_retention_service import (
+    BuildRetentionPolicy,
+    BuildRetentionService,
+)
+from application.source.task_service import TaskService
+from domain.source import BuildPurgeProgress
+from infra.persistence.file import FileSourceLexicalIndexStore
+from infra.persistence.memory import MemoryBuildRepository
+from tests.support.collection_service import build_test_collection_service
+
+
+def _finished_builds(task_service: TaskService, collection_id: str, statuses):
+    builds = []
+    for status in statuses:
+        task = task_service.create_task(collection_id, "build")
+        task_service.finish_task(task["task_id"], status=status)
+        builds.append(task_service.repository.read_build(task["task_id"]))
+    return builds
+
+
+def _retention(tmp_path, *, keep_last: int):
+    collection_service = build_test_collection_service(tmp_path / "collections")
+    task_service = TaskService(MemoryBuildRepository())
+    lexical_index_store = FileSourceLexicalIndexStore(collection_service)
+    service = BuildRetentionService(
+        task_service.repository,
+        collection_service,
+        lexical_index_store,
+        BuildRetentionPolicy(keep_last=keep_last),
+    )
+    return service, task_service
+
+
+def test_build_retention_keeps_newest_and_active_builds(tmp_path):
+    service, task_service = _retention(tmp_path, keep_last=1)
+    collection_id = service.collection_service.create_collection("Demo")["collection_id"]
+    first, second, third = _finished_builds(
+        task_service,
+        collection_id,
+        ("completed", "completed", "failed"),
+    )
+    running = task_service.create_task(collection_id, "build")
+
+    expired = service.list_expired_builds()
+
+    # `running` is the newest build; `second` stays active after `third` failed.
+    assert task_service.repository.read_active_build(collection_id) == second
+    assert [build.build_id for build in expired] == [third.build_id, first.build_id]
+    assert running["task_id"] not in {build.task_id for build in expired}
+
+
+def test_build_retention_dry_run_reports_without_deleting(tmp_path):
+    service, task_service = _retention(tmp_path, keep_last=1)
+    collection_service = service.collection_service
+    collection_id = collection_service.create_collection("Demo")["collection_id"]
+    old, _new = _finished_builds(
+        task_service,
+        collection_id,
+        ("completed", "completed"),
+    )
+    payload = b"figure bytes"
+    collection_service.write_figure_asset(
+        collection_id,
+        old.build_id,
+        "figure.png",
+        payload,
+        sha256(payload).hexdigest(),
+    )
+    service.lexical_index_store.write_index(collection_id, old.build_id, b"index")
+
+    report = service.dry_run()
+
+    assert report["build_count"] == 1
+    assert report["artifact_bytes"] == len(payload) + len(b"index")
+    assert report["builds"][0]["build_id"] == old.build_id
+    assert task_service.repository.read_build(old.task_id) == old
+
+
+def test_build_garbage_collector_frees_unshared_storage(tmp_path):
+    service, task_service = _retention(tmp_path, keep_last=1)
+    collection_service = service.collection_service
+    collection_id = collection_service.create_collection("Demo")["collection_id"]
+    old, new = _finished_builds(
+        task_service,
+        collection_id,
+        ("completed", "completed"),
+    )
+    shared = b"figure shared by both builds"
+    unique = b"figure only the old build has"
+    keys = [
+        collection_service.write_figure_asset(
+            collection_id,
+            build_id,
+            "figure.png",
+            payload,
+            sha256(payload).hexdigest(),
+        )
+        for build_id, payload in (
+            (old.build_id, shared),
+            (new.build_id, shared),
+            (old.build_id, unique),
+        )
+    ]
+    collector = BuildGarbageCollector(service)
+
+    result = collector.run_once()
+
+    assert result.collected_builds == 1
+    assert not collector.run_once().made_progress
+    assert collector.collected_builds == 1
+    assert collector.freed_bytes == len(unique)
+    assert task_service.repository.read_task(old.task_id) is None
+    assert task_service.repository.read_build(new.task_id) == new
+    assert (
+        collection_service.read_figure_asset(
+            collection_id,
+            keys[1],
+            sha256(shared).hexdigest(),
+        )
+        == shared
+    )
+    with pytest.raises(FileNotFoundError):
+        collection_service.read_figure_asset(
+            collection_id,
+            keys[0],
+            sha256(shared).hexdigest(),
+        )
+    assert service.list_expired_builds() == ()
+
+
+def test_build_retention_refuses_to_purge_the_active_build(tmp_path):
+    service, task_service = _retention(tmp_path, keep_last=0)
+    collection_id = service.collection_service.create_collection("Demo")["collection_id"]
+    (active,) = _finished_builds(task_service, collection_id, ("completed",))
+
+    assert service.list_expired_builds() == ()
+    with pytest.raises(ValueError, match="build is retained"):
+        service.purge_batch(active)
+
+
+def test_build_retention_policy_reads_the_environment(monkeypatch):
+    monkeypatch.delenv("BUILD_RETENTION_KEEP_LAST", raising=False)
+    assert BuildRetentionPolicy.from_env() is None
+    assert BuildRetentionPolicy.from_env(required=True) == BuildRetentionPolicy()
+
+    monkeypatch.setenv("BUILD_RETENTION_KEEP_LAST", "5")
+    monkeypatch.setenv("BUILD_RETENTION_BATCH_SIZE", "200")
+    assert BuildRetentionPolicy.from_env() == BuildRetentionPolicy(
+        keep_last=5,
+        batch_size=200,
+    )
+
+
+def test_build_collector_counts_builds_finalized_without_row_deletes():
+    build = SimpleNamespace(
+        collection_id="col-1",
+        build_id="build-1",
+        build_number=1,
+    )
+    expired = [build]
+    service = SimpleNamespace(
+        list_expired_builds=lambda: tuple(expired),
+        purge_batch=lambda build, start_table=None: BuildPurgeProgress(
+            build_id=build.build_id,
+            table=None,
+            deleted_rows=0,
+            done=True,
+        ),
+        finalize=lambda build: expired.remove(build) or 0,
+    )
+    collector = BuildGarbageCollector(service)
+
+    assert collector.run_once() == BuildCollectionPass(collected_builds=1)
+    assert collector.run_once().made_progress is False
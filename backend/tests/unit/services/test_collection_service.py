@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import base64
+from contextlib import contextmanager
 from dataclasses import replace
 from hashlib import sha256
+import io
+import time
+from types import SimpleNamespace
+import zipfile
+
 import pytest
 
+from application.source.collection_reaper import CollectionReaper
 from application.source.collection_service import CollectionService
 from domain.source import (
     CollectionImportDocumentRecord,
     CollectionImportRecord,
+    CollectionPurgeProgress,
 )
 from infra.persistence.memory import MemoryCollectionRepository
 from infra.source.ingestion.normalized_import import (
@@ -71,6 +79,14 @@ def test_delete_collection_removes_collection_directory(tmp_path):
     result = service.delete_collection(collection_id)
 
     assert result["collection_id"] == collection_id
+    assert service.repository.read_collection(collection_id) is None
+    assert service.list_collections() == []
+    assert paths.collection_dir.exists()
+
+    progress = service.purge_collection_batch(collection_id)
+
+    assert progress.done is True
+    assert service.list_tombstoned_collections() == ()
     assert not paths.collection_dir.exists()
     with pytest.raises(FileNotFoundError):
         service.object_store.read(uploaded["storage_key"], uploaded["sha256"])
@@ -105,13 +121,132 @@ def test_identical_uploads_share_identity_but_keep_collection_scoped_downloads(
             second_source_id,
         )
 
+    root = service.object_store.root_dir
+    assert (root / first_file["storage_key"]).stat().st_ino == (
+        root / second_file["storage_key"]
+    ).stat().st_ino
+
     service.delete_collection(first["collection_id"])
+    service.purge_collection_batch(first["collection_id"])
 
     assert (
         service.object_store.read(second_file["storage_key"], second_file["sha256"])
         == payload
     )
 
+    service.delete_collection(second["collection_id"])
+    service.purge_collection_batch(second["collection_id"])
+
+    assert service.object_store.collect_unreferenced() == 0
+    assert not any((root / "objects" / "sha256").glob("*/*/*"))
+
+
+def test_collection_reaper_purges_tombstoned_collections(tmp_path):
+    service = build_test_collection_service(tmp_path / "collections")
+    kept = service.create_collection("Kept")
+    deleted = service.create_collection("Deleted")
+    service.add_file(deleted["collection_id"], "paper.txt", b"Deleted bytes")
+    service.delete_collection(deleted["collection_id"])
+    reaper = CollectionReaper(service, batch_size=10)
+
+    reaper.run_once()
+
+    assert service.list_tombstoned_collections() == ()
+    assert not service.get_paths(deleted["collection_id"]).collection_dir.exists()
+    assert service.repository.list_collection_files(deleted["collection_id"]) == ()
+    assert service.get_collection(kept["collection_id"])["name"] == "Kept"
+
+
+def test_collection_reaper_waits_for_cancelled_builds_and_restarts_failed_purge():
+    cancelled = [1, 0, 0]
+    start_tables: list[str | None] = []
+    outcomes = iter(["source_documents", RuntimeError("restricted"), None])
+
+    def purge_collection_batch(  # noqa: ANN202
+        collection_id,  # noqa: ANN001
+        *,
+        batch_size,  # noqa: ANN001
+        start_table,  # noqa: ANN001
+    ):
+        start_tables.append(start_table)
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return CollectionPurgeProgress(
+            collection_id=collection_id,
+            table=outcome,
+            deleted_rows=1 if outcome else 0,
+            done=outcome is None,
+        )
+
+    service = SimpleNamespace(
+        list_tombstoned_collections=lambda: ("col_busy",),
+        cancel_collection_builds=lambda collection_id: cancelled.pop(0),
+        purge_collection_batch=purge_collection_batch,
+    )
+    reaper = CollectionReaper(service)
+
+    assert reaper.run_once() == 0
+    assert start_tables == []
+    assert reaper.run_once() == 1
+    reaper.run_once()
+
+    assert start_tables == [None, "source_documents", None]
+
+
+def test_collection_purge_releases_figure_blobs(tmp_path):
+    service = build_test_collection_service(tmp_path / "collections")
+    collection = service.create_collection("Figures")
+    collection_id = collection["collection_id"]
+    payload = b"figure bytes"
+    service.write_figure_asset(
+        collection_id,
+        "build-1",
+        "image_assets/figure.png",
+        payload,
+        sha256(payload).hexdigest(),
+    )
+    service.delete_collection(collection_id)
+
+    service.purge_collection_batch(collection_id)
+
+    root = service.object_store.root_dir
+    assert not any((root / "objects" / "sha256").glob("*/*/*"))
+
+
+def test_collection_reaper_skips_passes_while_another_process_holds_the_lock(
+    tmp_path,
+):
+    service = build_test_collection_service(tmp_path / "collections")
+    deleted = service.create_collection("Deleted")
+    service.delete_collection(deleted["collection_id"])
+
+    class HeldElsewhere:
+        @contextmanager
+        def hold(self):  # noqa: ANN202
+            yield False
+
+    reaper = CollectionReaper(service, idle_interval_s=0.01, lock=HeldElsewhere())
+    reaper.start()
+    time.sleep(0.1)
+    reaper.stop()
+
+    assert service.list_tombstoned_collections() == (deleted["collection_id"],)
+
+
+def test_collection_reaper_sweeps_blobs_orphaned_by_directory_removal(tmp_path):
+    service = build_test_collection_service(tmp_path / "collections")
+    collection = service.create_collection("Orphaned")
+    record = service.add_file(collection["collection_id"], "paper.txt", b"Orphan")
+    root = service.object_store.root_dir
+    (root / record["storage_key"]).unlink()
+    reaper = CollectionReaper(service, object_sweep_interval_s=3600)
+
+    assert reaper._object_sweep_due()
+    assert reaper.sweep_objects() == 1
+    assert not reaper._object_sweep_due()
+    assert not any((root / "objects" / "sha256").glob("*/*/*"))
+
 
 def test_delete_collection_raises_for_missing_collection(tmp_path):
     service = build_test_collection_service(tmp_path / "collections")
@@ -193,10 +328,10 @@ def test_delete_collection_keeps_bytes_when_relational_delete_fails(
     )
     collection_dir = service.get_paths(collection_id).collection_dir
 
-    def fail_delete(_collection_id: str) -> bool:
+    def fail_tombstone(_collection_id: str, *, deleted_at: str) -> bool:
         raise RuntimeError("database unavailable")
 
-    monkeypatch.setattr(service.repository, "delete_collection", fail_delete)
+    monkeypatch.setattr(service.repository, "tombstone_collection", fail_tombstone)
 
     with pytest.raises(RuntimeError, match="database unavailable"):
         service.delete_collection(collection_id)
@@ -398,6 +533,10 @@ def test_collection_service_cleans_only_unregistered_bytes_after_import_failure(
     failed_sha256 = sha256(b"Unregistered source bytes").hexdigest()
     with pytest.raises(FileNotFoundError):
         service.object_store.read(failed_key, failed_sha256)
+    root = service.object_store.root_dir
+    assert not (
+        root / "objects" / "sha256" / failed_sha256[:2] / failed_sha256[2:4]
+    ).joinpath(failed_sha256).exists()
     assert (
         service.object_store.read(
             registered["storage_key"],
@@ -473,6 +612,96 @@ def test_collection_service_add_file_uses_normalized_upload(monkeypatch, tmp_pat
     assert manifest["imports"][0]["documents"][0]["text_units"] == []
 
 
+def test_collection_service_imports_uploads_and_zip_members_as_one_batch(tmp_path):
+    service = build_test_collection_service(tmp_path / "collections")
+    collection_id = service.create_collection("Bulk Collection")["collection_id"]
+    archive_bytes = io.BytesIO()
+    with zipfile.ZipFile(archive_bytes, "w") as archive:
+        archive.writestr("papers/a.pdf", b"%PDF-1.4 first")
+        archive.writestr("papers/notes.md", b"Anneal at 600 C.")
+        archive.writestr("papers/figure.png", b"\x89PNG")
+        archive.writestr("__MACOSX/papers/._a.pdf", b"resource fork")
+    archive_bytes.seek(0)
+
+    records = service.add_uploads(
+        collection_id,
+        [
+            ("bundle.zip", archive_bytes, "application/zip"),
+            ("b.pdf", io.BytesIO(b"%PDF-1.4 second"), "application/pdf"),
+        ],
+    )
+
+    assert [record["original_filename"] for record in records] == [
+        "a.pdf",
+        "notes.md",
+        "b.pdf",
+    ]
+    for record, payload in zip(
+        records,
+        (b"%PDF-1.4 first", b"Anneal at 600 C.", b"%PDF-1.4 second"),
+    ):
+        assert record["sha256"] == sha256(payload).hexdigest()
+        assert record["size_bytes"] == len(payload)
+        assert service.object_store.read(record["storage_key"], record["sha256"]) == (
+            payload
+        )
+    manifest = service.get_import_manifest(collection_id)
+    assert len(manifest["imports"]) == 1
+    assert manifest["imports"][0]["raw_locator"] == "bundle.zip"
+    assert manifest["imports"][0]["warnings"] == [
+        "archive_member_skipped:papers/figure.png"
+    ]
+    assert [
+        len(document["text_units"])
+        for document in manifest["imports"][0]["documents"]
+    ] == [0, 1, 0]
+    assert list((service.root_dir / ".staging").iterdir()) == []
+
+
+def test_collection_service_discards_staged_uploads_when_a_file_is_rejected(
+    tmp_path,
+):
+    service = build_test_collection_service(tmp_path / "collections")
+    collection_id = service.create_collection("Rejected upload")["collection_id"]
+
+    with pytest.raises(ValueError, match="unsupported upload type"):
+        service.add_uploads(
+            collection_id,
+            [
+                ("a.pdf", io.BytesIO(b"%PDF-1.4 first"), "application/pdf"),
+                ("b.exe", io.BytesIO(b"MZ"), "application/octet-stream"),
+            ],
+        )
+
+    assert service.list_files(collection_id) == []
+    assert list((service.root_dir / ".staging").iterdir()) == []
+
+
+def test_collection_service_rejects_corrupt_archive_members(tmp_path):
+    service = build_test_collection_service(tmp_path / "collections")
+    collection_id = service.create_collection("Corrupt archive")["collection_id"]
+    archive_bytes = io.BytesIO()
+    with zipfile.ZipFile(archive_bytes, "w") as archive:
+        archive.writestr("papers/a.pdf", b"%PDF-1.4 first")
+    corrupt = archive_bytes.getvalue().replace(b"%PDF-1.4 first", b"%PDF-1.4 FIRST")
+
+    with pytest.raises(ValueError, match="member is corrupt: papers/a.pdf"):
+        service.add_uploads(
+            collection_id,
+            [("bundle.zip", io.BytesIO(corrupt), "application/zip")],
+        )
+    with pytest.raises(ValueError, match="must be imported as a batch"):
+        service.add_file_stream(
+            collection_id,
+            "bundle.zip",
+            io.BytesIO(archive_bytes.getvalue()),
+            "application/zip",
+        )
+
+    assert service.list_files(collection_id) == []
+    assert list((service.root_dir / ".staging").iterdir()) == []
+
+
 def test_collection_service_imports_from_source_adapter(tmp_path):
     service = build_test_collection_service(tmp_path / "collections")
     collection = service.create_collection("Adapter Collection")
@@ -12,6 +12,7 @@ from application.source.document_markdown_service import (
     SourceDocumentNotFoundError,
 )
 from domain.source import source_documents_from_records
+from infra.persistence.file import FileFigureRenderCache
 from infra.persistence.sqlite import SqliteSourceArtifactRepository
 from infra.source.ingestion.normalized_import import (
     NormalizedImportBatch,
@@ -329,6 +330,112 @@ def test_document_markdown_service_keeps_caption_when_figure_image_is_missing(tm
     assert "**Figure.** Fig. 1. Microstructure after annealing." in payload["markdown"]
 
 
+def test_document_markdown_service_renders_deferred_figures_on_demand(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    collection_service = build_test_collection_service(tmp_path / "collections")
+    render_cache = FileFigureRenderCache(collection_service)
+    markdown_service = DocumentMarkdownService(
+        collection_service,
+        source_artifact_repository=SqliteSourceArtifactRepository(
+            tmp_path / "lens.sqlite"
+        ),
+        figure_render_cache=render_cache,
+    )
+    collection_id = collection_service.create_collection("Lazy Figure Collection")[
+        "collection_id"
+    ]
+    pdf = fitz.open()
+    page = pdf.new_page(width=200, height=200)
+    page.draw_rect(fitz.Rect(20, 20, 120, 80), color=(1, 0, 0), fill=(1, 0, 0))
+    pdf_bytes = pdf.tobytes()
+    pdf.close()
+    collection_service.import_normalized_batch(
+        collection_id,
+        NormalizedImportBatch(
+            documents=(
+                NormalizedImportDocument(
+                    source_document_id="paper-1",
+                    origin_channel="upload",
+                    original_filename="figure.pdf",
+                    stored_filename="abc123_figure.pdf",
+                    media_type="application/pdf",
+                    storage_payload_base64=base64.b64encode(pdf_bytes).decode("ascii"),
+                ),
+            ),
+            text_units=(),
+            source_metadata=NormalizedImportSourceMetadata(
+                channel="upload",
+                adapter_name="upload",
+                ingested_at="2026-10-19T00:00:00+00:00",
+            ),
+        ),
+    )
+    markdown_service.source_artifact_repository.replace_collection_documents(
+        collection_id,
+        source_documents_from_records(
+            documents=[
+                {
+                    "id": "paper-1",
+                    "title": "Figure Paper",
+                    "text": "",
+                    "metadata": {"source_path": "abc123_figure.pdf"},
+                }
+            ],
+            figures=[
+                {
+                    "document_id": "paper-1",
+                    "figure_id": "fig-1",
+                    "figure_order": 1,
+                    "figure_label": "Fig. 1",
+                    "caption_text": "Fig. 1. Deferred crop.",
+                    "page": 1,
+                    "image_path": None,
+                    "image_mime_type": "image/png",
+                    "metadata": {
+                        "asset_source": "deferred_pdf_crop",
+                        "crop_geometry": {
+                            "page": 1,
+                            "bbox": [20, 180, 120, 120],
+                            "coord_origin": "BOTTOMLEFT",
+                        },
+                    },
+                }
+            ],
+        ),
+    )
+
+    markdown = markdown_service.get_document_markdown(collection_id, "paper-1")
+    cache_dir = (
+        collection_service.get_paths(collection_id).output_dir / "figure_render_cache"
+    )
+    assert "![Fig. 1]" in markdown["markdown"]
+    assert not cache_dir.exists()
+
+    payload = markdown_service.resolve_figure_image_file(
+        collection_id, "paper-1", "fig-1"
+    )
+
+    assert payload["media_type"] == "image/png"
+    assert payload["filename"] == "fig-1.png"
+    assert payload["content"].startswith(b"\x89PNG")
+    assert [path.suffix for path in cache_dir.iterdir()] == [".png"]
+    assert markdown_service.resolve_figure_image_file(
+        collection_id, "paper-1", "fig-1"
+    )["content"] == payload["content"]
+    assert markdown_service.prewarm_figure_images(collection_id) == {
+        "rendered": 0,
+        "cached": 1,
+        "failed": 0,
+    }
+    for path in cache_dir.iterdir():
+        path.unlink()
+    assert markdown_service.prewarm_figure_images(collection_id) == {
+        "rendered": 1,
+        "cached": 0,
+        "failed": 0,
+    }
+
+
 def test_document_markdown_service_falls_back_to_document_text(tmp_path):
     collection_service, markdown_service = _build_markdown_service(tmp_path)
     collection = collection_service.create_collection("Markdown Fallback Collection")
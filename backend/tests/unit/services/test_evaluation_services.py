@@ -814,6 +814,50 @@ def test_finding_source_snapshot_detects_each_stale_dimension(
     assert reasons == [expected_reason]
 
 
+def test_finding_source_index_reads_published_findings_once_per_version() -> None:
+    service = _finding_feedback_service()
+    repository = service.objective_repository
+    reads: list[tuple[str, str, int]] = []
+    iter_findings = repository.iter_findings_with_evidence
+
+    def _counting_iter(collection_id, objective_id, analysis_version, **options):
+        reads.append((collection_id, objective_id, analysis_version))
+        return iter_findings(collection_id, objective_id, analysis_version, **options)
+
+    repository.iter_findings_with_evidence = _counting_iter
+    candidate = service.source_snapshot_index(
+        collection_id="col-gold",
+        objective_id="obj-1",
+    )
+    service.record_feedback(
+        collection_id="col-gold",
+        objective_id="obj-1",
+        analysis_version=1,
+        finding_id="finding-1",
+        review_status="correct",
+        issue_type="none",
+    )
+    reviewed = service.source_snapshot_index(
+        collection_id="col-gold",
+        objective_id="obj-1",
+    )
+
+    assert reads == [("col-gold", "obj-1", 1)]
+    assert candidate.findings["finding-1"]["dataset_use_status"] == "review_candidate"
+    assert reviewed.findings["finding-1"]["dataset_use_status"] == "training_ready"
+    item = service.export_dataset(collection_id="col-gold", objective_id="obj-1")[
+        "items"
+    ][0]
+    assert reviewed.findings["finding-1"] == {
+        "finding_id": item["finding_id"],
+        "analysis_version": item["analysis_version"],
+        "dataset_use_status": item["dataset_use_status"],
+        "finding_fingerprint": item["finding_fingerprint"],
+        "evidence_fingerprint": item["evidence_fingerprint"],
+        "evidence_ids": [entry["evidence_id"] for entry in item["evidence"]],
+    }
+
+
 def test_finding_source_snapshot_is_stale_when_dataset_is_unavailable() -> None:
     service = _finding_feedback_service()
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from application.evaluation import FindingSourceIndex
 from application.goal.experiment_plan_service import (
     ExperimentPlanNotFoundError,
     ExperimentPlanService,
@@ -15,6 +16,11 @@ from tests.support.experiment_plan_repository import (
 class _FindingFeedbackService:
     def __init__(self, validity: str = "current") -> None:
         self.validity = validity
+        self.index_lookups = 0
+
+    def source_snapshot_index(self, **_kwargs):
+        self.index_lookups += 1
+        return FindingSourceIndex(analysis_version=1, findings={})
 
     def source_snapshot_validity(self, **_kwargs):
         reasons = [] if self.validity == "current" else ["finding_changed"]
@@ -135,6 +141,24 @@ def test_historical_grounded_plan_remains_auditable_after_chat_cutover() -> None
     assert listed[0].metadata["source_validity_reasons"] == []
 
 
+def test_listing_historical_plans_checks_sources_with_one_lookup() -> None:
+    repository = InMemoryExperimentPlanRepository()
+    historical = _historical_plan()
+    for index in range(3):
+        repository.upsert_plan(
+            ExperimentPlanRecord.from_mapping(
+                {**historical.to_record(), "plan_id": f"exp_historical_{index}"}
+            )
+        )
+    service = _service(repository)
+
+    listed = service.list_plans("col_1", "objective_1")
+
+    assert len(listed) == 3
+    assert {plan.metadata["source_validity"] for plan in listed} == {"current"}
+    assert service.finding_feedback_service.index_lookups == 1
+
+
 def test_stale_historical_plan_cannot_be_promoted() -> None:
     repository = InMemoryExperimentPlanRepository()
     historical = _historical_plan()
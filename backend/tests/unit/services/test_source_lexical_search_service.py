@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from application.source.lexical_search_service import SourceLexicalSearchService
+from domain.source import SourceBlock, SourceDocument, SourceTextUnit
+from infra.persistence.file import FileCollectionWorkspace, FileSourceLexicalIndexStore
+
+
+def _document() -> SourceDocument:
+    return SourceDocument(
+        document_id="doc-1",
+        document_order=0,
+        title="Scan strategy",
+        text="",
+        text_units=(
+            SourceTextUnit(
+                text_unit_id="tu-1",
+                text_unit_order=0,
+                text="Higher scanning speed reduced porosity in 316L.",
+                n_tokens=9,
+                document_ids=("doc-1",),
+            ),
+        ),
+        blocks=(
+            SourceBlock(
+                block_id="blk-1",
+                document_id="doc-1",
+                block_type="paragraph",
+                text="Higher scanning speed reduced porosity in 316L.",
+                block_order=0,
+                text_unit_ids=("tu-1",),
+                page=5,
+            ),
+        ),
+    )
+
+
+class _SourceArtifactRepository:
+    def __init__(self) -> None:
+        self.read_calls: list[tuple[str, str | None]] = []
+
+    def read_collection_documents(self, collection_id: str, build_id=None):  # noqa: ANN001, ANN201
+        self.read_calls.append((collection_id, build_id))
+        return (_document(),)
+
+
+class _BuildRepository:
+    def read_active_build(self, collection_id: str):  # noqa: ANN201
+        return SimpleNamespace(build_id="build-2")
+
+
+def test_lexical_search_builds_persists_and_reloads_per_build_indexes(tmp_path) -> None:
+    workspace = FileCollectionWorkspace(tmp_path / "collections")
+    store = FileSourceLexicalIndexStore(workspace)
+    repository = _SourceArtifactRepository()
+    service = SourceLexicalSearchService(repository, store, _BuildRepository())
+
+    service.build_index("col-1", "build-1", (_document(),))
+
+    assert (
+        workspace.get_paths("col-1").output_dir / "lexical_index" / "build-1.bm25.gz"
+    ).is_file()
+    reloaded = SourceLexicalSearchService(repository, store)
+    hits = reloaded.search("col-1", "porosity", build_id="build-1")
+    assert [(hit.kind, hit.entry_id, hit.page) for hit in hits] == [
+        ("block", "blk-1", 5),
+        ("text_unit", "tu-1", 5),
+    ]
+    assert repository.read_calls == []
+
+    active_hits = service.search("col-1", "scanning speed", kinds=("block",))
+
+    assert [hit.entry_id for hit in active_hits] == ["blk-1"]
+    assert repository.read_calls == [("col-1", "build-2")]
+    assert store.read_index("col-1", "build-2") is not None
+    assert SourceLexicalSearchService(repository, store).read_index("col-1") is None
+
+
+def test_lexical_index_store_rejects_unsafe_build_ids(tmp_path) -> None:
+    store = FileSourceLexicalIndexStore(FileCollectionWorkspace(tmp_path / "collections"))
+
+    with pytest.raises(ValueError):
+        store.write_index("col-1", "../escape", b"")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from application.source.reference_extraction_service import (
+    SourceReferenceCollector,
     SourceReferenceExtractionService,
 )
 from domain.source import SourceBlock, SourceDocument, assemble_source_documents
@@ -163,3 +164,49 @@ def test_source_reference_extraction_ignores_reference_section_citation_markers(
         ("ref-doc-1-0003", "[3]"),
     ]
     assert {candidate.mention_count for candidate in references.candidates} == {1}
+
+
+def test_source_reference_collector_numbers_batches_like_one_extraction():
+    def paper(document_id: str, order: int) -> SourceDocument:
+        return assemble_source_documents(
+            documents=(
+                SourceDocument(
+                    document_id=document_id,
+                    document_order=order,
+                    title=document_id,
+                    text="",
+                ),
+            ),
+            blocks=(
+                SourceBlock(
+                    block_id=f"{document_id}-body",
+                    document_id=document_id,
+                    block_type="paragraph",
+                    text="Earlier work [1] and [2].",
+                    block_order=1,
+                ),
+                SourceBlock(
+                    block_id=f"{document_id}-refs",
+                    document_id=document_id,
+                    block_type="heading",
+                    text="References",
+                    block_order=2,
+                ),
+                SourceBlock(
+                    block_id=f"{document_id}-ref-1",
+                    document_id=document_id,
+                    block_type="paragraph",
+                    text="[1] First Author. First Paper. Journal. 2021.",
+                    block_order=3,
+                ),
+            ),
+        )[0]
+
+    documents = (paper("doc-1", 0), paper("doc-2", 1))
+    collector = SourceReferenceCollector()
+
+    for document in documents:
+        collector.add((document,))
+
+    assert collector.result() == SourceReferenceExtractionService().extract(documents)
+    assert [entry.metadata["sequence"] for entry in collector.result().entries] == [1, 2]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from types import SimpleNamespace
 
 import pytest
 
@@ -128,3 +129,17 @@ def test_task_service_only_activates_newer_successful_builds() -> None:
     failed = task_service.create_task("col_a", "build")
     task_service.finish_task(failed["task_id"], status="failed")
     assert repository.read_active_build("col_a").task_id == second["task_id"]
+
+
+def test_task_service_publishes_progress_after_each_stored_update() -> None:
+    published: list[str] = []
+    task_service = TaskService(
+        MemoryBuildRepository(),
+        progress_notifier=SimpleNamespace(publish=published.append),
+    )
+    task = task_service.create_task("col_a", "build")
+
+    task_service.update_task(task["task_id"], status="running", progress_percent=10)
+    task_service.finish_task(task["task_id"], status="completed")
+
+    assert published == [f"task:{task['task_id']}"] * 2